@@ -5,7 +5,8 @@
 """
 
 import os
-import re
+
+from html_edit import HTMLEditor
 
 def add_lesson_objectives(file_path, lesson_info):
     """إضافة أهداف الدرس المخصصة"""
@@ -38,12 +39,11 @@ def add_lesson_objectives(file_path, lesson_info):
 '''
         
         # البحث عن مكان الإدراج (قبل قسم الأسئلة)
-        insertion_point = '<section id="quiz"'
-        if insertion_point in content:
-            content = content.replace(
-                insertion_point,
-                objectives_section + '    ' + insertion_point
-            )
+        editor = HTMLEditor(content)
+        quiz = editor.select_one('section#quiz')
+        if quiz is not None:
+            editor.insert_before(quiz, objectives_section + '    ')
+            content = editor.apply()
             
             # حفظ الملف
             with open(file_path, 'w', encoding='utf-8') as f:
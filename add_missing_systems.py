@@ -4,24 +4,42 @@
 إضافة الأنظمة المفقودة - النظام الصوتي والإشعارات والرسائل الذكية
 """
 
-import os
 import re
 
-def add_missing_systems(file_path):
-    """إضافة الأنظمة المفقودة لدرس واحد"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        print(f"🔧 إضافة الأنظمة المفقودة في {file_path}")
-        updated = False
+from patch_engine import contains, get_steps, handle_dry_run, register, run_steps, summarize
+
+STEP_NAME = 'add-missing-systems'
+
+# الدروس التي يستهدفها الإصلاح
+LESSONS = [
+    "unit-1-cells/lesson-1-1/index.html",
+    "unit-1-cells/lesson-1-2/index.html",
+    "unit-1-cells/lesson-1-3/index.html",
+    "unit-2-transport/lesson-2-1/index.html",
+    "unit-2-transport/lesson-2-2/index.html",
+    "unit-2-transport/lesson-2-3/index.html",
+    "unit-3-biomolecules/lesson-3-1/index.html",
+    "unit-3-biomolecules/lesson-3-2/index.html",
+    "unit-3-biomolecules/lesson-3-3/index.html",
+    "unit-4-nutrition/lesson-4-1/index.html",
+    "unit-4-nutrition/lesson-4-2/index.html",
+    "unit-5-respiration/lesson-5-1/index.html",
+    "unit-6-homeostasis/lesson-6-1/index.html",
+    "unit-6-homeostasis/lesson-6-2/index.html",
+    "unit-6-homeostasis/lesson-6-3/index.html",
+    "unit-6-homeostasis/lesson-6-4/index.html"
+]
+
+@register(STEP_NAME, targets=LESSONS, description='الرسائل الذكية والإشعارات وعرض النتائج',
+          applied=contains('askStudent()', 'SmartNotifications.progress('))
+def add_missing_systems(content, path):
+    """إضافة الأنظمة المفقودة لدرس واحد (تحويل في الذاكرة)"""
+    # البحث عن نهاية النظام الصوتي وإضافة الكود المطلوب
+    sound_system_end = 'SoundSystem.init();'
+    if sound_system_end in content and 'askStudent()' not in content:
         
-        # البحث عن نهاية النظام الصوتي وإضافة الكود المطلوب
-        sound_system_end = 'SoundSystem.init();'
-        if sound_system_end in content and 'askStudent()' not in content:
-            
-            # كود نظام الرسائل الذكية والإشعارات
-            smart_systems_code = '''
+        # كود نظام الرسائل الذكية والإشعارات
+        smart_systems_code = '''
     // نظام الرسائل التفاعلية الذكية
     async function askStudent(){
       SoundSystem.play('start');
@@ -164,24 +182,22 @@ def add_missing_systems(file_path):
         }, 1000);
       }
     };'''
-            
-            # إضافة الكود بعد SoundSystem.init()
-            content = content.replace(
-                'SoundSystem.init();',
-                'SoundSystem.init();' + smart_systems_code
-            )
-            updated = True
-            print(f"  ✅ تم إضافة نظام الرسائل الذكية والإشعارات")
         
-        # تحديث نظام التفاعل مع الأسئلة ليدعم الإشعارات
-        if "document.addEventListener('click', e =>" in content:
-            old_click_handler = re.search(
-                r"document\.addEventListener\('click', e => \{[^}]+\}\);",
-                content, re.DOTALL
-            )
-            
-            if old_click_handler:
-                new_click_handler = '''document.addEventListener('click', e => {
+        # إضافة الكود بعد SoundSystem.init()
+        content = content.replace(
+            'SoundSystem.init();',
+            'SoundSystem.init();' + smart_systems_code
+        )
+    
+    # تحديث نظام التفاعل مع الأسئلة ليدعم الإشعارات
+    if "document.addEventListener('click', e =>" in content:
+        old_click_handler = re.search(
+            r"document\.addEventListener\('click', e => \{[^}]+\}\);",
+            content, re.DOTALL
+        )
+        
+        if old_click_handler:
+            new_click_handler = '''document.addEventListener('click', e => {
       if (e.target.matches('.choice')) {
         const isCorrect = e.target.dataset.correct === 'true';
         
@@ -210,70 +226,31 @@ def add_missing_systems(file_path):
         }
       }
     });'''
-                
-                content = content.replace(old_click_handler.group(0), new_click_handler)
-                updated = True
-                print(f"  ✅ تم تحديث نظام التفاعل مع الإشعارات الذكية")
-        
-        # إضافة استدعاء askStudent إذا لم يكن موجوداً
-        if 'renderQuestions();' in content and 'askStudent();' not in content:
-            content = content.replace(
-                'renderQuestions();',
-                'renderQuestions();\n    askStudent();'
-            )
-            updated = True
-            print(f"  ✅ تم إضافة استدعاء askStudent")
-        
-        # حفظ الملف إذا تم التحديث
-        if updated:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        else:
-            print(f"  ℹ️  لا يحتاج تحديث: {file_path}")
-            return False
             
-    except Exception as e:
-        print(f"❌ خطأ في معالجة {file_path}: {e}")
-        return False
+            content = content.replace(old_click_handler.group(0), new_click_handler)
+    
+    # إضافة استدعاء askStudent إذا لم يكن موجوداً
+    if 'renderQuestions();' in content and 'askStudent();' not in content:
+        content = content.replace(
+            'renderQuestions();',
+            'renderQuestions();\n    askStudent();'
+        )
+    
+    return content
 
 def main():
     """الدالة الرئيسية"""
+    if handle_dry_run([STEP_NAME]):
+        return
     print("🚀 إضافة الأنظمة المفقودة...")
     print("=" * 60)
     
-    # قائمة جميع الدروس
-    lessons = [
-        "unit-1-cells/lesson-1-1/index.html",
-        "unit-1-cells/lesson-1-2/index.html", 
-        "unit-1-cells/lesson-1-3/index.html",
-        "unit-2-transport/lesson-2-1/index.html",
-        "unit-2-transport/lesson-2-2/index.html",
-        "unit-2-transport/lesson-2-3/index.html",
-        "unit-3-biomolecules/lesson-3-1/index.html",
-        "unit-3-biomolecules/lesson-3-2/index.html",
-        "unit-3-biomolecules/lesson-3-3/index.html",
-        "unit-4-nutrition/lesson-4-1/index.html",
-        "unit-4-nutrition/lesson-4-2/index.html",
-        "unit-5-respiration/lesson-5-1/index.html",
-        "unit-6-homeostasis/lesson-6-1/index.html",
-        "unit-6-homeostasis/lesson-6-2/index.html",
-        "unit-6-homeostasis/lesson-6-3/index.html",
-        "unit-6-homeostasis/lesson-6-4/index.html"
-    ]
-    
-    fixed_count = 0
-    
-    for lesson in lessons:
-        if os.path.exists(lesson):
-            if add_missing_systems(lesson):
-                fixed_count += 1
-        else:
-            print(f"❌ الملف غير موجود: {lesson}")
+    results = run_steps(get_steps([STEP_NAME]))
+    fixed_count, _ = summarize(results)
     
     print("\n" + "=" * 60)
     print(f"🎉 انتهاء العملية!")
-    print(f"✅ تم تحديث {fixed_count} درس من أصل {len(lessons)}")
+    print(f"✅ تم تحديث {fixed_count} درس من أصل {len(results)}")
     print("🌟 الأنظمة المضافة:")
     print("   💬 نظام الرسائل التفاعلية الذكية")
     print("   📢 نظام الإشعارات المتقدم")
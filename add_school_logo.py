@@ -5,33 +5,21 @@
 يضيف شعار مثبت في الأعلى بتصميم جميل ومتجاوب
 """
 import os
-import shutil
 from pathlib import Path
 
-def create_backup(file_path):
-    """إنشاء نسخة احتياطية من الملف"""
-    backup_path = f"{file_path}.backup_logo_add"
-    shutil.copy2(file_path, backup_path)
-    print(f"✅ تم إنشاء نسخة احتياطية: {backup_path}")
-    return backup_path
+from patch_engine import contains, get_steps, handle_dry_run, register, run_steps, summarize
 
-def add_school_logo_to_lesson(file_path):
-    """إضافة شعار المدرسة لصفحة درس واحد"""
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # التحقق من عدم وجود الشعار مسبقاً
-        if 'school-logo-header' in content:
-            print(f"⚠️  الشعار موجود مسبقاً في: {file_path}")
-            return False
-        
-        # إنشاء نسخة احتياطية
-        create_backup(file_path)
-        
-        # CSS للشعار - يتم إضافته قبل إغلاق </style>
-        logo_css = """
+STEP_NAME = 'add-school-logo'
+
+# النسخ الأصلية تُحفظ في مخزن اللقطات (snapshot_store.py) قبل تعديل أي ملف
+BACKUP_SUFFIX = 'backup_logo_add'
+
+@register(STEP_NAME, description='شعار المدرسة المثبت أعلى صفحات الدروس', backup=BACKUP_SUFFIX,
+          applied=contains('school-logo-header'))
+def add_school_logo_to_lesson(content, file_path):
+    """إضافة شعار المدرسة لصفحة درس واحد (تحويل في الذاكرة)"""
+    # CSS للشعار - يتم إضافته قبل إغلاق </style>
+    logo_css = """
     
     .school-logo-header {
       position: fixed;
@@ -84,67 +72,36 @@ def add_school_logo_to_lesson(file_path):
         height: 35px;
       }
     }"""
-        
-        # إضافة CSS قبل إغلاق </style>
-        content = content.replace('        </style>', logo_css + '\n        </style>')
-        
-        # تحديد المسار النسبي للصورة حسب موقع الدرس
-        # حساب عدد المستويات للوصول للجذر
-        relative_path = os.path.relpath(file_path, '.')
-        depth = len(Path(relative_path).parts) - 1  # -1 لأننا لا نحسب اسم الملف
-        logo_path = '../' * (depth - 1) + 'assets/images/school-logo.png'
-        
-        # HTML للشعار - يتم إضافته بعد <body>
-        logo_html = f"""
+    
+    # إضافة CSS قبل إغلاق </style>
+    content = content.replace('        </style>', logo_css + '\n        </style>')
+    
+    # تحديد المسار النسبي للصورة حسب موقع الدرس
+    # حساب عدد المستويات للوصول للجذر
+    relative_path = os.path.relpath(file_path, '.')
+    depth = len(Path(relative_path).parts) - 1  # -1 لأننا لا نحسب اسم الملف
+    logo_path = '../' * (depth - 1) + 'assets/images/school-logo.png'
+    
+    # HTML للشعار - يتم إضافته بعد <body>
+    logo_html = f"""
   <div class="school-logo-header" data-aos="fade-down" data-aos-delay="300">
     <img src="{logo_path}" alt="شعار المدرسة" loading="eager">
   </div>
   """
-        
-        # إضافة HTML بعد <body>
-        content = content.replace('<body>\n  <div class="wrap">', f'<body>{logo_html}\n  <div class="wrap">')
-        
-        # كتابة الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"✅ تم إضافة الشعار لـ: {file_path}")
-        print(f"   مسار الشعار: {logo_path}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في معالجة {file_path}: {str(e)}")
-        return False
+    
+    # إضافة HTML بعد <body>
+    return content.replace('<body>\n  <div class="wrap">', f'<body>{logo_html}\n  <div class="wrap">')
 
 def main():
     """الدالة الرئيسية"""
+    if handle_dry_run([STEP_NAME]):
+        return
     print("🏫 بدء إضافة شعار المدرسة لجميع صفحات الدروس...")
     print("=" * 60)
     
-    # العثور على جميع ملفات الدروس
-    lesson_files = []
-    base_path = Path('.')
-    
-    for unit_dir in base_path.glob('unit-*'):
-        if unit_dir.is_dir():
-            for lesson_dir in unit_dir.glob('lesson-*'):
-                if lesson_dir.is_dir():
-                    index_file = lesson_dir / 'index.html'
-                    if index_file.exists():
-                        lesson_files.append(str(index_file))
-    
-    print(f"📁 تم العثور على {len(lesson_files)} ملف درس")
-    print("=" * 60)
-    
-    # إضافة الشعار لكل ملف
-    success_count = 0
-    total_count = len(lesson_files)
-    
-    for file_path in lesson_files:
-        print(f"\n🔄 معالجة: {file_path}")
-        if add_school_logo_to_lesson(file_path):
-            success_count += 1
-    
+    results = run_steps(get_steps([STEP_NAME]))
+    success_count, _ = summarize(results)
+    total_count = len(results)
     # التقرير النهائي
     print("\n" + "=" * 60)
     print("📊 التقرير النهائي:")
@@ -154,7 +111,7 @@ def main():
     
     if success_count > 0:
         print("\n🎉 تم إضافة شعار المدرسة بنجاح!")
-        print("💡 تم إنشاء نسخ احتياطية لجميع الملفات المُعدّلة")
+        print("💡 النسخ الأصلية محفوظة في مخزن اللقطات (python snapshot_store.py list)")
         print("🏫 الشعار سيظهر في الجانب الأيمن العلوي لكل درس")
     else:
         print("\n⚠️  لا توجد ملفات تحتاج لإضافة الشعار")
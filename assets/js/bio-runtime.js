@@ -0,0 +1,308 @@
+// منطق الدروس المشترك - يعتمد على أسئلة الصفحة المبنية مسبقاً والمتغير lazyLibraries
+// يُنسخ إلى dist/ باسم مُبصّم بواسطة build.py
+
+AOS.init({ duration: 700, once: true });
+
+// تحميل مكتبة عند أول استخدام (مرة واحدة) وإرجاع الكائن العام الذي تعرّفه
+const libraryLoads = {};
+function loadLibrary(name){
+  if (window[name]) return Promise.resolve(window[name]);
+  if (!libraryLoads[name]) {
+    libraryLoads[name] = new Promise((resolve, reject)=>{
+      const script = document.createElement('script');
+      script.src = lazyLibraries[name];
+      script.async = true;
+      script.onload = ()=> resolve(window[name]);
+      script.onerror = ()=>{ delete libraryLoads[name]; reject(new Error(`فشل تحميل ${name}`)); };
+      document.head.appendChild(script);
+    });
+  }
+  return libraryLoads[name];
+}
+
+// النظام الصوتي المتقدم
+const SoundSystem = {
+  enabled: true,
+  sounds: {},
+  sprite: null,
+
+  init() {
+    const soundMappings = {
+      'correct': 'win.mp3',
+      'wrong': 'wrong_answer.mp3', 
+      'click': 'Click.mp3',
+      'select': 'select.mp3',
+      'milestone': 'g.mp3',
+      'celebration': 'win-Blockbusters.mp3',
+      'complete': 'end-timer.mp3',
+      'start': 'start-timer.mp3',
+      'welcome': 'name-start.mp3',
+      'progress': 'Notification.mp3'
+    };
+
+    // ملف صوتي واحد مدمج (يولده build.py عبر audio_sprite.py) = طلب واحد للصفحة
+    if (typeof audioSprite !== 'undefined' && audioSprite) {
+      this.sprite = new Howl({
+        src: audioSprite.src,
+        sprite: audioSprite.sprite,
+        volume: 0.7,
+        preload: true,
+        onloaderror: () => console.warn('فشل تحميل الملف الصوتي المدمج')
+      });
+      Object.keys(audioSprite.sprite).forEach(type => { this.sounds[type] = type; });
+    } else {
+      Object.keys(soundMappings).forEach(type => {
+        this.sounds[type] = new Howl({
+          src: [`../../assets/audio/${soundMappings[type]}`],
+          volume: 0.7,
+          preload: true,
+          onloaderror: () => console.warn(`فشل تحميل ${type}`)
+        });
+      });
+    }
+
+    console.log('🎵 تم تهيئة النظام الصوتي');
+  },
+
+  play(soundType) {
+    if (!this.enabled || !this.sounds[soundType]) return;
+    if (this.sprite) {
+      this.sprite.play(soundType);
+    } else {
+      this.sounds[soundType].play();
+    }
+  }
+};
+
+// تهيئة النظام الصوتي
+SoundSystem.init();
+
+
+const el = {
+  start: document.getElementById('btnStart'),
+  quiz: document.getElementById('quiz'),
+  list: document.getElementById('quizList'),
+  submit: document.getElementById('btnSubmit'),
+  reset: document.getElementById('btnReset'),
+  meta: document.getElementById('studentMeta'),
+  bar: document.getElementById('barFill'),
+  done: document.getElementById('countDone'),
+  total: document.getElementById('countTotal')
+};
+
+const storageKey = "watyn_bio_student";
+
+function getStudent(){ try{ return JSON.parse(localStorage.getItem(storageKey)) || null }catch{ return null } }
+function setStudent(obj){ localStorage.setItem(storageKey, JSON.stringify(obj)); }
+
+function answeredCount(){
+  let n=0;
+  document.querySelectorAll('.q').forEach(q=>{
+    if(q.querySelector('.choice.correct, .choice.wrong')) n++;
+  });
+  return n;
+}
+function updateProgress(){
+  const total = document.querySelectorAll('.q[data-qid]').length;
+  const answered = Array.from(document.querySelectorAll('.q')).filter(q => 
+    q.querySelector('.choice.correct, .choice.wrong')
+  ).length;
+
+  const barFill = document.getElementById('barFill');
+  const countDone = document.getElementById('countDone');
+  const countTotal = document.getElementById('countTotal');
+
+  if (countTotal) countTotal.textContent = total;
+  if (countDone) countDone.textContent = answered;
+  if (barFill) barFill.style.width = Math.round((answered/total)*100) + '%';
+}
+
+async function askStudent(){
+  SoundSystem.play('start');
+
+  const Swal = await loadLibrary('Swal').catch(()=> null);
+  if (!Swal) {
+    // دون اتصال أو تعذّر تحميل SweetAlert: نافذة المتصفح الأساسية بدلاً منها
+    const name = prompt('🎓 اسم الطالب/ـة:')?.trim();
+    const klass = name && prompt('الصف (مثال: التاسع/1):')?.trim();
+    if (!name || !klass) return;
+    setStudent({ name, klass });
+    updateMeta();
+    SoundSystem.play('welcome');
+    el.quiz.style.display = "block";
+    return;
+  }
+  const { value: formValues } = await Swal.fire({
+    title: '🎓 مرحباً بك!',
+    html:
+      `<div style="text-align:right">
+        <div style="margin-bottom:12px;font-weight:700;color:#d97706">أدخل بياناتك لتبدأ رحلتك العلمية:</div>
+        <input id="swal-name" class="swal2-input" placeholder="اسم الطالب/ـة" style="text-align:right">
+        <input id="swal-class" class="swal2-input" placeholder="الصف (مثال: التاسع/1)" style="text-align:right">
+      </div>`,
+    focusConfirm: false,
+    confirmButtonText: '🚀 لنبدأ التعلم!',
+    confirmButtonColor: '#d97706',
+    showCancelButton: true,
+    cancelButtonText: 'إلغاء',
+    preConfirm: () => {
+      const name = document.getElementById('swal-name').value?.trim();
+      const klass = document.getElementById('swal-class').value?.trim();
+      if(!name || !klass){
+        Swal.showValidationMessage('يرجى إدخال الاسم والصف');
+        return false;
+      }
+      return { name, klass };
+    }
+  });
+
+  if(formValues){
+    setStudent(formValues);
+    updateMeta();
+
+    // رسالة ترحيب شخصية
+    const welcomeMessages = [
+      `🔬 أهلاً ${formValues.name}! مرحبًا بك في عالم الخلايا المثير!`,
+      `🧬 مرحبًا ${formValues.name}! ستكتشف اليوم أسرار الخلية وعجائبها`,
+      `✨ أهلاً ${formValues.name}! رحلة مثيرة في عالم الخلايا المجهرية تنتظرك`
+    ];
+    const randomWelcome = welcomeMessages[Math.floor(Math.random() * welcomeMessages.length)];
+
+    Swal.fire({
+      title: '🎓 أهلاً وسهلاً!',
+      text: randomWelcome,
+      icon: 'success',
+      confirmButtonText: '🔬 لننطلق!',
+      timer: 4000,
+      timerProgressBar: true
+    }).then(() => {
+      SoundSystem.play('welcome');
+    });
+
+    el.quiz.style.display = "block";
+    gsap.from("#quiz .q", {opacity:0, y:20, stagger:.08, duration:.6});
+  }
+}
+
+function updateMeta(){
+  const s = getStudent();
+  el.meta.textContent = s ? (`الطالب/ـة: ${s.name} — الصف: ${s.klass}`) : "مرحبًا! لنبدأ…";
+}
+
+document.addEventListener('click', (e)=>{
+  const choice = e.target.closest('.choice');
+  if(!choice) return;
+
+  const container = choice.closest('.choices');
+  const wasAnswered = container.querySelector('.choice.correct, .choice.wrong');
+  if (wasAnswered) return;
+
+  SoundSystem.play('click');
+
+  container.querySelectorAll('.choice').forEach(c=> c.classList.remove('correct','wrong'));
+
+  if(choice.dataset.correct === "true"){
+    choice.classList.add('correct'); 
+    SoundSystem.play('correct');
+    gsap.fromTo(choice, {scale:1}, {scale:1.05, duration:.3, yoyo:true, repeat:1});
+  }else{
+    choice.classList.add('wrong'); 
+    SoundSystem.play('wrong');
+    gsap.fromTo(choice, {x:0}, {x:-10, duration:.1, yoyo:true, repeat:3});
+  }
+  updateProgress();
+});
+
+function computeScore(){
+  const blocks = Array.from(document.querySelectorAll('.q[data-qid]'));
+  let correct = 0;
+  blocks.forEach(b=>{ const sel = b.querySelector('.choice.correct'); if(sel) correct++; });
+  return { correct, total: blocks.length, percent: Math.round((correct/blocks.length)*100) };
+}
+
+async function celebrate(){
+  SoundSystem.play('celebration');
+  const confetti = await loadLibrary('confetti').catch(()=> null);
+  if (!confetti) return;
+  const duration = 2000; const end = Date.now() + duration;
+  (function frame(){
+    confetti({ particleCount: 5, angle: 60, spread: 70, origin: { x: 0 } });
+    confetti({ particleCount: 5, angle: 120, spread: 70, origin: { x: 1 } });
+    if (Date.now() < end) requestAnimationFrame(frame);
+  })();
+}
+
+el.start.addEventListener('click', askStudent);
+
+el.submit.addEventListener('click', async ()=>{
+  const s = getStudent();
+  const { correct, total, percent } = computeScore();
+
+  celebrate();
+  const Swal = await loadLibrary('Swal').catch(()=> null);
+
+  // رسائل ذكية حسب الأداء
+  let message, icon, soundType;
+  if (percent >= 90) {
+    message = `🏆 ممتاز ${s?.name}! أداء رائع - ${percent}%`;
+    icon = 'success';
+    soundType = 'celebration';
+  } else if (percent >= 70) {
+    message = `👏 أحسنت ${s?.name}! أداء جيد - ${percent}%`;
+    icon = 'success';
+    soundType = 'correct';
+  } else {
+    message = `💪 استمر ${s?.name}! يمكنك التحسن - ${percent}%`;
+    icon = 'info';
+    soundType = 'complete';
+  }
+
+  if (!Swal) {
+    alert(`${message}\n👤 الطالب: ${s?.name || '-'}\n🏫 الصف: ${s?.klass || '-'}\n📊 النتيجة: ${correct}/${total} سؤال (${percent}%)`);
+    if (confirm('🔄 إعادة المحاولة؟ (إلغاء: العودة للرئيسية)')) resetQuiz();
+    else window.location.href='../../index.html';
+    return;
+  }
+
+  Swal.fire({
+    title: 'النتيجة النهائية �',
+    html: `
+      <div style="text-align:right;line-height:2.2;font-size:16px">
+        <div style="background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;padding:15px;border-radius:12px;margin-bottom:15px">
+          ${message}
+        </div>
+        <div style="background:#f8f9ff;padding:15px;border-radius:10px;border-right:4px solid #667eea">
+          <div><strong>👤 الطالب:</strong> ${s?.name || '-'}</div>
+          <div><strong>🏫 الصف:</strong> ${s?.klass || '-'}</div>
+          <div><strong>📊 النتيجة:</strong> ${correct}/${total} سؤال (${percent}%)</div>
+        </div>
+      </div>`,
+    icon: icon,
+    confirmButtonText: '🔄 إعادة المحاولة',
+    confirmButtonColor: '#10b981',
+    showDenyButton: true,
+    denyButtonText: '🏠 العودة للرئيسية',
+    denyButtonColor: '#d97706'
+  }).then(res=>{ 
+    if(res.isConfirmed) resetQuiz(); 
+    else window.location.href='../../index.html'; 
+  });
+});
+
+function resetQuiz(){
+  document.querySelectorAll('.choice').forEach(c=> c.classList.remove('correct','wrong'));
+  updateProgress();
+  gsap.from("#quiz .q", {opacity:0, y:10, stagger:.05, duration:.45});
+  window.scrollTo({ top:0, behavior:'smooth' });
+}
+
+el.reset.addEventListener('click', resetQuiz);
+
+// بدء (الأسئلة مبنية مسبقاً في الصفحة بواسطة build.py؛ هنا يُربط السلوك فقط)
+updateMeta();
+updateProgress();
+
+// العمل بدون اتصال: عامل الخدمة يولده build.py في جذر الموقع
+if ('serviceWorker' in navigator) {
+  navigator.serviceWorker.register('../../sw.js').catch(() => {});
+}
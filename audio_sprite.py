@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+دمج أصوات الدروس في ملف صوتي واحد (Howler sprite) بجودة مناسبة للويب
+Audio sprite pipeline: trim silence, merge cues, transcode to Opus/MP3
+
+- يُزال الصمت من بداية ونهاية كل صوت، وتُقصّر الأصوات الطويلة مع تلاشٍ تدريجي
+- تُدمج الأصوات في ملف واحد مع جدول المواضع (sprite) لـ Howler
+- يُصدّر بصيغتي Opus (webm) و MP3 بمعدل بت منخفض؛ طلب واحد لكل صفحة
+- يتطلب ffmpeg؛ إن لم يتوفر تبقى الدروس على الملفات المنفصلة
+- النتائج مخزنة في .cache/audio-sprite/ ومفهرسة ببصمة الأصوات والإعدادات
+
+الاستخدام:
+    python audio_sprite.py          # توليد الملف وعرض الأحجام
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from parse_cache import content_digest
+
+AUDIO_DIR = Path('assets/audio')
+CACHE_DIR = Path('.cache') / 'audio-sprite'
+SPRITE_NAME = 'bio-sprite'
+
+# مفاتيح الأصوات في SoundSystem -> الملف المصدر
+CUES = {
+    'correct': 'win.mp3',
+    'wrong': 'wrong_answer.mp3',
+    'click': 'Click.mp3',
+    'select': 'select.mp3',
+    'milestone': 'g.mp3',
+    'celebration': 'win-Blockbusters.mp3',
+    'complete': 'end-timer.mp3',
+    'start': 'start-timer.mp3',
+    'welcome': 'name-start.mp3',
+    'progress': 'Notification.mp3',
+}
+
+SAMPLE_RATE = 24000
+SILENCE_THRESHOLD = '-45dB'
+MAX_CUE_SECONDS = 3.5
+FADE_SECONDS = 0.3
+GAP_SECONDS = 0.25
+
+# الصيغ الناتجة بترتيب الأفضلية في Howler: (الامتداد، معاملات الترميز)
+FORMATS = [
+    ('webm', ['-c:a', 'libopus', '-b:a', '24k', '-application', 'audio']),
+    ('mp3', ['-c:a', 'libmp3lame', '-b:a', '32k']),
+]
+
+
+class AudioSpriteError(Exception):
+    """خطأ في توليد الملف الصوتي المدمج"""
+
+
+def ffmpeg_available():
+    """هل ffmpeg متوفر؟"""
+    return shutil.which('ffmpeg') is not None
+
+
+def _ffmpeg(args, data=None):
+    """تشغيل ffmpeg وإرجاع المخرجات"""
+    result = subprocess.run(['ffmpeg', '-hide_banner', '-loglevel', 'error', '-y'] + args,
+                            input=data, capture_output=True)
+    if result.returncode != 0:
+        raise AudioSpriteError(result.stderr.decode('utf-8', 'replace').strip())
+    return result.stdout
+
+
+def _decode_trimmed(path):
+    """فك ترميز صوت إلى PCM أحادي مع إزالة الصمت وتقصير الطويل"""
+    trim = f'silenceremove=start_periods=1:start_threshold={SILENCE_THRESHOLD}'
+    filters = ','.join([
+        trim, 'areverse', trim, 'areverse',
+        f'atrim=0:{MAX_CUE_SECONDS}',
+        f'afade=t=out:st={MAX_CUE_SECONDS - FADE_SECONDS}:d={FADE_SECONDS}',
+    ])
+    return _ffmpeg(['-i', str(path), '-af', filters, '-ac', '1', '-ar', str(SAMPLE_RATE),
+                    '-f', 's16le', 'pipe:1'])
+
+
+def sources_digest():
+    """بصمة الأصوات المصدر وإعدادات الدمج"""
+    parts = [json.dumps([CUES, SAMPLE_RATE, SILENCE_THRESHOLD, MAX_CUE_SECONDS,
+                         FADE_SECONDS, GAP_SECONDS, FORMATS]).encode('utf-8')]
+    for name in CUES.values():
+        with open(AUDIO_DIR / name, 'rb') as f:
+            parts.append(f.read())
+    return content_digest(b'\0'.join(parts))
+
+
+def build_sprite():
+    """توليد الملف المدمج (أو إرجاعه من الذاكرة) -> (مجلد النتائج، جدول المواضع)"""
+    digest = sources_digest()[:12]
+    cache = CACHE_DIR / digest
+    manifest_path = cache / 'sprite.json'
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return cache, json.load(f)
+
+    if not ffmpeg_available():
+        raise AudioSpriteError("ffmpeg غير متوفر")
+
+    gap = b'\0\0' * int(SAMPLE_RATE * GAP_SECONDS)
+    pcm = bytearray()
+    sprite = {}
+    for key, name in CUES.items():
+        samples = _decode_trimmed(AUDIO_DIR / name)
+        start_ms = round(len(pcm) / 2 / SAMPLE_RATE * 1000)
+        duration_ms = round(len(samples) / 2 / SAMPLE_RATE * 1000)
+        sprite[key] = [start_ms, duration_ms]
+        pcm += samples + gap
+
+    cache.mkdir(parents=True, exist_ok=True)
+    files = []
+    for extension, codec in FORMATS:
+        name = f"{SPRITE_NAME}.{digest}.{extension}"
+        _ffmpeg(['-f', 's16le', '-ar', str(SAMPLE_RATE), '-ac', '1', '-i', 'pipe:0']
+                + codec + [str(cache / name)], data=bytes(pcm))
+        files.append(name)
+
+    data = {'files': files, 'sprite': sprite}
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return cache, data
+
+
+def install_sprite(out_dir, prefix='../../'):
+    """نسخ الملف المدمج إلى dist/assets/audio/ وإرجاع إعدادات Howler (أو None)"""
+    try:
+        cache, data = build_sprite()
+    except (AudioSpriteError, OSError) as e:
+        print(f"ℹ️ تعذر دمج الأصوات ({e})؛ ستُستخدم الملفات المنفصلة")
+        return None
+
+    target_dir = Path(out_dir) / AUDIO_DIR
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for name in data['files']:
+        if not (target_dir / name).exists():
+            shutil.copy2(cache / name, target_dir / name)
+    for old in target_dir.glob(f"{SPRITE_NAME}.*"):
+        if old.name not in data['files']:
+            old.unlink()
+    return {
+        'src': [f"{prefix}{(AUDIO_DIR / name).as_posix()}" for name in data['files']],
+        'sprite': data['sprite'],
+    }
+
+
+def main():
+    """توليد الملف المدمج وعرض مقارنة الأحجام"""
+    original = sum((AUDIO_DIR / name).stat().st_size for name in CUES.values())
+    print(f"🎵 الأصوات الأصلية: {len(CUES)} ملف ({original / 1024:.0f} KB)")
+    try:
+        cache, data = build_sprite()
+    except AudioSpriteError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    for name in data['files']:
+        print(f"✅ {name}: {(cache / name).stat().st_size / 1024:.0f} KB")
+    for key, (start, duration) in data['sprite'].items():
+        print(f"   🔊 {key}: {start} ms + {duration} ms")
+
+
+if __name__ == "__main__":
+    main()
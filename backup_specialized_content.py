@@ -9,6 +9,9 @@ import os
 import re
 import json
 
+from js_literal import replace_assignment
+from lesson_parser import load_lesson
+
 def extract_and_save_all_content():
     """استخراج وحفظ جميع المحتوى المتخصص"""
     
@@ -45,8 +48,7 @@ def extract_and_save_all_content():
             continue
         
         try:
-            with open(q_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            lesson = load_lesson(q_file)
             
             lesson_data = {
                 'title': lesson_title,
@@ -55,29 +57,18 @@ def extract_and_save_all_content():
             }
             
             # استخراج الأسئلة
-            bank_match = re.search(r'const bank\s*=\s*\[(.*?)\];', content, re.DOTALL)
-            if bank_match:
-                questions_text = bank_match.group(1)
-                questions = re.findall(r'\{q:"([^"]+)",\s*c:\[([^\]]+)\],\s*a:(\d+)\}', questions_text)
-                
-                for q_text, choices_text, answer_index in questions:
-                    choices = re.findall(r'"([^"]+)"', choices_text)
-                    lesson_data['questions'].append({
-                        'question': q_text,
-                        'choices': choices,
-                        'answer': int(answer_index)
-                    })
+            for question in lesson.questions:
+                lesson_data['questions'].append({
+                    'question': question.text,
+                    'choices': question.choices,
+                    'answer': question.answer
+                })
             
             # استخراج الأهداف
-            objectives_section = re.search(r'<h1>🎯 أهداف الدرس</h1>\s*<p class="lead">([^<]+)</p>\s*<ul>(.*?)</ul>', content, re.DOTALL)
-            if objectives_section:
-                description = objectives_section.group(1).strip()
-                objectives_html = objectives_section.group(2)
-                objectives = re.findall(r'<li>([^<]+(?:<[^>]*>[^<]*</[^>]*>[^<]*)*)</li>', objectives_html)
-                
+            if lesson.objectives:
                 lesson_data['objectives'] = {
-                    'description': description,
-                    'objectives': [obj.strip() for obj in objectives if obj.strip()]
+                    'description': lesson.objectives.description,
+                    'objectives': lesson.objectives.items
                 }
             
             specialized_content[lesson_id] = lesson_data
@@ -148,9 +139,9 @@ def load_and_apply_specialized_content():
                 
                 new_bank = "[\n      " + ",\n      ".join(js_questions) + "\n    ]"
                 
-                bank_pattern = r'const bank\s*=\s*\[.*?\];'
-                if re.search(bank_pattern, content, re.DOTALL):
-                    content = re.sub(bank_pattern, f'const bank = {new_bank};', content, flags=re.DOTALL)
+                new_content = replace_assignment(content, 'bank', new_bank)
+                if new_content is not None:
+                    content = new_content
                     updated = True
                     print(f"  ✅ تم تحديث {len(lesson_data['questions'])} سؤال")
             
@@ -0,0 +1,678 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+بناء الموقع من قالب الدروس وبيانات كل درس
+Parallel static-site build from lesson_template.html plus per-lesson data
+
+- كل درس = lesson_template.html + ملف lesson.json بجانبه + أسئلته من بنك الأسئلة
+- بطاقات الأسئلة (<article class="q">) تُبنى في HTML مباشرة فتظهر مع العرض الأول،
+  ومنطق الدروس يربط السلوك فقط
+- الدروس تُبنى بالتوازي على جميع الأنوية (ProcessPoolExecutor)
+- المخرجات تُكتب في مجلد العمل .build/ فقط، ولا يُعدل أي ملف في المصدر؛ بعد كل بناء
+  ناجح يُنشر .build/ كجيل كامل، و dist رابط رمزي إلى الجيل الحالي (انظر generations.py)
+- منطق الدروس وأنماطها المشتركة (assets/js/bio-runtime.js و assets/css/bio-runtime.css)
+  تُنسخ بأسماء مُبصّمة بالمحتوى فتُخزن في المتصفح مرة واحدة لكل الدروس
+- أصوات الدروس تُدمج في ملف واحد (audio sprite) إن توفر ffmpeg (انظر audio_sprite.py)
+- عامل خدمة sw.js بقائمة تخزين مسبق مُبصّمة لكل ملفات الموقع (للعمل بدون اتصال)
+- خط Cairo يُقلّص إلى المحارف المستخدمة وتُضمّن قواعده في الصفحات إن توفر fontTools
+  (انظر font_subset.py)
+- صور assets/images/ تُصغّر بعدة عروض وصيغ وتُحوّل وسوم <img> إلى صور متجاوبة
+  (انظر responsive_images.py)
+- روابط CDN تُستبدل بالنسخ المحلية في assets/vendor/ إن وُجدت (انظر vendor.py)
+- المسار الحرج: CSS الجزء الظاهر أولاً يُضمّن في الصفحة ويُحمّل الباقي دون حجب، مع
+  تلميحات preload/preconnect للعرض الأول فقط (انظر critical_path.py)
+- بعد كل بناء تُقارن أوزان الصفحات بميزانيات الأداء (انظر page_budget.py)
+- الصفحات والملفات المشتركة وعامل الخدمة تُصغّر، وتُكتب بجانب الملفات النصية نسخ
+  مضغوطة مسبقاً .gz (و .br إن توفرت مكتبة brotli) للخوادم التي تدعمها (انظر minify.py)
+- بناء تزايدي: تُحفظ بصمات مدخلات كل صفحة (القالب، البيانات، الأسئلة، الوسائط
+  المشار إليها) في .build/.build-manifest.json، ولا يُعاد بناء إلا ما تغيرت مدخلاته
+- وضع المراقبة --watch يعيد بناء الدروس المتأثرة فقط فور حفظ أي ملف
+
+الاستخدام:
+    python build.py                  # بناء جميع الدروس ونشرها في dist/
+    python build.py 1-2 6-3          # بناء دروس محددة
+    python build.py --jobs 4         # تحديد عدد العمليات
+    python build.py --force          # إعادة بناء كل شيء
+    python build.py --watch          # مراقبة التغييرات وإعادة البناء تلقائياً
+    python build.py --init-data      # إنشاء lesson.json من الدروس الحالية
+"""
+
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from audio_sprite import SPRITE_NAME, install_sprite
+from critical_path import optimize_page
+from file_watch import FileWatcher
+from font_subset import font_html, inline_fonts, install_fonts
+from generations import GenerationError, publish
+from js_literal import JSLiteralError
+from lesson_parser import OBJECTIVE_ITEM_PATTERN, OBJECTIVES_PATTERN, discover_lessons, parse_bank
+from minify import minify_html, minify_js, minify_text, precompress
+from page_budget import analyze_site, load_budgets, violations
+from parse_cache import content_digest
+from question_bank import DEFAULT_DB_PATH, format_bank, get_lesson_questions
+from responsive_images import install_images, rewrite_images
+from vendor import LOCK_FILE as VENDOR_LOCK_FILE
+from vendor import rewrite_urls, url_map
+
+TEMPLATE_FILE = Path('lesson_template.html')
+DATA_FILE_NAME = 'lesson.json'
+BUILD_DIR = Path('.build')
+DIST_DIR = Path('dist')
+MANIFEST_FILE = '.build-manifest.json'
+SW_TEMPLATE_FILE = Path('sw_template.js')
+SW_FILE = 'sw.js'
+# تسجيل عامل الخدمة في الصفحة الرئيسية المبنية فقط (sw.js لا يوجد إلا في الموقع المبني)
+SW_REGISTRATION = ("<script>if('serviceWorker' in navigator){"
+                   f"navigator.serviceWorker.register('{SW_FILE}').catch(()=>{{}});}}</script>")
+
+# يُرفع عند تغيير منطق البناء لإجبار إعادة بناء كل الصفحات
+BUILD_VERSION = 5
+
+# بادئة المدخل الافتراضي لأسئلة الدرس في بنك الأسئلة
+BANK_INPUT = 'bank:'
+
+# بادئة مدخلات القيم المشتركة المولدة أثناء البناء (مثل جدول الملف الصوتي المدمج)
+SHARED_INPUT = 'shared:'
+
+# الملفات الثابتة التي تُنسخ كما هي إلى مجلد البناء
+STATIC_ITEMS = ['index.html', 'assets']
+
+# ملفات المنطق والأنماط المشتركة: اسم القيمة في القالب -> الملف المصدر
+RUNTIME_ASSETS = {
+    'runtime_js': Path('assets/js/bio-runtime.js'),
+    'runtime_css': Path('assets/css/bio-runtime.css'),
+}
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+HEADER_PATTERN = re.compile(r'<div class="title">([^<]*)</div>')
+TITLE_PATTERN = re.compile(r'<title>([^<]*)</title>')
+OBJECTIVES_MARKER = '<!-- أهداف الدرس -->'
+QUIZ_MARKER = '<!-- الأسئلة (يتم توليدها من بنك الأسئلة) -->'
+ASSET_REF_PATTERN = re.compile(r'\.\./\.\./(assets/[^"\'\s)?#`$]+\.\w+)')
+
+
+class BuildError(Exception):
+    """خطأ في بناء درس"""
+
+
+def render(template, values):
+    """استبدال {{ name }} بالقيم في مرور واحد على القالب"""
+    def replace(match):
+        name = match.group(1)
+        if name not in values:
+            raise BuildError(f"قيمة غير معرفة في القالب: {name}")
+        return values[name]
+    return PLACEHOLDER_PATTERN.sub(replace, template)
+
+
+def load_data(lesson_dir):
+    """قراءة lesson.json للدرس"""
+    data_path = Path(lesson_dir) / DATA_FILE_NAME
+    if not data_path.exists():
+        raise BuildError(f"ملف البيانات غير موجود: {data_path}")
+    with open(data_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _lesson_key(lesson_dir):
+    """مفتاح الدرس مثل: unit-1-cells/lesson-1-2"""
+    return '/'.join(Path(lesson_dir).parts[-2:])
+
+
+def lesson_questions(lesson_dir):
+    """أسئلة الدرس ومصدرها: من بنك الأسئلة، أو من بنك الدرس المصدر إن لم تكن القاعدة موجودة"""
+    lesson_dir = Path(lesson_dir)
+    questions = get_lesson_questions(_lesson_key(lesson_dir))
+    if questions is not None:
+        return questions, BANK_INPUT + _lesson_key(lesson_dir)
+    source = lesson_dir / 'index.html'
+    with open(source, 'r', encoding='utf-8-sig') as f:
+        content = f.read()
+    try:
+        questions, _ = parse_bank(content)
+    except JSLiteralError as e:
+        raise BuildError(f"بنك الأسئلة غير صالح في {lesson_dir}: {e}")
+    return questions, str(source)
+
+
+def questions_markup(questions):
+    """بطاقات الأسئلة كما كان يولدها renderQuestions() في المتصفح
+
+    النصوص تُدرج كما هي (HTML) مثل innerHTML سابقاً، فيعمل أي تنسيق في البنك كما كان.
+    """
+    cards = []
+    for number, question in enumerate(questions, 1):
+        choices = ''.join(
+            f'<div class="choice" data-correct="{"true" if i == question.answer else "false"}">{choice}</div>'
+            for i, choice in enumerate(question.choices))
+        cards.append(
+            f'        <article class="q" data-qid="q{number}">\n'
+            f'          <div><strong>{number}) {question.text}</strong></div>\n'
+            f'          <div class="choices">\n'
+            f'            {choices}\n'
+            f'          </div>\n'
+            f'        </article>')
+    return '\n'.join(cards)
+
+
+def lesson_values(data, questions):
+    """قيم القالب لدرس واحد"""
+    text = lambda value: html.escape(value, quote=False)
+    objectives = data.get('objectives') or {}
+    # عناصر الأهداف HTML مضمّن (قد تحتوي <strong> وغيرها) فتُدرج كما هي
+    items = [f"        <li>{item}</li>" for item in objectives.get('items', [])]
+    return {
+        'title': text(data['title']),
+        'header': text(data['header']),
+        'objectives_heading': text(objectives.get('heading', '')),
+        'objectives_lead': text(objectives.get('lead', '')),
+        'objectives_items': '\n'.join(items),
+        'sections': data.get('sections', ''),
+        'question_count': str(len(questions)),
+        'bank': format_bank(questions),
+        'questions': questions_markup(questions),
+    }
+
+
+def file_digest(path):
+    """بصمة محتوى ملف أو None إذا لم يكن موجوداً"""
+    try:
+        with open(path, 'rb') as f:
+            return content_digest(f.read())
+    except OSError:
+        return None
+
+
+def input_digest(name):
+    """البصمة الحالية لمدخل (ملف أو أسئلة درس في بنك الأسئلة)"""
+    if name.startswith(BANK_INPUT):
+        questions = get_lesson_questions(name[len(BANK_INPUT):])
+        if questions is None:
+            return None
+        return content_digest(format_bank(questions).encode('utf-8'))
+    return file_digest(name)
+
+
+def shared_digests(shared_values):
+    """بصمات القيم المشتركة كمدخلات للصفحات"""
+    return {SHARED_INPUT + name: content_digest(value.encode('utf-8'))
+            for name, value in sorted(shared_values.items())}
+
+
+def bundle_runtime(out_dir):
+    """نسخ الملفات المشتركة بأسماء مُبصّمة (bio-runtime.<hash>.js) وإرجاع روابطها
+
+    تُحذف النسخ القديمة ذات البصمات السابقة من dist/.
+    """
+    urls = {}
+    for name, source in RUNTIME_ASSETS.items():
+        with open(source, 'r', encoding='utf-8') as f:
+            data = minify_text(f.read(), source.suffix).encode('utf-8')
+        hashed = source.with_name(f"{source.stem}.{content_digest(data)[:10]}{source.suffix}")
+        target = Path(out_dir) / hashed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if not target.exists():
+            with open(target, 'wb') as f:
+                f.write(data)
+        for old in target.parent.glob(f"{source.stem}.*{source.suffix}"):
+            if old != target:
+                old.unlink()
+        urls[name] = f"../../{hashed.as_posix()}"
+    return urls
+
+
+def precache_manifest(out_dir):
+    """ملفات dist/ للتخزين المسبق في عامل الخدمة: المسار النسبي -> بصمة المحتوى
+
+    عند وجود الملف الصوتي المدمج لا تُخزن الأصوات المنفصلة (لا تطلبها الصفحات).
+    """
+    out_dir = Path(out_dir)
+    audio_dir = out_dir / 'assets' / 'audio'
+    has_sprite = any(audio_dir.glob(f"{SPRITE_NAME}.*"))
+    entries = {}
+    for path in sorted(out_dir.rglob('*')):
+        if not path.is_file() or path.name.startswith('.') or path.name == SW_FILE \
+                or path.suffix in ('.tmp', '.gz', '.br'):
+            continue
+        if has_sprite and path.parent == audio_dir and not path.name.startswith(SPRITE_NAME):
+            continue
+        entries[path.relative_to(out_dir).as_posix()] = file_digest(path)[:16]
+    return entries
+
+
+def register_service_worker(page):
+    """إضافة تسجيل عامل الخدمة قبل </body> في الصفحة الرئيسية المبنية"""
+    end = page.rfind('</body>')
+    if end < 0:
+        return page + SW_REGISTRATION
+    return page[:end] + SW_REGISTRATION + page[end:]
+
+
+def write_service_worker(out_dir):
+    """توليد dist/sw.js من sw_template.js؛ يُرجع True إذا تغير"""
+    entries = precache_manifest(out_dir)
+    with open(SW_TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        template = f.read()
+    version = content_digest(json.dumps(entries, sort_keys=True).encode('utf-8') + template.encode('utf-8'))[:10]
+    script = minify_js(render(template, {
+        'version': version,
+        'precache': json.dumps(entries, ensure_ascii=False, separators=(',', ':')),
+    }))
+    target = Path(out_dir) / SW_FILE
+    if target.exists():
+        with open(target, 'r', encoding='utf-8') as f:
+            if f.read() == script:
+                return False
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write(script)
+    return True
+
+
+_template = None
+_shared_values = {}
+_vendor_urls = {}
+_images = {}
+_runtime_css = {}
+
+
+def _init_worker(template, shared_values, vendor_urls, images):
+    """تحميل القالب والقيم المشتركة مرة واحدة في كل عملية"""
+    global _template, _shared_values, _vendor_urls, _images
+    _template = template
+    _shared_values = shared_values
+    _vendor_urls = vendor_urls
+    _images = images
+
+
+def _bundled_css(out_dir, href):
+    """محتوى ملف الأنماط المشترك المُبصّم في dist/ (مرة واحدة لكل عملية)"""
+    if href not in _runtime_css:
+        with open(Path(out_dir) / href.replace('../../', '', 1), 'r', encoding='utf-8') as f:
+            _runtime_css[href] = f.read()
+    return _runtime_css[href]
+
+
+def build_lesson(lesson_dir, out_dir):
+    """بناء درس واحد وكتابته في out_dir؛ يُرجع (المسار، الحجم، بصمات المدخلات)"""
+    lesson_dir = Path(lesson_dir)
+    questions, bank_input = lesson_questions(lesson_dir)
+    values = lesson_values(load_data(lesson_dir), questions)
+    values.update(_shared_values)
+    page = render(_template, values)
+    referenced = set(ASSET_REF_PATTERN.findall(page))
+    page = rewrite_urls(rewrite_images(page, _images, '../../'), _vendor_urls, '../../')
+    href = values['runtime_css']
+    page = minify_html(optimize_page(page, _bundled_css(out_dir, href), href))
+
+    inputs = {
+        str(TEMPLATE_FILE): file_digest(TEMPLATE_FILE),
+        **{str(source): file_digest(source) for source in RUNTIME_ASSETS.values()},
+        str(VENDOR_LOCK_FILE): file_digest(VENDOR_LOCK_FILE),
+        **shared_digests(_shared_values),
+        str(lesson_dir / DATA_FILE_NAME): file_digest(lesson_dir / DATA_FILE_NAME),
+    }
+    if bank_input.startswith(BANK_INPUT):
+        inputs[bank_input] = content_digest(values['bank'].encode('utf-8'))
+    else:
+        inputs[bank_input] = file_digest(bank_input)
+    for asset in sorted(referenced | set(ASSET_REF_PATTERN.findall(page))):
+        if os.path.isfile(asset):
+            inputs[asset] = file_digest(asset)
+
+    target = Path(out_dir) / lesson_dir.parts[-2] / lesson_dir.parts[-1] / 'index.html'
+    target.parent.mkdir(parents=True, exist_ok=True)
+    data = page.encode('utf-8')
+    with open(target, 'wb') as f:
+        f.write(data)
+    return str(target), len(data), inputs
+
+
+def copy_static(out_dir, vendor_urls, font_rules=None, images=None):
+    """نسخ الملفات الثابتة المتغيرة فقط (الصفحة الرئيسية والوسائط) إلى dist/
+
+    صفحات HTML تُنسخ بعد تضمين قواعد الخط المقلّص وتحويل الصور إلى صور متجاوبة
+    واستبدال روابط CDN بالنسخ المحلية.
+    """
+    copied = 0
+    for item in STATIC_ITEMS:
+        source = Path(item)
+        files = [p for p in source.rglob('*') if p.is_file()] if source.is_dir() else [source]
+        for path in files:
+            if not path.exists() or path in RUNTIME_ASSETS.values():
+                continue
+            target = Path(out_dir) / path
+            if path.suffix == '.html':
+                with open(path, 'r', encoding='utf-8') as f:
+                    page = rewrite_images(inline_fonts(f.read(), font_rules), images)
+                    page = minify_html(rewrite_urls(page, vendor_urls))
+                if path == Path('index.html'):
+                    page = register_service_worker(page)
+                if target.exists():
+                    with open(target, 'r', encoding='utf-8') as f:
+                        if f.read() == page:
+                            continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with open(target, 'w', encoding='utf-8') as f:
+                    f.write(page)
+                copied += 1
+                continue
+            stat = path.stat()
+            if target.exists():
+                target_stat = target.stat()
+                if (target_stat.st_size, target_stat.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                    continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, target)
+            copied += 1
+    return copied
+
+
+def load_manifest(out_dir):
+    """قراءة سجل مدخلات البناء السابق"""
+    try:
+        with open(Path(out_dir) / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != BUILD_VERSION:
+        return {}
+    return manifest.get('pages', {})
+
+
+def save_manifest(out_dir, pages):
+    """حفظ سجل مدخلات البناء (كتابة ذرية)"""
+    path = Path(out_dir) / MANIFEST_FILE
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'version': BUILD_VERSION, 'pages': pages}, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _target(lesson_path, out_dir):
+    """مسار مخرج الدرس في dist/"""
+    return str(Path(out_dir) / lesson_path.parts[-3] / lesson_path.parts[-2] / 'index.html')
+
+
+def stale_lessons(lesson_paths, out_dir, pages, shared_values):
+    """الدروس التي تغيرت بصمة أي من مدخلاتها أو غاب مخرجها"""
+    digests = shared_digests(shared_values)
+    stale = []
+    for path in lesson_paths:
+        entry = pages.get(_target(path, out_dir))
+        if entry is None or not os.path.exists(_target(path, out_dir)):
+            stale.append(path)
+            continue
+        for name, digest in entry.items():
+            if name not in digests:
+                digests[name] = None if name.startswith(SHARED_INPUT) else input_digest(name)
+            if digests[name] != digest:
+                stale.append(path)
+                break
+    return stale
+
+
+def extract_data(lesson_path):
+    """استخراج بيانات lesson.json من درس موجود"""
+    with open(lesson_path, 'r', encoding='utf-8-sig') as f:
+        content = f.read()
+
+    title = TITLE_PATTERN.search(content)
+    header = HEADER_PATTERN.search(content)
+    objectives = OBJECTIVES_PATTERN.search(content)
+
+    sections = ''
+    start = content.find(OBJECTIVES_MARKER)
+    end = content.find(QUIZ_MARKER)
+    if start != -1 and end != -1:
+        after = content.find('</section>', start) + len('</section>')
+        line_start = content.rfind('\n', 0, end) + 1
+        if after < line_start:
+            sections = content[after:line_start].lstrip('\n')
+            if sections.strip():
+                sections = sections.rstrip() + '\n\n'
+            else:
+                sections = ''
+
+    unescape = lambda value: html.unescape(value.strip())
+    heading, lead, items_html = objectives.groups() if objectives else ('', '', '')
+    return {
+        'title': unescape(title.group(1)) if title else '',
+        'header': unescape(header.group(1)) if header else '',
+        'objectives': {
+            'heading': unescape(heading),
+            'lead': unescape(lead),
+            'items': [item.strip() for item in OBJECTIVE_ITEM_PATTERN.findall(items_html)],
+        },
+        'sections': sections,
+    }
+
+
+def init_data(lesson_paths, force=False):
+    """إنشاء lesson.json لكل درس من محتواه الحالي"""
+    for path in lesson_paths:
+        data_path = path.parent / DATA_FILE_NAME
+        if data_path.exists() and not force:
+            print(f"⏭️ موجود مسبقاً: {data_path}")
+            continue
+        tmp = data_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(extract_data(path), f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        os.replace(tmp, data_path)
+        print(f"✅ تم إنشاء: {data_path}")
+
+
+def _selected(paths, names):
+    """تصفية الدروس حسب الأرقام الممررة (مثل 1-2)"""
+    if not names:
+        return paths
+    return [p for p in paths if p.parent.name.replace('lesson-', '') in names]
+
+
+def build(lesson_paths, out_dir=BUILD_DIR, jobs=None, force=False, release=True):
+    """بناء الدروس المتغيرة بالتوازي؛ يُرجع عدد الأخطاء
+
+    release=False (وضع المراقبة): بدون فحص ميزانيات الأداء ونشر جيل جديد، فإعادة البناء
+    لا تكلف إلا الدروس المتغيرة؛ يُنشر الجيل مرة واحدة عند إيقاف المراقبة.
+    """
+    out_dir = Path(out_dir)
+    if out_dir.resolve() == Path('.').resolve() or any(
+            out_dir.resolve() == p.parent.resolve() for p in lesson_paths):
+        raise BuildError(f"مجلد المخرجات لا يمكن أن يكون داخل المصدر: {out_dir}")
+
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        template = f.read()
+
+    start = time.perf_counter()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    vendor_urls = url_map()
+    font_rules = install_fonts(out_dir)
+    images = install_images(out_dir)
+    copied = copy_static(out_dir, vendor_urls, font_rules, images)
+    shared_values = bundle_runtime(out_dir)
+    shared_values['font_faces'] = font_html(font_rules, '../../')
+    sprite = install_sprite(out_dir)
+    shared_values['audio_sprite'] = json.dumps(sprite, ensure_ascii=False) if sprite else 'null'
+    if copied:
+        print(f"📁 تم نسخ {copied} ملف ثابت")
+
+    pages = load_manifest(out_dir)
+    todo = list(lesson_paths) if force else stale_lessons(lesson_paths, out_dir, pages, shared_values)
+    if not todo:
+        if write_service_worker(out_dir):
+            print(f"📴 تم تحديث {SW_FILE}")
+        precompress(out_dir, jobs)
+        if release:
+            publish_generation(out_dir)
+        print(f"✨ جميع الدروس محدثة ({time.perf_counter() - start:.2f} ث)")
+        return 0
+
+    errors = 0
+    total = 0
+
+    def record(path, result):
+        nonlocal total
+        target, size, inputs = result
+        pages[target] = inputs
+        total += size
+        print(f"✅ {target} ({size / 1024:.1f} KB)")
+
+    if len(todo) == 1 or jobs == 1:
+        # درس واحد (الحالة المعتادة في وضع المراقبة): بدون كلفة تشغيل العمليات
+        _init_worker(template, shared_values, vendor_urls, images)
+        for path in todo:
+            try:
+                record(path, build_lesson(str(path.parent), str(out_dir)))
+            except (BuildError, OSError, KeyError) as e:
+                errors += 1
+                print(f"❌ {path.parent}: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(template, shared_values, vendor_urls, images)) as pool:
+            futures = {pool.submit(build_lesson, str(p.parent), str(out_dir)): p for p in todo}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    record(path, future.result())
+                except (BuildError, OSError, KeyError) as e:
+                    errors += 1
+                    print(f"❌ {path.parent}: {e}")
+
+    save_manifest(out_dir, pages)
+    if write_service_worker(out_dir):
+        print(f"📴 تم تحديث {SW_FILE} ({len(precache_manifest(out_dir))} ملف للعمل بدون اتصال)")
+    compressed = precompress(out_dir, jobs)
+    if compressed:
+        print(f"🗜️ تم ضغط {compressed} ملف مسبقاً (.gz/.br)")
+    if release:
+        budgets = load_budgets()
+        over = [s for s in analyze_site(out_dir, jobs) if violations(s, budgets)]
+        if over:
+            print(f"⚠️ {len(over)} صفحة تتجاوز ميزانية الأداء (التفاصيل: python page_budget.py)")
+        if not errors:
+            publish_generation(out_dir)
+    elapsed = time.perf_counter() - start
+    print(f"📦 تم بناء {len(todo) - errors} من {len(lesson_paths)} درس في {out_dir}/ "
+          f"({total / 1024:.0f} KB، {elapsed:.2f} ث)")
+    return errors
+
+
+def adopt_dist():
+    """نقل dist/ القديم (مجلد حقيقي من البناءات السابقة) ليصبح مجلد العمل .build/
+
+    بعد ذلك ينشئ النشر dist كرابط رمزي إلى الجيل الحالي.
+    """
+    if DIST_DIR.is_symlink() or not DIST_DIR.is_dir():
+        return
+    if BUILD_DIR.exists():
+        shutil.rmtree(DIST_DIR)
+    else:
+        os.replace(DIST_DIR, BUILD_DIR)
+    print(f"📁 {DIST_DIR}/ أصبح رابطاً إلى الجيل الحالي، والبناء يكتب في {BUILD_DIR}/")
+
+
+def publish_generation(out_dir):
+    """نشر مجلد البناء كجيل كامل في .generations/dist/ (تبديل ذري للرابط current، و dist يشير إليه)"""
+    try:
+        name, copied, linked = publish('dist', 'build', source=out_dir)
+    except (GenerationError, OSError) as e:
+        print(f"⚠️ تعذر نشر جيل جديد للموقع: {e}")
+        return
+    if copied:
+        print(f"🚀 الجيل {name}: {copied} ملف جديد، {linked} رابط لملفات غير متغيرة "
+              f"(التراجع: python generations.py rollback)")
+
+
+def affected_lessons(changed, lesson_paths, out_dir):
+    """الدروس التي تعتمد على أي من الملفات المتغيرة (حسب سجل المدخلات)"""
+    pages = load_manifest(out_dir)
+    changed = {str(p) for p in changed}
+    db_changed = any(name.startswith(str(DEFAULT_DB_PATH)) for name in changed)
+    affected = []
+    for path in lesson_paths:
+        inputs = pages.get(_target(path, out_dir))
+        if inputs is None:
+            if str(path.parent / DATA_FILE_NAME) in changed or str(path) in changed:
+                affected.append(path)
+            continue
+        if changed & inputs.keys() or (db_changed and any(n.startswith(BANK_INPUT) for n in inputs)):
+            affected.append(path)
+    return affected
+
+
+def watch(lesson_paths, out_dir=BUILD_DIR, jobs=None):
+    """مراقبة المصدر وإعادة بناء الدروس المتأثرة فقط عند كل حفظ
+
+    المعاينة أثناء المراقبة من مجلد البناء مباشرة، ويُنشر جيل واحد في dist عند الإيقاف.
+    """
+    build(lesson_paths, out_dir, jobs, release=False)
+    lesson_dirs = sorted({p.parent for p in lesson_paths})
+    watcher = FileWatcher(['.'] + lesson_dirs, recursive_roots=[p for p in STATIC_ITEMS if Path(p).is_dir()])
+    print(f"\n👀 مراقبة التغييرات ({watcher.backend}) والمعاينة من {out_dir}/... اضغط Ctrl+C للإيقاف")
+    try:
+        for changed in watcher.changes():
+            affected = affected_lessons(changed, lesson_paths, out_dir)
+            static = [p for p in changed if p.parts and p.parts[0] in STATIC_ITEMS or p == SW_TEMPLATE_FILE]
+            if not affected and not static:
+                continue
+            print(f"\n🔄 تغيير في: {', '.join(sorted(str(p) for p in changed))}")
+            try:
+                # أي تغيير قد يغير القيم المشتركة (الخط المقلّص، الملف الصوتي المدمج)،
+                # فتُفحص كل الدروس ويُعاد بناء ما تغيرت بصماته فقط
+                build(lesson_paths, out_dir, jobs, release=False)
+            except (BuildError, OSError) as e:
+                print(f"❌ {e}")
+    except KeyboardInterrupt:
+        print("\n👋 تم إيقاف المراقبة")
+    finally:
+        watcher.close()
+    publish_generation(out_dir)
+
+
+def main():
+    """الدالة الرئيسية"""
+    args = sys.argv[1:]
+    jobs = None
+    if '--jobs' in args:
+        i = args.index('--jobs')
+        jobs = int(args[i + 1])
+        del args[i:i + 2]
+    force = '--force' in args
+    init = '--init-data' in args
+    watch_mode = '--watch' in args
+    names = [a for a in args if not a.startswith('--')]
+
+    lesson_paths = _selected(discover_lessons(), names)
+    if not lesson_paths:
+        print("❌ لم يتم العثور على دروس")
+        sys.exit(1)
+
+    if init:
+        init_data(lesson_paths, force)
+        return
+
+    adopt_dist()
+    if watch_mode:
+        watch(lesson_paths, BUILD_DIR, jobs)
+        return
+
+    print(f"🔨 بناء {len(lesson_paths)} درس على {jobs or os.cpu_count()} عملية...")
+    try:
+        errors = build(lesson_paths, BUILD_DIR, jobs, force)
+    except BuildError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
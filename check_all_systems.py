@@ -7,18 +7,20 @@
 import os
 import re
 
+from lesson_parser import load_lesson
+
 def check_all_systems(file_path):
     """فحص جميع الأنظمة في درس واحد"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        lesson = load_lesson(file_path)
+        content = lesson.content
         
         print(f"\n🔍 فحص شامل للدرس: {file_path}")
         print("=" * 60)
         
         # 1. فحص النظام الصوتي (SoundSystem)
         print("🔊 النظام الصوتي:")
-        if 'const SoundSystem = {' in content:
+        if lesson.has_system('SoundSystem'):
             print("  ✅ SoundSystem معرّف")
             if 'SoundSystem.init()' in content:
                 print("  ✅ يتم استدعاء SoundSystem.init()")
@@ -34,7 +36,7 @@ def check_all_systems(file_path):
         
         # 2. فحص نظام الإشعارات (SweetAlert2)
         print("\n📢 نظام الإشعارات:")
-        if 'Swal.fire(' in content:
+        if lesson.has_system('SweetAlert2'):
             print("  ✅ SweetAlert2 يُستخدم")
             swal_count = len(re.findall(r'Swal\.fire\(', content))
             print(f"  📊 عدد الإشعارات: {swal_count}")
@@ -44,9 +46,9 @@ def check_all_systems(file_path):
         # 3. فحص نظام الرسائل الذكية
         print("\n💬 نظام الرسائل التفاعلية:")
         smart_messages = []
-        if 'askStudent()' in content:
+        if lesson.has_system('askStudent'):
             smart_messages.append("طلب بيانات الطالب")
-        if 'showResults()' in content:
+        if lesson.has_system('showResults'):
             smart_messages.append("عرض النتائج")
         if 'Swal.fire({' in content:
             smart_messages.append("رسائل تفاعلية مخصصة")
@@ -72,10 +74,8 @@ def check_all_systems(file_path):
         
         # 5. فحص الأسئلة التفاعلية
         print("\n❓ الأسئلة التفاعلية:")
-        bank_match = re.search(r'const bank\s*=\s*\[(.*?)\];', content, re.DOTALL)
-        if bank_match:
-            questions = re.findall(r'\{q:"[^"]+",\s*c:\[[^\]]+\],\s*a:\d+\}', bank_match.group(1))
-            print(f"  ✅ عدد الأسئلة: {len(questions)}")
+        if lesson.questions:
+            print(f"  ✅ عدد الأسئلة: {len(lesson.questions)}")
             
             # فحص التفاعل
             if "document.addEventListener('click', e =>" in content:
@@ -87,7 +87,7 @@ def check_all_systems(file_path):
         
         # 6. فحص شريط التقدم
         print("\n📊 شريط التقدم:")
-        if 'function updateProgress()' in content:
+        if lesson.has_system('updateProgress'):
             print("  ✅ دالة updateProgress موجودة")
             if 'updateProgress()' in content:
                 print("  ✅ يتم استدعاء updateProgress")
@@ -103,7 +103,7 @@ def check_all_systems(file_path):
         # فحص الأخطاء الشائعة
         if 'this.sounds    [' in content:
             js_issues.append("خطأ في تعريف SoundSystem")
-        if 'const bank =' in content and not re.search(r'const bank\s*=\s*\[.*?\];', content, re.DOTALL):
+        if 'const bank =' in content and not lesson.has_bank:
             js_issues.append("خطأ في تعريف bank")
         
         if js_issues:
@@ -3,68 +3,51 @@
 """
 التحقق من الأسئلة المكررة في جميع الدروس
 Check for duplicate questions across all lessons
+
+الأسئلة المتشابهة تُستخرج من فهرس MinHash/LSH دائم (minhash_index.py) بدلاً من مقارنة
+كل زوج، فلا تُحسب إلا الأسئلة الجديدة في كل تشغيل.
+
+الاستخدام:
+    python check_duplicate_questions.py
+    python check_duplicate_questions.py --threshold 0.7 --char-threshold 0.9 --min-common 3
+    python check_duplicate_questions.py --char-threshold 0    # الكلمات فقط
 """
 
 import os
-import re
-from collections import defaultdict
+import sys
+
+from lesson_parser import discover_lessons, load_lesson
+from minhash_index import CHAR_THRESHOLD, MIN_COMMON_WORDS, WORD_THRESHOLD, normalize, open_index
 
 def extract_questions_from_lesson(file_path):
     """استخراج الأسئلة من درس واحد"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # استخراج عنوان الدرس
-        title_match = re.search(r'<title>([^<]+)</title>', content)
-        lesson_title = title_match.group(1) if title_match else "درس غير محدد"
-        
-        # البحث عن الأسئلة في JavaScript
-        question_pattern = r'\{\s*q:\s*["\']([^"\']+)["\']\s*,\s*c:\s*\[(.*?)\]\s*,\s*a:\s*(\d+)\s*\}'
-        question_matches = re.findall(question_pattern, content, re.DOTALL)
+        lesson = load_lesson(file_path)
         
         questions = []
-        for i, (question, choices_str, answer_idx) in enumerate(question_matches, 1):
-            # تنظيف النص
-            clean_question = question.strip()
+        for i, question in enumerate(lesson.questions, 1):
             questions.append({
-                'text': clean_question,
+                'text': question.text,
                 'number': i,
-                'choices': choices_str,
-                'answer': answer_idx
+                'choices': question.choices,
+                'answer': question.answer
             })
         
-        return lesson_title, questions
+        return lesson.title, questions
         
     except Exception as e:
         print(f"❌ خطأ في قراءة {file_path}: {e}")
         return None, []
 
-def find_duplicate_questions():
+def find_duplicate_questions(word_threshold=WORD_THRESHOLD, char_threshold=CHAR_THRESHOLD,
+                             min_common=MIN_COMMON_WORDS, jobs=None):
     """العثور على الأسئلة المكررة"""
     
     print("🔄 بدء التحقق من الأسئلة المكررة في جميع الدروس...")
     print("=" * 70)
     
     # قائمة الدروس
-    lessons = [
-        ("unit-1-cells/lesson-1-1/index.html", "🔬 درس 1-1"),
-        ("unit-1-cells/lesson-1-2/index.html", "🧪 درس 1-2"),
-        ("unit-1-cells/lesson-1-3/index.html", "🔍 درس 1-3"),
-        ("unit-2-transport/lesson-2-1/index.html", "🚛 درس 2-1"),
-        ("unit-2-transport/lesson-2-2/index.html", "💧 درس 2-2"),
-        ("unit-2-transport/lesson-2-3/index.html", "⚡ درس 2-3"),
-        ("unit-3-biomolecules/lesson-3-1/index.html", "🧬 درس 3-1"),
-        ("unit-3-biomolecules/lesson-3-2/index.html", "🧪 درس 3-2"),
-        ("unit-3-biomolecules/lesson-3-3/index.html", "⚗️ درس 3-3"),
-        ("unit-4-nutrition/lesson-4-1/index.html", "🍎 درس 4-1"),
-        ("unit-4-nutrition/lesson-4-2/index.html", "🔄 درس 4-2"),
-        ("unit-5-respiration/lesson-5-1/index.html", "💨 درس 5-1"),
-        ("unit-6-homeostasis/lesson-6-1/index.html", "⚖️ درس 6-1"),
-        ("unit-6-homeostasis/lesson-6-2/index.html", "🌡️ درس 6-2"),
-        ("unit-6-homeostasis/lesson-6-3/index.html", "🍬 درس 6-3"),
-        ("unit-6-homeostasis/lesson-6-4/index.html", "🧠 درس 6-4")
-    ]
+    lessons = [(path, load_lesson(path).short_name) for path in discover_lessons()]
     
     # قاموس لتتبع الأسئلة
     all_questions = {}  # question_text -> [(lesson, question_number), ...]
@@ -79,7 +62,7 @@ def find_duplicate_questions():
             lesson_questions[lesson_short_name] = questions
             
             for q in questions:
-                question_text = q['text'].lower().strip()
+                question_text = normalize(q['text'])
                 if question_text not in all_questions:
                     all_questions[question_text] = []
                 all_questions[question_text].append((lesson_short_name, q['number']))
@@ -96,18 +79,16 @@ def find_duplicate_questions():
         if len(occurrences) > 1:
             duplicates[question_text] = occurrences
     
-    # البحث عن الأسئلة المتشابهة (تحتوي على كلمات مشتركة)
+    # البحث عن الأسئلة المتشابهة (فهرس MinHash/LSH: الأسئلة الجديدة فقط تُقارن بمرشحيها)
     question_texts = list(all_questions.keys())
-    for i, q1 in enumerate(question_texts):
-        for j, q2 in enumerate(question_texts[i+1:], i+1):
-            # حساب نسبة التشابه
-            words1 = set(q1.split())
-            words2 = set(q2.split())
-            common_words = words1.intersection(words2)
-            if len(common_words) >= 3 and len(common_words) / len(words1.union(words2)) > 0.6:
-                if q1 not in similar_questions:
-                    similar_questions[q1] = []
-                similar_questions[q1].append(q2)
+    order = {text: i for i, text in enumerate(question_texts)}
+    index = open_index(word_threshold=word_threshold, char_threshold=char_threshold, min_common=min_common)
+    index.update(question_texts, jobs)
+    pairs = (sorted(pair, key=order.get) for pair in index.pairs())
+    for q1, q2 in sorted(pairs, key=lambda pair: (order[pair[0]], order[pair[1]])):
+        if q1 not in similar_questions:
+            similar_questions[q1] = []
+        similar_questions[q1].append(q2)
     
     # إنشاء التقرير
     report = []
@@ -176,7 +157,7 @@ def find_duplicate_questions():
         # حساب الأسئلة المكررة في هذا الدرس
         lesson_duplicates = 0
         for q in questions:
-            q_text = q['text'].lower().strip()
+            q_text = normalize(q['text'])
             if q_text in duplicates:
                 lesson_duplicates += 1
         
@@ -224,7 +205,13 @@ def find_duplicate_questions():
 
 def main():
     """الدالة الرئيسية"""
-    find_duplicate_questions()
+    args = sys.argv[1:]
+    options = {}
+    for flag, name, cast in (('--threshold', 'word_threshold', float), ('--char-threshold', 'char_threshold', float),
+                             ('--min-common', 'min_common', int), ('--jobs', 'jobs', int)):
+        if flag in args:
+            options[name] = cast(args[args.index(flag) + 1])
+    find_duplicate_questions(**options)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
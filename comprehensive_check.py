@@ -7,16 +7,18 @@
 import os
 import re
 
+from lesson_parser import load_lesson
+
 def comprehensive_check(main_file, reference_file):
     """فحص شامل لمقارنة الملف الرئيسي مع المرجع"""
     try:
         # قراءة الملفات
-        with open(main_file, 'r', encoding='utf-8') as f:
-            main_content = f.read()
+        main_lesson = load_lesson(main_file)
+        main_content = main_lesson.content
         
         if os.path.exists(reference_file):
-            with open(reference_file, 'r', encoding='utf-8') as f:
-                ref_content = f.read()
+            ref_lesson = load_lesson(reference_file)
+            ref_content = ref_lesson.content
         else:
             print(f"❌ الملف المرجعي غير موجود: {reference_file}")
             return False
@@ -26,8 +28,8 @@ def comprehensive_check(main_file, reference_file):
         
         # 1. فحص أهداف الدرس
         print("🎯 أهداف الدرس:")
-        if '<section class="objectives"' in ref_content or 'الأهداف' in ref_content:
-            if '<section class="objectives"' in main_content or 'الأهداف' in main_content:
+        if ref_lesson.objectives or 'الأهداف' in ref_content:
+            if main_lesson.objectives or 'الأهداف' in main_content:
                 print("  ✅ أهداف الدرس موجودة")
             else:
                 print("  ❌ أهداف الدرس مفقودة!")
@@ -36,7 +38,7 @@ def comprehensive_check(main_file, reference_file):
         
         # 2. فحص ميزة تسجيل الاسم والصف
         print("\n👤 ميزة تسجيل الاسم والصف:")
-        if 'askStudent()' in main_content:
+        if main_lesson.has_system('askStudent'):
             print("  ✅ ميزة تسجيل الاسم موجودة")
             if 'swal-name' in main_content and 'swal-class' in main_content:
                 print("  ✅ حقول الاسم والصف موجودة")
@@ -115,13 +117,13 @@ def comprehensive_check(main_file, reference_file):
         # 9. فحص الأنظمة التقنية
         print("\n⚙️ الأنظمة التقنية:")
         systems = []
-        if 'SoundSystem' in main_content:
+        if main_lesson.has_system('SoundSystem'):
             systems.append("النظام الصوتي")
-        if 'Swal.fire' in main_content:
+        if main_lesson.has_system('SweetAlert2'):
             systems.append("نظام الإشعارات")
-        if 'updateProgress' in main_content:
+        if main_lesson.has_system('updateProgress'):
             systems.append("شريط التقدم")
-        if 'localStorage' in main_content:
+        if main_lesson.has_system('localStorage'):
             systems.append("حفظ البيانات")
         
         print(f"  ✅ الأنظمة الفعالة: {', '.join(systems)}")
@@ -6,101 +6,28 @@ Copy specialized questions from Q folder to main lessons
 """
 
 import os
-import re
+
+from lesson_parser import load_lesson
+from question_bank import set_lesson_questions
 
 def extract_questions_from_q_folder(q_file_path):
     """استخراج الأسئلة من ملف في مجلد Q"""
     try:
-        with open(q_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # البحث عن الأسئلة بالنمط الجديد (HTML format)
-        html_questions = []
-        question_pattern = r'<article class="q" data-qid="([^"]+)">(.*?)</article>'
-        question_matches = re.findall(question_pattern, content, re.DOTALL)
-        
-        if question_matches:
-            for qid, q_content in question_matches:
-                # استخراج نص السؤال
-                question_text_match = re.search(r'<div><strong>[^)]*\)\s*([^<]+)</strong></div>', q_content)
-                question_text = question_text_match.group(1).strip() if question_text_match else ""
-                
-                # استخراج الخيارات
-                choices = []
-                correct_answer_idx = -1
-                choice_pattern = r'<div class="choice" data-correct="([^"]+)">([^<]+)</div>'
-                choice_matches = re.findall(choice_pattern, q_content)
-                
-                for i, (is_correct, choice_text) in enumerate(choice_matches):
-                    choices.append(choice_text.strip())
-                    if is_correct == "true":
-                        correct_answer_idx = i
-                
-                if question_text and choices and correct_answer_idx >= 0:
-                    html_questions.append({
-                        'q': question_text,
-                        'c': choices,
-                        'a': correct_answer_idx
-                    })
-        
-        # إذا لم نجد أسئلة بالنمط HTML، ابحث عن النمط الجافا سكريبت
-        if not html_questions:
-            js_pattern = r'\{\s*q:\s*["\']([^"\']+)["\']\s*,\s*c:\s*\[(.*?)\]\s*,\s*a:\s*(\d+)\s*\}'
-            js_matches = re.findall(js_pattern, content, re.DOTALL)
-            
-            for question, choices_str, answer_idx in js_matches:
-                choices_pattern = r'["\']([^"\']+)["\']'
-                choices = re.findall(choices_pattern, choices_str)
-                
-                html_questions.append({
-                    'q': question.strip(),
-                    'c': [choice.strip() for choice in choices],
-                    'a': int(answer_idx)
-                })
-        
-        return html_questions
+        return load_lesson(q_file_path).questions
         
     except Exception as e:
         print(f"❌ خطأ في قراءة {q_file_path}: {e}")
         return []
 
 def update_lesson_questions(lesson_path, new_questions):
-    """تحديث الأسئلة في درس محدد"""
+    """تحديث أسئلة درس في بنك الأسئلة ثم كتابتها في الدرس (python question_bank.py compile)"""
     try:
-        with open(lesson_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         if not new_questions:
             print(f"⚠️ لا توجد أسئلة جديدة لـ {lesson_path}")
             return False
         
-        # تحويل الأسئلة إلى تنسيق JavaScript
-        js_questions = []
-        for q in new_questions:
-            choices_str = ', '.join([f'"{choice}"' for choice in q['c']])
-            js_questions.append(f'      {{q:"{q["q"]}", c:[{choices_str}], a:{q["a"]}}}')
-        
-        questions_block = ',\n'.join(js_questions)
-        
-        # البحث عن مصفوفة الأسئلة الحالية واستبدالها
-        current_questions_pattern = r'(\s*)(//.*أسئلة.*\n)?\s*(\[[\s\S]*?\];)'
-        
-        # البحث عن النمط الأكثر تحديداً
-        questions_array_pattern = r'(\s*\[[\s\S]*?\{[\s\S]*?q:[\s\S]*?\}[\s\S]*?\];)'
-        
-        replacement = f'    [\n{questions_block}\n    ];'
-        
-        if re.search(questions_array_pattern, content):
-            content = re.sub(questions_array_pattern, replacement, content, count=1)
-            print(f"✅ تم استبدال الأسئلة في {lesson_path}")
-        else:
-            print(f"⚠️ لم يتم العثور على مصفوفة الأسئلة في {lesson_path}")
-            return False
-        
-        # حفظ الملف المحدث
-        with open(lesson_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+        set_lesson_questions(lesson_path, new_questions)
+        print(f"✅ تم استبدال الأسئلة في {lesson_path}")
         return True
         
     except Exception as e:
@@ -6,45 +6,29 @@ Extract questions and answers from all lessons and create text file
 """
 
 import os
-import re
+
+from lesson_parser import discover_lessons, load_lesson
+from question_bank import get_lesson_questions
 
 def extract_questions_from_lesson(file_path):
     """استخراج الأسئلة والإجابات من درس واحد"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        lesson = load_lesson(file_path)
         
-        # استخراج عنوان الدرس
-        title_match = re.search(r'<title>([^<]+)</title>', content)
-        lesson_title = title_match.group(1) if title_match else "درس غير محدد"
+        # بنك الأسئلة الموحد هو المصدر إن وُجد، وإلا الدرس نفسه
+        bank_questions = get_lesson_questions(lesson.key)
         
-        # استخراج الأسئلة من JavaScript
         questions = []
+        for i, question in enumerate(bank_questions or lesson.questions, 1):
+            questions.append({
+                'number': i,
+                'question': question.text,
+                'choices': question.choices,
+                'correct_answer': question.correct_answer,
+                'answer_index': question.answer
+            })
         
-        # البحث عن الأسئلة في JavaScript - النمط الجديد
-        # البحث عن بنية {q:"...", c:[...], a:n}
-        question_pattern = r'\{\s*q:\s*["\']([^"\']+)["\']\s*,\s*c:\s*\[(.*?)\]\s*,\s*a:\s*(\d+)\s*\}'
-        question_matches = re.findall(question_pattern, content, re.DOTALL)
-        
-        if question_matches:
-            for i, (question, choices_str, answer_idx) in enumerate(question_matches, 1):
-                # تحليل الخيارات
-                choices_pattern = r'["\']([^"\']+)["\']'
-                choices = re.findall(choices_pattern, choices_str)
-                
-                # الحصول على الإجابة الصحيحة
-                answer_idx = int(answer_idx)
-                correct_answer = choices[answer_idx] if answer_idx < len(choices) else "غير محدد"
-                
-                questions.append({
-                    'number': i,
-                    'question': question.strip(),
-                    'choices': [choice.strip() for choice in choices],
-                    'correct_answer': correct_answer.strip(),
-                    'answer_index': answer_idx
-                })
-        
-        return lesson_title, questions
+        return lesson.title, questions
         
     except Exception as e:
         print(f"❌ خطأ في استخراج الأسئلة من {file_path}: {e}")
@@ -56,24 +40,7 @@ def create_answers_file():
     print("📚 بدء استخراج الأسئلة والإجابات من جميع الدروس...")
     
     # قائمة الدروس
-    lessons = [
-        ("unit-1-cells/lesson-1-1/index.html", "🔬 درس 1-1 — مقدمة في الخلايا"),
-        ("unit-1-cells/lesson-1-2/index.html", "🧪 درس 1-2 — رسم الخلايا وحساب التكبير"),
-        ("unit-1-cells/lesson-1-3/index.html", "🔍 درس 1-3 — أجزاء الخلية ووظائفها"),
-        ("unit-2-transport/lesson-2-1/index.html", "🚛 درس 2-1 — النقل عبر الأغشية"),
-        ("unit-2-transport/lesson-2-2/index.html", "💧 درس 2-2 — الانتشار والخاصية الأسموزية"),
-        ("unit-2-transport/lesson-2-3/index.html", "⚡ درس 2-3 — النقل النشط والسلبي"),
-        ("unit-3-biomolecules/lesson-3-1/index.html", "🧬 درس 3-1 — الكربوهيدرات والدهون"),
-        ("unit-3-biomolecules/lesson-3-2/index.html", "🧪 درس 3-2 — البروتينات والأحماض النووية"),
-        ("unit-3-biomolecules/lesson-3-3/index.html", "⚗️ درس 3-3 — الإنزيمات وآلية عملها"),
-        ("unit-4-nutrition/lesson-4-1/index.html", "🍎 درس 4-1 — التغذية والهضم"),
-        ("unit-4-nutrition/lesson-4-2/index.html", "🔄 درس 4-2 — الامتصاص والنقل"),
-        ("unit-5-respiration/lesson-5-1/index.html", "💨 درس 5-1 — التنفس الخلوي"),
-        ("unit-6-homeostasis/lesson-6-1/index.html", "⚖️ درس 6-1 — التوازن المائي"),
-        ("unit-6-homeostasis/lesson-6-2/index.html", "🌡️ درس 6-2 — تنظيم درجة الحرارة"),
-        ("unit-6-homeostasis/lesson-6-3/index.html", "🍬 درس 6-3 — تنظيم السكر في الدم"),
-        ("unit-6-homeostasis/lesson-6-4/index.html", "🧠 درس 6-4 — الجهاز العصبي والتوازن")
-    ]
+    lessons = [(path, load_lesson(path).title) for path in discover_lessons()]
     
     # محتوى الملف النصي
     output_content = []
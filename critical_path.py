@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+تحسين المسار الحرج لعرض الصفحة الأول
+Critical-path pass: inline above-the-fold CSS and emit first-paint hints
+
+- تُستخرج من الأنماط المشتركة القواعد التي تطابق عناصر الجزء الظاهر أولاً من الصفحة
+  (الترويسة وقسم الأهداف) وتُضمّن في <style>، ويُحمّل ملف الأنماط الكامل دون حجب العرض
+- تلميحات preload/preconnect للعرض الأول فقط: خطوط Cairo العربية المضمّنة، أو
+  خوادم Google Fonts إن بقي رابط الخط الخارجي
+- المكتبات التي لا يحتاجها العرض الأول (sweetalert2 و canvas-confetti) تُحمّل عند
+  أول استخدام من bio-runtime.js، والبقية defer في القالب
+
+الاستخدام:
+    python critical_path.py dist/unit-1-cells/lesson-1-2/index.html   # عرض CSS الحرج
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# نهاية الجزء الظاهر أولاً: نهاية أول قسم في الصفحة (قسم الأهداف)
+FOLD_END = '</section>'
+
+# مجموعات محارف الخط التي يحتاجها العرض الأول (تُحمّل مسبقاً)
+FIRST_PAINT_FONT_SUBSETS = ('arabic',)
+
+GOOGLE_FONTS_CSS = 'https://fonts.googleapis.com/'
+GOOGLE_FONTS_FILES = 'https://fonts.gstatic.com'
+
+TAG_PATTERN = re.compile(r'<([a-zA-Z][\w-]*)([^>]*)>')
+CLASS_PATTERN = re.compile(r'\bclass\s*=\s*"([^"]*)"')
+ID_PATTERN = re.compile(r'\bid\s*=\s*"([^"]*)"')
+ATTR_NAME_PATTERN = re.compile(r'([\w-]+)\s*=')
+PSEUDO_PATTERN = re.compile(r'::?[\w-]+(?:\([^)]*\))?')
+COMBINATOR_PATTERN = re.compile(r'\s*[\s>+~]\s*')
+KEYFRAMES_NAME = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)')
+STYLESHEET_PATTERN = '<link rel="stylesheet" href="{href}" />'
+VIEWPORT_PATTERN = re.compile(r'<meta name="viewport"[^>]*>')
+FONT_FACE_URL = re.compile(r'@font-face\{[^}]*?url\(([^)]+\.woff2)\)')
+
+
+def fold_tokens(page):
+    """الوسوم والأصناف والمعرّفات والخصائص في الجزء الظاهر أولاً من الصفحة"""
+    body = page.find('<body')
+    body = 0 if body == -1 else body
+    end = page.find(FOLD_END, body)
+    fold = page[:len(page) if end == -1 else end]
+    tokens = {'tags': {'html', 'body', 'head'}, 'classes': set(), 'ids': set(), 'attrs': set()}
+    for name, attrs in TAG_PATTERN.findall(fold):
+        tokens['tags'].add(name.lower())
+        for classes in CLASS_PATTERN.findall(attrs):
+            tokens['classes'].update(classes.split())
+        tokens['ids'].update(ID_PATTERN.findall(attrs))
+        tokens['attrs'].update(a.lower() for a in ATTR_NAME_PATTERN.findall(attrs))
+    return tokens
+
+
+def _selector_matches(selector, tokens):
+    """هل قد يطابق المحدد عنصراً في الجزء الظاهر؟ (تقريب محافظ يتجاهل الحالات مثل :hover)"""
+    selector = PSEUDO_PATTERN.sub('', selector).strip()
+    for compound in COMBINATOR_PATTERN.split(selector):
+        if not compound or compound == '*':
+            continue
+        tag = re.match(r'[a-zA-Z][\w-]*', compound)
+        if tag and tag.group(0).lower() not in tokens['tags']:
+            return False
+        if any(c not in tokens['classes'] for c in re.findall(r'\.([\w-]+)', compound)):
+            return False
+        if any(i not in tokens['ids'] for i in re.findall(r'#([\w-]+)', compound)):
+            return False
+        if any(a.lower() not in tokens['attrs'] for a in re.findall(r'\[([\w-]+)', compound)):
+            return False
+    return True
+
+
+def _blocks(css):
+    """تقسيم CSS إلى (الترويسة، المحتوى) للكتل العليا مع احترام الأقواس المتداخلة"""
+    i = 0
+    while i < len(css):
+        start = css.find('{', i)
+        if start == -1:
+            return
+        depth = 0
+        for end in range(start, len(css)):
+            if css[end] == '{':
+                depth += 1
+            elif css[end] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+        yield css[i:start].strip(), css[start + 1:end]
+        i = end + 1
+
+
+def critical_css(css, tokens):
+    """القواعد التي يحتاجها الجزء الظاهر أولاً (مع @keyframes المستخدمة فيها)"""
+    keyframes = {}
+
+    def select(css):
+        out = []
+        for prelude, body in _blocks(css):
+            if prelude.startswith('@media') or prelude.startswith('@supports'):
+                inner = select(body)
+                if inner:
+                    out.append(f"{prelude}{{{inner}}}")
+            elif KEYFRAMES_NAME.match(prelude):
+                keyframes[KEYFRAMES_NAME.match(prelude).group(1)] = f"{prelude}{{{body}}}"
+            elif prelude.startswith('@'):
+                out.append(f"{prelude}{{{body}}}")
+            elif any(_selector_matches(s, tokens) for s in prelude.split(',')):
+                out.append(f"{prelude}{{{body}}}")
+        return ''.join(out)
+
+    selected = select(css)
+    used = [rule for name, rule in keyframes.items() if re.search(rf'\b{re.escape(name)}\b', selected)]
+    return selected + ''.join(used)
+
+
+def resource_hints(page):
+    """تلميحات preload/preconnect لما يحتاجه العرض الأول فقط"""
+    hints = []
+    for url in FONT_FACE_URL.findall(page):
+        if any(f"-{subset}." in url for subset in FIRST_PAINT_FONT_SUBSETS):
+            hints.append(f'<link rel="preload" href="{url}" as="font" type="font/woff2" crossorigin />')
+    if GOOGLE_FONTS_CSS in page:
+        hints.append(f'<link rel="preconnect" href="{GOOGLE_FONTS_FILES}" crossorigin />')
+    return list(dict.fromkeys(hints))
+
+
+def optimize_page(page, css, href):
+    """تضمين CSS الحرج وتحميل ملف الأنماط href دون حجب، وإضافة تلميحات العرض الأول"""
+    link = STYLESHEET_PATTERN.format(href=href)
+    if css and link in page:
+        critical = critical_css(css, fold_tokens(page))
+        deferred = (f'<style>{critical}</style>\n'
+                    f'  <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'" />\n'
+                    f'  <noscript>{link}</noscript>')
+        page = page.replace(link, deferred, 1)
+    hints = resource_hints(page)
+    if hints:
+        page = VIEWPORT_PATTERN.sub(lambda m: m.group(0) + ''.join(f"\n  {h}" for h in hints), page, count=1)
+    return page
+
+
+def main():
+    """عرض CSS الحرج لصفحة مبنية"""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    path = Path(sys.argv[1])
+    with open(path, 'r', encoding='utf-8') as f:
+        page = f.read()
+    hrefs = re.findall(r'href="([^"]*bio-runtime\.[0-9a-f]+\.css)"', page)
+    if not hrefs:
+        print("❌ لا يوجد ملف أنماط مشترك في الصفحة")
+        sys.exit(1)
+    with open((path.parent / hrefs[0]).resolve(), 'r', encoding='utf-8') as f:
+        css = f.read()
+    critical = critical_css(css, fold_tokens(page))
+    print(critical)
+    print(f"\n✂️ CSS الحرج: {len(critical) / 1024:.1f} KB من {len(css) / 1024:.1f} KB", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
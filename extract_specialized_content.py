@@ -7,7 +7,9 @@ Extract specialized questions and objectives from Q folder and organize them in
 
 import os
 import re
-import json
+
+from lesson_parser import Question, load_lesson
+from question_bank import set_lesson_questions
 
 def extract_questions_from_q_folder(q_file_path):
     """استخراج الأسئلة من ملف في مجلد Q"""
@@ -15,27 +17,14 @@ def extract_questions_from_q_folder(q_file_path):
         if not os.path.exists(q_file_path):
             return []
         
-        with open(q_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # البحث عن bank الأسئلة
-        bank_match = re.search(r'const bank\s*=\s*\[(.*?)\];', content, re.DOTALL)
-        if not bank_match:
-            return []
-        
-        # استخراج الأسئلة الفردية
-        questions_text = bank_match.group(1)
-        questions = re.findall(r'\{q:"([^"]+)",\s*c:\[([^\]]+)\],\s*a:(\d+)\}', questions_text)
+        lesson = load_lesson(q_file_path)
         
         formatted_questions = []
-        for q_text, choices_text, answer_index in questions:
-            # استخراج الخيارات
-            choices = re.findall(r'"([^"]+)"', choices_text)
-            
+        for question in lesson.questions:
             formatted_questions.append({
-                'question': q_text,
-                'choices': choices,
-                'answer': int(answer_index)
+                'question': question.text,
+                'choices': question.choices,
+                'answer': question.answer
             })
         
         return formatted_questions
@@ -50,43 +39,19 @@ def extract_objectives_from_q_folder(q_file_path):
         if not os.path.exists(q_file_path):
             return None
         
-        with open(q_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # البحث عن قسم الأهداف
-        objectives_section = re.search(r'<h1>🎯 أهداف الدرس</h1>\s*<p class="lead">([^<]+)</p>\s*<ul>(.*?)</ul>', content, re.DOTALL)
-        
-        if not objectives_section:
+        objectives = load_lesson(q_file_path).objectives
+        if not objectives:
             return None
         
-        description = objectives_section.group(1).strip()
-        objectives_html = objectives_section.group(2)
-        
-        # استخراج الأهداف الفردية
-        objectives = re.findall(r'<li>([^<]+(?:<[^>]*>[^<]*</[^>]*>[^<]*)*)</li>', objectives_html)
-        
         return {
-            'description': description,
-            'objectives': [obj.strip() for obj in objectives if obj.strip()]
+            'description': objectives.description,
+            'objectives': objectives.items
         }
         
     except Exception as e:
         print(f"❌ خطأ في استخراج الأهداف من {q_file_path}: {e}")
         return None
 
-def format_questions_for_js(questions):
-    """تنسيق الأسئلة لكود JavaScript"""
-    if not questions:
-        return "[]"
-    
-    js_questions = []
-    for q in questions:
-        choices_str = ', '.join(f'"{choice}"' for choice in q['choices'])
-        js_question = f'{{q:"{q["question"]}", c:[{choices_str}], a:{q["answer"]}}}'
-        js_questions.append(js_question)
-    
-    return "[\n      " + ",\n      ".join(js_questions) + "\n    ]"
-
 def update_lesson_with_specialized_content(main_lesson_file, questions, objectives):
     """تحديث ملف الدرس بالمحتوى المتخصص"""
     try:
@@ -99,20 +64,7 @@ def update_lesson_with_specialized_content(main_lesson_file, questions, objectiv
         
         updated = False
         
-        # 1. تحديث الأسئلة
-        if questions:
-            new_bank = format_questions_for_js(questions)
-            
-            # البحث عن bank الحالي واستبداله
-            bank_pattern = r'const bank\s*=\s*\[.*?\];'
-            if re.search(bank_pattern, content, re.DOTALL):
-                content = re.sub(bank_pattern, f'const bank = {new_bank};', content, flags=re.DOTALL)
-                updated = True
-                print(f"  ✅ تم تحديث {len(questions)} سؤال")
-            else:
-                print(f"  ⚠️ لم يتم العثور على bank في {main_lesson_file}")
-        
-        # 2. تحديث الأهداف
+        # 1. تحديث الأهداف
         if objectives:
             # البحث عن قسم الأهداف الحالي
             objectives_pattern = r'(<h1>🎯 أهداف الدرس</h1>\s*<p class="lead">)[^<]+(</p>\s*<ul>).*?(</ul>)'
@@ -133,6 +85,15 @@ def update_lesson_with_specialized_content(main_lesson_file, questions, objectiv
         if updated:
             with open(main_lesson_file, 'w', encoding='utf-8') as f:
                 f.write(content)
+        
+        # 2. تحديث الأسئلة في بنك الأسئلة ثم كتابتها في الدرس (لا تُكتب مصفوفة bank هنا)
+        if questions:
+            set_lesson_questions(main_lesson_file, [
+                Question(q['question'], q['choices'], q['answer']) for q in questions])
+            updated = True
+            print(f"  ✅ تم تحديث {len(questions)} سؤال")
+        
+        if updated:
             return True
         else:
             print(f"  ℹ️ لا يحتاج تحديث: {main_lesson_file}")
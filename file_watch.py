@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+مراقبة تغييرات الملفات (inotify على لينكس، مع بديل بالاستطلاع الدوري)
+File watcher: inotify via ctypes on Linux, stat polling elsewhere
+
+يُرجع المولّد changes() مجموعة المسارات المتغيرة بعد تجميع الأحداث المتقاربة
+(حفظ الملف في المحرر يولّد عادة عدة أحداث متتالية).
+
+الاستخدام:
+    python file_watch.py [مجلد...]    # طباعة الملفات المتغيرة
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+# المجلدات التي لا تُراقب أبداً
+IGNORED_DIRS = {'.git', '.cache', '__pycache__', 'dist', 'node_modules'}
+
+# أعلام inotify (من <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_libc():
+    """مكتبة libc إذا كانت تدعم inotify، وإلا None"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+def _walk_dirs(roots, recursive):
+    """المجلدات المطلوب مراقبتها (مع تخطي المجلدات المستبعدة)"""
+    for root in roots:
+        root = Path(root)
+        if not root.is_dir():
+            continue
+        yield root
+        if not recursive:
+            continue
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS and not d.startswith('.')]
+            for name in dirnames:
+                yield Path(dirpath) / name
+
+
+class FileWatcher:
+    """مراقب ملفات بمصدرين: inotify أو الاستطلاع الدوري"""
+
+    def __init__(self, roots, recursive_roots=(), debounce=0.03, poll_interval=0.05):
+        self.roots = [Path(r) for r in roots]
+        self.recursive_roots = [Path(r) for r in recursive_roots]
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.fd = None
+        self.watches = {}
+        libc = _load_libc()
+        if libc is not None and os.environ.get('FILE_WATCH', '') != 'poll':
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                self.libc = libc
+                self.fd = fd
+                for directory in self._directories():
+                    self._add_watch(directory)
+        if self.fd is None:
+            self.snapshot = self._scan()
+
+    @property
+    def backend(self):
+        """اسم آلية المراقبة المستخدمة"""
+        return 'inotify' if self.fd is not None else 'polling'
+
+    def _directories(self):
+        """جميع المجلدات المراقبة"""
+        yield from _walk_dirs(self.roots, recursive=False)
+        yield from _walk_dirs(self.recursive_roots, recursive=True)
+
+    def _add_watch(self, directory):
+        """إضافة مراقبة inotify لمجلد"""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = Path(directory)
+
+    def _read_events(self):
+        """قراءة أحداث inotify المتاحة وإرجاع المسارات المتأثرة"""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+                offset += length
+                directory = self.watches.get(wd)
+                if directory is None or not name:
+                    continue
+                path = directory / name
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO) and name not in IGNORED_DIRS and any(
+                            directory == r or r in directory.parents for r in self.recursive_roots):
+                        self._add_watch(path)
+                    continue
+                changed.add(path)
+        return changed
+
+    def _scan(self):
+        """لقطة (mtime, size) لكل ملف في المجلدات المراقبة"""
+        snapshot = {}
+        for directory in self._directories():
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _poll(self):
+        """مقارنة اللقطة الحالية بالسابقة"""
+        current = self._scan()
+        changed = {path for path, sig in current.items() if self.snapshot.get(path) != sig}
+        changed |= set(self.snapshot) - set(current)
+        self.snapshot = current
+        return changed
+
+    def _wait(self, timeout):
+        """انتظار تغييرات لمدة timeout (None = بلا حد)"""
+        if self.fd is not None:
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+            return self._read_events() if ready else set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self._poll()
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(self.poll_interval)
+
+    def changes(self):
+        """مولّد يُرجع مجموعة المسارات المتغيرة بعد تجميع الأحداث المتقاربة"""
+        while True:
+            changed = self._wait(None)
+            while True:
+                more = self._wait(self.debounce)
+                if not more:
+                    break
+                changed |= more
+            if changed:
+                yield changed
+
+    def close(self):
+        """إيقاف المراقبة"""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def main():
+    """طباعة الملفات المتغيرة في المجلدات الممررة"""
+    roots = sys.argv[1:] or ['.']
+    watcher = FileWatcher([], recursive_roots=roots)
+    print(f"👀 مراقبة {', '.join(roots)} ({watcher.backend})... اضغط Ctrl+C للإيقاف")
+    try:
+        for changed in watcher.changes():
+            for path in sorted(changed):
+                print(f"  📝 {path}")
+    except KeyboardInterrupt:
+        print("\n👋 تم الإيقاف")
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()
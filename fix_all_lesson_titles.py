@@ -4,10 +4,17 @@
 سكريبت إصلاح عناوين جميع الدروس بحذر شديد
 يقوم بتحديث العناوين دون التأثير على المحتوى الأساسي
 """
-import os
 import re
-import shutil
-from pathlib import Path
+
+from patch_engine import get_steps, handle_dry_run, register, run_steps, summarize
+
+STEP_NAME = 'fix-lesson-titles'
+
+# النسخ الأصلية تُحفظ في مخزن اللقطات (snapshot_store.py) قبل تعديل أي ملف
+BACKUP_SUFFIX = 'backup_title_fix'
+
+# العنوان المنسوخ خطأً من الدرس 1-1 إلى بقية الدروس
+WRONG_TITLE = '🧬 نشاط تفاعلي — الدرس 1-1: الخلايا الحيوانية والنباتية'
 
 # قاموس العناوين الصحيحة لكل درس
 LESSON_TITLES = {
@@ -42,13 +49,6 @@ LESSON_TITLES = {
     'unit-6-homeostasis/lesson-6-5': '⚖️ نشاط تفاعلي — الدرس 6-5: التوازن الداخلي',
 }
 
-def create_backup(file_path):
-    """إنشاء نسخة احتياطية من الملف"""
-    backup_path = f"{file_path}.backup_title_fix"
-    shutil.copy2(file_path, backup_path)
-    print(f"✅ تم إنشاء نسخة احتياطية: {backup_path}")
-    return backup_path
-
 def extract_title_from_head(html_content):
     """استخراج العنوان من قسم head"""
     title_match = re.search(r'<title>(.*?)</title>', html_content, re.DOTALL)
@@ -63,87 +63,41 @@ def extract_title_from_head(html_content):
                 return f"{icon_part} نشاط تفاعلي — {lesson_part}"
     return None
 
-def fix_lesson_title(file_path):
-    """إصلاح عنوان درس واحد"""
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # التحقق من وجود العنوان الخاطئ
-        wrong_title = '🧬 نشاط تفاعلي — الدرس 1-1: الخلايا الحيوانية والنباتية'
-        if wrong_title not in content:
-            print(f"⚠️  لا يحتوي على العنوان الخاطئ: {file_path}")
-            return False
-        
-        # إنشاء نسخة احتياطية
-        create_backup(file_path)
-        
-        # تحديد العنوان الصحيح
-        correct_title = None
-        
-        # البحث في قاموس العناوين
-        for lesson_key, title in LESSON_TITLES.items():
-            if lesson_key in file_path.replace('\\', '/'):
-                correct_title = title
-                break
-        
-        # إذا لم نجد في القاموس، نحاول استخراج من head
-        if not correct_title:
-            correct_title = extract_title_from_head(content)
-        
-        if not correct_title:
-            print(f"❌ لا يمكن تحديد العنوان الصحيح لـ: {file_path}")
-            return False
-        
-        # استبدال العنوان
-        new_content = content.replace(wrong_title, correct_title)
-        
-        # التحقق من التغيير
-        if new_content == content:
-            print(f"⚠️  لم يتم إجراء أي تغيير في: {file_path}")
-            return False
-        
-        # كتابة الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        
-        print(f"✅ تم إصلاح العنوان في: {file_path}")
-        print(f"   العنوان الجديد: {correct_title}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في معالجة {file_path}: {str(e)}")
-        return False
+@register(STEP_NAME, description='تصحيح عنوان النشاط المنسوخ من الدرس 1-1', backup=BACKUP_SUFFIX)
+def fix_lesson_title(content, file_path):
+    """إصلاح عنوان درس واحد (تحويل في الذاكرة)"""
+    # التحقق من وجود العنوان الخاطئ
+    if WRONG_TITLE not in content:
+        return content
+    
+    # تحديد العنوان الصحيح من القاموس
+    correct_title = None
+    for lesson_key, title in LESSON_TITLES.items():
+        if lesson_key in str(file_path).replace('\\', '/'):
+            correct_title = title
+            break
+    
+    # إذا لم نجد في القاموس، نحاول استخراج من head
+    if not correct_title:
+        correct_title = extract_title_from_head(content)
+    
+    if not correct_title:
+        print(f"❌ لا يمكن تحديد العنوان الصحيح لـ: {file_path}")
+        return content
+    
+    # استبدال العنوان
+    return content.replace(WRONG_TITLE, correct_title)
 
 def main():
     """الدالة الرئيسية"""
+    if handle_dry_run([STEP_NAME]):
+        return
     print("🔧 بدء إصلاح عناوين جميع الدروس...")
     print("=" * 50)
     
-    # العثور على جميع ملفات الدروس
-    lesson_files = []
-    base_path = Path('.')
-    
-    for unit_dir in base_path.glob('unit-*'):
-        if unit_dir.is_dir():
-            for lesson_dir in unit_dir.glob('lesson-*'):
-                if lesson_dir.is_dir():
-                    index_file = lesson_dir / 'index.html'
-                    if index_file.exists():
-                        lesson_files.append(str(index_file))
-    
-    print(f"📁 تم العثور على {len(lesson_files)} ملف درس")
-    print("=" * 50)
-    
-    # إصلاح كل ملف
-    success_count = 0
-    total_count = len(lesson_files)
-    
-    for file_path in lesson_files:
-        print(f"\n🔄 معالجة: {file_path}")
-        if fix_lesson_title(file_path):
-            success_count += 1
+    results = run_steps(get_steps([STEP_NAME]))
+    success_count, _ = summarize(results)
+    total_count = len(results)
     
     # التقرير النهائي
     print("\n" + "=" * 50)
@@ -154,7 +108,7 @@ def main():
     
     if success_count > 0:
         print("\n🎉 تم إصلاح العناوين بنجاح!")
-        print("💡 تم إنشاء نسخ احتياطية لجميع الملفات المُعدّلة")
+        print("💡 النسخ الأصلية محفوظة في مخزن اللقطات (python snapshot_store.py list)")
     else:
         print("\n⚠️  لا توجد ملفات تحتاج لإصلاح")
 
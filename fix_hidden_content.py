@@ -2,34 +2,32 @@
 """
 إصلاح مشكلة إخفاء المحتوى وتوحيد الأنظمة
 """
-import os
 import re
-from pathlib import Path
 
-def fix_hidden_content(lesson_path):
-    """إصلاح مشكلة المحتوى المخفي"""
-    try:
-        with open(lesson_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        lesson_name = str(lesson_path).split(os.sep)[-2]
-        
-        # تخطي lesson-1-1 لأنه يعمل بشكل مثالي
-        if 'lesson-1-1' in str(lesson_path):
-            return True
-        
-        # إزالة الكود المكرر والمتضارب
-        # البحث عن تعريفات متعددة لنفس الوظائف
-        content = re.sub(r'async function askStudent\(\)\{[^}]*\}[^}]*\}', '', content, flags=re.DOTALL)
-        
-        # إزالة تعريفات el المكررة
-        content = re.sub(r'const el = \{[^}]*\};', '', content)
-        
-        # إزالة storageKey المكرر
-        content = re.sub(r'const storageKey = "watyn_bio_student";', '', content)
-        
-        # إضافة نظام موحد وبسيط في نهاية الـ script
-        unified_system = '''
+from patch_engine import contains, get_steps, handle_dry_run, register, run_steps, summarize
+
+STEP_NAME = 'unify-hidden-content'
+
+@register(STEP_NAME, description='إزالة التعريفات المكررة وإضافة النظام الموحد',
+          applied=contains('// النظام الموحد والبسيط'))
+def fix_hidden_content(content, lesson_path):
+    """إصلاح مشكلة المحتوى المخفي (تحويل في الذاكرة)"""
+    # تخطي lesson-1-1 لأنه يعمل بشكل مثالي
+    if 'lesson-1-1' in str(lesson_path):
+        return content
+    
+    # إزالة الكود المكرر والمتضارب
+    # البحث عن تعريفات متعددة لنفس الوظائف
+    content = re.sub(r'async function askStudent\(\)\{[^}]*\}[^}]*\}', '', content, flags=re.DOTALL)
+    
+    # إزالة تعريفات el المكررة
+    content = re.sub(r'const el = \{[^}]*\};', '', content)
+    
+    # إزالة storageKey المكرر
+    content = re.sub(r'const storageKey = "watyn_bio_student";', '', content)
+    
+    # إضافة نظام موحد وبسيط في نهاية الـ script
+    unified_system = '''
     // النظام الموحد والبسيط
     const elements = {
       start: document.getElementById('btnStart'),
@@ -176,54 +174,24 @@ def fix_hidden_content(lesson_path):
       
       console.log('✅ تم تحميل جميع الأنظمة بنجاح');
     });'''
-        
-        # إضافة النظام الموحد قبل إغلاق script
-        script_end_pattern = r'(\s*</script>\s*</body>)'
-        content = re.sub(script_end_pattern, f'{unified_system}\\1', content, flags=re.DOTALL)
-        
-        # كتابة الملف المحدث
-        with open(lesson_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        return True
-        
-    except Exception as e:
-        print(f"  ❌ خطأ: {str(e)}")
-        return False
+    
+    # إضافة النظام الموحد قبل إغلاق script
+    script_end_pattern = r'(\s*</script>\s*</body>)'
+    return re.sub(script_end_pattern, f'{unified_system}\\1', content, flags=re.DOTALL)
 
 def main():
+    if handle_dry_run([STEP_NAME]):
+        return
     print("🔧 إصلاح مشكلة المحتوى المخفي")
     print("=" * 50)
     
-    # العثور على جميع الدروس
-    lessons = []
-    units = ['unit-1-cells', 'unit-2-transport', 'unit-3-biomolecules', 
-             'unit-4-nutrition', 'unit-5-respiration', 'unit-6-homeostasis']
-    
-    for unit in units:
-        if os.path.exists(unit):
-            for lesson_dir in os.listdir(unit):
-                if lesson_dir.startswith('lesson-'):
-                    lesson_path = Path(unit) / lesson_dir / 'index.html'
-                    if lesson_path.exists():
-                        lessons.append((f"{unit}/{lesson_dir}", lesson_path))
-    
-    print(f"📚 تم العثور على {len(lessons)} درس")
-    print()
-    
-    success_count = 0
-    for lesson_name, lesson_path in lessons:
-        print(f"🔧 معالجة: {lesson_name}")
-        if fix_hidden_content(lesson_path):
-            success_count += 1
-            print(f"  ✅ تم الإصلاح")
-        else:
-            print(f"  ❌ فشل")
+    results = run_steps(get_steps([STEP_NAME]))
+    success_count, failed_count = summarize(results)
     
     print("\n" + "=" * 50)
     print(f"📊 النتائج:")
     print(f"✅ تم الإصلاح: {success_count} درس")
-    print(f"❌ فشل: {len(lessons) - success_count} درس")
+    print(f"❌ فشل: {failed_count} درس")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
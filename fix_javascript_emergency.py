@@ -4,29 +4,44 @@
 إصلاح عاجل - إعادة ترتيب الكود JavaScript بالكامل
 """
 
-import os
 import re
 
-def fix_javascript_structure(file_path):
-    """إصلاح بنية JavaScript بالكامل"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        print(f"🔧 إعادة ترتيب JavaScript في {file_path}")
-        
-        # استخراج الأسئلة
-        questions_pattern = r'\{q:"[^"]+",\s*c:\[[^\]]+\],\s*a:\d+\}'
-        questions = re.findall(questions_pattern, content)
-        
-        if not questions:
-            print(f"❌ لا توجد أسئلة للاستخراج في {file_path}")
-            return False
-        
-        print(f"📝 تم العثور على {len(questions)} سؤال")
-        
-        # إنشاء SoundSystem صحيح
-        sound_system_code = '''// النظام الصوتي المتقدم
+from patch_engine import get_steps, handle_dry_run, register, run_steps, summarize
+
+STEP_NAME = 'rebuild-lesson-script'
+
+# تطبيق على جميع الدروس
+LESSONS = [
+    "unit-1-cells/lesson-1-1/index.html",
+    "unit-1-cells/lesson-1-2/index.html",
+    "unit-1-cells/lesson-1-3/index.html",
+    "unit-2-transport/lesson-2-1/index.html",
+    "unit-2-transport/lesson-2-2/index.html",
+    "unit-2-transport/lesson-2-3/index.html",
+    "unit-3-biomolecules/lesson-3-1/index.html",
+    "unit-3-biomolecules/lesson-3-2/index.html",
+    "unit-3-biomolecules/lesson-3-3/index.html",
+    "unit-4-nutrition/lesson-4-1/index.html",
+    "unit-4-nutrition/lesson-4-2/index.html",
+    "unit-5-respiration/lesson-5-1/index.html",
+    "unit-6-homeostasis/lesson-6-1/index.html",
+    "unit-6-homeostasis/lesson-6-2/index.html",
+    "unit-6-homeostasis/lesson-6-3/index.html",
+    "unit-6-homeostasis/lesson-6-4/index.html"
+]
+
+@register(STEP_NAME, targets=LESSONS, description='إعادة بناء سكربت الدرس من بنك الأسئلة (إصلاح عاجل)')
+def fix_javascript_structure(content, path):
+    """إصلاح بنية JavaScript بالكامل (تحويل في الذاكرة)"""
+    # استخراج الأسئلة
+    questions_pattern = r'\{q:"[^"]+",\s*c:\[[^\]]+\],\s*a:\d+\}'
+    questions = re.findall(questions_pattern, content)
+    
+    if not questions:
+        return content
+    
+    # إنشاء SoundSystem صحيح
+    sound_system_code = '''// النظام الصوتي المتقدم
     const SoundSystem = {
       enabled: true,
       sounds: {},
@@ -60,22 +75,22 @@ def fix_javascript_structure(file_path):
         }
       }
     };'''
-        
-        # إنشاء bank صحيح
-        bank_code = f'''
+    
+    # إنشاء bank صحيح
+    bank_code = f'''
     const bank = [
       {chr(10).join("      " + q + "," for q in questions)}
     ];'''
-        
-        # البحث عن نهاية </script> الأخير وإضافة الكود الصحيح
-        # إزالة الكود القديم المكسور أولاً
-        # إزالة كل شيء من AOS.init حتى نهاية script
-        aos_pattern = r'AOS\.init\([^;]+\);.*?</script>'
-        match = re.search(aos_pattern, content, re.DOTALL)
-        
-        if match:
-            # استبدال بالكود الصحيح
-            new_script_section = f'''AOS.init({{ duration: 700, once: true }});
+    
+    # البحث عن نهاية </script> الأخير وإضافة الكود الصحيح
+    # إزالة الكود القديم المكسور أولاً
+    # إزالة كل شيء من AOS.init حتى نهاية script
+    aos_pattern = r'AOS\.init\([^;]+\);.*?</script>'
+    match = re.search(aos_pattern, content, re.DOTALL)
+    
+    if match:
+        # استبدال بالكود الصحيح
+        new_script_section = f'''AOS.init({{ duration: 700, once: true }});
 
 {sound_system_code}
 {bank_code}
@@ -161,61 +176,24 @@ def fix_javascript_structure(file_path):
     renderQuestions();
     updateProgress();
   </script>'''
-            
-            content = content.replace(match.group(0), new_script_section)
-            
-            # حفظ الملف
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"✅ تم إصلاح JavaScript بنجاح في {file_path}")
-            return True
         
-        else:
-            print(f"❌ لم يتم العثور على نمط AOS.init في {file_path}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ خطأ في إصلاح {file_path}: {e}")
-        return False
+        return content.replace(match.group(0), new_script_section)
+    
+    return content
 
 def main():
     """الدالة الرئيسية"""
+    if handle_dry_run([STEP_NAME]):
+        return
     print("🚀 إصلاح عاجل - إعادة ترتيب JavaScript...")
     print("=" * 60)
     
-    # تطبيق على جميع الدروس
-    lessons = [
-        "unit-1-cells/lesson-1-1/index.html",
-        "unit-1-cells/lesson-1-2/index.html", 
-        "unit-1-cells/lesson-1-3/index.html",
-        "unit-2-transport/lesson-2-1/index.html",
-        "unit-2-transport/lesson-2-2/index.html",
-        "unit-2-transport/lesson-2-3/index.html",
-        "unit-3-biomolecules/lesson-3-1/index.html",
-        "unit-3-biomolecules/lesson-3-2/index.html",
-        "unit-3-biomolecules/lesson-3-3/index.html",
-        "unit-4-nutrition/lesson-4-1/index.html",
-        "unit-4-nutrition/lesson-4-2/index.html",
-        "unit-5-respiration/lesson-5-1/index.html",
-        "unit-6-homeostasis/lesson-6-1/index.html",
-        "unit-6-homeostasis/lesson-6-2/index.html",
-        "unit-6-homeostasis/lesson-6-3/index.html",
-        "unit-6-homeostasis/lesson-6-4/index.html"
-    ]
-    
-    fixed_count = 0
-    
-    for lesson in lessons:
-        if os.path.exists(lesson):
-            if fix_javascript_structure(lesson):
-                fixed_count += 1
-        else:
-            print(f"❌ الملف غير موجود: {lesson}")
+    results = run_steps(get_steps([STEP_NAME]))
+    fixed_count, _ = summarize(results)
     
     print("\n" + "=" * 60)
     print(f"🎉 انتهاء العملية!")
-    print(f"✅ تم إصلاح {fixed_count} درس من أصل {len(lessons)}")
+    print(f"✅ تم إصلاح {fixed_count} درس من أصل {len(results)}")
     print("🌟 الأسئلة ستظهر الآن في جميع الدروس!")
 
 if __name__ == "__main__":
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+تقليص خط Cairo إلى المحارف المستخدمة فعلاً في الدروس وبنوك الأسئلة
+Subset the vendored Cairo fonts to the glyphs actually used by the site
+
+- تُجمع المحارف من lesson.json وبنك الأسئلة والقالب والصفحة الرئيسية والمنطق المشترك
+- لكل وزن (500/700/900) ولكل مجموعة محارف يُولّد ملف woff2 مُقلّص (مع تثبيت
+  الوزن إن كان الخط متغيراً)، وتُضمّن قواعد @font-face في الصفحة مع font-display: swap
+- المصدر: ملفات Cairo المنسوخة في assets/vendor/cairo/ (انظر vendor.py)
+- يتطلب fontTools و brotli؛ إن لم يتوفرا تبقى الصفحات على ملف CSS الخط الكامل
+- النتائج مخزنة في .cache/fonts/ ومفهرسة ببصمة الخطوط والمحارف
+
+الاستخدام:
+    python font_subset.py          # توليد الخطوط وعرض الأحجام
+"""
+
+import html
+import io
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from lesson_parser import discover_lessons, load_lesson
+from parse_cache import content_digest
+from question_bank import get_lesson_questions
+from vendor import FONT, VENDOR_DIR
+
+try:
+    from fontTools import subset as ft_subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:
+    ft_subset = None
+
+CACHE_DIR = Path('.cache') / 'fonts'
+FONTS_DIR = Path('assets/fonts')
+FONT_CSS = VENDOR_DIR / FONT['file']
+DATA_FILE_NAME = 'lesson.json'
+
+# رابط الخط في الصفحات (يُستبدل بقواعد @font-face المضمّنة)
+FONT_LINK = f'<link href="{FONT["url"]}" rel="stylesheet" />'
+FONT_LINK_PATTERN = re.compile(r'<link href="' + re.escape(FONT['url']).replace('&', '&(?:amp;)?')
+                               + r'" rel="stylesheet"\s*/?>')
+
+# ملفات تظهر نصوصها في الصفحات إضافة إلى بيانات الدروس
+TEXT_SOURCES = ['lesson_template.html', 'index.html', 'assets/js/bio-runtime.js']
+
+# محارف تُضمن دائماً: ASCII المطبوعة والأرقام الهندية وعلامات الترقيم العربية
+ALWAYS_INCLUDED = set(range(0x20, 0x7F)) | set(range(0x660, 0x66A)) | {0x60C, 0x61B, 0x61F, 0x640, 0xA0}
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+FACE_PATTERN = re.compile(r'/\* ([\w-]+) \*/\s*@font-face\s*\{([^}]*)\}')
+WEIGHT_PATTERN = re.compile(r'font-weight:\s*(\d+)')
+SRC_PATTERN = re.compile(r'url\(([^)]+)\)')
+RANGE_PATTERN = re.compile(r'unicode-range:\s*([^;]+);')
+
+
+class FontSubsetError(Exception):
+    """خطأ في تقليص الخطوط"""
+
+
+def collect_text():
+    """جميع النصوص التي قد تظهر في الموقع"""
+    parts = []
+    for path in discover_lessons():
+        data_path = path.parent / DATA_FILE_NAME
+        if data_path.exists():
+            with open(data_path, 'r', encoding='utf-8') as f:
+                parts.append(json.dumps(json.load(f), ensure_ascii=False))
+        lesson = load_lesson(path)
+        questions = get_lesson_questions(lesson.key)
+        if questions is None:
+            questions = lesson.questions
+        for question in questions:
+            parts.append(question.text)
+            parts.extend(question.choices)
+    for source in TEXT_SOURCES:
+        if Path(source).exists():
+            with open(source, 'r', encoding='utf-8-sig') as f:
+                parts.append(f.read())
+    return html.unescape(TAG_PATTERN.sub(' ', '\n'.join(parts)))
+
+
+def used_codepoints(text):
+    """المحارف المستخدمة (بدون محارف التحكم)"""
+    return sorted({ord(ch) for ch in text if ord(ch) >= 0x20} | ALWAYS_INCLUDED)
+
+
+def parse_ranges(value):
+    """تحويل unicode-range (U+0600-06FF, U+200C) إلى مجموعة محارف"""
+    codepoints = set()
+    for part in value.split(','):
+        part = part.strip()[2:]
+        if '-' in part:
+            start, end = part.split('-')
+            codepoints.update(range(int(start, 16), int(end, 16) + 1))
+        elif part:
+            codepoints.add(int(part, 16))
+    return codepoints
+
+
+def format_ranges(codepoints):
+    """تحويل مجموعة محارف إلى unicode-range مختصر"""
+    ranges = []
+    for cp in sorted(codepoints):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ', '.join(f"U+{a:04X}" if a == b else f"U+{a:04X}-{b:04X}" for a, b in ranges)
+
+
+def source_faces():
+    """قواعد الخط في assets/vendor/cairo/cairo.css: (المجموعة، الوزن، الملف، المحارف)"""
+    if not FONT_CSS.exists():
+        raise FontSubsetError(f"الخط غير منسوخ محلياً ({FONT_CSS})؛ شغّل python vendor.py")
+    with open(FONT_CSS, 'r', encoding='utf-8') as f:
+        css = f.read()
+    faces = []
+    for subset, block in FACE_PATTERN.findall(css):
+        weight = WEIGHT_PATTERN.search(block)
+        src = SRC_PATTERN.search(block)
+        ranges = RANGE_PATTERN.search(block)
+        if weight and src:
+            faces.append((subset, int(weight.group(1)), FONT_CSS.parent / src.group(1),
+                          parse_ranges(ranges.group(1)) if ranges else None))
+    if not faces:
+        raise FontSubsetError(f"لا توجد قواعد @font-face في {FONT_CSS}")
+    return faces
+
+
+def _subset_face(source, weight, codepoints):
+    """تقليص ملف خط واحد إلى وزن ومحارف محددة -> بيانات woff2"""
+    font = TTFont(source)
+    if 'fvar' in font:
+        axes = {axis.axisTag: axis for axis in font['fvar'].axes}
+        if 'wght' in axes:
+            wght = axes['wght']
+            font = instancer.instantiateVariableFont(
+                font, {'wght': min(max(weight, wght.minValue), wght.maxValue)})
+    options = ft_subset.Options()
+    options.layout_features = ['*']  # الحفاظ على أشكال الحروف العربية المتصلة
+    options.flavor = 'woff2'
+    options.name_IDs = ['*']
+    subsetter = ft_subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    ft_subset.save_font(font, buffer, options)
+    return buffer.getvalue()
+
+
+def build_fonts(text):
+    """توليد الخطوط المقلّصة (أو إرجاعها من الذاكرة) -> (مجلد النتائج، القواعد)"""
+    faces = source_faces()
+    codepoints = used_codepoints(text)
+    parts = [json.dumps([FONT['subsets'], codepoints]).encode('utf-8')]
+    for _, weight, source, _ in faces:
+        with open(source, 'rb') as f:
+            parts.append(str(weight).encode('ascii') + f.read())
+    digest = content_digest(b'\0'.join(parts))[:12]
+    cache = CACHE_DIR / digest
+    manifest_path = cache / 'fonts.json'
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return cache, json.load(f)
+
+    if ft_subset is None:
+        raise FontSubsetError("fontTools غير مثبت (pip install fonttools brotli)")
+
+    cache.mkdir(parents=True, exist_ok=True)
+    rules = []
+    for subset, weight, source, ranges in faces:
+        wanted = set(codepoints) & ranges if ranges else set(codepoints)
+        if not wanted:
+            continue
+        try:
+            data = _subset_face(source, weight, wanted)
+        except ImportError as e:  # woff2 يتطلب brotli
+            raise FontSubsetError(f"تعذر كتابة woff2: {e}")
+        name = f"cairo-{weight}-{subset}.{content_digest(data)[:10]}.woff2"
+        with open(cache / name, 'wb') as f:
+            f.write(data)
+        rules.append({'weight': weight, 'file': name, 'unicode_range': format_ranges(wanted)})
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(rules, f, ensure_ascii=False, indent=2)
+    return cache, rules
+
+
+def font_face_css(rules, prefix=''):
+    """قواعد @font-face المضمّنة لملفات الخط المقلّصة"""
+    return '\n'.join(
+        f"@font-face{{font-family:'Cairo';font-style:normal;font-weight:{rule['weight']};"
+        f"font-display:swap;src:url({prefix}{(FONTS_DIR / rule['file']).as_posix()}) format('woff2');"
+        f"unicode-range:{rule['unicode_range']}}}"
+        for rule in rules)
+
+
+def install_fonts(out_dir):
+    """نسخ الخطوط المقلّصة إلى dist/assets/fonts/ وإرجاع قواعدها (أو None)"""
+    try:
+        cache, rules = build_fonts(collect_text())
+    except (FontSubsetError, OSError) as e:
+        print(f"ℹ️ تعذر تقليص الخط ({e})؛ سيُستخدم ملف الخط الكامل")
+        return None
+
+    target_dir = Path(out_dir) / FONTS_DIR
+    target_dir.mkdir(parents=True, exist_ok=True)
+    names = {rule['file'] for rule in rules}
+    for name in names:
+        if not (target_dir / name).exists():
+            shutil.copy2(cache / name, target_dir / name)
+    for old in target_dir.glob('cairo-*.woff2'):
+        if old.name not in names:
+            old.unlink()
+    return rules
+
+
+def font_html(rules, prefix=''):
+    """وسم الخط في رأس الصفحة: قواعد @font-face مضمّنة، أو رابط الخط الكامل"""
+    if not rules:
+        return FONT_LINK
+    return f"<style>\n{font_face_css(rules, prefix)}\n  </style>"
+
+
+def inline_fonts(page, rules, prefix=''):
+    """استبدال رابط ملف الخط في صفحة موجودة بقواعد @font-face مضمّنة"""
+    if not rules:
+        return page
+    style = font_html(rules, prefix)
+    return FONT_LINK_PATTERN.sub(lambda _: style, page, count=1)
+
+
+def main():
+    """توليد الخطوط المقلّصة وعرض مقارنة الأحجام"""
+    text = collect_text()
+    print(f"🔤 المحارف المستخدمة: {len(used_codepoints(text))}")
+    try:
+        faces = source_faces()
+        cache, rules = build_fonts(text)
+    except FontSubsetError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    original = sum(source.stat().st_size for source in {face[2] for face in faces})
+    subset = sum((cache / rule['file']).stat().st_size for rule in rules)
+    for rule in rules:
+        print(f"✅ {rule['file']}: {(cache / rule['file']).stat().st_size / 1024:.1f} KB")
+    print(f"📉 {original / 1024:.0f} KB ← {subset / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+أجيال الموقع الكاملة مع تبديل ذري وتراجع فوري
+Immutable whole-site generations with an atomic `current` symlink and O(1) rollback
+
+- كل بناء (build.py) ينشر مجلد العمل .build/ كجيل كامل في .generations/dist/، وكل تشغيل
+  لسكربتات الإصلاح (patch_engine.py) ينشر مدخلات البناء (الصفحات والقالب وبنك الأسئلة والدروس
+  والوسائط) كجيل في .generations/source/
+- dist رابط رمزي ثابت إلى .generations/dist/current، فما يُنشر ويُعرض هو الجيل الحالي دائماً
+  والتراجع يغير الموقع المنشور فوراً
+- الجيل مجلد للقراءة فقط لا يتغير بعد نشره، ومعه بيان .generation.json (المسار -> البصمة)
+- الرابط الرمزي current يشير إلى الجيل المعروض ويُبدّل ذرياً (رابط مؤقت ثم os.replace)،
+  فالتراجع تبديل رابط واحد مهما كان حجم الموقع
+- الملفات غير المتغيرة روابط صلبة (hard links) لنفس الملف في الأجيال السابقة، فالجيل
+  الجديد لا يكلف إلا الملفات التي تغيرت فعلاً
+- سياسة الاحتفاظ: آخر KEEP_GENERATIONS جيل إضافة إلى الجيل الحالي، والباقي يُحذف
+
+الاستخدام:
+    python generations.py list [dist|source]             # الأجيال والجيل الحالي
+    python generations.py publish [dist|source]          # نشر جيل جديد يدوياً
+    python generations.py rollback [dist|source] [اسم]   # الرجوع إلى الجيل السابق (أو المحدد)
+    python generations.py restore [اسم]                  # إعادة ملفات المشروع إلى جيل من المصدر
+    python generations.py gc [--keep N]                  # حذف الأجيال القديمة
+"""
+
+import json
+import os
+from fnmatch import fnmatch
+import shutil
+import stat
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from parse_cache import content_digest
+
+try:
+    import fcntl
+except ImportError:  # Windows: بدون قفل بين العمليات
+    fcntl = None
+
+GENERATIONS_DIR = Path('.generations')
+CURRENT_LINK = 'current'
+MANIFEST_NAME = '.generation.json'
+
+# عدد الأجيال المحتفظ بها لكل نوع (إضافة إلى الجيل الحالي)؛ يمكن تغييره بـ SITE_GENERATIONS_KEEP
+KEEP_GENERATIONS = int(os.environ.get('SITE_GENERATIONS_KEEP', 5))
+
+# مصدر كل نوع من الأجيال: (المجلد، الأنماط أو None لكل الملفات)
+SOURCES = {
+    'dist': (Path('.build'), None),
+    'source': (Path('.'), ('index.html', 'lesson_template.html', 'question_bank.sqlite', 'assets', 'unit-*')),
+}
+
+# المسار المعروض لكل نوع: رابط رمزي ثابت إلى current (المصدر يُستعاد بالأمر restore)
+SERVED = {'dist': Path('dist')}
+
+
+class GenerationError(Exception):
+    """خطأ في أجيال الموقع"""
+
+
+def _kind_dir(kind, root=GENERATIONS_DIR):
+    if kind not in SOURCES:
+        raise GenerationError(f"نوع غير معروف: {kind} (المتاح: {', '.join(SOURCES)})")
+    return Path(root) / kind
+
+
+@contextmanager
+def _lock(kind_dir):
+    """قفل حصري على أجيال نوع واحد أثناء النشر أو التبديل أو الحذف"""
+    kind_dir.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    with open(kind_dir / '.lock', 'a') as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def site_files(source, patterns=None):
+    """ملفات الموقع في source: المسار النسبي -> المسار (بدون الملفات والمجلدات المخفية)"""
+    source = Path(source)
+    roots = [source] if patterns is None else [p for pattern in patterns for p in sorted(source.glob(pattern))]
+    files = {}
+    for root in roots:
+        paths = [root] if root.is_file() else sorted(p for p in root.rglob('*') if p.is_file())
+        for path in paths:
+            relative = path.relative_to(source)
+            if any(part.startswith('.') or part == '__pycache__' for part in relative.parts):
+                continue
+            files[relative.as_posix()] = path
+    return files
+
+
+def _order(path):
+    """مفتاح ترتيب جيل: رقمه التسلسلي ثم وقت إنشائه (الاسم لا يكفي داخل الثانية نفسها)"""
+    with open(path / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    return manifest.get('sequence', 0), manifest.get('created', ''), path.name
+
+
+def generations(kind, root=GENERATIONS_DIR):
+    """أسماء أجيال نوع من الأقدم إلى الأحدث (حسب الرقم التسلسلي في البيان)"""
+    kind_dir = _kind_dir(kind, root)
+    if not kind_dir.is_dir():
+        return []
+    paths = [p for p in kind_dir.iterdir()
+             if p.is_dir() and not p.is_symlink() and (p / MANIFEST_NAME).exists()]
+    return [key[-1] for key in sorted(_order(p) for p in paths)]
+
+
+def current(kind, root=GENERATIONS_DIR):
+    """اسم الجيل الحالي أو None"""
+    link = _kind_dir(kind, root) / CURRENT_LINK
+    return os.readlink(link) if link.is_symlink() else None
+
+
+def load_manifest(kind, name, root=GENERATIONS_DIR):
+    """بيان جيل: الاسم والوقت والمصدر والمسار -> البصمة"""
+    path = _kind_dir(kind, root) / name / MANIFEST_NAME
+    if not path.exists():
+        raise GenerationError(f"لا يوجد جيل {kind}/{name} (python generations.py list {kind})")
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def switch(kind, name, root=GENERATIONS_DIR):
+    """تبديل ذري للرابط current إلى الجيل name"""
+    kind_dir = _kind_dir(kind, root)
+    if not (kind_dir / name / MANIFEST_NAME).exists():
+        raise GenerationError(f"لا يوجد جيل {kind}/{name}")
+    tmp = kind_dir / f".{CURRENT_LINK}.{os.getpid()}.tmp"
+    if tmp.is_symlink():
+        tmp.unlink()
+    os.symlink(name, tmp)
+    os.replace(tmp, kind_dir / CURRENT_LINK)
+    serve(kind, root)
+
+
+def serve(kind, root=GENERATIONS_DIR):
+    """إنشاء الرابط المعروض (dist -> .generations/dist/current) إن لم يكن موجوداً"""
+    link = SERVED.get(kind)
+    if link is None:
+        return
+    target = os.path.relpath(_kind_dir(kind, root) / CURRENT_LINK, link.parent)
+    if link.is_symlink():
+        if os.readlink(link) == target:
+            return
+    elif link.exists():
+        raise GenerationError(f"{link} موجود وليس رابطاً رمزياً؛ انقله أو احذفه ليصبح رابطاً إلى الجيل الحالي")
+    tmp = link.with_name(f".{link.name}.{os.getpid()}.tmp")
+    if tmp.is_symlink():
+        tmp.unlink()
+    os.symlink(target, tmp)
+    os.replace(tmp, link)
+
+
+def _link_or_copy(existing, path, target):
+    """ربط صلب بملف مطابق من جيل سابق، وإلا نسخ -> True إذا رُبط"""
+    if existing is not None:
+        try:
+            os.link(existing, target)
+            return True
+        except OSError:  # نظام ملفات بدون روابط صلبة أو أجهزة مختلفة
+            pass
+    shutil.copy2(path, target)
+    os.chmod(target, stat.S_IMODE(os.stat(target).st_mode) & ~0o222)
+    return False
+
+
+def publish(kind, label='', source=None, root=GENERATIONS_DIR, keep=KEEP_GENERATIONS):
+    """نشر جيل جديد من مصدر النوع (أو من source) وجعله الحالي -> (اسم الجيل، المنسوخة، المربوطة)
+
+    إذا كان المحتوى مطابقاً للجيل الحالي لا يُنشأ جيل جديد ويُرجع (الاسم الحالي، 0، 0).
+    """
+    kind_dir = _kind_dir(kind, root)
+    default_source, patterns = SOURCES[kind]
+    source = Path(source or default_source)
+    files = site_files(source, patterns)
+    if not files:
+        raise GenerationError(f"لا توجد ملفات في {source}")
+    digests = {relative: content_digest(path.read_bytes()) for relative, path in files.items()}
+
+    with _lock(kind_dir):
+        active = current(kind, root)
+        if active and load_manifest(kind, active, root)['files'] == digests:
+            return active, 0, 0
+
+        # بصمة -> ملف موجود في أي جيل محتفظ به (الأحدث أولاً)
+        known = {}
+        names = generations(kind, root)
+        for name in reversed(names):
+            for relative, digest in load_manifest(kind, name, root)['files'].items():
+                known.setdefault(digest, kind_dir / name / relative)
+        # رقم تسلسلي متزايد يُحسب تحت القفل، فترتيب الأجيال لا يعتمد على الساعة أو الاسم
+        sequence = load_manifest(kind, names[-1], root).get('sequence', len(names)) + 1 if names else 1
+
+        name = datetime.now().strftime('%Y%m%d-%H%M%S') + (f"-{label}" if label else '')
+        base, n = name, 1
+        while (kind_dir / name).exists():
+            n += 1
+            name = f"{base}-{n}"
+        staging = kind_dir / f".{name}.tmp"
+        copied = linked = 0
+        try:
+            for relative, path in files.items():
+                target = staging / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if _link_or_copy(known.get(digests[relative]), path, target):
+                    linked += 1
+                else:
+                    copied += 1
+                    known[digests[relative]] = target
+            manifest = {'name': name, 'kind': kind, 'sequence': sequence,
+                        'created': datetime.now().isoformat(timespec='microseconds'),
+                        'source': str(source), 'patterns': patterns, 'files': digests}
+            with open(staging / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=1)
+            # الجيل يظهر باسمه النهائي كاملاً أو لا يظهر
+            os.replace(staging, kind_dir / name)
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging)
+        switch(kind, name, root)
+        collect_garbage(kind, keep, root)
+    return name, copied, linked
+
+
+def rollback(kind, name=None, root=GENERATIONS_DIR):
+    """الرجوع إلى الجيل السابق للحالي (أو إلى name) بتبديل الرابط فقط -> اسم الجيل"""
+    kind_dir = _kind_dir(kind, root)
+    with _lock(kind_dir):
+        names = generations(kind, root)
+        if name is None:
+            active = current(kind, root)
+            older = names[:names.index(active)] if active in names else []
+            if not older:
+                raise GenerationError(f"لا يوجد جيل أقدم من {active} في {kind}")
+            name = older[-1]
+        switch(kind, name, root)
+    return name
+
+
+def collect_garbage(kind, keep=KEEP_GENERATIONS, root=GENERATIONS_DIR):
+    """حذف الأجيال الأقدم من آخر keep جيل (عدا الحالي) -> الأسماء المحذوفة
+
+    يُستدعى والقفل مأخوذ (publish أو الأمر gc).
+    """
+    kind_dir = _kind_dir(kind, root)
+    names = generations(kind, root)
+    active = current(kind, root)
+    removed = [name for name in names[:max(len(names) - keep, 0)] if name != active]
+    for name in removed:
+        shutil.rmtree(kind_dir / name)
+    return removed
+
+
+def restore(name=None, root=GENERATIONS_DIR):
+    """إعادة ملفات المشروع إلى جيل من المصدر (الحالي افتراضياً) -> (المنسوخة، المحذوفة)
+
+    الملفات التي تقع ضمن أنماط الجيل وليست فيه تُحذف، فالمشروع يطابق الجيل تماماً.
+    """
+    name = name or current('source', root)
+    if name is None:
+        raise GenerationError("لا توجد أجيال للمصدر")
+    manifest = load_manifest('source', name, root)
+    source, patterns = SOURCES['source']
+    if 'patterns' in manifest:
+        patterns = manifest['patterns']
+    else:  # جيل أقدم من تسجيل الأنماط: لا يُحذف إلا ما يغطيه فعلاً
+        tops = {relative.split('/')[0] for relative in manifest['files']}
+        patterns = [p for p in patterns if any(fnmatch(top, p) for top in tops)]
+    changed = []
+    for relative, digest in manifest['files'].items():
+        target = source / relative
+        if target.exists() and content_digest(target.read_bytes()) == digest:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        shutil.copyfile(_kind_dir('source', root) / name / relative, tmp)
+        os.replace(tmp, target)
+        changed.append(relative)
+    removed = []
+    for relative, path in site_files(source, patterns).items():
+        if relative in manifest['files']:
+            continue
+        path.unlink()
+        removed.append(relative)
+        # حذف المجلدات التي أصبحت فارغة (مثل درس لم يكن في الجيل)
+        parent = path.parent
+        while parent != source and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+    return changed, removed
+
+
+def disk_usage(kind, root=GENERATIONS_DIR):
+    """(الحجم الظاهري لكل الأجيال، الحجم الفعلي بعد احتساب الروابط الصلبة مرة واحدة)"""
+    kind_dir = _kind_dir(kind, root)
+    apparent = 0
+    inodes = {}
+    for name in generations(kind, root):
+        for path in (kind_dir / name).rglob('*'):
+            if path.is_file():
+                info = path.stat()
+                apparent += info.st_size
+                inodes[(info.st_dev, info.st_ino)] = info.st_size
+    return apparent, sum(inodes.values())
+
+
+def main():
+    """الدالة الرئيسية"""
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    command, args = args[0], args[1:]
+    keep = KEEP_GENERATIONS
+    if '--keep' in args:
+        i = args.index('--keep')
+        keep = int(args[i + 1])
+        del args[i:i + 2]
+    kinds = [args.pop(0)] if args and args[0] in SOURCES else []
+    kind = kinds[0] if kinds else 'dist'
+
+    try:
+        if command == 'list':
+            for kind in kinds or list(SOURCES):
+                active = current(kind)
+                print(f"📚 {kind}:")
+                for name in generations(kind):
+                    manifest = load_manifest(kind, name)
+                    marker = '👉' if name == active else '  '
+                    print(f"   {marker} {name:<32} {len(manifest['files']):>4} ملف")
+                apparent, actual = disk_usage(kind)
+                if apparent:
+                    print(f"   💾 {apparent / 1024:.0f} KB ظاهرياً، {actual / 1024:.0f} KB فعلياً (روابط صلبة)")
+        elif command == 'publish':
+            name, copied, linked = publish(kind, 'manual', keep=keep)
+            print(f"🚀 {kind}/{name} (منسوخ {copied}، مربوط {linked})")
+        elif command == 'rollback':
+            name = rollback(kind, args[0] if args else None)
+            print(f"⏪ {kind}/current -> {name}")
+        elif command == 'restore':
+            changed, removed = restore(args[0] if args else None)
+            for path in changed:
+                print(f"♻️  {path}")
+            for path in removed:
+                print(f"🗑️  {path}")
+            print(f"✅ تم استرجاع {len(changed)} ملف وحذف {len(removed)}")
+        elif command == 'gc':
+            for kind in kinds or list(SOURCES):
+                with _lock(_kind_dir(kind)):
+                    for name in collect_garbage(kind, keep):
+                        print(f"🗑️  {kind}/{name}")
+        else:
+            print(f"❌ أمر غير معروف: {command}")
+            print(__doc__)
+            sys.exit(1)
+    except GenerationError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+تعديل HTML حسب البنية: تحديد الأقسام بمحددات CSS واستبدالها بالمواضع
+Structure-aware HTML editing: one streaming tokenizer pass, selector lookup, offset splices
+
+- المُرمِّز يمر على النص مرة واحدة: الوسوم والتعليقات و <!DOCTYPE>، ومحتوى <script> و
+  <style> و <textarea> و <title> يُتخطى كنص خام فلا تُحسب الوسوم داخل سلاسل JavaScript
+- مكدس العناصر المفتوحة يربط كل وسم فتح بوسم إغلاقه الصحيح مهما تداخلت عناصر بنفس
+  الاسم (وهذا ما يخطئ فيه نمط مثل <div[^>]*>.*?</div>)، مع الوسوم الفارغة (br، img…)
+  والإغلاق الضمني لـ <p> و <li> و <option>
+- المحددات المدعومة: tag و .class و #id و [attr] و [attr=v] و [attr*=v] و [attr^=v]
+  و [attr$=v] وتجميعها (section.card#quiz) والسلالة بمسافة (footer .credit) والقوائم بفاصلة
+- التعديلات (استبدال، إدراج قبل/بعد، داخل البداية/النهاية، حذف) تُجمع ثم تُطبق بتقطيع
+  واحد للنص حسب المواضع، بدون إعادة بناء الشجرة أو مسح النص لكل نمط
+
+الاستخدام:
+    python html_edit.py unit-1-cells/lesson-1-2/index.html "#quiz"
+    python html_edit.py unit-1-cells/lesson-1-2/index.html "section.card" "footer"
+    python html_edit.py --check      # التحقق من أن المرور يبقى خطياً مع مدخلات مشوهة
+"""
+
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+    'param', 'source', 'track', 'wbr',
+}
+# عناصر محتواها نص خام لا يحتوي وسوماً
+RAW_TEXT_ELEMENTS = {'script', 'style', 'textarea', 'title'}
+# وسم فتح من نفس الاسم يغلق العنصر السابق ضمنياً
+IMPLIED_CLOSE = {'p': {'p'}, 'li': {'li'}, 'option': {'option'}, 'dt': {'dt', 'dd'}, 'dd': {'dt', 'dd'}}
+
+# لا يقبل اسم الخاصية ولا القيمة بدون علامات تنصيص المحرف < ، فكل < غير مغلق يفشل فوراً
+# بدلاً من مسح النص حتى نهايته (وإلا صار المرور تربيعياً مع '<a <a <a …')
+_ATTR = r'''[^\s"'<>/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'=<>`]+))?'''
+TOKEN_PATTERN = re.compile(
+    r'<(?:'
+    r'(?P<comment>!--.*?(?:--\s*>|\Z))'  # التعليق غير المغلق يمتد إلى نهاية النص كما في المتصفح
+    r'|(?P<decl>[!?][^<>]*)>'
+    r'|/(?P<end>[a-zA-Z][\w:-]*)\s*>'
+    r'|(?P<start>[a-zA-Z][\w:-]*)(?P<attrs>(?:\s+' + _ATTR + r')*)\s*(?P<self>/?)>'
+    r')',
+    re.DOTALL)
+ATTR_PATTERN = re.compile(r'''([^\s"'<>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?''')
+RAW_END = {name: re.compile(rf'</{name}\s*>', re.IGNORECASE) for name in RAW_TEXT_ELEMENTS}
+
+SELECTOR_PART = re.compile(
+    r'(?P<tag>[a-zA-Z][\w-]*|\*)'
+    r'|\.(?P<cls>[\w-]+)'
+    r'|#(?P<id>[\w-]+)'
+    r'''|\[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[*^$~|]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]''')
+
+
+class HTMLEditError(ValueError):
+    """خطأ في محدد أو في تعديلات متداخلة"""
+
+
+@dataclass
+class Element:
+    """عنصر في النص الأصلي: وسم الفتح [start, open_end) ووسم الإغلاق [close_start, end)
+
+    للعناصر الفارغة أو غير المغلقة close_start == end == open_end أو نهاية الأب.
+    """
+    tag: str
+    attrs: Dict[str, str]
+    start: int
+    open_end: int
+    close_start: int = -1
+    end: int = -1
+    parent: Optional['Element'] = field(default=None, repr=False)
+
+    @property
+    def classes(self):
+        return self.attrs.get('class', '').split()
+
+    def outer(self, html):
+        """نص العنصر كاملاً"""
+        return html[self.start:self.end]
+
+    def inner(self, html):
+        """محتوى العنصر بين وسمي الفتح والإغلاق"""
+        return html[self.open_end:self.close_start]
+
+    def contains(self, other):
+        """هل العنصر other داخل هذا العنصر؟"""
+        return self.start <= other.start and other.end <= self.end and self is not other
+
+
+def parse_attrs(text):
+    """خصائص وسم الفتح -> قاموس (الأسماء بأحرف صغيرة)"""
+    attrs = {}
+    for name, dq, sq, bare in ATTR_PATTERN.findall(text):
+        attrs.setdefault(name.lower(), dq or sq or bare)
+    return attrs
+
+
+def tokenize(html):
+    """مرور واحد على النص: ('start', الاسم، الخصائص، البداية، النهاية، مغلق ذاتياً) أو ('end', الاسم، البداية، النهاية)"""
+    pos = 0
+    while True:
+        match = TOKEN_PATTERN.search(html, pos)
+        if not match:
+            return
+        pos = match.end()
+        name = match.group('start')
+        if name:
+            name = name.lower()
+            yield 'start', name, parse_attrs(match.group('attrs')), match.start(), pos, bool(match.group('self'))
+            if name in RAW_TEXT_ELEMENTS and not match.group('self'):
+                close = RAW_END[name].search(html, pos)
+                if close is None:
+                    return
+                yield 'end', name, close.start(), close.end()
+                pos = close.end()
+        elif match.group('end'):
+            yield 'end', match.group('end').lower(), match.start(), pos
+
+
+def elements(html):
+    """جميع العناصر بترتيب ظهورها مع مواضع الإغلاق الصحيحة (مرور خطي واحد)"""
+    found = []
+    stack: List[Element] = []
+
+    def close(element, close_start, end):
+        element.close_start, element.end = close_start, end
+
+    for token in tokenize(html):
+        if token[0] == 'start':
+            _, name, attrs, start, end, self_closing = token
+            while stack and stack[-1].tag in IMPLIED_CLOSE.get(name, ()):
+                close(stack.pop(), start, start)
+            element = Element(name, attrs, start, end, parent=stack[-1] if stack else None)
+            found.append(element)
+            if self_closing or name in VOID_ELEMENTS:
+                close(element, end, end)
+            else:
+                stack.append(element)
+        else:
+            _, name, start, end = token
+            if not any(open_element.tag == name for open_element in stack):
+                continue  # وسم إغلاق بلا فتح: يُتجاهل كما يفعل المتصفح
+            while stack:
+                element = stack.pop()
+                if element.tag == name:
+                    close(element, start, end)
+                    break
+                close(element, start, start)
+    for element in stack:
+        close(element, len(html), len(html))
+    return found
+
+
+def _compound(text):
+    """تحليل محدد مركب (مثل section.card#quiz) -> قائمة شروط"""
+    conditions = []
+    pos = 0
+    while pos < len(text):
+        match = SELECTOR_PART.match(text, pos)
+        if not match or match.end() == pos:
+            raise HTMLEditError(f"محدد غير مدعوم: {text[pos:]!r}")
+        if match.group('tag'):
+            if match.group('tag') != '*':
+                conditions.append(('tag', match.group('tag').lower(), None))
+        elif match.group('cls'):
+            conditions.append(('class', match.group('cls'), None))
+        elif match.group('id'):
+            conditions.append(('attr', 'id', ('=', match.group('id'))))
+        else:
+            value = next((v for v in match.group('dq', 'sq', 'bare') if v is not None), None)
+            conditions.append(('attr', match.group('attr').lower(),
+                               (match.group('op'), value) if match.group('op') else None))
+        pos = match.end()
+    return conditions
+
+
+def parse_selector(selector):
+    """محدد CSS -> قائمة بدائل (فاصلة)، كل بديل سلسلة مركبات (سلالة بمسافة)"""
+    alternatives = []
+    for alternative in selector.split(','):
+        chain = [_compound(part) for part in alternative.split()]
+        if not chain:
+            raise HTMLEditError(f"محدد فارغ: {selector!r}")
+        alternatives.append(chain)
+    return alternatives
+
+
+def _matches_compound(element, conditions):
+    for kind, name, test in conditions:
+        if kind == 'tag':
+            if element.tag != name:
+                return False
+        elif kind == 'class':
+            if name not in element.classes:
+                return False
+        else:
+            if name not in element.attrs:
+                return False
+            if test is None:
+                continue
+            op, value = test
+            actual = element.attrs[name]
+            if not {'=': actual == value,
+                    '*=': value in actual,
+                    '^=': actual.startswith(value),
+                    '$=': actual.endswith(value),
+                    '~=': value in actual.split(),
+                    '|=': actual == value or actual.startswith(value + '-')}[op]:
+                return False
+    return True
+
+
+def _matches(element, chain):
+    """مطابقة سلسلة سلالة: آخر مركب على العنصر والبقية على أسلافه بالترتيب"""
+    if not _matches_compound(element, chain[-1]):
+        return False
+    ancestor = element.parent
+    for conditions in reversed(chain[:-1]):
+        while ancestor is not None and not _matches_compound(ancestor, conditions):
+            ancestor = ancestor.parent
+        if ancestor is None:
+            return False
+        ancestor = ancestor.parent
+    return True
+
+
+def select(html, selector, found=None):
+    """العناصر المطابقة للمحدد بترتيب ظهورها"""
+    alternatives = parse_selector(selector)
+    found = elements(html) if found is None else found
+    return [element for element in found if any(_matches(element, chain) for chain in alternatives)]
+
+
+def outermost(matches):
+    """حذف العناصر الواقعة داخل عنصر آخر من القائمة (لتجنب تعديلات متداخلة)"""
+    result = []
+    for element in matches:
+        if not result or not result[-1].contains(element):
+            result.append(element)
+    return result
+
+
+class HTMLEditor:
+    """مستند HTML يُرمَّز مرة واحدة وتُجمع تعديلاته ثم تُطبق بتقطيع واحد
+
+        editor = HTMLEditor(content)
+        quiz = editor.select_one('#quiz')
+        editor.insert_before(quiz, objectives_html)
+        content = editor.apply()
+    """
+
+    def __init__(self, html):
+        self.html = html
+        self.elements = elements(html)
+        self.edits: List[Tuple[int, int, int, str]] = []  # (البداية، النهاية، الترتيب، النص)
+
+    def select(self, selector):
+        """جميع العناصر المطابقة"""
+        return select(self.html, selector, self.elements)
+
+    def select_one(self, selector):
+        """أول عنصر مطابق أو None"""
+        matches = self.select(selector)
+        return matches[0] if matches else None
+
+    def text(self, element):
+        """محتوى العنصر الداخلي"""
+        return element.inner(self.html)
+
+    def splice(self, start, end, text):
+        """استبدال المدى [start, end) من النص الأصلي بالنص text"""
+        self.edits.append((start, end, len(self.edits), text))
+
+    def replace(self, element, text):
+        self.splice(element.start, element.end, text)
+
+    def replace_inner(self, element, text):
+        self.splice(element.open_end, element.close_start, text)
+
+    def insert_before(self, element, text):
+        self.splice(element.start, element.start, text)
+
+    def insert_after(self, element, text):
+        self.splice(element.end, element.end, text)
+
+    def prepend(self, element, text):
+        """إدراج في بداية محتوى العنصر"""
+        self.splice(element.open_end, element.open_end, text)
+
+    def append(self, element, text):
+        """إدراج في نهاية محتوى العنصر (قبل وسم الإغلاق)"""
+        self.splice(element.close_start, element.close_start, text)
+
+    def remove(self, element):
+        self.splice(element.start, element.end, '')
+
+    def apply(self):
+        """تطبيق جميع التعديلات -> النص الجديد
+
+        الإدراجات في نفس الموضع تُطبق بترتيب إضافتها، والاستبدالات المتداخلة خطأ.
+        """
+        parts = []
+        pos = 0
+        for start, end, _, text in sorted(self.edits):
+            if start < pos:
+                raise HTMLEditError(f"تعديلات متداخلة عند الموضع {start}")
+            parts.append(self.html[pos:start])
+            parts.append(text)
+            pos = end
+        parts.append(self.html[pos:])
+        return ''.join(parts)
+
+
+# مدخلات مشوهة كانت تجعل المرور تربيعياً (كل < غير مغلق يمسح النص حتى نهايته)
+ADVERSARIAL_INPUTS = ['<a ', '<a b ', '<a b=c ', '<a b="', '<!', '<?', '<!--', '</a ']
+
+
+def check_linear(size=4000, growth=4, max_ratio=8.0):
+    """زمن elements() لكل مدخل مشوه بحجمين (size و size*growth) -> المدخلات التي نما زمنها أسرع من الخطي
+
+    النمو الخطي يضاعف الزمن growth مرة تقريباً، والتربيعي growth² مرة.
+    """
+    slow = []
+    for unit in ADVERSARIAL_INPUTS:
+        times = []
+        for n in (size, size * growth):
+            start = time.perf_counter()
+            elements(unit * n)
+            times.append(time.perf_counter() - start)
+        ratio = times[1] / max(times[0], 1e-4)
+        if ratio > max_ratio:
+            slow.append((unit, times[1], ratio))
+    return slow
+
+
+def main():
+    """عرض العناصر المطابقة للمحددات في ملف"""
+    if sys.argv[1:] == ['--check']:
+        slow = check_linear()
+        for unit, seconds, ratio in slow:
+            print(f"❌ {unit!r}: {seconds:.2f} ث (نمو ×{ratio:.0f} لمدخل أكبر ×4)")
+        if slow:
+            sys.exit(1)
+        print(f"✅ المرور خطي مع {len(ADVERSARIAL_INPUTS)} مدخل مشوه")
+        return
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        html = f.read()
+    found = elements(html)
+    for selector in sys.argv[2:]:
+        try:
+            matches = select(html, selector, found)
+        except HTMLEditError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"🔎 {selector}: {len(matches)} عنصر")
+        for element in matches:
+            line = html.count('\n', 0, element.start) + 1
+            opening = html[element.start:element.open_end]
+            print(f"   السطر {line:<5} [{element.start}–{element.end}] {opening[:90]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+محلل خطي لقيم JavaScript الحرفية المستخدمة في بنوك الأسئلة
+Linear-time tokenizer/parser for the JS object-literal subset used by question banks
+
+يدعم المجموعة الفرعية المستخدمة في الدروس:
+    {q:"…", c:["…", …], a:1}
+    {question:"…", answers:[…], correct:1}
+أي: المصفوفات، الكائنات (بمفاتيح معرّفة أو نصية)، النصوص بعلامات ' أو " أو `
+(بدون ${})، الأرقام، true/false/null، والتعليقات // و /* */.
+
+- كل محرف يُقرأ عدداً ثابتاً من المرات: O(n) على أي مدخل، بدون تراجع متشعب
+- المحلل يعمل بمكدس صريح بدلاً من الاستدعاء الذاتي، فلا يتأثر بعمق التداخل
+- الأخطاء تُرفع كـ JSLiteralError مع الموضع والسطر والعمود
+
+الاستخدام:
+    python js_literal.py <ملف.html> [اسم_المتغير]
+"""
+
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+# أنماط القيم البسيطة. النصوص مكتوبة بصيغة "الحلقة المفكوكة"
+# [^"\\]*(?:\\.[^"\\]*)* لضمان المسح الخطي بدون تراجع
+_DQ = r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"'
+_SQ = r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'"
+_BT = r'`[^`\\$]*(?:(?:\\.|\$(?!\{))[^`\\$]*)*`'
+_NUMBER = r'-?(?:0[xX][0-9a-fA-F]+|(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)'
+_IDENT = r'[A-Za-z_$][\w$]*'
+
+# نمط موحد للرموز: كل فرع يبدأ بمحرف مميز، والفرع الأخير يلتقط أي محرف غير متوقع
+TOKEN_PATTERN = re.compile(
+    r'(?:\s+|//[^\n]*|/\*.*?\*/)*'
+    r'(?:'
+    r'(?P<dq>' + _DQ + ')'
+    r'|(?P<sq>' + _SQ + ')'
+    r'|(?P<bt>' + _BT + ')'
+    r'|(?P<number>' + _NUMBER + ')'
+    r'|(?P<ident>' + _IDENT + ')'
+    r'|(?P<punct>[\[\]{},:])'
+    r'|(?P<bad_comment>/\*)'
+    r'|(?P<bad_string>["\'`])'
+    r'|(?P<end>\Z)'
+    r'|(?P<error>.)'
+    r')',
+    re.DOTALL)
+
+# المسار السريع: كائن مسطح كامل (قيمه نصوص/أرقام/مصفوفات بسيطة) يُطابق بعملية واحدة.
+# كل تكرار يبدأ بمحرف مميز ويُختم بفاصلة أو '}'، ويتوقف النمط عند أول '{' داخلية،
+# فلا يُمسح أي جزء من المدخل بالمسار السريع أكثر من مرة.
+_SIMPLE = '(?:' + _DQ + '|' + _SQ + '|' + _NUMBER + r'|(?:true|false|null|undefined)(?![\w$]))'
+_ARRAY = r'\[\s*(?:' + _SIMPLE + r'\s*(?:,\s*|(?=\])))*\]'
+_KEY = '(?:' + _IDENT + '|' + _DQ + '|' + _SQ + ')'
+FLAT_OBJECT_PATTERN = re.compile(
+    r'\{\s*(?:' + _KEY + r'\s*:\s*(?:' + _SIMPLE + '|' + _ARRAY + r')\s*(?:,\s*|(?=\})))*\}')
+_DQ_BODY = r'"([^"\\\n]*(?:\\.[^"\\\n]*)*)"'
+_SQ_BODY = r"'([^'\\\n]*(?:\\.[^'\\\n]*)*)'"
+_OTHER = '(' + _NUMBER + r'|(?:true|false|null|undefined)(?![\w$]))'
+# مجموعات العضو: (مفتاح معرّف، مفتاح "…"، مفتاح '…'، قيمة "…"، قيمة '…'، رقم/كلمة، مصفوفة)
+MEMBER_PATTERN = re.compile(
+    '(?:(' + _IDENT + ')|' + _DQ_BODY + '|' + _SQ_BODY + r')\s*:\s*'
+    '(?:' + _DQ_BODY + '|' + _SQ_BODY + '|' + _OTHER + '|(' + _ARRAY + '))')
+# مجموعات العنصر: (نص "…"، نص '…'، رقم/كلمة)
+ITEM_PATTERN = re.compile(_DQ_BODY + '|' + _SQ_BODY + '|' + _OTHER)
+
+ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+}
+ESCAPE_PATTERN = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)', re.DOTALL)
+KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+# الحد الأقصى لطول الرقم (تجنباً لتحويل أعداد ضخمة بتكلفة غير خطية)
+MAX_NUMBER_LENGTH = 64
+
+
+class JSLiteralError(ValueError):
+    """خطأ في تحليل قيمة JavaScript حرفية"""
+
+    def __init__(self, message, source, pos):
+        self.message = message
+        self.pos = pos
+        self.line = source.count('\n', 0, pos) + 1
+        self.column = pos - (source.rfind('\n', 0, pos) + 1) + 1
+        super().__init__(f"{message} (السطر {self.line}، العمود {self.column}، الموضع {pos})")
+
+
+class Token(NamedTuple):
+    """رمز واحد من المدخل"""
+    kind: str
+    value: Any
+    start: int
+    end: int
+
+
+@dataclass
+class LiteralSpan:
+    """قيمة محللة مع موقعها في النص الأصلي [start, end)"""
+    value: Any
+    start: int
+    end: int
+
+
+def _unescape(body):
+    """فك ترميز محارف الهروب داخل نص"""
+    if '\\' not in body:
+        return body
+
+    def replace(match):
+        esc = match.group(1)
+        if esc[0] == 'u' and len(esc) > 1:
+            return chr(int(esc[2:-1] if esc[1] == '{' else esc[1:], 16))
+        if esc[0] == 'x' and len(esc) > 1:
+            return chr(int(esc[1:], 16))
+        if esc in ('\n', '\r\n', '\r'):
+            return ''
+        return ESCAPES.get(esc, esc)
+
+    return ESCAPE_PATTERN.sub(replace, body)
+
+
+def _number(text, source=None, pos=0):
+    """تحويل نص رقمي إلى int أو float"""
+    if len(text) > MAX_NUMBER_LENGTH:
+        raise JSLiteralError("رقم طويل جداً", source or text, pos)
+    if text.lstrip('-')[:2] in ('0x', '0X'):
+        return int(text, 16)
+    if '.' in text or 'e' in text or 'E' in text:
+        return float(text)
+    return int(text)
+
+
+def _scan(source, pos):
+    """قراءة الرمز التالي ابتداءً من pos: (النوع، القيمة، البداية، النهاية)"""
+    match = TOKEN_PATTERN.match(source, pos)
+    kind = match.lastgroup
+    start = match.start(kind)
+    text = match.group(kind)
+
+    if kind == 'punct':
+        return text, text, start, match.end()
+    if kind in ('dq', 'sq', 'bt'):
+        return 'string', _unescape(text[1:-1]), start, match.end()
+    if kind == 'number':
+        return 'number', _number(text, source, start), start, match.end()
+    if kind == 'ident':
+        return 'ident', text, start, match.end()
+    if kind == 'end':
+        return 'end', None, start, start
+    if kind == 'bad_comment':
+        raise JSLiteralError("تعليق غير مغلق", source, start)
+    if kind == 'bad_string':
+        closing = source.find('`', start + 1)
+        if text == '`' and '${' in source[start:closing if closing > 0 else len(source)]:
+            raise JSLiteralError("قوالب ${} غير مدعومة في النصوص", source, start)
+        raise JSLiteralError("نص غير مغلق", source, start)
+    raise JSLiteralError(f"محرف غير متوقع {text!r}", source, start)
+
+
+def _other_value(text, source, pos):
+    """تحويل رقم أو كلمة محجوزة إلى قيمة Python"""
+    if text in KEYWORDS:
+        return KEYWORDS[text]
+    return _number(text, source, pos)
+
+
+def _flat_object(source, match):
+    """تحويل كائن مسطح طابق FLAT_OBJECT_PATTERN إلى قاموس"""
+    obj = {}
+    pos = match.start()
+    for key, dq_key, sq_key, dq, sq, other, array in MEMBER_PATTERN.findall(match.group()):
+        if not key:
+            key = dq_key or sq_key
+            if '\\' in key:
+                key = _unescape(key)
+        if array:
+            items = []
+            for item_dq, item_sq, item_other in ITEM_PATTERN.findall(array):
+                if item_other:
+                    items.append(_other_value(item_other, source, pos))
+                else:
+                    text = item_dq or item_sq
+                    items.append(_unescape(text) if '\\' in text else text)
+            obj[key] = items
+        elif other:
+            obj[key] = _other_value(other, source, pos)
+        else:
+            text = dq or sq
+            obj[key] = _unescape(text) if '\\' in text else text
+    return obj
+
+
+def tokenize(source, start=0):
+    """مولّد رموز متدفق يبدأ من الموضع start (يتجاهل المسافات والتعليقات)"""
+    pos = start
+    while True:
+        kind, value, token_start, pos = _scan(source, pos)
+        if kind == 'end':
+            return
+        yield Token(kind, value, token_start, pos)
+
+
+def _attach(stack, value):
+    """إضافة قيمة مكتملة إلى الحاوية الأعلى؛ True إذا اكتملت القيمة الجذرية"""
+    if not stack:
+        return True
+    top = stack[-1]
+    if top[1] is not None:
+        top[0][top[1]] = value
+        top[1] = None
+    else:
+        top[0].append(value)
+    top[2] = 'comma'
+    return False
+
+
+def parse_literal(source, start=0):
+    """تحليل قيمة حرفية واحدة تبدأ عند start وإرجاع LiteralSpan
+
+    يتوقف المحلل فور انتهاء القيمة، فلا يُقرأ ما بعدها من الملف.
+    """
+    # كل عنصر في المكدس: [الحاوية، المفتاح المنتظر، الحالة]
+    # الحالات: 'value' (ننتظر قيمة أو إغلاق مصفوفة)، 'comma' (ننتظر فاصلة أو إغلاق)، 'key'، 'colon'
+    stack = []
+    literal_start = None
+    pos = start
+
+    while True:
+        kind, value, token_start, pos = _scan(source, pos)
+        if kind == 'end':
+            raise JSLiteralError("نهاية غير متوقعة للمدخل", source, token_start)
+        if literal_start is None:
+            literal_start = token_start
+
+        if stack:
+            top = stack[-1]
+            is_object = isinstance(top[0], dict)
+            state = top[2]
+
+            if state == 'comma':
+                if kind == ',':
+                    top[2] = 'key' if is_object else 'value'
+                    continue
+                if kind == ('}' if is_object else ']'):
+                    done = stack.pop()[0]
+                    if _attach(stack, done):
+                        return LiteralSpan(done, literal_start, pos)
+                    continue
+                closing = '}' if is_object else ']'
+                raise JSLiteralError(f"متوقع ',' أو '{closing}'", source, token_start)
+
+            if state == 'key':
+                if kind == '}':
+                    done = stack.pop()[0]
+                    if _attach(stack, done):
+                        return LiteralSpan(done, literal_start, pos)
+                    continue
+                if kind in ('ident', 'string', 'number'):
+                    top[1] = str(value)
+                    top[2] = 'colon'
+                    continue
+                raise JSLiteralError("متوقع اسم خاصية", source, token_start)
+
+            if state == 'colon':
+                if kind == ':':
+                    top[2] = 'value'
+                    continue
+                raise JSLiteralError("متوقع ':'", source, token_start)
+
+            # state == 'value'
+            if kind == ']' and not is_object:
+                done = stack.pop()[0]
+                if _attach(stack, done):
+                    return LiteralSpan(done, literal_start, pos)
+                continue
+
+        if kind == '{':
+            flat = FLAT_OBJECT_PATTERN.match(source, token_start)
+            if flat:
+                pos = flat.end()
+                done = _flat_object(source, flat)
+                if _attach(stack, done):
+                    return LiteralSpan(done, literal_start, pos)
+                continue
+            stack.append([{}, None, 'key'])
+            continue
+        if kind == '[':
+            stack.append([[], None, 'value'])
+            continue
+
+        if kind == 'ident' and value in KEYWORDS:
+            value = KEYWORDS[value]
+        elif kind not in ('string', 'number'):
+            raise JSLiteralError(f"قيمة غير متوقعة {value!r}", source, token_start)
+
+        if _attach(stack, value):
+            return LiteralSpan(value, literal_start, pos)
+
+
+def find_assignment(source, name):
+    """موضع بداية القيمة في `const|let|var name = …` أو -1"""
+    match = re.search(r'\b(?:const|let|var)\s+' + re.escape(name) + r'\s*=', source)
+    return match.end() if match else -1
+
+
+def parse_assignment(source, name):
+    """تحليل القيمة المسندة إلى المتغير name وإرجاع LiteralSpan أو None إذا لم يوجد"""
+    pos = find_assignment(source, name)
+    if pos < 0:
+        return None
+    return parse_literal(source, pos)
+
+
+def replace_assignment(source, name, new_literal):
+    """استبدال القيمة الحرفية المسندة إلى name بالنص new_literal
+
+    يعتمد على المواضع الدقيقة من المحلل، لذلك لا يتأثر بوجود '];' داخل النصوص.
+    يُرجع None إذا لم يوجد المتغير.
+    """
+    span = parse_assignment(source, name)
+    if span is None:
+        return None
+    return source[:span.start] + new_literal + source[span.end:]
+
+
+def main():
+    """تحليل المتغير المطلوب في الملف الممرر وعرض النتيجة"""
+    if len(sys.argv) < 2:
+        print("الاستخدام: python js_literal.py <ملف.html> [اسم_المتغير]")
+        return
+    name = sys.argv[2] if len(sys.argv) > 2 else 'bank'
+    with open(sys.argv[1], 'r', encoding='utf-8-sig') as f:
+        source = f.read()
+    try:
+        span = parse_assignment(source, name)
+    except JSLiteralError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if span is None:
+        print(f"⚠️ لم يتم العثور على المتغير {name}")
+        return
+    count = len(span.value) if isinstance(span.value, list) else 1
+    print(f"✅ {name}: {count} عنصر (الموضع {span.start}–{span.end})")
+
+
+if __name__ == "__main__":
+    main()
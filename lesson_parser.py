@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+محلل الدروس الموحد - قراءة كل درس مرة واحدة وإرجاع كائن Lesson
+Unified lesson parser - read each lesson once and return a typed Lesson
+
+تستورد جميع أدوات الفحص والاستخراج هذا الملف بدلاً من تكرار أنماط البحث
+الخاصة بها، ويتم تحليل كل ملف مرة واحدة فقط في كل عملية تشغيل.
+"""
+
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from js_literal import JSLiteralError, parse_assignment
+from parse_cache import content_digest, get_cache
+
+# يُرفع هذا الرقم عند تغيير منطق التحليل لإبطال الذاكرة الدائمة
+PARSER_VERSION = 2
+
+# مجلد المراجع الأصلية
+REFERENCE_DIR = 'Q'
+
+# علامات الأنظمة التفاعلية: اسم النظام -> النص الدال على وجوده
+SYSTEM_MARKERS = {
+    'SoundSystem': 'const SoundSystem = {',
+    'SweetAlert2': 'Swal.fire(',
+    'askStudent': 'askStudent()',
+    'showResults': 'showResults()',
+    'renderQuestions': 'function renderQuestions()',
+    'updateProgress': 'function updateProgress()',
+    'localStorage': 'localStorage',
+    'EnhancedNotificationSystem': 'const EnhancedNotificationSystem',
+    'SmartNotifications': 'const SmartNotifications',
+    'gsap': 'gsap.',
+    'AOS': 'AOS.init(',
+    'confetti': 'confetti(',
+    'Howler': 'new Howl(',
+}
+
+TITLE_PATTERN = re.compile(r'<title>([^<]+)</title>')
+SCRIPT_PATTERN = re.compile(r'<script\b([^>]*)>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+# أسماء متغيرات بنوك الأسئلة وأسماء حقولها: (النص، الخيارات، الإجابة)
+BANK_FORMATS = (
+    ('bank', ('q', 'c', 'a')),
+    ('questions', ('question', 'answers', 'correct')),
+)
+ARTICLE_PATTERN = re.compile(r'<article class="q" data-qid="[^"]+">(.*?)</article>', re.DOTALL)
+ARTICLE_TEXT_PATTERN = re.compile(r'<div><strong>[^)]*\)\s*([^<]+)</strong></div>')
+ARTICLE_CHOICE_PATTERN = re.compile(r'<div class="choice" data-correct="([^"]+)">([^<]+)</div>')
+OBJECTIVES_PATTERN = re.compile(
+    r'<h1>([^<]*)</h1>\s*<p class="lead">([^<]*)</p>\s*<ul>(.*?)</ul>', re.DOTALL)
+OBJECTIVES_CLASS_PATTERN = re.compile(
+    r'<(?:div|section)[^>]*class="[^"]*objectives[^"]*"[^>]*>.*?<ul[^>]*>(.*?)</ul>',
+    re.DOTALL | re.IGNORECASE)
+OBJECTIVE_ITEM_PATTERN = re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+@dataclass
+class Question:
+    """سؤال اختيار من متعدد"""
+    text: str
+    choices: List[str]
+    answer: int
+
+    @property
+    def correct_answer(self) -> str:
+        """نص الإجابة الصحيحة"""
+        if 0 <= self.answer < len(self.choices):
+            return self.choices[self.answer]
+        return "غير محدد"
+
+
+@dataclass
+class Objectives:
+    """قسم أهداف الدرس"""
+    heading: str
+    description: str
+    items: List[str]
+
+
+@dataclass
+class Lesson:
+    """درس واحد بعد التحليل"""
+    path: Path
+    content: str
+    title: str
+    questions: List[Question] = field(default_factory=list)
+    objectives: Optional[Objectives] = None
+    scripts: List[str] = field(default_factory=list)
+    systems: List[str] = field(default_factory=list)
+    has_bank: bool = False
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def number(self) -> str:
+        """رقم الدرس مثل: 1-1"""
+        match = re.search(r'lesson-([\d-]+)', self.path.parent.name)
+        return match.group(1) if match else self.path.parent.name
+
+    @property
+    def short_name(self) -> str:
+        """الاسم المختصر مثل: 🔬 درس 1-1"""
+        icon = self.title.split()[0] if self.title and not self.title[0].isalnum() else "📘"
+        return f"{icon} درس {self.number}"
+
+    @property
+    def key(self) -> str:
+        """مفتاح الدرس مثل: unit-1-cells/lesson-1-1"""
+        parts = self.path.parts
+        return '/'.join(parts[-3:-1]) if len(parts) >= 3 else str(self.path.parent)
+
+    def has_system(self, name: str) -> bool:
+        """هل يحتوي الدرس على النظام المحدد؟"""
+        return name in self.systems
+
+
+def parse_bank(content):
+    """تحليل أول بنك أسئلة موجود (bank أو questions) بالمحلل الخطي
+
+    يُرجع (الأسئلة، اسم المتغير) أو ([]، None) إذا لم يوجد بنك.
+    يرفع JSLiteralError إذا كان البنك موجوداً لكنه غير صالح.
+    """
+    for name, (text_key, choices_key, answer_key) in BANK_FORMATS:
+        span = parse_assignment(content, name)
+        if span is None or not isinstance(span.value, list):
+            continue
+        questions = []
+        for item in span.value:
+            if not isinstance(item, dict) or text_key not in item:
+                continue
+            choices = [str(c).strip() for c in item.get(choices_key) or []]
+            answer = item.get(answer_key)
+            questions.append(Question(str(item[text_key]).strip(), choices,
+                                      answer if isinstance(answer, int) else -1))
+        if questions:
+            return questions, name
+    return [], None
+
+
+def parse_article_questions(content):
+    """استخراج الأسئلة من عناصر article الثابتة (ملفات المراجع في Q)"""
+    questions = []
+    for block in ARTICLE_PATTERN.findall(content):
+        text_match = ARTICLE_TEXT_PATTERN.search(block)
+        choices = []
+        answer = -1
+        for i, (is_correct, choice_text) in enumerate(ARTICLE_CHOICE_PATTERN.findall(block)):
+            choices.append(choice_text.strip())
+            if is_correct == "true":
+                answer = i
+        if text_match and choices and answer >= 0:
+            questions.append(Question(text_match.group(1).strip(), choices, answer))
+    return questions
+
+
+def parse_questions(content):
+    """استخراج الأسئلة من bank أو questions أو من عناصر article الثابتة"""
+    try:
+        questions, _ = parse_bank(content)
+    except JSLiteralError:
+        questions = []
+    return questions or parse_article_questions(content)
+
+
+def parse_objectives(content):
+    """استخراج قسم الأهداف (العنوان والوصف وقائمة الأهداف)"""
+    match = OBJECTIVES_PATTERN.search(content)
+    if match:
+        heading, description, items_html = match.groups()
+    else:
+        match = OBJECTIVES_CLASS_PATTERN.search(content)
+        if not match:
+            return None
+        heading, description, items_html = "🎯 أهداف الدرس", "", match.group(1)
+
+    items = []
+    for item in OBJECTIVE_ITEM_PATTERN.findall(items_html):
+        text = TAG_PATTERN.sub('', item).strip()
+        if text:
+            items.append(text)
+
+    return Objectives(heading.strip(), description.strip(), items)
+
+
+def parse_lesson_content(path, content):
+    """تحليل محتوى درس مقروء مسبقاً"""
+    title_match = TITLE_PATTERN.search(content)
+
+    scripts = [body for attrs, body in SCRIPT_PATTERN.findall(content)
+               if 'src=' not in attrs and body.strip()]
+
+    errors = []
+    try:
+        questions, bank_name = parse_bank(content)
+    except JSLiteralError as e:
+        questions, bank_name = [], None
+        errors.append(f"بنك الأسئلة غير صالح: {e}")
+    if not questions:
+        questions = parse_article_questions(content)
+
+    return Lesson(
+        path=Path(path),
+        content=content,
+        title=title_match.group(1).strip() if title_match else "درس غير محدد",
+        questions=questions,
+        objectives=parse_objectives(content),
+        scripts=scripts,
+        systems=[name for name, marker in SYSTEM_MARKERS.items() if marker in content],
+        has_bank=bank_name == 'bank',
+        errors=errors,
+    )
+
+
+def lesson_to_dict(lesson):
+    """تحويل نتيجة التحليل إلى قاموس قابل للتخزين (بدون المحتوى الخام)"""
+    data = asdict(lesson)
+    data.pop('path')
+    data.pop('content')
+    return data
+
+
+def lesson_from_dict(path, content, data):
+    """إعادة بناء Lesson من قاموس مخزن"""
+    objectives = data.get('objectives')
+    return Lesson(
+        path=Path(path),
+        content=content,
+        title=data['title'],
+        questions=[Question(**q) for q in data['questions']],
+        objectives=Objectives(**objectives) if objectives else None,
+        scripts=data['scripts'],
+        systems=data['systems'],
+        has_bank=data['has_bank'],
+        errors=data.get('errors', []),
+    )
+
+
+# ذاكرة مؤقتة داخل العملية: تحليل واحد لكل ملف
+_parsed: Dict[str, Tuple[int, Lesson]] = {}
+
+
+def load_lesson(path):
+    """قراءة وتحليل درس واحد (مرة واحدة لكل ملف في كل عملية تشغيل)
+
+    يُستخدم parse_cache لتخطي التحليل بالكامل إذا لم يتغير محتوى الملف
+    منذ آخر تشغيل.
+    """
+    path = Path(path)
+    key = str(path.resolve())
+    stat = path.stat()
+    cached = _parsed.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    content = raw.decode('utf-8-sig')
+
+    cache = get_cache()
+    digest = content_digest(raw)
+    data = cache.get(path, digest, 'lesson', PARSER_VERSION) if cache else None
+    if data is not None:
+        lesson = lesson_from_dict(path, content, data)
+    else:
+        lesson = parse_lesson_content(path, content)
+        if cache:
+            cache.put(path, digest, 'lesson', PARSER_VERSION, lesson_to_dict(lesson))
+
+    _parsed[key] = (stat.st_mtime_ns, lesson)
+    return lesson
+
+
+def _natural_key(path):
+    """ترتيب طبيعي للمسارات (lesson-1-2 قبل lesson-1-10)"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', str(path))]
+
+
+def discover_lessons(base_dir='.'):
+    """العثور على جميع ملفات الدروس unit-*/lesson-*/index.html"""
+    base_path = Path(base_dir)
+    return sorted(base_path.glob('unit-*/lesson-*/index.html'), key=_natural_key)
+
+
+def reference_path(lesson_path, base_dir='.'):
+    """مسار الملف المرجعي في مجلد Q المقابل للدرس"""
+    lesson_path = Path(lesson_path)
+    relative = Path(*lesson_path.parts[-3:])
+    return Path(base_dir) / REFERENCE_DIR / relative
+
+
+def load_lessons(paths=None, base_dir='.'):
+    """تحليل قائمة من الدروس (أو جميع الدروس إن لم تُحدد)"""
+    if paths is None:
+        paths = discover_lessons(base_dir)
+    lessons = []
+    for path in paths:
+        if os.path.exists(path):
+            lessons.append(load_lesson(path))
+    return lessons
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+فهرس الأسئلة المتشابهة بتوقيعات MinHash وتقسيم LSH
+Persistent MinHash/LSH near-duplicate index for question texts
+
+- لكل سؤال توقيعان MinHash: على كلماته وعلى مقاطعه الحرفية الثلاثية (تلتقط اختلاف
+  الإملاء مثل ة/ه أو كلمة ملتصقة)
+- التوقيع يُقسّم إلى نطاقات (bands)، والأسئلة التي تتفق في نطاق كامل مرشحة للتشابه فقط،
+  فلا تُقارن كل الأزواج O(n²)؛ عدد النطاقات وصفوفها يُحسب من العتبة بحيث لا يفوت
+  أكثر من 1% من الأزواج عند العتبة (والأزواج الأعلى تشابهاً أقل من ذلك بكثير)
+- كل مرشح يُتحقق منه بتشابه Jaccard الدقيق، فالنتيجة لا تحتوي أزواجاً خاطئة
+- الفهرس محفوظ في .cache/minhash_index.sqlite: التوقيعات والنطاقات والأزواج المتشابهة،
+  فالأسئلة الجديدة وحدها تُحسب وتُقارن بالفهرس، والمحذوفة تُزال مع أزواجها
+- تغيير العتبات يعيد بناء النطاقات والأزواج من التوقيعات المحفوظة بدون إعادة حسابها
+
+الاستخدام:
+    python minhash_index.py           # إحصائيات الفهرس
+    python minhash_index.py --clear   # مسح الفهرس
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# مسار الفهرس الافتراضي (يمكن تغييره بمتغير البيئة MINHASH_INDEX)
+DEFAULT_INDEX_PATH = Path('.cache') / 'minhash_index.sqlite'
+
+# يُرفع عند تغيير طريقة حساب التوقيعات لإبطال الفهرس
+INDEX_VERSION = 1
+
+# عدد دوال التجزئة في توقيع الكلمات وتوقيع المقاطع الحرفية
+WORDS, CHARS = 0, 1
+NUM_PERM = {WORDS: 64, CHARS: 32}
+
+# عتبات التشابه الافتراضية: الكلمات (مع حد أدنى للكلمات المشتركة) والمقاطع الحرفية
+WORD_THRESHOLD = 0.6
+MIN_COMMON_WORDS = 3
+CHAR_THRESHOLD = 0.85
+CHAR_SHINGLE = 3
+
+# أقل عدد من الأسئلة الجديدة يستحق توزيع حساب التوقيعات على عدة عمليات
+PARALLEL_MIN = 2000
+
+# نسبة الأزواج عند العتبة التي يجب أن يلتقطها LSH
+LSH_RECALL = 0.99
+
+# عدد أولي (2^61 - 1) لطي قيم النطاق، و55 بت منها تكفي مع النوع ورقم النطاق في مفتاح 63 بت
+BUCKET_MODULUS = (1 << 61) - 1
+BUCKET_BITS = 55
+
+
+def normalize(text):
+    """النص كما يقارن به التقرير: أحرف صغيرة وبدون مسافات طرفية"""
+    return text.lower().strip()
+
+
+def word_shingles(text):
+    """مجموعة كلمات السؤال"""
+    return set(text.split())
+
+
+def char_shingles(text):
+    """المقاطع الحرفية الثلاثية للسؤال (بعد توحيد المسافات)"""
+    text = ' '.join(text.split())
+    if len(text) <= CHAR_SHINGLE:
+        return {text}
+    return {text[i:i + CHAR_SHINGLE] for i in range(len(text) - CHAR_SHINGLE + 1)}
+
+
+def jaccard(a, b):
+    """تشابه Jaccard بين مجموعتين"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def signature(shingles, num_perm, cache=None):
+    """توقيع MinHash: num_perm قيمة من 31 بت محزومة في عدد صحيح واحد (32 بت لكل قيمة)
+
+    كل مقطع يُجزّأ مرة واحدة بـ shake_128 إلى num_perm قيمة مستقلة، وأصغر قيمة في كل
+    موضع تُحسب لكل المواضع معاً بعمليات على العدد الكبير (SWAR): البت 31 في كل موضع
+    بت حماية يبيّن بعد الطرح أي القيمتين أصغر، فلا حلقة بايثون على المواضع.
+    cache (اختياري): المقطع -> قيمه المجزأة، للمقاطع المتكررة بين الأسئلة.
+    """
+    values = int.from_bytes(b'\xff\xff\xff\x7f' * num_perm, 'little')
+    guard = int.from_bytes(b'\x00\x00\x00\x80' * num_perm, 'little')
+    result = None
+    for shingle in shingles or ('',):
+        value = cache.get(shingle) if cache is not None else None
+        if value is None:
+            value = int.from_bytes(hashlib.shake_128(shingle.encode('utf-8')).digest(num_perm * 4), 'little') & values
+            if cache is not None:
+                cache[shingle] = value
+        if result is None:
+            result = value
+            continue
+        smaller = ((result | guard) - value) & guard  # بت الحماية: القيمة الحالية >= الجديدة
+        mask = smaller - (smaller >> 31)
+        result = (value & mask) | (result & (values ^ mask))
+    return result.to_bytes(num_perm * 4, 'little')
+
+
+def question_signatures(texts):
+    """توقيعا الكلمات والمقاطع الحرفية لكل نص: [(النص، توقيع الكلمات، توقيع المقاطع)]"""
+    hashes = {kind: {} for kind in NUM_PERM}
+    return [(text, signature(word_shingles(text), NUM_PERM[WORDS], hashes[WORDS]),
+             signature(char_shingles(text), NUM_PERM[CHARS], hashes[CHARS]))
+            for text in texts]
+
+
+def lsh_params(threshold, num_perm, recall=LSH_RECALL):
+    """(عدد النطاقات، الصفوف في كل نطاق): أكبر عدد صفوف يلتقط recall من الأزواج عند العتبة"""
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+def band_keys(sig, kind, bands, rows):
+    """مفاتيح نطاقات التوقيع: النوع ورقم النطاق وقيم صفوفه المطوية في عدد واحد من 63 بت"""
+    width = rows * 4
+    mask = (1 << BUCKET_BITS) - 1
+    return [((kind << 7 | band) << BUCKET_BITS)
+            | (int.from_bytes(sig[band * width:(band + 1) * width], 'little') % BUCKET_MODULUS & mask)
+            for band in range(bands)]
+
+
+class NearDuplicateIndex:
+    """فهرس MinHash/LSH دائم لنصوص الأسئلة"""
+
+    def __init__(self, db_path=DEFAULT_INDEX_PATH, word_threshold=WORD_THRESHOLD,
+                 char_threshold=CHAR_THRESHOLD, min_common=MIN_COMMON_WORDS):
+        self.word_threshold = word_threshold
+        self.char_threshold = char_threshold
+        self.min_common = min_common
+        self.params = {WORDS: lsh_params(word_threshold, NUM_PERM[WORDS])}
+        if char_threshold:
+            self.params[CHARS] = lsh_params(char_threshold, NUM_PERM[CHARS])
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key     TEXT PRIMARY KEY,
+                value   TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS questions (
+                id      INTEGER PRIMARY KEY,
+                text    TEXT NOT NULL UNIQUE,
+                words   BLOB NOT NULL,
+                chars   BLOB NOT NULL,
+                buckets BLOB
+            );
+            CREATE TABLE IF NOT EXISTS pairs (
+                a       INTEGER NOT NULL,
+                b       INTEGER NOT NULL,
+                PRIMARY KEY (a, b)
+            );
+        ''')
+
+    def _meta(self, key):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _check_config(self):
+        """إبطال التوقيعات عند تغيير طريقة حسابها، والنطاقات والأزواج عند تغيير العتبات
+
+        يُستدعى عند التحديث فقط، فعرض الإحصائيات بعتبات مختلفة لا يمسح الفهرس.
+        """
+        signatures = json.dumps([INDEX_VERSION, sorted(NUM_PERM.items()), CHAR_SHINGLE])
+        thresholds = json.dumps([self.word_threshold, self.min_common, self.char_threshold,
+                                 sorted(self.params.items())])
+        with self.conn:
+            if self._meta('signatures') != signatures:
+                self.conn.execute('DELETE FROM questions')
+            if self._meta('signatures') != signatures or self._meta('thresholds') != thresholds:
+                self.conn.execute('DELETE FROM pairs')
+                self.conn.execute('UPDATE questions SET buckets = NULL')
+                self.conn.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', ('signatures', signatures))
+                self.conn.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', ('thresholds', thresholds))
+
+    def similar(self, a, b):
+        """التحقق الدقيق: كلمات مشتركة كافية بتشابه أعلى من العتبة، أو مقاطع حرفية متطابقة تقريباً"""
+        words_a, words_b = word_shingles(a), word_shingles(b)
+        common = len(words_a & words_b)
+        if common >= self.min_common and common / len(words_a | words_b) > self.word_threshold:
+            return True
+        return bool(self.char_threshold) and jaccard(char_shingles(a), char_shingles(b)) >= self.char_threshold
+
+    def update(self, texts, jobs=None):
+        """مزامنة الفهرس مع نصوص الأسئلة الحالية -> (عدد الجديدة، عدد المحذوفة)
+
+        الأسئلة الجديدة فقط تُحسب توقيعاتها (على jobs عملية إذا كانت كثيرة) ومفاتيح
+        نطاقاتها، ومرشحوها هم الأسئلة التي تشاركها مفتاحاً واحداً على الأقل (فحص تقاطع
+        مجموعات داخل C لكل سؤال مخزن).
+        """
+        self._check_config()
+        texts = set(texts)
+        known = dict(self.conn.execute('SELECT text, id FROM questions'))
+        removed = [(known[text],) for text in known.keys() - texts]
+        new = sorted(texts - known.keys())
+
+        with self.conn:
+            if removed:
+                self.conn.executemany('DELETE FROM questions WHERE id = ?', removed)
+                self.conn.executemany('DELETE FROM pairs WHERE a = ?', removed)
+                self.conn.executemany('DELETE FROM pairs WHERE b = ?', removed)
+            jobs = min(jobs or os.cpu_count() or 1, len(new) // PARALLEL_MIN) or 1
+            if jobs > 1:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    signed = [row for chunk in pool.map(question_signatures, [new[i::jobs] for i in range(jobs)])
+                              for row in chunk]
+            else:
+                signed = question_signatures(new)
+            self.conn.executemany('INSERT INTO questions (text, words, chars) VALUES (?, ?, ?)', signed)
+
+            # مفاتيح نطاقات الأسئلة الجديدة (أو كل الأسئلة بعد تغيير العتبات)
+            rows = self.conn.execute('SELECT id, words, chars FROM questions WHERE buckets IS NULL').fetchall()
+            if not rows:
+                return len(new), len(removed)
+            fresh = {}
+            by_key = {}
+            for qid, words, chars in rows:
+                keys = [key for kind, (bands, width) in self.params.items()
+                        for key in band_keys(words if kind == WORDS else chars, kind, bands, width)]
+                fresh[qid] = keys
+                for key in keys:
+                    by_key.setdefault(key, []).append(qid)
+
+            # المرشحون: الأسئلة الجديدة التي تتفق في نطاق، ثم الأسئلة المخزنة التي تشارك أياً منها نطاقاً
+            candidates = {(min(x, y), max(x, y)) for ids in by_key.values() if len(ids) > 1
+                          for x in ids for y in ids if x < y}
+            for qid, blob in self.conn.execute('SELECT id, buckets FROM questions WHERE buckets IS NOT NULL'):
+                keys = array('q', blob)
+                if not by_key.keys().isdisjoint(keys):
+                    candidates.update((min(qid, other), max(qid, other))
+                                      for key in keys for other in by_key.get(key, ()))
+            self.conn.executemany('UPDATE questions SET buckets = ? WHERE id = ?',
+                                  ((array('q', keys).tobytes(), qid) for qid, keys in fresh.items()))
+
+            if candidates:
+                ids = {i for pair in candidates for i in pair}
+                text_of = {i: t for i, t in self.conn.execute('SELECT id, text FROM questions') if i in ids}
+                self.conn.executemany('INSERT OR IGNORE INTO pairs VALUES (?, ?)',
+                                      [(a, b) for a, b in candidates if self.similar(text_of[a], text_of[b])])
+        return len(new), len(removed)
+
+    def pairs(self):
+        """كل أزواج الأسئلة المتشابهة في الفهرس: [(نص، نص)]"""
+        return self.conn.execute('''
+            SELECT qa.text, qb.text FROM pairs
+            JOIN questions qa ON qa.id = pairs.a
+            JOIN questions qb ON qb.id = pairs.b
+        ''').fetchall()
+
+    def stats(self):
+        """إحصائيات الفهرس"""
+        questions = self.conn.execute('SELECT COUNT(*) FROM questions').fetchone()[0]
+        pairs = self.conn.execute('SELECT COUNT(*) FROM pairs').fetchone()[0]
+        size = self.db_path.stat().st_size if self.db_path.exists() else 0
+        return {'questions': questions, 'pairs': pairs, 'bytes': size,
+                'thresholds': json.loads(self._meta('thresholds') or 'null')}
+
+    def clear(self):
+        """مسح الفهرس بالكامل"""
+        with self.conn:
+            for table in ('questions', 'pairs'):
+                self.conn.execute(f'DELETE FROM {table}')
+
+    def close(self):
+        """إغلاق الاتصال بقاعدة البيانات"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def open_index(**thresholds):
+    """فتح الفهرس في مساره الافتراضي (أو MINHASH_INDEX) مع إغلاقه عند الخروج"""
+    index = NearDuplicateIndex(os.environ.get('MINHASH_INDEX') or DEFAULT_INDEX_PATH, **thresholds)
+    atexit.register(index.close)
+    return index
+
+
+def main():
+    """الدالة الرئيسية"""
+    index = open_index()
+    if '--clear' in sys.argv:
+        index.clear()
+        print("🗑️ تم مسح فهرس الأسئلة المتشابهة")
+        return
+    stats = index.stats()
+    print(f"📇 الفهرس: {index.db_path}")
+    print(f"   ❓ الأسئلة: {stats['questions']}")
+    print(f"   🔍 الأزواج المتشابهة: {stats['pairs']}")
+    if stats['thresholds']:
+        word_threshold, min_common, char_threshold, params = stats['thresholds']
+        print(f"   🎚️ العتبات: الكلمات > {word_threshold} (≥ {min_common} كلمات مشتركة)، المقاطع ≥ {char_threshold}")
+        print(f"   🧮 النطاقات × الصفوف: {dict(('words' if kind == WORDS else 'chars', tuple(p)) for kind, p in params)}")
+    print(f"   💾 الحجم: {stats['bytes'] / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+تصغير HTML و CSS و JavaScript وإنشاء نسخ مضغوطة مسبقاً (.gz و .br) للمخرجات
+Conservative HTML/CSS/JS minifier plus precompressed .gz/.br siblings
+
+- التصغير محافظ وآمن للنص العربي: تُحذف التعليقات وتُدمج المسافات المتتالية في
+  مسافة واحدة فقط (المسافة غير المنقسمة وعلامات الاتجاه لا تُمس)، والنصوص داخل
+  السلاسل و <pre> و <textarea> والقوالب `...` تبقى كما هي
+- في JavaScript تُحفظ الأسطر الجديدة التي قد يعتمد عليها الإدراج التلقائي للفاصلة المنقوطة
+- الضغط: gzip بأعلى مستوى دائماً، و Brotli بأعلى جودة إن كانت مكتبة brotli مثبتة؛
+  يُتخطى أي ملف لم تتغير بصمته منذ آخر ضغط (.build/.compress-manifest.json)
+
+الاستخدام:
+    python minify.py                 # تصغير وضغط ملفات مجلد البناء .build/
+    python minify.py ملف.html        # عرض نسخة مصغرة من ملف
+"""
+
+import gzip
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from parse_cache import content_digest
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_MANIFEST = '.compress-manifest.json'
+COMPRESSIBLE = ('.html', '.css', '.js', '.json', '.svg', '.txt', '.xml')
+MIN_COMPRESS_SIZE = 256
+
+# مسافات HTML/CSS فقط (بدون \xa0 وبقية مسافات يونيكود التي يعدها \s)
+WHITESPACE = re.compile(r'[ \t\n\r\f]+')
+
+
+# ---------------------------------------------------------------- CSS
+
+CSS_TOKEN = re.compile(r'''("(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')|(/\*.*?\*/)|([ \t\n\r\f]+)''', re.S)
+CSS_TIGHT = re.compile(r' ?([{};,>]) ?')
+
+
+def minify_css(source):
+    """تصغير CSS: حذف التعليقات والمسافات حول { } ; , > وبعد :"""
+    out = []
+    for part, (string, comment, space) in _split(CSS_TOKEN, source):
+        if string:
+            out.append(('s', string))
+        elif comment:
+            out.append(('c', ' '))
+        elif space:
+            out.append(('c', ' '))
+        else:
+            out.append(('c', part))
+    # دمج الأجزاء غير النصية ثم تضييقها (السلاسل لا تُمس)
+    result = []
+    buffer = []
+    for kind, text in out + [('s', '')]:
+        if kind == 'c':
+            buffer.append(text)
+            continue
+        code = WHITESPACE.sub(' ', ''.join(buffer))
+        code = CSS_TIGHT.sub(r'\1', code).replace(': ', ':').replace(';}', '}')
+        result.append(code)
+        result.append(text)
+        buffer = []
+    return ''.join(result).strip()
+
+
+def _split(pattern, source):
+    """تقسيم النص إلى أجزاء عادية وأجزاء مطابقة للنمط"""
+    position = 0
+    for match in pattern.finditer(source):
+        if match.start() > position:
+            yield source[position:match.start()], (None,) * pattern.groups
+        yield match.group(0), match.groups()
+        position = match.end()
+    if position < len(source):
+        yield source[position:], (None,) * pattern.groups
+
+
+# ---------------------------------------------------------------- JavaScript
+
+# الكلمات التي يمكن أن يليها تعبير نمطي /.../
+REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+                  'void', 'throw', 'instanceof', 'yield', 'await'}
+# سطر جديد بعد هذه الرموز أو قبل الرموز التالية لا يؤثر على الفواصل المنقوطة التلقائية
+NEWLINE_AFTER = set('{([,;:=&|?')
+NEWLINE_BEFORE = set('})],;:.?')
+JS_LINE_TERMINATORS = '\n\r\u2028\u2029'
+JS_WHITESPACE = ' \t\v\f\xa0\ufeff' + JS_LINE_TERMINATORS
+
+
+def _identifier_char(ch):
+    return ch.isalnum() or ch in '_$' or ord(ch) > 127
+
+
+def _skip_string(source, i):
+    """نهاية سلسلة '...' أو "..." تبدأ عند i"""
+    quote = source[i]
+    i += 1
+    while i < len(source):
+        ch = source[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == quote or ch == '\n':
+            return i + 1
+        i += 1
+    return i
+
+
+def _skip_template(source, i):
+    """نهاية قالب `...` يبدأ عند i (مع التعبيرات ${...} المتداخلة)"""
+    i += 1
+    while i < len(source):
+        ch = source[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == '`':
+            return i + 1
+        if ch == '$' and source.startswith('{', i + 1):
+            i = _skip_expression(source, i + 2)
+            continue
+        i += 1
+    return i
+
+
+def _skip_expression(source, i):
+    """نهاية تعبير ${...} داخل قالب"""
+    depth = 1
+    while i < len(source):
+        ch = source[i]
+        if ch in '"\'':
+            i = _skip_string(source, i)
+            continue
+        if ch == '`':
+            i = _skip_template(source, i)
+            continue
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _skip_regex(source, i):
+    """نهاية تعبير نمطي /.../flags يبدأ عند i"""
+    i += 1
+    in_class = False
+    while i < len(source):
+        ch = source[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == '\n':
+            return i
+        if ch == '[':
+            in_class = True
+        elif ch == ']':
+            in_class = False
+        elif ch == '/' and not in_class:
+            i += 1
+            while i < len(source) and _identifier_char(source[i]):
+                i += 1
+            return i
+        i += 1
+    return i
+
+
+def minify_js(source):
+    """تصغير JavaScript محافظ: حذف التعليقات والمسافات الزائدة مع حفظ الأسطر المؤثرة"""
+    out = []
+    last = ';'       # آخر رمز غير مسافة في المخرجات (البداية كأنها بعد ;)
+    last_word = ''   # آخر كلمة (لتمييز / القسمة عن بداية تعبير نمطي)
+    pending = ''     # مسافة معلقة: '' أو ' ' أو '\n'
+    i = 0
+    n = len(source)
+
+    def emit(text, word=''):
+        nonlocal last, last_word, pending
+        first = text[0]
+        if pending == '\n' and last not in NEWLINE_AFTER and first not in NEWLINE_BEFORE:
+            out.append('\n')
+        elif pending and (
+                (_identifier_char(last) and _identifier_char(first))
+                or (first == last and first in '+-/')):
+            # مسافة لازمة: return x ، a + +b ، a / /re/
+            out.append(' ')
+        out.append(text)
+        last = text[-1]
+        last_word = word
+        pending = ''
+
+    while i < n:
+        ch = source[i]
+        if ch in JS_WHITESPACE:
+            if ch in JS_LINE_TERMINATORS:
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            i += 1
+            continue
+        if ch == '/' and source.startswith('/', i + 1):
+            end = source.find('\n', i)
+            i = n if end == -1 else end
+            continue
+        if ch == '/' and source.startswith('*', i + 1):
+            end = source.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            if '\n' in source[i:end]:
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            i = end
+            continue
+        if ch in '"\'':
+            end = _skip_string(source, i)
+            emit(source[i:end])
+            i = end
+            continue
+        if ch == '`':
+            end = _skip_template(source, i)
+            emit(source[i:end])
+            i = end
+            continue
+        if ch == '/' and (not last or last in '(,=:[!&|?{};+-*%<>~^' or last_word in REGEX_KEYWORDS):
+            end = _skip_regex(source, i)
+            emit(source[i:end])
+            i = end
+            continue
+        if _identifier_char(ch):
+            end = i + 1
+            while end < n and _identifier_char(source[end]):
+                end += 1
+            word = source[i:end]
+            emit(word, word)
+            i = end
+            continue
+        emit(ch)
+        i += 1
+    return ''.join(out)
+
+
+# ---------------------------------------------------------------- HTML
+
+HTML_TOKEN = re.compile(
+    r'(<!--(?!\[if).*?-->)'
+    r'|(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\3\s*>)'
+    r'|(<[^>]+>)',
+    re.S | re.I)
+SCRIPT_TYPE = re.compile(r'\btype\s*=\s*"([^"]*)"', re.I)
+JS_TYPES = ('', 'text/javascript', 'module', 'application/javascript')
+# وسوم لا يتأثر عرضها بالمسافات المحيطة بها
+BLOCK_TAGS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'script', 'style', 'div', 'section',
+    'article', 'header', 'footer', 'main', 'nav', 'aside', 'p', 'h1', 'h2', 'h3', 'h4',
+    'h5', 'h6', 'ul', 'ol', 'li', 'table', 'thead', 'tbody', 'tr', 'td', 'th', 'form',
+    'br', 'hr', 'option', 'select', 'picture', 'source', 'figure', 'figcaption', '!doctype',
+}
+TAG_NAME = re.compile(r'</?\s*([!\w-]+)')
+
+
+def _tag_name(tag):
+    match = TAG_NAME.match(tag)
+    return match.group(1).lower() if match else ''
+
+
+def minify_html(source):
+    """تصغير HTML: حذف التعليقات ودمج المسافات، وتصغير CSS و JS المضمّنين"""
+    parts = []  # (نوع، نص): 'text' أو 'tag'
+    for part, groups in _split(HTML_TOKEN, source):
+        comment, open_tag, name, body, close_tag, tag = groups
+        if comment:
+            continue
+        if open_tag:
+            name = name.lower()
+            if name == 'style':
+                body = minify_css(body)
+            elif name == 'script' and not re.search(r'\bsrc\s*=', open_tag, re.I):
+                script_type = SCRIPT_TYPE.search(open_tag)
+                if (script_type.group(1).lower() if script_type else '') in JS_TYPES:
+                    body = minify_js(body)
+            parts.append(('tag', open_tag + body + close_tag, name))
+        elif tag:
+            parts.append(('tag', tag, _tag_name(tag)))
+        else:
+            parts.append(('text', part, ''))
+
+    out = []
+    for index, (kind, text, name) in enumerate(parts):
+        if kind == 'tag':
+            out.append(text)
+            continue
+        collapsed = WHITESPACE.sub(' ', text)
+        if collapsed == ' ':
+            before = parts[index - 1][2] if index else 'html'
+            after = parts[index + 1][2] if index + 1 < len(parts) else 'html'
+            if before in BLOCK_TAGS or after in BLOCK_TAGS:
+                continue
+        out.append(collapsed)
+    return ''.join(out).strip() + '\n'
+
+
+MINIFIERS = {'.html': minify_html, '.css': minify_css, '.js': minify_js}
+
+
+def minify_text(text, suffix):
+    """تصغير نص حسب امتداد الملف (أو إرجاعه كما هو)"""
+    minifier = MINIFIERS.get(suffix)
+    return minifier(text) if minifier else text
+
+
+# ---------------------------------------------------------------- الضغط
+
+def _compress_file(path):
+    """كتابة path.gz و path.br (إن كانت أصغر)؛ يُرجع (المسار، البصمة، الأحجام)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    sizes = {}
+    variants = [('.gz', lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', lambda d: brotli.compress(d, quality=11)))
+    for suffix, compress in variants:
+        target = f"{path}{suffix}"
+        packed = compress(data)
+        if len(packed) >= len(data):
+            if os.path.exists(target):
+                os.unlink(target)
+            continue
+        tmp = f"{target}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(packed)
+        os.replace(tmp, target)
+        sizes[suffix] = len(packed)
+    return path, content_digest(data), sizes
+
+
+def precompress(out_dir, jobs=None):
+    """إنشاء نسخ .gz/.br للملفات النصية المتغيرة فقط في out_dir؛ يُرجع عدد الملفات"""
+    out_dir = Path(out_dir)
+    manifest_path = out_dir / COMPRESS_MANIFEST
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get('brotli') != (brotli is not None):
+        manifest = {}
+    files = manifest.get('files', {})
+
+    todo = []
+    current = {}
+    for path in sorted(out_dir.rglob('*')):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE or path.name.startswith('.'):
+            continue
+        if path.stat().st_size < MIN_COMPRESS_SIZE:
+            continue
+        relative = path.relative_to(out_dir).as_posix()
+        with open(path, 'rb') as f:
+            digest = content_digest(f.read())
+        current[relative] = digest
+        if files.get(relative) != digest or not os.path.exists(f"{path}.gz"):
+            todo.append(str(path))
+
+    # حذف النسخ المضغوطة لملفات لم تعد موجودة
+    for relative in set(files) - set(current):
+        for suffix in ('.gz', '.br'):
+            stale = out_dir / f"{relative}{suffix}"
+            if stale.exists():
+                stale.unlink()
+
+    if len(todo) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(_compress_file, todo))
+    else:
+        for path in todo:
+            _compress_file(path)
+
+    tmp = manifest_path.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'brotli': brotli is not None, 'files': current}, f, indent=1, sort_keys=True)
+    os.replace(tmp, manifest_path)
+    return len(todo)
+
+
+def _minify_file(path):
+    """تصغير ملف في مكانه؛ يُرجع (الحجم قبل، الحجم بعد)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    minified = minify_text(text, Path(path).suffix)
+    if minified != text:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(minified)
+    return len(text.encode('utf-8')), len(minified.encode('utf-8'))
+
+
+def main():
+    """تصغير وضغط ملفات مجلد البناء أو عرض نسخة مصغرة من ملف"""
+    args = sys.argv[1:]
+    if args and Path(args[0]).is_file():
+        path = Path(args[0])
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            sys.stdout.write(minify_text(f.read(), path.suffix))
+        return
+
+    # dist رابط إلى جيل منشور للقراءة فقط، فالتعديل في مجلد العمل ثم python build.py ينشره
+    out_dir = Path(args[0] if args else '.build')
+    if not out_dir.is_dir():
+        print(f"❌ المجلد غير موجود: {out_dir} (شغّل python build.py أولاً)")
+        sys.exit(1)
+    paths = [str(p) for p in sorted(out_dir.rglob('*'))
+             if p.suffix in MINIFIERS and '.min.' not in p.name and 'vendor' not in p.parts]
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(_minify_file, paths))
+    before = sum(r[0] for r in results)
+    after = sum(r[1] for r in results)
+    print(f"✂️ تصغير {len(paths)} ملف: {before / 1024:.0f} KB ← {after / 1024:.0f} KB")
+    compressed = precompress(out_dir)
+    print(f"🗜️ تم ضغط {compressed} ملف (gzip{' + brotli' if brotli else ''})")
+
+
+if __name__ == "__main__":
+    main()
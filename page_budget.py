@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+تحليل وزن صفحات الموقع المبني ومقارنته بميزانيات الأداء
+Per-page weight analyzer with performance budgets for dist/
+
+لكل صفحة HTML في dist/ يحسب:
+- عدد الطلبات عند التحميل الأول والحجم حسب النوع (HTML/JS/CSS/صوت/صور/خطوط)
+- الموارد التي تحجب العرض (سكربتات متزامنة وملفات أنماط)
+- الخوادم الخارجية (third-party) التي تعتمد عليها الصفحة
+- الأصوات التي يحمّلها منطق الصفحة مسبقاً (الملف المدمج audioSprite أو الملفات المنفصلة
+  المذكورة في سكربتات الصفحة)
+
+الميزانيات الافتراضية في DEFAULT_BUDGETS، ويمكن تعديلها في budgets.json:
+    {"default": {"audio": 153600}, "pages": {"index.html": {"image": 204800}}}
+
+الاستخدام:
+    python page_budget.py              # تقرير كامل؛ رمز خروج 1 عند تجاوز أي ميزانية
+    python page_budget.py --json       # المخرجات بصيغة JSON
+"""
+
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+DIST_DIR = Path('dist')
+BUDGETS_FILE = Path('budgets.json')
+
+KB = 1024
+# الحدود لكل صفحة: الأحجام بالبايت (قبل الضغط)، والبقية أعداد
+DEFAULT_BUDGETS = {
+    'requests': 15,
+    'total': 400 * KB,
+    'html': 60 * KB,
+    'js': 150 * KB,
+    'css': 50 * KB,
+    'audio': 150 * KB,
+    'image': 100 * KB,
+    'font': 120 * KB,
+    'blocking': 3,
+    'third_party': 0,
+}
+
+TYPES = {
+    'html': ('.html',),
+    'js': ('.js', '.mjs'),
+    'css': ('.css',),
+    'audio': ('.mp3', '.ogg', '.oga', '.opus', '.webm', '.wav', '.m4a'),
+    'image': ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg', '.ico'),
+    'font': ('.woff2', '.woff', '.ttf', '.otf'),
+}
+
+TAG_PATTERN = re.compile(r'<(script|link|img)\b([^>]*)>', re.I)
+ATTR_PATTERN = re.compile(r'([\w-]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+NOSCRIPT_PATTERN = re.compile(r'<noscript\b.*?</noscript>', re.I | re.S)
+STYLE_PATTERN = re.compile(r'<style[^>]*>(.*?)</style>', re.I | re.S)
+CSS_URL_PATTERN = re.compile(r'url\(\s*[\'"]?([^\'")]+)[\'"]?\s*\)')
+SPRITE_PATTERN = re.compile(r'\baudioSprite\s*=\s*(\{.*?\})\s*;', re.S)
+SCRIPT_MEDIA_PATTERN = re.compile(r'[\'"`/]([\w-]+\.(?:mp3|ogg|opus|wav|m4a))[\'"`]')
+
+
+def _attrs(text):
+    """خصائص وسم HTML كقاموس"""
+    return {name.lower(): next((v for v in values if v), '')
+            for name, *values in ATTR_PATTERN.findall(text)}
+
+
+def resource_type(url):
+    """نوع المورد من امتداده"""
+    suffix = os.path.splitext(urlsplit(url).path)[1].lower()
+    for name, suffixes in TYPES.items():
+        if suffix in suffixes:
+            return name
+    return 'other'
+
+
+class PageAnalysis:
+    """موارد صفحة واحدة عند التحميل الأول"""
+
+    def __init__(self, page_path, out_dir):
+        self.page_path = Path(page_path)
+        self.out_dir = Path(out_dir)
+        self.resources = {}   # الرابط -> (النوع، الحجم أو None للخارجي)
+        self.blocking = []
+        self.third_party = set()
+
+    def _local_path(self, url):
+        """المسار المحلي لرابط في الصفحة، أو None إذا كان خارجياً"""
+        parts = urlsplit(url)
+        if parts.scheme in ('http', 'https') or url.startswith('//'):
+            return None
+        if parts.scheme:
+            return False  # data: و blob: وغيرها لا تُعد طلبات
+        base = self.out_dir if parts.path.startswith('/') else self.page_path.parent
+        return Path(os.path.normpath(base / parts.path.lstrip('/')))
+
+    def add(self, url, base=None, kind=None):
+        """تسجيل مورد (مرة واحدة لكل رابط)"""
+        if not url:
+            return None
+        if base is not None and not urlsplit(url).scheme and not url.startswith('/'):
+            url = os.path.normpath(os.path.join(os.path.dirname(base), url))
+        local = self._local_path(url)
+        if local is False or url in self.resources:
+            return local
+        kind = kind or resource_type(url)
+        if local is None:
+            self.third_party.add(urlsplit(url if not url.startswith('//') else 'https:' + url).netloc)
+            self.resources[url] = (kind, None)
+        else:
+            self.resources[url] = (kind, local.stat().st_size if local.is_file() else 0)
+        return local
+
+    def analyze(self):
+        """تحليل الصفحة وملفات الأنماط والسكربتات المحلية المرتبطة بها"""
+        with open(self.page_path, 'r', encoding='utf-8') as f:
+            page = f.read()
+        self.resources[self.page_path.name] = ('html', len(page.encode('utf-8')))
+        page = NOSCRIPT_PATTERN.sub('', page)
+        in_head = page.find('</head>')
+
+        scripts = []
+        for match in TAG_PATTERN.finditer(page):
+            tag, attrs = match.group(1).lower(), _attrs(match.group(2))
+            if tag == 'script' and attrs.get('src'):
+                local = self.add(attrs['src'])
+                scripts.append(local)
+                if not ({'defer', 'async'} & attrs.keys() or attrs.get('type') == 'module'):
+                    self.blocking.append(attrs['src'])
+            elif tag == 'link':
+                rel = attrs.get('rel', '').lower().split()
+                href = attrs.get('href')
+                if 'stylesheet' in rel:
+                    local = self.add(href, kind='css')
+                    self._stylesheet(href, local)
+                    if attrs.get('media', 'all') not in ('print',) and match.start() < in_head:
+                        self.blocking.append(href)
+                elif 'preload' in rel:
+                    self.add(href)
+                    if attrs.get('as') == 'style':
+                        self._stylesheet(href, self._local_path(href))
+                elif 'icon' in rel:
+                    self.add(href, kind='image')
+            elif tag == 'img' and attrs.get('loading') != 'lazy':
+                self.add(attrs.get('src'))
+
+        for css in STYLE_PATTERN.findall(page):
+            for url in CSS_URL_PATTERN.findall(css):
+                self.add(url)
+
+        self._preloaded_audio(page, scripts)
+        return self.summary()
+
+    def _stylesheet(self, href, local):
+        """الموارد داخل ملف أنماط محلي (مثل ملفات الخطوط)"""
+        if not local or not local.is_file():
+            return
+        with open(local, 'r', encoding='utf-8', errors='replace') as f:
+            css = f.read()
+        for url in CSS_URL_PATTERN.findall(css):
+            self.add(url, base=href)
+
+    def _preloaded_audio(self, page, scripts):
+        """الأصوات التي يحمّلها منطق الصفحة: الملف المدمج، أو الملفات المذكورة في السكربتات"""
+        sprite = SPRITE_PATTERN.search(page)
+        if sprite:
+            try:
+                sources = json.loads(sprite.group(1)).get('src', [])
+            except ValueError:
+                sources = []
+            if sources:
+                self.add(sources[0], kind='audio')
+                return
+        for local in scripts:
+            if not local or not local.is_file():
+                continue
+            with open(local, 'r', encoding='utf-8', errors='replace') as f:
+                script = f.read()
+            for name in sorted(set(SCRIPT_MEDIA_PATTERN.findall(script))):
+                for found in sorted(self.out_dir.glob(f'assets/**/{name}')):
+                    self.add(os.path.relpath(found, self.page_path.parent), kind='audio')
+
+    def summary(self):
+        """ملخص الصفحة كقاموس"""
+        by_type = {name: 0 for name in list(TYPES) + ['other']}
+        for kind, size in self.resources.values():
+            by_type[kind] += size or 0
+        return {
+            'page': self.page_path.relative_to(self.out_dir).as_posix(),
+            'requests': len(self.resources),
+            'total': sum(by_type.values()),
+            'bytes': by_type,
+            'blocking': self.blocking,
+            'third_party': sorted(self.third_party),
+        }
+
+
+def analyze_page(args):
+    """تحليل صفحة واحدة (للتشغيل في عملية منفصلة)"""
+    page_path, out_dir = args
+    return PageAnalysis(page_path, out_dir).analyze()
+
+
+def load_budgets(path=BUDGETS_FILE):
+    """الميزانيات: الافتراضية مع تعديلات budgets.json إن وُجد"""
+    config = {}
+    if Path(path).exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    default = {**DEFAULT_BUDGETS, **config.get('default', {})}
+    return default, config.get('pages', {})
+
+
+def violations(summary, budgets):
+    """قائمة تجاوزات الصفحة: (البند، القيمة، الحد)"""
+    default, pages = budgets
+    limits = {**default, **pages.get(summary['page'], {})}
+    values = {
+        'requests': summary['requests'],
+        'total': summary['total'],
+        'blocking': len(summary['blocking']),
+        'third_party': len(summary['third_party']),
+        **summary['bytes'],
+    }
+    return [(name, values[name], limit) for name, limit in limits.items()
+            if name in values and values[name] > limit]
+
+
+def analyze_site(out_dir=DIST_DIR, jobs=None):
+    """تحليل جميع صفحات HTML في out_dir بالتوازي"""
+    pages = sorted(Path(out_dir).rglob('*.html'))
+    args = [(str(p), str(out_dir)) for p in pages]
+    if len(args) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(analyze_page, args))
+    return [analyze_page(a) for a in args]
+
+
+def _format(name, value):
+    """عرض قيمة بند الميزانية"""
+    return f"{value / KB:.0f} KB" if name not in ('requests', 'blocking', 'third_party') else str(value)
+
+
+def report(summaries, budgets):
+    """طباعة التقرير؛ يُرجع عدد الصفحات المتجاوزة"""
+    header = f"{'الصفحة':<44} {'طلبات':>5} {'الكل':>7} {'HTML':>6} {'JS':>6} {'CSS':>6} {'صوت':>6} {'صور':>6} {'خطوط':>6} {'حاجب':>4} {'خارجي':>5}"
+    print(header)
+    print('-' * len(header))
+    over = 0
+    for s in summaries:
+        b = s['bytes']
+        print(f"{s['page']:<44} {s['requests']:>5} {s['total'] / KB:>6.0f}K "
+              + ' '.join(f"{b[t] / KB:>5.0f}K" for t in ('html', 'js', 'css', 'audio', 'image', 'font'))
+              + f" {len(s['blocking']):>4} {len(s['third_party']):>5}")
+    print()
+    for s in summaries:
+        problems = violations(s, budgets)
+        if not problems:
+            continue
+        over += 1
+        print(f"❌ {s['page']}")
+        for name, value, limit in problems:
+            print(f"   • {name}: {_format(name, value)} (الحد {_format(name, limit)})")
+            if name == 'blocking':
+                for url in s['blocking']:
+                    print(f"       ⛔ {url}")
+            elif name == 'third_party':
+                print(f"       🌐 {', '.join(s['third_party'])}")
+    if over:
+        print(f"\n⚠️ {over} من {len(summaries)} صفحة تتجاوز الميزانية")
+    else:
+        print(f"✅ جميع الصفحات ({len(summaries)}) ضمن الميزانية")
+    return over
+
+
+def main():
+    """الدالة الرئيسية"""
+    args = sys.argv[1:]
+    out_dir = Path(next((a for a in args if not a.startswith('--')), DIST_DIR))
+    if not out_dir.is_dir():
+        print(f"❌ المجلد غير موجود: {out_dir} (شغّل python build.py أولاً)")
+        sys.exit(1)
+    budgets = load_budgets()
+    summaries = analyze_site(out_dir)
+    if '--json' in args:
+        for s in summaries:
+            s['violations'] = [{'budget': n, 'value': v, 'limit': l} for n, v, l in violations(s, budgets)]
+        json.dump(summaries, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        over = sum(1 for s in summaries if s['violations'])
+    else:
+        over = report(summaries, budgets)
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+تاريخ أوزان صفحات الدروس عبر مراجعات git
+Page-weight history across git revisions (read through git cat-file --batch)
+
+- تُقرأ الإيداعات والأشجار وملفات الدروس من عملية واحدة git cat-file --batch بدلاً من
+  استخراج كل مراجعة على القرص، وتُحفظ نتائج الأشجار الفرعية في الذاكرة حسب بصمتها
+- لكل إيداع: حجم HTML لكل درس وللمجموع، وحجم السكربتات المضمّنة، وعدد الأسئلة،
+  والموارد المشار إليها (src/href)
+- نتائج تحليل كل ملف مخزنة في .cache/page-history.json ومفهرسة ببصمة git للملف
+  فلا يُحلل أي محتوى مرتين مهما تكرر في التاريخ
+- التقرير يعرض الإيداعات التي غيّرت الدروس وأكبر الإضافات (أي إيداع أضاف كل جزء)
+
+الاستخدام:
+    python page_history.py                        # ملخص التاريخ وأكبر الإضافات
+    python page_history.py cb9546d..HEAD          # نطاق مراجعات محدد
+    python page_history.py --csv history.csv      # سلسلة زمنية بصيغة CSV (سطر لكل درس وإيداع)
+    python page_history.py --json history.json    # سلسلة زمنية بصيغة JSON
+"""
+
+import csv
+import fnmatch
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from lesson_parser import SCRIPT_PATTERN, _natural_key, parse_questions
+
+CACHE_FILE = Path('.cache') / 'page-history.json'
+
+# يُرفع هذا الرقم عند تغيير طريقة حساب المقاييس لإبطال الذاكرة
+HISTORY_VERSION = 1
+
+LESSON_GLOB = 'unit-*/lesson-*/index.html'
+TOTAL = 'TOTAL'
+TOP_ADDITIONS = 15
+
+ASSET_PATTERN = re.compile(r'<(?:script|link|img|audio|source)\b[^>]*?\b(?:src|href)\s*=\s*"([^"]+)"', re.I)
+METRICS = ('bytes', 'inline_script_bytes', 'questions', 'assets')
+
+
+class GitError(Exception):
+    """خطأ في قراءة مستودع git"""
+
+
+class ObjectReader:
+    """قراءة كائنات git عبر عملية git cat-file --batch واحدة"""
+
+    def __init__(self, repo='.'):
+        try:
+            self.process = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=repo,
+                                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        except OSError as e:
+            raise GitError(f"تعذر تشغيل git: {e}")
+        self._trees = {}
+
+    def read(self, sha):
+        """(النوع، المحتوى) لكائن git"""
+        self.process.stdin.write(sha.encode('ascii') + b'\n')
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().split()
+        if len(header) != 3:
+            raise GitError(f"كائن غير موجود: {sha}")
+        data = self.process.stdout.read(int(header[2]))
+        self.process.stdout.read(1)
+        return header[1].decode('ascii'), data
+
+    def tree_entries(self, sha):
+        """مدخلات شجرة: [(النمط، الاسم، البصمة)]"""
+        kind, data = self.read(sha)
+        if kind != 'tree':
+            raise GitError(f"{sha} ليس شجرة ({kind})")
+        entries = []
+        i = 0
+        while i < len(data):
+            space = data.index(b' ', i)
+            nul = data.index(b'\0', space)
+            entries.append((data[i:space].decode('ascii'), data[space + 1:nul].decode('utf-8'),
+                            data[nul + 1:nul + 21].hex()))
+            i = nul + 21
+        return entries
+
+    def lesson_blobs(self, tree, prefix=''):
+        """ملفات الدروس في شجرة: المسار -> بصمة الملف (مع حفظ الأشجار الفرعية)"""
+        key = (tree, prefix)
+        if key in self._trees:
+            return self._trees[key]
+        depth = prefix.count('/')
+        pattern = '/'.join(LESSON_GLOB.split('/')[:depth + 1])
+        found = {}
+        for mode, name, sha in self.tree_entries(tree):
+            path = prefix + name
+            if not fnmatch.fnmatch(path, pattern):
+                continue
+            if mode == '40000' and depth < LESSON_GLOB.count('/'):
+                found.update(self.lesson_blobs(sha, path + '/'))
+            elif mode.startswith('100') and path.count('/') == LESSON_GLOB.count('/'):
+                found[path] = sha
+        self._trees[key] = found
+        return found
+
+    def commit_tree(self, sha):
+        """بصمة الشجرة الجذرية لإيداع"""
+        kind, data = self.read(sha)
+        if kind != 'commit' or not data.startswith(b'tree '):
+            raise GitError(f"{sha} ليس إيداعاً ({kind})")
+        return data[5:45].decode('ascii')
+
+    def close(self):
+        """إنهاء عملية git"""
+        if self.process.stdin:
+            self.process.stdin.close()
+        self.process.wait()
+
+
+def list_commits(revision='HEAD', repo='.'):
+    """الإيداعات من الأقدم إلى الأحدث: [(البصمة، التاريخ، العنوان)]"""
+    result = subprocess.run(['git', 'log', '--reverse', '--format=%H%x09%cI%x09%s', revision],
+                            cwd=repo, capture_output=True)
+    if result.returncode != 0:
+        raise GitError(result.stderr.decode('utf-8', 'replace').strip())
+    return [tuple(line.split('\t', 2)) for line in result.stdout.decode('utf-8').splitlines() if line]
+
+
+def blob_metrics(data):
+    """مقاييس ملف درس واحد"""
+    content = data.decode('utf-8-sig', errors='replace')
+    inline = [body for attrs, body in SCRIPT_PATTERN.findall(content) if 'src=' not in attrs]
+    return {
+        'bytes': len(data),
+        'inline_script_bytes': sum(len(body.encode('utf-8')) for body in inline),
+        'questions': len(parse_questions(content)),
+        'asset_list': sorted(set(ASSET_PATTERN.findall(content))),
+    }
+
+
+def load_cache():
+    """نتائج التحليل المخزنة: بصمة الملف -> المقاييس"""
+    if CACHE_FILE.exists():
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == HISTORY_VERSION:
+            return data['blobs']
+    return {}
+
+
+def save_cache(blobs):
+    """حفظ نتائج التحليل"""
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'version': HISTORY_VERSION, 'blobs': blobs}, f, ensure_ascii=False)
+
+
+def page_history(revision='HEAD', repo='.'):
+    """السلسلة الزمنية: قائمة إيداعات مع مقاييس كل درس والمجموع"""
+    blobs = load_cache()
+    cached = len(blobs)
+    reader = ObjectReader(repo)
+    history = []
+    try:
+        for sha, date, subject in list_commits(revision, repo):
+            pages = {}
+            for path, blob in sorted(reader.lesson_blobs(reader.commit_tree(sha)).items(),
+                                     key=lambda item: _natural_key(item[0])):
+                if blob not in blobs:
+                    blobs[blob] = blob_metrics(reader.read(blob)[1])
+                metrics = blobs[blob]
+                pages[path] = {**{k: metrics[k] for k in METRICS if k != 'assets'},
+                               'assets': len(metrics['asset_list']), 'blob': blob}
+            assets = set()
+            for page in pages.values():
+                assets.update(blobs[page['blob']]['asset_list'])
+            total = {k: sum(page[k] for page in pages.values()) for k in METRICS if k != 'assets'}
+            total['assets'] = len(assets)
+            history.append({'commit': sha, 'date': date, 'subject': subject,
+                            'lessons': len(pages), 'total': total, 'pages': pages})
+    finally:
+        reader.close()
+    if len(blobs) != cached:
+        save_cache(blobs)
+    return history
+
+
+def additions(history):
+    """تغيّر حجم كل درس في كل إيداع: [(الفرق، الإيداع، الدرس)] مرتبة من الأكبر"""
+    changes = []
+    previous = {}
+    for entry in history:
+        for path, page in entry['pages'].items():
+            old = previous.get(path)
+            if old is None or old['blob'] != page['blob']:
+                changes.append((page['bytes'] - (old['bytes'] if old else 0), entry, path))
+        previous = entry['pages']
+    return sorted(changes, key=lambda change: -change[0])
+
+
+def write_csv(history, path):
+    """سطر لكل (إيداع، درس) إضافة إلى سطر المجموع TOTAL"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['commit', 'date', 'subject', 'page', *METRICS, 'delta_bytes'])
+        previous = {}
+        for entry in history:
+            rows = [(TOTAL, entry['total'])] + list(entry['pages'].items())
+            for page, metrics in rows:
+                old = previous.get(page, {}).get('bytes', 0)
+                writer.writerow([entry['commit'], entry['date'], entry['subject'], page,
+                                 *(metrics[k] for k in METRICS), metrics['bytes'] - old])
+            previous = {TOTAL: entry['total'], **entry['pages']}
+
+
+def report(history):
+    """طباعة الإيداعات التي غيّرت الدروس وأكبر الإضافات"""
+    print(f"{'الإيداع':<9} {'التاريخ':<10} {'دروس':>4} {'HTML':>8} {'الفرق':>8} {'سكربت':>8} {'أسئلة':>5} {'موارد':>5}  العنوان")
+    previous = None
+    for entry in history:
+        total = entry['total']
+        if previous is not None and entry['pages'] == previous['pages']:
+            continue
+        delta = total['bytes'] - (previous['total']['bytes'] if previous else 0)
+        print(f"{entry['commit'][:8]:<9} {entry['date'][:10]:<10} {entry['lessons']:>4} "
+              f"{total['bytes'] / 1024:>7.0f}K {delta / 1024:>+7.0f}K {total['inline_script_bytes'] / 1024:>7.0f}K "
+              f"{total['questions']:>5} {total['assets']:>5}  {entry['subject'][:60]}")
+        previous = entry
+
+    growth = [change for change in additions(history) if change[0] > 0][:TOP_ADDITIONS]
+    if growth:
+        print("\n📈 أكبر الإضافات:")
+        for delta, entry, path in growth:
+            print(f"   +{delta / 1024:>6.1f} KB  {entry['commit'][:8]}  {path:<36} {entry['subject'][:50]}")
+
+
+def main():
+    """الدالة الرئيسية"""
+    args = sys.argv[1:]
+    outputs = {}
+    revision = 'HEAD'
+    i = 0
+    while i < len(args):
+        if args[i] in ('--csv', '--json'):
+            if i + 1 >= len(args) or args[i + 1].startswith('--'):
+                print(f"❌ {args[i]} يحتاج اسم ملف (مثل: python page_history.py {args[i]} history{args[i].replace('--', '.')})")
+                sys.exit(2)
+            outputs[args[i]] = args[i + 1]
+            i += 2
+            continue
+        if args[i].startswith('--'):
+            print(f"❌ خيار غير معروف: {args[i]}")
+            print(__doc__)
+            sys.exit(2)
+        revision = args[i]
+        i += 1
+
+    try:
+        history = page_history(revision)
+    except GitError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if not history:
+        print("ℹ️ لا توجد إيداعات في النطاق المحدد")
+        return
+
+    if '--csv' in outputs:
+        write_csv(history, outputs['--csv'])
+        print(f"💾 {outputs['--csv']}: {len(history)} إيداع")
+    if '--json' in outputs:
+        with open(outputs['--json'], 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+        print(f"💾 {outputs['--json']}: {len(history)} إيداع")
+    if not outputs:
+        report(history)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ذاكرة تحليل دائمة على القرص مفهرسة ببصمة محتوى الملف
+Persistent on-disk parse cache keyed on file content hash
+
+- لا يُعاد تحليل أي ملف لم يتغير محتواه (المفتاح هو sha256 للمحتوى)
+- تُحذف المدخلات تلقائياً عند اختفاء الملفات التي تصفها
+- التخزين في SQLite مع ضغط البيانات بـ zlib
+
+الاستخدام:
+    python parse_cache.py           # عرض إحصائيات الذاكرة
+    python parse_cache.py --clear   # مسح الذاكرة بالكامل
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import zlib
+from pathlib import Path
+
+# مسار قاعدة البيانات الافتراضي (يمكن تغييره بمتغير البيئة LESSON_CACHE)
+DEFAULT_CACHE_PATH = Path('.cache') / 'parse_cache.sqlite'
+
+
+def content_digest(data):
+    """بصمة sha256 لمحتوى الملف (bytes)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ParseCache:
+    """ذاكرة تحليل مفهرسة ببصمة المحتوى"""
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest  TEXT NOT NULL,
+                kind    TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                data    BLOB NOT NULL,
+                PRIMARY KEY (digest, kind)
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                path    TEXT PRIMARY KEY,
+                digest  TEXT NOT NULL
+            );
+        ''')
+        self.hits = 0
+        self.misses = 0
+        self.evict_missing()
+        self._known = dict(self.conn.execute('SELECT path, digest FROM files'))
+
+    def get(self, path, digest, kind, version):
+        """إرجاع البيانات المخزنة لهذه البصمة أو None"""
+        row = self.conn.execute(
+            'SELECT data FROM blobs WHERE digest = ? AND kind = ? AND version = ?',
+            (digest, kind, version)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._track(path, digest)
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def put(self, path, digest, kind, version, data):
+        """تخزين نتيجة التحليل لهذه البصمة"""
+        payload = zlib.compress(json.dumps(data, ensure_ascii=False).encode('utf-8'), 6)
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO blobs (digest, kind, version, data) VALUES (?, ?, ?, ?)',
+                (digest, kind, version, payload))
+        self._track(path, digest)
+
+    def _track(self, path, digest):
+        """ربط المسار بآخر بصمة معروفة له"""
+        path = str(Path(path).resolve())
+        if self._known.get(path) == digest:
+            return
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO files (path, digest) VALUES (?, ?)',
+                              (path, digest))
+        self._known[path] = digest
+
+    def evict_missing(self):
+        """حذف مدخلات الملفات المحذوفة والبصمات التي لم يعد يشير إليها أي ملف"""
+        gone = [(path,) for (path,) in self.conn.execute('SELECT path FROM files')
+                if not os.path.exists(path)]
+        with self.conn:
+            if gone:
+                self.conn.executemany('DELETE FROM files WHERE path = ?', gone)
+            self.conn.execute('DELETE FROM blobs WHERE digest NOT IN (SELECT digest FROM files)')
+        return len(gone)
+
+    def stats(self):
+        """إحصائيات الذاكرة"""
+        files = self.conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+        blobs, size = self.conn.execute('SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM blobs').fetchone()
+        return {'files': files, 'blobs': blobs, 'bytes': size}
+
+    def clear(self):
+        """مسح الذاكرة بالكامل"""
+        with self.conn:
+            self.conn.execute('DELETE FROM blobs')
+            self.conn.execute('DELETE FROM files')
+        self._known = {}
+
+    def close(self):
+        """إغلاق الاتصال بقاعدة البيانات"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+_cache = None
+
+
+def get_cache():
+    """الذاكرة المشتركة للعملية الحالية، أو None إذا كانت معطلة (LESSON_CACHE=off)"""
+    global _cache
+    setting = os.environ.get('LESSON_CACHE', '')
+    if setting.lower() in ('off', '0', 'no'):
+        return None
+    if _cache is None:
+        try:
+            _cache = ParseCache(setting or DEFAULT_CACHE_PATH)
+        except sqlite3.Error as e:
+            print(f"⚠️ تعذر فتح ذاكرة التحليل: {e}")
+            return None
+        atexit.register(_cache.close)
+    return _cache
+
+
+def main():
+    """الدالة الرئيسية"""
+    cache = get_cache()
+    if cache is None:
+        print("ℹ️ ذاكرة التحليل معطلة (LESSON_CACHE=off)")
+        return
+
+    if '--clear' in sys.argv:
+        cache.clear()
+        print("🗑️ تم مسح ذاكرة التحليل")
+        return
+
+    stats = cache.stats()
+    print(f"💾 ذاكرة التحليل: {cache.db_path}")
+    print(f"   📄 ملفات متتبعة: {stats['files']}")
+    print(f"   🧩 نتائج مخزنة: {stats['blobs']}")
+    print(f"   📦 الحجم: {stats['bytes'] / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
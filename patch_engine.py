@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+محرك التعديلات الموحد - قراءة وكتابة واحدة لكل ملف مهما تعددت الإصلاحات
+Transactional multi-patch engine: one read/modify/write per file for all steps
+
+- كل سكربت إصلاح (fix_*، add_*، update_*) يسجّل تحويله كخطوة مسماة بـ @register
+  والتحويل دالة نقية: (المحتوى، المسار) -> المحتوى الجديد
+- الخطوات تُطبّق بترتيب تسجيلها (ترتيب PATCH_MODULES) على المحتوى في الذاكرة،
+  فيُقرأ كل ملف مرة واحدة ويُكتب مرة واحدة: O(الملفات) بدلاً من O(الملفات × السكربتات)
+- الكتابة ذرية (ملف مؤقت ثم fsync ثم os.replace) وتُتخطى إذا لم يتغير المحتوى
+- كل ملف معاملة واحدة: إذا فشلت أي خطوة لا يُكتب شيء في ذلك الملف
+- الملفات تُوزّع على عدة عمليات (--jobs)، وكل ملف عليه قفل استشاري (fcntl.flock) من
+  القراءة حتى الكتابة، فتشغيل سكربتين في نفس الوقت لا يُفسد أي درس
+- في النهاية ملخص واحد بنتيجة كل ملف وزمنه
+- كل تشغيل يغيّر مدخلات البناء ينشر المصدر كجيل كامل في .generations/source/ (قبل
+  التعديل وبعده)، فالتراجع عن تشغيل كامل: python generations.py rollback source ثم restore
+- صفحات الدروس unit-*/lesson-*/index.html لم تعد مدخلات للبناء (build.py يبني الدروس من
+  lesson_template.html و lesson.json وبنك الأسئلة)، فالخطوات التي لا تستهدف غيرها خطوات
+  قديمة (legacy): تُعلَّم في --list، ولا يُنشر لها جيل لأنها لا تغير الموقع المبني
+- الخطوات ذات backup= تحفظ النسخة الأصلية في مخزن اللقطات (snapshot_store.py) بدلاً من
+  ملف .backup_* بجانب الدرس: لقطة واحدة لكل لاحقة في كل تشغيل (مثل backup_logo_add-20250101-120000)
+
+عدم تكرار التعديلات:
+- لكل خطوة معرّف (اسمها) وبصمة (من مصدر السكربت الذي يعرّفها)، وشرط اختياري applied
+  يتعرف على علامة التعديل في المحتوى (مثل class="designers") فلا تُضاف الكتلة مرتين
+- سجل التعديلات .cache/patch_ledger.sqlite يحفظ لكل ملف بصمة محتواه بعد آخر مرور
+  والخطوات التي قُيّمت عليه؛ إذا لم يتغير الملف ولا الخطوة فإعادة التشغيل مقارنة بصمة
+  فقط بدون فك ترميز أو بحث في المحتوى
+- إذا عُدّل الملف خارج المحرك تُقيّم الخطوات من جديد ويمنع الشرط applied التكرار
+
+المعاينة (--dry-run) لا تكتب شيئاً: تُحسب الفروقات الموحدة (unified diff) لكل الملفات
+على عدة عمليات، ويُطبع لكل ملف عدد الأسطر والبايتات المضافة والمحذوفة، ويمكن حفظ
+الفروقات كلها في ملف patch واحد (--patch) يُطبق لاحقاً بـ git apply
+
+الاستخدام:
+    python patch_engine.py --list                          # الخطوات المسجلة
+    python patch_engine.py update-credits designers-style  # تطبيق عدة خطوات في مرور واحد
+    python patch_engine.py --force fix-progress            # تجاهل السجل وإعادة التقييم
+    python patch_engine.py --jobs 4 update-credits         # تحديد عدد العمليات
+    python patch_engine.py --ledger                        # عرض سجل التعديلات
+    python patch_engine.py --forget                        # مسح سجل التعديلات
+    python patch_engine.py --dry-run update-credits        # معاينة الفروقات بدون كتابة
+    python patch_engine.py --dry-run                       # معاينة جميع الخطوات (التطبيق يحتاج أسماء)
+    python patch_engine.py --dry-run --patch out.patch --jobs 4 designers-style
+    python update_credits.py --dry-run                     # كل سكربت إصلاح يقبل نفس الخيارات
+"""
+
+import atexit
+import difflib
+import fnmatch
+import importlib
+import inspect
+import os
+import shutil
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from generations import GenerationError, publish
+from lesson_parser import _natural_key
+from parse_cache import content_digest
+from snapshot_store import SnapshotStore
+
+try:
+    import fcntl
+except ImportError:  # Windows: بدون أقفال بين العمليات
+    fcntl = None
+
+# جميع ملفات الدروس
+LESSON_FILES = ('unit-*/lesson-*/index.html',)
+
+# ملفات لا يقرؤها build.py (الدروس تُبنى من lesson_template.html و lesson.json والبنك)
+LEGACY_FILES = LESSON_FILES + ('lesson-1-2-backup.html',)
+
+# الصفحات التي تحمل الترويسة والتذييل المشتركين
+PAGE_FILES = ('index.html', 'lesson_template.html', 'lesson-1-2-backup.html') + LESSON_FILES
+
+# السكربتات التي تسجّل خطوات، بترتيب التطبيق
+PATCH_MODULES = [
+    'fix_javascript_emergency',
+    'fix_critical_js_errors',
+    'add_missing_systems',
+    'fix_progress_only',
+    'fix_hidden_content',
+    'fix_show_content',
+    'fix_content_visibility_final',
+    'add_school_logo',
+    'remove_logo_from_lessons',
+    'update_designers_style',
+    'update_credits',
+    'fix_all_lesson_titles',
+    'fix_match_perfect_lesson',
+]
+
+# سجل التعديلات (يمكن تغيير مساره بمتغير البيئة PATCH_LEDGER أو تعطيله بـ PATCH_LEDGER=off)
+DEFAULT_LEDGER_PATH = Path('.cache') / 'patch_ledger.sqlite'
+
+# ملفات الأقفال بين العمليات (بجانب المحرك حتى تشترك فيها العمليات مهما كان مجلد التشغيل)
+LOCK_DIR = Path(__file__).resolve().parent / '.cache' / 'locks'
+
+
+@dataclass
+class PatchStep:
+    """خطوة تعديل مسجلة"""
+    name: str
+    transform: Callable[[str, Path], str]
+    targets: Tuple[str, ...]
+    description: str = ''
+    backup: Optional[str] = None  # اسم لقطة النسخ الأصلية (مثل backup_logo_add) أو None
+    applied: Optional[Callable[[str], bool]] = None  # هل التعديل موجود في المحتوى مسبقاً؟
+    fingerprint: str = ''
+
+    @property
+    def legacy(self):
+        """هل تستهدف الخطوة ملفات لا تصل إلى الموقع المبني فقط؟"""
+        return not any(reaches_build(target) for target in self.targets)
+
+
+_registry: Dict[str, PatchStep] = {}
+
+
+def reaches_build(path):
+    """هل الملف (أو النمط) من مدخلات build.py؟ (صفحات الدروس القديمة ليست منها)"""
+    relative = Path(path).as_posix()
+    return not any(fnmatch.fnmatch(relative, pattern) for pattern in LEGACY_FILES)
+
+
+def contains(*markers):
+    """شرط applied: جميع العلامات موجودة في المحتوى"""
+    return lambda content: all(marker in content for marker in markers)
+
+
+def step_fingerprint(name, transform, version=1):
+    """بصمة الخطوة: تتغير عند تعديل السكربت الذي يعرّفها أو رفع version"""
+    try:
+        source = inspect.getsource(inspect.getmodule(transform))
+    except (OSError, TypeError):
+        source = transform.__qualname__
+    return content_digest(f"{name}\0{version}\0{source}".encode('utf-8'))[:16]
+
+
+def register(name, targets=LESSON_FILES, description='', backup=None, applied=None, version=1):
+    """مزخرف لتسجيل تحويل كخطوة مسماة
+
+    targets: أنماط glob أو مسارات محددة نسبة إلى مجلد المشروع.
+    applied: (المحتوى) -> bool، إذا أرجعت True فالتعديل مطبق ولا يُستدعى التحويل.
+    """
+    def decorator(transform):
+        _registry[name] = PatchStep(name, transform, tuple(targets), description, backup,
+                                    applied, step_fingerprint(name, transform, version))
+        return transform
+    return decorator
+
+
+def load_steps():
+    """استيراد السكربتات المسجلة في PATCH_MODULES (مرة واحدة)"""
+    for module in PATCH_MODULES:
+        importlib.import_module(module)
+
+
+def get_steps(names=None):
+    """الخطوات المطلوبة (أو جميعها) بترتيب التسجيل"""
+    load_steps()
+    if names is None:
+        return list(_registry.values())
+    unknown = [name for name in names if name not in _registry]
+    if unknown:
+        raise KeyError(', '.join(unknown))
+    return [step for step in _registry.values() if step.name in names]
+
+
+def target_files(steps, base_dir='.'):
+    """الملفات المستهدفة -> الخطوات التي تنطبق عليها (بترتيب طبيعي للمسارات)"""
+    base = Path(base_dir)
+    files: Dict[Path, List[PatchStep]] = {}
+    for step in steps:
+        for target in step.targets:
+            matches = sorted(base.glob(target)) if any(c in target for c in '*?[') else [base / target]
+            for path in matches:
+                if path.is_file():
+                    files.setdefault(path, [])
+                    if step not in files[path]:
+                        files[path].append(step)
+    return {path: files[path] for path in sorted(files, key=_natural_key)}
+
+
+class PatchLedger:
+    """سجل الخطوات المطبقة على كل ملف، مفهرس ببصمة محتواه"""
+
+    def __init__(self, db_path=DEFAULT_LEDGER_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS files (
+                path    TEXT PRIMARY KEY,
+                digest  TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS patches (
+                path        TEXT NOT NULL,
+                step        TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                digest      TEXT NOT NULL,
+                changed     INTEGER NOT NULL,
+                applied_at  TEXT NOT NULL,
+                PRIMARY KEY (path, step)
+            );
+        ''')
+
+    @staticmethod
+    def _key(path):
+        return Path(path).resolve().as_posix()
+
+    def known(self, path, digest):
+        """الخطوة -> بصمتها للخطوات المسجلة على الملف، إذا كان محتواه كما تركه آخر مرور"""
+        key = self._key(path)
+        row = self.conn.execute('SELECT digest FROM files WHERE path = ?', (key,)).fetchone()
+        if row is None or row[0] != digest:
+            return {}
+        return dict(self.conn.execute('SELECT step, fingerprint FROM patches WHERE path = ?', (key,)))
+
+    def record(self, path, before, after, evaluated, changed, reset=False):
+        """تسجيل مرور: الخطوات التي قُيّمت على المحتوى before وبصمة الناتج after
+
+        reset: المحتوى عُدّل خارج المحرك فتُحذف سجلات الملف السابقة.
+        """
+        key = self._key(path)
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            if reset:
+                self.conn.execute('DELETE FROM patches WHERE path = ?', (key,))
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO patches (path, step, fingerprint, digest, changed, applied_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(key, step.name, step.fingerprint, before, int(step.name in changed), now)
+                 for step in evaluated])
+            self.conn.execute('INSERT OR REPLACE INTO files (path, digest) VALUES (?, ?)', (key, after))
+
+    def entries(self):
+        """جميع السجلات: (المسار، الخطوة، البصمة، غيّرت الملف؟، الوقت)"""
+        return self.conn.execute(
+            'SELECT path, step, fingerprint, changed, applied_at FROM patches '
+            'ORDER BY path, applied_at').fetchall()
+
+    def clear(self):
+        """مسح السجل بالكامل"""
+        with self.conn:
+            self.conn.execute('DELETE FROM patches')
+            self.conn.execute('DELETE FROM files')
+
+    def close(self):
+        """إغلاق الاتصال بقاعدة البيانات"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+_ledger = None
+
+
+def get_ledger():
+    """سجل التعديلات المشترك للعملية الحالية، أو None إذا كان معطلاً (PATCH_LEDGER=off)"""
+    global _ledger
+    setting = os.environ.get('PATCH_LEDGER', '')
+    if setting.lower() in ('off', '0', 'no'):
+        return None
+    if _ledger is None:
+        try:
+            _ledger = PatchLedger(setting or DEFAULT_LEDGER_PATH)
+        except sqlite3.Error as e:
+            print(f"⚠️ تعذر فتح سجل التعديلات، يستمر التشغيل بدونه: {e}")
+            return None
+        atexit.register(_ledger.close)
+    return _ledger
+
+
+def apply_steps(content, path, steps):
+    """تطبيق الخطوات على المحتوى في الذاكرة -> (المحتوى الجديد، أسماء الخطوات التي غيّرته)
+
+    الخطوة التي يدل شرطها applied على أنها مطبقة لا يُستدعى تحويلها.
+    """
+    applied = []
+    for step in steps:
+        if step.applied is not None and step.applied(content):
+            continue
+        updated = step.transform(content, Path(path))
+        if updated != content:
+            applied.append(step.name)
+            content = updated
+    return content, applied
+
+
+def read_text(path):
+    """قراءة ملف نصي كما هو (بدون تحويل نهايات الأسطر)"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def write_atomic(path, content):
+    """كتابة ذرية: ملف مؤقت في نفس المجلد ثم fsync ثم os.replace
+
+    لا يرى أي قارئ ملفاً نصف مكتوب، وبعد os.replace يُزامن المجلد نفسه فيبقى
+    الاسم الجديد حتى لو انقطع التيار.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+        _fsync_dir(path.parent)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _fsync_dir(directory):
+    """مزامنة مدخلات المجلد (غير متاحة على Windows)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def file_lock(path):
+    """قفل استشاري حصري على ملف طوال قراءته وتعديله وكتابته
+
+    القفل على ملف جانبي في LOCK_DIR وليس على الملف نفسه، لأن os.replace يبدّل الملف
+    فيفقد القفل معناه. بدون fcntl (Windows) لا يوجد قفل.
+    """
+    if fcntl is None:
+        yield
+        return
+    key = content_digest(Path(path).resolve().as_posix().encode('utf-8'))[:24]
+    LOCK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_DIR / f"{key}.lock", 'a') as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def patch_file(path, steps, ledger=None, backups=None):
+    """قراءة الملف مرة واحدة وتطبيق الخطوات وكتابته مرة واحدة إن تغيّر
+
+    يُرجع (أسماء الخطوات التي غيّرت الملف، عدد الخطوات التي قُيّمت). الخطوات المسجلة
+    في ledger لنفس بصمة المحتوى ونفس بصمة الخطوة لا تُقيّم. الملف مقفل من القراءة
+    حتى تسجيل النتيجة، فلا تتداخل عمليتان على نفس الدرس. النسخة الأصلية لخطوات
+    backup= تُحفظ في مخزن اللقطات وتُضاف بصمتها إلى backups (اللاحقة -> البصمة).
+    """
+    with file_lock(path):
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = content_digest(raw)
+        known = ledger.known(path, digest) if ledger else {}
+        pending = [step for step in steps if known.get(step.name) != step.fingerprint]
+        if not pending:
+            return [], 0
+
+        original = raw.decode('utf-8')
+        content, applied = apply_steps(original, path, pending)
+        after = digest
+        if applied and content != original:
+            for step in pending:
+                if step.backup and step.name in applied:
+                    store = get_store()
+                    stored = store.put(raw, bases=(store.latest_versions().get(Path(path).as_posix()),))
+                    if backups is not None:
+                        backups[step.backup] = stored
+            write_atomic(path, content)
+            after = content_digest(content.encode('utf-8'))
+        else:
+            applied = []
+        if ledger:
+            ledger.record(path, digest, after, pending, applied, reset=not known)
+        return applied, len(pending)
+
+
+def _init_worker():
+    """كل عملية تفتح اتصالها الخاص بسجل التعديلات (اتصالات SQLite لا تُورّث عبر fork)"""
+    global _ledger, _store
+    _ledger = None
+    _store = None
+
+
+_store = None
+
+
+def get_store():
+    """مخزن اللقطات للعملية الحالية"""
+    global _store
+    if _store is None:
+        _store = SnapshotStore()
+    return _store
+
+
+def save_backups(outcomes):
+    """لقطة لكل لاحقة backup= بالنسخ الأصلية للملفات التي عُدّلت في هذا التشغيل"""
+    groups = {}
+    for path, _, _, _, _, backups in outcomes:
+        for suffix, digest in backups.items():
+            groups.setdefault(suffix, {})[Path(path).as_posix()] = digest
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    for suffix, files in groups.items():
+        name = get_store().write_manifest(f"{suffix}-{stamp}", files, f"قبل تطبيق الخطوات ({suffix})")
+        print(f"📸 النسخ الأصلية في اللقطة {name} ({len(files)} ملف)")
+
+
+def patch_shard(shard, use_ledger=True):
+    """تطبيق الخطوات على مجموعة ملفات داخل عملية واحدة
+
+    shard: [(المسار، أسماء الخطوات)]
+    -> [(المسار، الخطوات المطبقة أو None، عدد المقيّمة، الزمن، الخطأ، بصمات النسخ الأصلية)]
+    """
+    ledger = get_ledger() if use_ledger else None
+    results = []
+    for path, names in shard:
+        start = time.perf_counter()
+        backups = {}
+        try:
+            applied, evaluated = patch_file(path, get_steps(names), ledger, backups)
+            error = None
+        except Exception as e:
+            applied, evaluated, error = None, 0, str(e)
+        results.append((path, applied, evaluated, time.perf_counter() - start, error, backups))
+    return results
+
+
+def publish_generation(base_dir, label):
+    """نشر صفحات المصدر كجيل في .generations/source/ (لا شيء إذا طابقت الجيل الحالي)"""
+    try:
+        name, copied, linked = publish('source', label, source=base_dir)
+    except (GenerationError, OSError) as e:
+        print(f"⚠️ تعذر نشر جيل للمصدر: {e}")
+        return
+    if copied:
+        print(f"🚀 الجيل source/{name}: {copied} ملف جديد، {linked} رابط لملفات غير متغيرة")
+
+
+def run_steps(steps, base_dir='.', use_ledger=True, jobs=None):
+    """تطبيق الخطوات على جميع ملفاتها المستهدفة -> المسار -> الخطوات المطبقة (أو None عند الفشل)
+
+    الملفات تُوزّع على jobs عملية (افتراضياً عدد الأنوية) بالتناوب، وكل ملف مقفل أثناء
+    تعديله، فيمكن تشغيل عدة سكربتات في نفس الوقت على نفس الدروس بأمان.
+    """
+    start = time.perf_counter()
+    files = [(path, [step.name for step in file_steps])
+             for path, file_steps in target_files(steps, base_dir).items()]
+    # الجيل يحفظ مدخلات البناء؛ تعديل صفحات الدروس القديمة وحدها لا يغير الموقع المبني
+    build_inputs = any(reaches_build(os.path.relpath(path, base_dir)) for path, _ in files)
+    if build_inputs:
+        publish_generation(base_dir, 'pre-patch')
+    elif files:
+        print("ℹ️ الملفات المستهدفة صفحات دروس قديمة لا يقرؤها build.py (لا يُنشر جيل)")
+    jobs = min(jobs or os.cpu_count() or 1, len(files)) or 1
+    if jobs == 1:
+        outcomes = patch_shard(files, use_ledger)
+    else:
+        shards = [files[i::jobs] for i in range(jobs)]
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            outcomes = [outcome for shard in pool.map(patch_shard, shards, [use_ledger] * jobs)
+                        for outcome in shard]
+        outcomes.sort(key=lambda outcome: _natural_key(outcome[0]))
+
+    results = {}
+    for path, applied, evaluated, elapsed, error, _ in outcomes:
+        results[path] = applied
+        timing = f"({elapsed * 1000:.0f} ms)"
+        if error is not None:
+            print(f"❌ خطأ في معالجة {path}: {error} {timing}")
+        elif applied:
+            print(f"✅ {path}: {', '.join(applied)} {timing}")
+        elif not evaluated:
+            print(f"⏭️  مطبق مسبقاً (سجل التعديلات): {path} {timing}")
+        else:
+            print(f"ℹ️  لا يحتاج تحديث: {path} {timing}")
+
+    if outcomes:
+        slowest = max(outcomes, key=lambda outcome: outcome[3])
+        skipped = sum(1 for outcome in outcomes if outcome[2] == 0 and outcome[4] is None)
+        print(f"⏱️  {len(outcomes)} ملف على {jobs} عملية في {time.perf_counter() - start:.2f} ث "
+              f"(تخطى السجل {skipped}، الأبطأ: {slowest[0]} {slowest[3] * 1000:.0f} ms)")
+    save_backups(outcomes)
+    if build_inputs and any(results.values()):
+        publish_generation(base_dir, 'patch')
+    return results
+
+
+def unified_diff(original, content, path):
+    """فرق موحد بين نسختين من ملف بصيغة يقبلها git apply"""
+    name = Path(path).as_posix()
+    lines = []
+    for line in difflib.unified_diff(original.splitlines(keepends=True), content.splitlines(keepends=True),
+                                     f"a/{name}", f"b/{name}"):
+        lines.append(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n')
+    return ''.join(lines)
+
+
+def diff_stats(diff):
+    """(الأسطر المضافة، المحذوفة، البايتات المضافة، المحذوفة) في فرق موحد"""
+    added = removed = added_bytes = removed_bytes = 0
+    for line in diff.splitlines(keepends=True):
+        if line.startswith(('+++', '---')):
+            continue
+        if line.startswith('+'):
+            added += 1
+            added_bytes += len(line[1:].encode('utf-8'))
+        elif line.startswith('-'):
+            removed += 1
+            removed_bytes += len(line[1:].encode('utf-8'))
+    return added, removed, added_bytes, removed_bytes
+
+
+def preview_file(path, names):
+    """معاينة خطوات على ملف بدون كتابة -> (الخطوات التي ستغيّره، الفرق الموحد)
+
+    تعمل داخل عمليات ProcessPoolExecutor، لذلك تستقبل أسماء الخطوات وتحمّلها بنفسها.
+    """
+    original = read_text(path)
+    content, applied = apply_steps(original, path, get_steps(names))
+    if content == original:
+        return [], ''
+    return applied, unified_diff(original, content, path)
+
+
+def dry_run(steps, base_dir='.', patch_path=None, jobs=None):
+    """معاينة الخطوات على جميع ملفاتها بالتوازي وطباعة ملخص الفروقات -> عدد الملفات التي ستتغير"""
+    files = target_files(steps, base_dir)
+    names = {path: [step.name for step in file_steps] for path, file_steps in files.items()}
+    results = {}
+    if len(files) <= 1 or jobs == 1:
+        for path in files:
+            results[path] = preview_file(path, names[path])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {path: pool.submit(preview_file, path, names[path]) for path in files}
+            for path, future in futures.items():
+                results[path] = future.result()
+
+    totals = [0, 0, 0, 0]
+    changed = 0
+    for path, (applied, diff) in results.items():
+        if not diff:
+            continue
+        changed += 1
+        stats = diff_stats(diff)
+        totals = [t + s for t, s in zip(totals, stats)]
+        print(f"📝 {Path(path).as_posix():<40} +{stats[0]:<4} -{stats[1]:<4} سطر  "
+              f"+{stats[2]:<6} -{stats[3]:<6} بايت  ({', '.join(applied)})")
+    print("=" * 60)
+    print(f"🔍 معاينة: سيتغير {changed} ملف من أصل {len(results)} "
+          f"(+{totals[0]} -{totals[1]} سطر، +{totals[2]} -{totals[3]} بايت)، لم يُكتب أي ملف")
+
+    if patch_path:
+        with open(patch_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(''.join(diff for _, diff in results.values()))
+        print(f"💾 {patch_path}: فروقات {changed} ملف (للتطبيق: git apply {patch_path})")
+    return changed
+
+
+def _option(args, name):
+    """قيمة خيار من سطر الأوامر (مثل --patch out.patch) أو None"""
+    if name in args:
+        i = args.index(name)
+        if i + 1 < len(args):
+            return args[i + 1]
+    return None
+
+
+def handle_dry_run(names, args=None):
+    """تنفيذ --dry-run لسكربت إصلاح إن طُلب -> True إذا نُفذت المعاينة"""
+    args = sys.argv[1:] if args is None else args
+    if '--dry-run' not in args:
+        return False
+    jobs = _option(args, '--jobs')
+    dry_run(get_steps(names), patch_path=_option(args, '--patch'), jobs=int(jobs) if jobs else None)
+    return True
+
+
+def summarize(results):
+    """ملخص نتائج التشغيل: (المحدثة، الفاشلة)"""
+    updated = sum(1 for applied in results.values() if applied)
+    failed = sum(1 for applied in results.values() if applied is None)
+    return updated, failed
+
+
+def show_ledger():
+    """طباعة سجل التعديلات"""
+    ledger = get_ledger()
+    if ledger is None:
+        print("ℹ️ سجل التعديلات معطل (PATCH_LEDGER=off)")
+        return
+    entries = ledger.entries()
+    print(f"📒 {ledger.db_path}: {len(entries)} مدخل")
+    root = Path('.').resolve().as_posix() + '/'
+    for path, step, fingerprint, changed, applied_at in entries:
+        mark = '✅' if changed else '➖'
+        print(f"   {mark} {path.replace(root, '', 1):<40} {step:<26} {fingerprint[:8]}  {applied_at}")
+
+
+def main():
+    """الدالة الرئيسية"""
+    args = sys.argv[1:]
+    if not args or '--list' in args:
+        for step in get_steps():
+            legacy = ' 🗄️ (قديمة: صفحات دروس لا يقرؤها build.py)' if step.legacy else ''
+            print(f"🔧 {step.name:<28} {step.description}{legacy}")
+            targets = step.targets if len(step.targets) <= 4 else [f"{len(step.targets)} ملف"]
+            print(f"   📁 {', '.join(targets)}")
+        if not args:
+            print(__doc__)
+        return
+    if '--ledger' in args:
+        show_ledger()
+        return
+    if '--forget' in args:
+        ledger = get_ledger()
+        if ledger is not None:
+            ledger.clear()
+        print("🗑️ تم مسح سجل التعديلات")
+        return
+
+    values = {_option(args, name) for name in ('--patch', '--jobs')}
+    names = [a for a in args if not a.startswith('--') and a not in values]
+    if not names and '--dry-run' not in args:
+        # التطبيق يحتاج أسماء صريحة: بعض الخطوات متعارضة (add/remove-school-logo) أو للطوارئ
+        print("❌ حدد أسماء الخطوات المطلوب تطبيقها (python patch_engine.py --list)")
+        sys.exit(2)
+    try:
+        # المعاينة وحدها بدون أسماء تشمل جميع الخطوات المسجلة (لا تكتب شيئاً)
+        steps = get_steps(names or None)
+    except KeyError as e:
+        print(f"❌ خطوات غير معروفة: {e.args[0]} (python patch_engine.py --list)")
+        sys.exit(1)
+    if handle_dry_run([step.name for step in steps], args):
+        return
+
+    print(f"🚀 تطبيق {len(steps)} خطوة في مرور واحد: {', '.join(s.name for s in steps)}")
+    print("=" * 60)
+    jobs = _option(args, '--jobs')
+    results = run_steps(steps, use_ledger='--force' not in args, jobs=int(jobs) if jobs else None)
+    updated, failed = summarize(results)
+    print("=" * 60)
+    print(f"✅ تم تحديث {updated} ملف من أصل {len(results)}")
+    if failed:
+        print(f"❌ فشل {failed} ملف (لم يُكتب فيها أي تعديل)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # السكربتات تسجّل خطواتها في الوحدة المستوردة patch_engine وليس في __main__
+    import patch_engine
+    patch_engine.main()
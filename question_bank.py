@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+بنك الأسئلة الموحد - المصدر الوحيد لأسئلة جميع الدروس
+Canonical question bank (SQLite) compiled into the lessons' inline banks
+
+- لكل سؤال معرّف ثابت لا يتغير ولا يُعاد استخدامه
+- جداول: الدروس، الأسئلة، الخيارات، وعضوية الأسئلة في الدروس (مع الترتيب)
+- التعديل الجماعي معاملة واحدة على القاعدة، ثم خطوة compile تكتب مصفوفة
+  bank في كل درس بالمواضع الدقيقة من js_literal
+
+الاستخدام:
+    python question_bank.py import [--source lessons|q|backup] [درس...]
+    python question_bank.py compile [درس...]     # كتابة البنوك في الدروس
+    python question_bank.py check                # هل الدروس مطابقة للقاعدة؟
+    python question_bank.py stats                # إحصائيات القاعدة
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+from js_literal import JSLiteralError, parse_assignment, replace_assignment
+from lesson_parser import Question, discover_lessons, load_lesson, reference_path
+
+# مسار قاعدة البيانات (ملف متتبع في المستودع بجانب الدروس)
+DEFAULT_DB_PATH = Path('question_bank.sqlite')
+
+# ملف النسخة الاحتياطية للمحتوى المتخصص
+BACKUP_FILE = Path('specialized_content_backup.json')
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS lessons (
+        id       TEXT PRIMARY KEY,              -- unit-1-cells/lesson-1-1
+        number   TEXT NOT NULL,                 -- 1-1
+        title    TEXT NOT NULL DEFAULT ''
+    );
+    CREATE TABLE IF NOT EXISTS questions (
+        id       INTEGER PRIMARY KEY AUTOINCREMENT,
+        text     TEXT NOT NULL,
+        answer   INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS choices (
+        question_id INTEGER NOT NULL REFERENCES questions(id) ON DELETE CASCADE,
+        position    INTEGER NOT NULL,
+        text        TEXT NOT NULL,
+        PRIMARY KEY (question_id, position)
+    );
+    CREATE TABLE IF NOT EXISTS lesson_questions (
+        lesson_id   TEXT NOT NULL REFERENCES lessons(id) ON DELETE CASCADE,
+        position    INTEGER NOT NULL,
+        question_id INTEGER NOT NULL REFERENCES questions(id),
+        PRIMARY KEY (lesson_id, position),
+        UNIQUE (lesson_id, question_id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_lesson_questions_question ON lesson_questions(question_id);
+    CREATE INDEX IF NOT EXISTS idx_questions_text ON questions(text);
+'''
+
+
+def _content(question):
+    """محتوى سؤال للمقارنة بصف في القاعدة: (النص، الخيارات، الإجابة)"""
+    return question.text, tuple(question.choices), question.answer
+
+
+class QuestionBank:
+    """قاعدة أسئلة SQLite مع معرّفات ثابتة"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, readonly=False):
+        self.db_path = Path(db_path)
+        if readonly:
+            self.conn = sqlite3.connect(f'{self.db_path.resolve().as_uri()}?mode=ro', uri=True)
+            return
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """إغلاق الاتصال بقاعدة البيانات"""
+        self.conn.close()
+
+    def lesson_ids(self):
+        """معرّفات جميع الدروس المسجلة"""
+        return [row[0] for row in self.conn.execute('SELECT id FROM lessons ORDER BY rowid')]
+
+    def lesson_questions(self, lesson_id):
+        """أسئلة الدرس بالترتيب كقائمة Question، أو None إذا لم يكن الدرس مسجلاً"""
+        if self.conn.execute('SELECT 1 FROM lessons WHERE id = ?', (lesson_id,)).fetchone() is None:
+            return None
+        rows = self.conn.execute('''
+            SELECT q.id, q.text, q.answer
+            FROM lesson_questions lq JOIN questions q ON q.id = lq.question_id
+            WHERE lq.lesson_id = ? ORDER BY lq.position
+        ''', (lesson_id,)).fetchall()
+        choices = {}
+        for question_id, text in self.conn.execute('''
+            SELECT c.question_id, c.text
+            FROM choices c JOIN lesson_questions lq ON lq.question_id = c.question_id
+            WHERE lq.lesson_id = ? ORDER BY c.question_id, c.position
+        ''', (lesson_id,)):
+            choices.setdefault(question_id, []).append(text)
+        return [Question(text, choices.get(question_id, []), answer)
+                for question_id, text, answer in rows]
+
+    def _row(self, question_id):
+        """محتوى صف سؤال: (النص، الخيارات، الإجابة)"""
+        text, answer = self.conn.execute(
+            'SELECT text, answer FROM questions WHERE id = ?', (question_id,)).fetchone()
+        choices = tuple(choice for (choice,) in self.conn.execute(
+            'SELECT text FROM choices WHERE question_id = ? ORDER BY position', (question_id,)))
+        return text, choices, answer
+
+    def _find_identical(self, question, exclude):
+        """معرّف سؤال مطابق تماماً (النص والخيارات والإجابة) في القاعدة كلها، خارج exclude"""
+        for (question_id,) in self.conn.execute(
+                'SELECT id FROM questions WHERE text = ? AND answer = ? ORDER BY id',
+                (question.text, question.answer)):
+            if question_id not in exclude and self._row(question_id) == _content(question):
+                return question_id
+        return None
+
+    def _shared(self, question_id, lesson_id):
+        """هل ينتمي السؤال إلى درس آخر غير lesson_id؟"""
+        return self.conn.execute(
+            'SELECT 1 FROM lesson_questions WHERE question_id = ? AND lesson_id != ? LIMIT 1',
+            (question_id, lesson_id)).fetchone() is not None
+
+    def set_lesson(self, lesson_id, number, title, questions):
+        """استبدال أسئلة درس كاملة (يُستدعى داخل معاملة) -> المعرّفات بترتيب الأسئلة
+
+        مطابقة كل سؤال بصف واحد فقط، بالترتيب:
+        1. سؤال مطابق تماماً من أسئلة الدرس الحالية (يحتفظ بمعرّفه ولو تغير ترتيبه)
+        2. السؤال الذي كان في نفس الموضع: يُعدّل في مكانه (تعديل النص لا يغير المعرّف)،
+           إلا إذا كان يشترك فيه درس آخر فيُنشأ صف جديد (نسخ عند الكتابة)
+        3. سؤال مطابق تماماً في درس آخر، وإلا صف جديد
+        لا يُدمج سؤالان مختلفان (أو مكرران) من المدخلات في صف واحد أبداً.
+        """
+        self.conn.execute('''
+            INSERT INTO lessons (id, number, title) VALUES (?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET number = excluded.number, title = excluded.title
+        ''', (lesson_id, number, title))
+
+        previous = [question_id for (question_id,) in self.conn.execute(
+            'SELECT question_id FROM lesson_questions WHERE lesson_id = ? ORDER BY position', (lesson_id,))]
+        by_content = {}
+        for question_id in previous:
+            by_content.setdefault(self._row(question_id), []).append(question_id)
+
+        ids = [None] * len(questions)
+        claimed = set()
+        for i, question in enumerate(questions):
+            candidates = by_content.get(_content(question))
+            if candidates:
+                ids[i] = candidates.pop(0)
+                claimed.add(ids[i])
+
+        for i, question in enumerate(questions):
+            if ids[i] is not None or i >= len(previous) or previous[i] in claimed:
+                continue
+            question_id = previous[i]
+            claimed.add(question_id)
+            if self._shared(question_id, lesson_id):
+                continue
+            self.conn.execute('UPDATE questions SET text = ?, answer = ? WHERE id = ?',
+                              (question.text, question.answer, question_id))
+            self.conn.execute('DELETE FROM choices WHERE question_id = ?', (question_id,))
+            self._insert_choices(question_id, question)
+            ids[i] = question_id
+
+        for i, question in enumerate(questions):
+            if ids[i] is not None:
+                continue
+            question_id = self._find_identical(question, claimed)
+            if question_id is None:
+                question_id = self.conn.execute(
+                    'INSERT INTO questions (text, answer) VALUES (?, ?)',
+                    (question.text, question.answer)).lastrowid
+                self._insert_choices(question_id, question)
+            claimed.add(question_id)
+            ids[i] = question_id
+
+        self.conn.execute('DELETE FROM lesson_questions WHERE lesson_id = ?', (lesson_id,))
+        self.conn.executemany(
+            'INSERT INTO lesson_questions (lesson_id, position, question_id) VALUES (?, ?, ?)',
+            [(lesson_id, i, question_id) for i, question_id in enumerate(ids)])
+        return ids
+
+    def _insert_choices(self, question_id, question):
+        """كتابة خيارات السؤال بترتيبها"""
+        self.conn.executemany(
+            'INSERT INTO choices (question_id, position, text) VALUES (?, ?, ?)',
+            [(question_id, i, choice) for i, choice in enumerate(question.choices)])
+
+    def prune(self):
+        """حذف الأسئلة التي لم تعد تنتمي لأي درس"""
+        return self.conn.execute('''
+            DELETE FROM questions WHERE id NOT IN (SELECT question_id FROM lesson_questions)
+        ''').rowcount
+
+    def stats(self):
+        """إحصائيات القاعدة"""
+        count = lambda table: self.conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        shared = self.conn.execute('''
+            SELECT COUNT(*) FROM (SELECT question_id FROM lesson_questions
+                                  GROUP BY question_id HAVING COUNT(*) > 1)
+        ''').fetchone()[0]
+        return {'lessons': count('lessons'), 'questions': count('questions'),
+                'choices': count('choices'), 'shared': shared}
+
+
+def js_string(text):
+    """نص JavaScript آمن (علامات التنصيص، الشرطة المائلة، و</script>)"""
+    return json.dumps(text, ensure_ascii=False).replace('</', '<\\/')
+
+
+def format_bank(questions):
+    """تحويل قائمة Question إلى مصفوفة bank بتنسيق الدروس"""
+    items = []
+    for question in questions:
+        choices = ','.join(js_string(choice) for choice in question.choices)
+        items.append(f'      {{q:{js_string(question.text)}, c:[{choices}], a:{question.answer}}}')
+    return "[\n" + ",\n".join(items) + "\n    ]"
+
+
+def _same_questions(a, b):
+    """مقارنة قائمتين من الأسئلة بالمحتوى"""
+    return [(q.text, q.choices, q.answer) for q in a] == [(q.text, q.choices, q.answer) for q in b]
+
+
+def _selected(paths, names):
+    """تصفية الدروس حسب الأسماء الممررة (1-1 أو unit-1-cells/lesson-1-1)"""
+    if not names:
+        return paths
+    return [p for p in paths
+            if p.parent.name.replace('lesson-', '') in names or '/'.join(p.parts[-3:-1]) in names]
+
+
+def _source_questions(source, lesson_path, lesson_id, backup):
+    """أسئلة الدرس من المصدر المطلوب"""
+    if source == 'backup':
+        entry = backup.get(lesson_id) or {}
+        return [Question(q['question'].strip(), [c.strip() for c in q['choices']], q['answer'])
+                for q in entry.get('questions', [])]
+    path = reference_path(lesson_path) if source == 'q' else lesson_path
+    if not path.exists():
+        return []
+    return load_lesson(path).questions
+
+
+def import_lessons(bank, source='lessons', names=None):
+    """استيراد الأسئلة من المصدر إلى القاعدة في معاملة واحدة"""
+    backup = {}
+    if source == 'backup':
+        with open(BACKUP_FILE, 'r', encoding='utf-8') as f:
+            backup = json.load(f)
+
+    imported = 0
+    with bank.conn:
+        for path in _selected(discover_lessons(), names):
+            lesson = load_lesson(path)
+            questions = _source_questions(source, path, lesson.key, backup)
+            if not questions:
+                print(f"⚠️ لا توجد أسئلة لـ {lesson.short_name} في المصدر {source}")
+                continue
+            bank.set_lesson(lesson.key, lesson.number, lesson.title, questions)
+            imported += len(questions)
+            print(f"✅ {lesson.short_name}: {len(questions)} سؤال")
+        pruned = bank.prune()
+
+    print(f"\n📥 تم استيراد {imported} سؤال")
+    if pruned:
+        print(f"🗑️ حُذف {pruned} سؤال لم يعد مستخدماً")
+
+
+def compile_lessons(bank, names=None, write=True):
+    """كتابة بنك كل درس من القاعدة؛ يُرجع قائمة الدروس المختلفة عن القاعدة"""
+    changed = []
+    for path in _selected(discover_lessons(), names):
+        lesson = load_lesson(path)
+        questions = bank.lesson_questions(lesson.key)
+        if questions is None:
+            print(f"⚠️ {lesson.short_name} غير مسجل في القاعدة")
+            continue
+
+        try:
+            span = parse_assignment(lesson.content, 'bank')
+        except JSLiteralError as e:
+            print(f"❌ {lesson.short_name}: بنك الأسئلة غير صالح: {e}")
+            changed.append(lesson.key)
+            continue
+        if span is None:
+            print(f"⚠️ لم يتم العثور على bank في {path}")
+            continue
+        if _same_questions(lesson.questions, questions):
+            continue
+
+        changed.append(lesson.key)
+        if not write:
+            print(f"🔄 {lesson.short_name}: يختلف عن القاعدة")
+            continue
+        content = replace_assignment(lesson.content, 'bank', format_bank(questions))
+        # كتابة ذرية: لا يُترك درس نصف مكتوب إذا انقطعت العملية
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp, path)
+        print(f"✅ {lesson.short_name}: تمت كتابة {len(questions)} سؤال")
+    return changed
+
+
+def set_lesson_questions(lesson_path, questions, db_path=DEFAULT_DB_PATH):
+    """استبدال أسئلة درس في القاعدة ثم كتابة بنكه في الدرس (للسكريبتات الأخرى)
+
+    السكريبتات لا تكتب مصفوفة bank بنفسها، فالقاعدة تبقى المصدر الوحيد و check لا يجد فرقاً.
+    """
+    lesson = load_lesson(lesson_path)
+    bank = QuestionBank(db_path)
+    try:
+        with bank.conn:
+            bank.set_lesson(lesson.key, lesson.number, lesson.title, questions)
+            bank.prune()
+        compile_lessons(bank, [lesson.key])
+    finally:
+        bank.close()
+    return len(questions)
+
+
+def get_lesson_questions(lesson_key, db_path=DEFAULT_DB_PATH):
+    """أسئلة درس من القاعدة إن وُجدت، وإلا None (للسكريبتات الأخرى)"""
+    if not Path(db_path).exists():
+        return None
+    bank = QuestionBank(db_path, readonly=True)
+    try:
+        return bank.lesson_questions(lesson_key)
+    finally:
+        bank.close()
+
+
+def main():
+    """الدالة الرئيسية"""
+    args = sys.argv[1:]
+    command = args.pop(0) if args else 'stats'
+
+    source = 'lessons'
+    if '--source' in args:
+        i = args.index('--source')
+        source = args[i + 1] if i + 1 < len(args) else ''
+        del args[i:i + 2]
+    if source not in ('lessons', 'q', 'backup'):
+        print("❌ المصدر يجب أن يكون lessons أو q أو backup")
+        sys.exit(2)
+
+    if command != 'import' and not DEFAULT_DB_PATH.exists():
+        print(f"❌ القاعدة غير موجودة: {DEFAULT_DB_PATH} (شغّل: python question_bank.py import)")
+        sys.exit(1)
+
+    bank = QuestionBank()
+    try:
+        if command == 'import':
+            print(f"📥 استيراد الأسئلة من: {source}")
+            import_lessons(bank, source, args)
+        elif command == 'compile':
+            print("🔨 كتابة بنوك الأسئلة في الدروس...")
+            changed = compile_lessons(bank, args)
+            print(f"\n📊 تم تحديث {len(changed)} درس")
+        elif command == 'check':
+            changed = compile_lessons(bank, args, write=False)
+            if changed:
+                print(f"\n❌ {len(changed)} درس غير مطابق للقاعدة (شغّل: python question_bank.py compile)")
+                sys.exit(1)
+            print("✅ جميع الدروس مطابقة لبنك الأسئلة")
+        elif command == 'stats':
+            stats = bank.stats()
+            print(f"🗃️ بنك الأسئلة: {bank.db_path}")
+            print(f"   📚 الدروس: {stats['lessons']}")
+            print(f"   ❓ الأسئلة: {stats['questions']}")
+            print(f"   🔤 الخيارات: {stats['choices']}")
+            print(f"   🔗 أسئلة مشتركة بين أكثر من درس: {stats['shared']}")
+        else:
+            print(__doc__)
+            sys.exit(2)
+    finally:
+        bank.close()
+
+
+if __name__ == "__main__":
+    main()
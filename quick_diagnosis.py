@@ -7,20 +7,20 @@
 import os
 import re
 
+from lesson_parser import load_lesson
+
 def quick_diagnosis(file_path):
     """تشخيص سريع للملف"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        lesson = load_lesson(file_path)
+        content = lesson.content
         
         print(f"\n🔍 تشخيص سريع: {file_path}")
         print("-" * 50)
         
         # 1. فحص الأسئلة
-        bank_match = re.search(r'const bank\s*=\s*\[(.*?)\];', content, re.DOTALL)
-        if bank_match:
-            questions = re.findall(r'\{q:"[^"]+",\s*c:\[[^\]]+\],\s*a:\d+\}', bank_match.group(1))
-            print(f"✅ الأسئلة: {len(questions)} سؤال موجود")
+        if lesson.questions:
+            print(f"✅ الأسئلة: {len(lesson.questions)} سؤال موجود")
         else:
             print("❌ لا توجد أسئلة!")
         
@@ -31,7 +31,7 @@ def quick_diagnosis(file_path):
             print("❌ لا يتم استدعاء renderQuestions!")
         
         # 3. فحص دالة renderQuestions
-        if 'function renderQuestions()' in content:
+        if lesson.has_system('renderQuestions'):
             print("✅ دالة renderQuestions موجودة")
         else:
             print("❌ دالة renderQuestions غير موجودة!")
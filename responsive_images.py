@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+صور متجاوبة: نسخ مصغرة بصيغ AVIF/WebP/PNG مع srcset و sizes وأبعاد ثابتة
+Responsive image stage: resized AVIF/WebP/PNG variants and <img> rewriting
+
+- كل صورة نقطية في assets/images/ تُصغّر إلى عدة عروض بصيغ AVIF (إن دعمها Pillow)
+  و WebP و PNG/JPEG، والنتائج مخزنة في .cache/images/ ومفهرسة ببصمة الصورة المصدر
+  فلا يُعاد ترميز صورة لم تتغير
+- كل وسم <img> لصورة محلية في الصفحات المبنية يُحوّل إلى <picture> مع srcset و sizes
+  و width/height (لمنع اهتزاز الصفحة) و loading="lazy" ما لم يحدد الوسم غير ذلك
+- بدون Pillow تُضاف الأبعاد (تُقرأ من ترويسة الملف) و loading فقط، وتبقى الصورة الأصلية
+
+الاستخدام:
+    python responsive_images.py          # توليد النسخ وعرض الأحجام
+"""
+
+import json
+import os
+import re
+import shutil
+import struct
+import sys
+from pathlib import Path
+
+from parse_cache import content_digest
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+IMAGES_DIR = Path('assets/images')
+CACHE_DIR = Path('.cache') / 'images'
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# العروض الافتراضية (تُحذف الأكبر من عرض الصورة الأصلية)
+DEFAULT_WIDTHS = (320, 640, 1280)
+DEFAULT_SIZES = '(max-width: 768px) 100vw, 768px'
+
+# صور بحجم عرض معروف: المسار -> (العروض، sizes)
+# الشعار يُعرض بارتفاع 50px (40px على الشاشات الصغيرة) ونسبته ~1:1
+IMAGE_SIZES = {
+    'assets/images/school-logo.png': ((51, 102, 153), '(max-width: 768px) 41px, 51px'),
+}
+
+# الصيغ بترتيب الأفضلية: (الامتداد، نوع MIME، معاملات الحفظ)
+MODERN_FORMATS = [
+    ('avif', 'image/avif', {'quality': 55}),
+    ('webp', 'image/webp', {'quality': 80, 'method': 6}),
+]
+
+IMG_PATTERN = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+ATTR_PATTERN = re.compile(r'([\w-]+)\s*=\s*"([^"]*)"')
+
+
+def image_size(path):
+    """أبعاد صورة (العرض، الارتفاع) من ترويسة الملف مباشرة، أو None"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(32)
+            if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+                return struct.unpack('>II', head[16:24])
+            if head[:6] in (b'GIF87a', b'GIF89a'):
+                return struct.unpack('<HH', head[6:10])
+            if head.startswith(b'\xff\xd8'):
+                f.seek(2)
+                while True:
+                    marker = f.read(4)
+                    if len(marker) < 4 or marker[0] != 0xFF:
+                        return None
+                    length = struct.unpack('>H', marker[2:4])[0]
+                    # SOF0..SOF15 ما عدا DHT (C4) و JPG (C8) و DAC (CC)
+                    if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                        height, width = struct.unpack('>HH', f.read(5)[1:5])
+                        return width, height
+                    f.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+def _available_formats():
+    """الصيغ الحديثة التي يدعمها Pillow المثبت"""
+    available = []
+    for extension, mime, options in MODERN_FORMATS:
+        if extension == 'avif' and not features.check('avif'):
+            continue
+        if extension == 'webp' and not features.check('webp'):
+            continue
+        available.append((extension, mime, options))
+    return available
+
+
+def build_variants(source):
+    """توليد النسخ المصغرة لصورة (أو إرجاعها من الذاكرة) -> (مجلد النتائج، الوصف)"""
+    source = Path(source)
+    widths, _ = IMAGE_SIZES.get(source.as_posix(), (DEFAULT_WIDTHS, DEFAULT_SIZES))
+    with open(source, 'rb') as f:
+        data = f.read()
+    formats = [ext for ext, _, _ in _available_formats()]
+    key = json.dumps([list(widths), formats, MODERN_FORMATS]).encode('utf-8')
+    digest = content_digest(key + b'\0' + data)[:12]
+    cache = CACHE_DIR / digest
+    manifest_path = cache / 'variants.json'
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return cache, json.load(f)
+
+    cache.mkdir(parents=True, exist_ok=True)
+    with Image.open(source) as image:
+        image.load()
+        width, height = image.size
+        fallback = 'jpg' if source.suffix.lower() in ('.jpg', '.jpeg') else 'png'
+        targets = sorted({min(w, width) for w in widths})
+        variants = {}
+        for extension, mime, options in _available_formats() + [(fallback, f'image/{fallback}', {})]:
+            for target in targets:
+                resized = image if target == width else image.resize(
+                    (target, round(height * target / width)), Image.LANCZOS)
+                if extension == 'jpg':
+                    resized = resized.convert('RGB')
+                    save_options = {'format': 'JPEG', 'quality': 82, 'optimize': True, 'progressive': True}
+                elif extension == 'png':
+                    save_options = {'format': 'PNG', 'optimize': True}
+                else:
+                    save_options = {'format': extension.upper(), **options}
+                temp = cache / f'tmp.{extension}'
+                resized.save(temp, **save_options)
+                with open(temp, 'rb') as f:
+                    name = f"{source.stem}-{target}w.{content_digest(f.read())[:10]}.{extension}"
+                os.replace(temp, cache / name)
+                variants.setdefault(mime, []).append([name, target])
+
+    info = {'width': width, 'height': height, 'variants': variants}
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(info, f, ensure_ascii=False, indent=2)
+    return cache, info
+
+
+def install_images(out_dir):
+    """تجهيز كل صور assets/images/ ونسخ نسخها إلى dist/؛ يُرجع المسار -> الوصف"""
+    images = {}
+    sources = sorted(p for p in IMAGES_DIR.rglob('*') if p.suffix.lower() in IMAGE_EXTENSIONS) \
+        if IMAGES_DIR.is_dir() else []
+    if sources and Image is None:
+        print("ℹ️ Pillow غير مثبت: تُضاف أبعاد الصور فقط بدون نسخ مصغرة (pip install pillow)")
+    for source in sources:
+        key = source.as_posix()
+        if Image is None:
+            size = image_size(source)
+            if size:
+                images[key] = {'width': size[0], 'height': size[1], 'variants': {}}
+            continue
+        try:
+            cache, info = build_variants(source)
+        except OSError as e:
+            print(f"⚠️ تعذر معالجة {source}: {e}")
+            continue
+        target_dir = Path(out_dir) / source.parent
+        target_dir.mkdir(parents=True, exist_ok=True)
+        names = {name for files in info['variants'].values() for name, _ in files}
+        for name in names:
+            if not (target_dir / name).exists():
+                shutil.copy2(cache / name, target_dir / name)
+        for old in target_dir.glob(f"{source.stem}-*w.*.*"):
+            if old.name not in names:
+                old.unlink()
+        images[key] = info
+    return images
+
+
+def _srcset(directory, files):
+    """قيمة srcset من قائمة (الاسم، العرض)"""
+    return ', '.join(f"{directory}/{name} {width}w" for name, width in files)
+
+
+def rewrite_images(page, images, prefix=''):
+    """تحويل وسوم <img> للصور المحلية في صفحة إلى صور متجاوبة (prefix مثل ../../)"""
+    if not images:
+        return page
+
+    def replace(match):
+        tag = match.group(0)
+        attrs = dict((k.lower(), v) for k, v in ATTR_PATTERN.findall(tag))
+        src = attrs.get('src', '')
+        if not src.startswith(prefix) or src[len(prefix):] not in images or 'srcset' in attrs:
+            return tag
+        info = images[src[len(prefix):]]
+        _, sizes = IMAGE_SIZES.get(src[len(prefix):], (DEFAULT_WIDTHS, DEFAULT_SIZES))
+        directory = src.rsplit('/', 1)[0]
+
+        extra = []
+        for name, value in (('width', info['width']), ('height', info['height']),
+                            ('loading', 'lazy'), ('decoding', 'async')):
+            if name not in attrs:
+                extra.append(f'{name}="{value}"')
+        variants = info['variants']
+        if not variants:
+            return tag[:-1].rstrip('/ ') + ' ' + ' '.join(extra) + '>' if extra else tag
+
+        fallback_mime = list(variants)[-1]
+        fallback = variants[fallback_mime]
+        img = tag.replace(f'src="{src}"', f'src="{directory}/{fallback[-1][0]}" '
+                                           f'srcset="{_srcset(directory, fallback)}" sizes="{sizes}"', 1)
+        if extra:
+            img = img[:-1].rstrip('/ ') + ' ' + ' '.join(extra) + '>'
+        sources = ''.join(f'<source type="{mime}" srcset="{_srcset(directory, files)}" sizes="{sizes}">'
+                          for mime, files in variants.items() if mime != fallback_mime)
+        return f"<picture>{sources}{img}</picture>"
+
+    return IMG_PATTERN.sub(replace, page)
+
+
+def main():
+    """توليد النسخ المصغرة وعرض مقارنة الأحجام"""
+    if Image is None:
+        print("❌ Pillow غير مثبت (pip install pillow)")
+        sys.exit(1)
+    for source in sorted(p for p in IMAGES_DIR.rglob('*') if p.suffix.lower() in IMAGE_EXTENSIONS):
+        cache, info = build_variants(source)
+        print(f"🖼️ {source} ({info['width']}×{info['height']}، {source.stat().st_size / 1024:.0f} KB)")
+        for mime, files in info['variants'].items():
+            sizes = '، '.join(f"{width}w: {(cache / name).stat().st_size / 1024:.1f} KB" for name, width in files)
+            print(f"   ✅ {mime}: {sizes}")
+
+
+if __name__ == "__main__":
+    main()
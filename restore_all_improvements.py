@@ -12,9 +12,12 @@
 
 import os
 import json
-import re
 from pathlib import Path
 
+from html_edit import HTMLEditor, outermost
+from js_literal import replace_assignment
+from lesson_parser import load_lesson
+
 class ComprehensiveRestorer:
     def __init__(self):
         self.base_dir = Path('.')
@@ -52,39 +55,11 @@ class ComprehensiveRestorer:
             return []
             
         try:
-            with open(q_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # البحث عن قائمة الأسئلة
-            questions_match = re.search(r'const\s+questions\s*=\s*\[(.*?)\];', content, re.DOTALL)
-            if not questions_match:
-                return []
-            
-            questions_content = questions_match.group(1)
-            questions = []
-            
-            # استخراج كل سؤال
-            question_pattern = r'\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}'
-            for match in re.finditer(question_pattern, questions_content):
-                question_text = match.group(1)
-                
-                # استخراج التفاصيل
-                question_match = re.search(r'question:\s*["\']([^"\']*)["\']', question_text)
-                answers_match = re.search(r'answers:\s*\[(.*?)\]', question_text, re.DOTALL)
-                correct_match = re.search(r'correct:\s*(\d+)', question_text)
-                
-                if question_match and answers_match and correct_match:
-                    # استخراج الإجابات
-                    answers_text = answers_match.group(1)
-                    answers = re.findall(r'["\']([^"\']*)["\']', answers_text)
-                    
-                    questions.append({
-                        'question': question_match.group(1),
-                        'answers': answers,
-                        'correct': int(correct_match.group(1))
-                    })
-            
-            return questions
+            return [{
+                'question': question.text,
+                'answers': question.choices,
+                'correct': question.answer
+            } for question in load_lesson(q_file_path).questions]
         except Exception as e:
             print(f"⚠️ خطأ في استخراج الأسئلة من {q_file_path}: {e}")
             return []
@@ -95,27 +70,8 @@ class ComprehensiveRestorer:
             return []
             
         try:
-            with open(q_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # البحث عن قسم الأهداف
-            objectives_pattern = r'<div[^>]*class="[^"]*objectives[^"]*"[^>]*>.*?<ul[^>]*>(.*?)</ul>'
-            objectives_match = re.search(objectives_pattern, content, re.DOTALL | re.IGNORECASE)
-            
-            if not objectives_match:
-                return []
-            
-            objectives_content = objectives_match.group(1)
-            objectives = []
-            
-            # استخراج كل هدف
-            objective_pattern = r'<li[^>]*>(.*?)</li>'
-            for match in re.finditer(objective_pattern, objectives_content, re.DOTALL):
-                objective_text = re.sub(r'<[^>]+>', '', match.group(1)).strip()
-                if objective_text:
-                    objectives.append(objective_text)
-            
-            return objectives
+            objectives = load_lesson(q_file_path).objectives
+            return objectives.items if objectives else []
         except Exception as e:
             print(f"⚠️ خطأ في استخراج الأهداف من {q_file_path}: {e}")
             return []
@@ -140,12 +96,13 @@ class ComprehensiveRestorer:
         }}''')
             
             questions_js = ',\n'.join(js_questions)
-            new_questions_block = f"    const questions = [\n{questions_js}\n    ];"
+            new_questions_array = f"[\n{questions_js}\n    ]"
+            new_questions_block = f"    const questions = {new_questions_array};"
             
             # البحث عن قائمة الأسئلة الحالية واستبدالها
-            questions_pattern = r'const\s+questions\s*=\s*\[.*?\];'
-            if re.search(questions_pattern, content, re.DOTALL):
-                content = re.sub(questions_pattern, new_questions_block, content, flags=re.DOTALL)
+            new_content = replace_assignment(content, 'questions', new_questions_array)
+            if new_content is not None:
+                content = new_content
             else:
                 # إضافة الأسئلة قبل نهاية الـ script
                 script_end = content.rfind('</script>')
@@ -178,15 +135,17 @@ class ComprehensiveRestorer:
                 </ul>
             </div>'''
             
-            # البحث عن قسم الأهداف الحالي واستبدالها
-            objectives_pattern = r'<div[^>]*class="[^"]*objectives[^"]*"[^>]*>.*?</div>'
-            if re.search(objectives_pattern, content, re.DOTALL | re.IGNORECASE):
-                content = re.sub(objectives_pattern, new_objectives_section, content, flags=re.DOTALL | re.IGNORECASE)
-            else:
+            # البحث عن قسم الأهداف الحالي واستبداله كاملاً (مع ما بداخله من div متداخلة)
+            editor = HTMLEditor(content)
+            sections = outermost(editor.select('div[class*=objectives]'))
+            for section in sections:
+                editor.replace(section, new_objectives_section)
+            if not sections:
                 # إضافة الأهداف بعد العنوان الرئيسي
-                main_title_pattern = r'(<h1[^>]*>.*?</h1>)'
-                if re.search(main_title_pattern, content, re.DOTALL):
-                    content = re.sub(main_title_pattern, r'\1\n        ' + new_objectives_section, content, flags=re.DOTALL)
+                main_title = editor.select_one('h1')
+                if main_title is not None:
+                    editor.insert_after(main_title, '\n        ' + new_objectives_section)
+            content = editor.apply()
             
             with open(lesson_path, 'w', encoding='utf-8') as f:
                 f.write(content)
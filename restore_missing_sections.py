@@ -5,7 +5,8 @@
 """
 
 import os
-import re
+
+from html_edit import HTMLEditor
 
 def restore_missing_sections(main_file, reference_file):
     """استعادة الأقسام المفقودة من المرجع"""
@@ -24,26 +25,24 @@ def restore_missing_sections(main_file, reference_file):
         print(f"🔧 استعادة الأقسام المفقودة في {main_file}")
         updated = False
         
+        # الملفان يُرمّزان مرة واحدة، وكل التعديلات تُطبق معاً في النهاية حسب المواضع
+        main = HTMLEditor(main_content)
+        ref = HTMLEditor(ref_content)
+        quiz = main.select_one('section#quiz')
+        footers = main.select('footer')
+        
         # 1. استعادة قسم أهداف الدرس
         if '🎯 أهداف الدرس' in ref_content and '🎯 أهداف الدرس' not in main_content:
-            # استخراج قسم الأهداف من المرجع
-            objectives_match = re.search(
-                r'<!-- أهداف الدرس -->(.*?)<!-- الأسئلة',
-                ref_content, re.DOTALL
-            )
+            # استخراج قسم الأهداف من المرجع (أصغر section يحتوي العنوان)
+            sections = [s for s in ref.select('section') if '🎯 أهداف الدرس' in ref.text(s)]
             
-            if objectives_match:
-                objectives_section = objectives_match.group(1).strip()
+            if sections and quiz is not None:
+                objectives_section = min(sections, key=lambda s: s.end - s.start).outer(ref_content)
                 
-                # البحث عن مكان الإدراج (قبل قسم الأسئلة)
-                insertion_point = '<section id="quiz"'
-                if insertion_point in main_content:
-                    main_content = main_content.replace(
-                        insertion_point,
-                        f'    <!-- أهداف الدرس -->\n{objectives_section}\n\n    {insertion_point}'
-                    )
-                    updated = True
-                    print("  ✅ تم إضافة قسم أهداف الدرس")
+                # الإدراج قبل قسم الأسئلة
+                main.insert_before(quiz, f'<!-- أهداف الدرس -->\n    {objectives_section}\n\n    ')
+                updated = True
+                print("  ✅ تم إضافة قسم أهداف الدرس")
         
         # 2. إضافة أزرار التنقل المفقودة
         if ('السابق' in ref_content or 'التالي' in ref_content) and 'السابق' not in main_content:
@@ -55,13 +54,9 @@ def restore_missing_sections(main_file, reference_file):
       </div>'''
             
             # إضافة قبل إغلاق footer
-            footer_pattern = r'(<footer class="card"[^>]*>.*?)(</footer>)'
-            if re.search(footer_pattern, main_content, re.DOTALL):
-                main_content = re.sub(
-                    footer_pattern,
-                    r'\1' + navigation_buttons + '\n    \\2',
-                    main_content, flags=re.DOTALL
-                )
+            footer = main.select_one('footer.card')
+            if footer is not None:
+                main.append(footer, navigation_buttons + '\n    ')
                 updated = True
                 print("  ✅ تم إضافة أزرار التنقل")
         
@@ -82,9 +77,8 @@ def restore_missing_sections(main_file, reference_file):
     </section>'''
             
             # إضافة قبل footer
-            footer_position = main_content.find('<footer')
-            if footer_position != -1:
-                main_content = main_content[:footer_position] + summary_section + '\n\n    ' + main_content[footer_position:]
+            if footers:
+                main.insert_before(footers[0], summary_section + '\n\n    ')
                 updated = True
                 print("  ✅ تم إضافة قسم الملخص")
         
@@ -97,35 +91,28 @@ def restore_missing_sections(main_file, reference_file):
       </div>'''
             
             # إضافة في footer قبل الإغلاق
-            footer_end = '</footer>'
-            if footer_end in main_content:
-                main_content = main_content.replace(
-                    footer_end,
-                    reference_link + '\n    ' + footer_end
-                )
+            for footer in footers:
+                main.append(footer, reference_link + '\n    ')
                 updated = True
                 print("  ✅ تم إضافة رابط المراجع")
         
         # 5. تحديث عنوان الصفحة ليطابق المرجع
-        ref_title_match = re.search(r'<title>(.*?)</title>', ref_content)
-        main_title_match = re.search(r'<title>(.*?)</title>', main_content)
+        ref_title_element = ref.select_one('title')
+        main_title_element = main.select_one('title')
         
-        if ref_title_match and main_title_match:
-            ref_title = ref_title_match.group(1)
-            main_title = main_title_match.group(1)
+        if ref_title_element and main_title_element:
+            ref_title = ref.text(ref_title_element)
+            main_title = main.text(main_title_element)
             
             if ref_title != main_title:
-                main_content = main_content.replace(
-                    f'<title>{main_title}</title>',
-                    f'<title>{ref_title}</title>'
-                )
+                main.replace_inner(main_title_element, ref_title)
                 updated = True
                 print(f"  ✅ تم تحديث العنوان: {ref_title}")
         
         # حفظ الملف إذا تم التحديث
         if updated:
             with open(main_file, 'w', encoding='utf-8') as f:
-                f.write(main_content)
+                f.write(main.apply())
             return True
         else:
             print(f"  ℹ️  لا يحتاج تحديث: {main_file}")
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+مخزن لقطات مفهرس بالمحتوى ومضغوط بدلاً من ملفات .backup_* المتناثرة
+Content-addressed, compressed snapshot store (replaces the .backup_* full copies)
+
+- كل نسخة مختلفة من أي ملف تُحفظ مرة واحدة فقط في .snapshots/objects باسم بصمتها sha256
+- الدروس تتشارك معظم محتواها، لذلك تُحفظ النسخة كفرق أسطر عن أقرب نسخة مخزنة (النسخة
+  السابقة لنفس الملف أو ملف مشابه) إذا كان أصغر، بسلسلة فروق محدودة العمق
+- الضغط zstd إن كانت مكتبة zstandard مثبتة، وإلا zlib
+- اللقطة ملف JSON صغير في .snapshots/snapshots: اسمها ووقتها ورسالتها والمسار -> البصمة،
+  فأخذ لقطة لملفات لم تتغير مجرد حساب بصمات
+- الاسترجاع يأخذ لقطة للحالة الحالية أولاً (pre-restore-…) فيمكن التراجع عنه
+
+الاستخدام:
+    python snapshot_store.py snapshot [-m رسالة] [--name اسم] [ملفات...]   # الافتراضي: الصفحات والدروس
+    python snapshot_store.py list                                         # اللقطات وحجم المخزن
+    python snapshot_store.py diff اسم [اسم2] [--stat]                     # مقارنة بلقطة أخرى أو بالملفات الحالية
+    python snapshot_store.py restore اسم [ملفات...]                       # استرجاع ملفات اللقطة
+    python snapshot_store.py import-backups [--keep]                      # نقل ملفات .backup_* إلى المخزن
+"""
+
+import difflib
+import json
+import os
+import re
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from parse_cache import content_digest
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+STORE_DIR = Path('.snapshots')
+
+# الملفات التي تُؤخذ لها لقطة افتراضياً
+DEFAULT_TARGETS = ('index.html', 'lesson_template.html', 'unit-*/lesson-*/index.html')
+
+# أقصى طول لسلسلة الفروق قبل حفظ نسخة كاملة (يحدد كلفة القراءة)
+MAX_DELTA_DEPTH = 8
+
+# لاحقة النسخ الاحتياطية القديمة: index.html.backup_title_fix
+BACKUP_PATTERN = re.compile(r'^(?P<name>.+?)\.(?P<suffix>backup(?:_[\w-]+)?)$')
+
+HEADER_MAGIC = b'BIOSNAP1'
+
+
+class SnapshotError(Exception):
+    """خطأ في مخزن اللقطات"""
+
+
+def _compress(data):
+    if zstandard is not None:
+        return b'zstd', zstandard.ZstdCompressor(level=19).compress(data)
+    return b'zlib', zlib.compress(data, 9)
+
+
+def _decompress(codec, payload):
+    if codec == b'zstd':
+        if zstandard is None:
+            raise SnapshotError("الكائن مضغوط بـ zstd ومكتبة zstandard غير مثبتة (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return zlib.decompress(payload)
+
+
+def line_delta(base, data):
+    """فرق أسطر يعيد بناء data من base: قائمة [بداية، نهاية] (نسخ أسطر من base) أو نص (إدراج)"""
+    base_lines = base.splitlines(keepends=True)
+    lines = data.splitlines(keepends=True)
+    ops = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, base_lines, lines, autojunk=False).get_opcodes():
+        if tag == 'equal':
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append(''.join(lines[j1:j2]))
+    return ops
+
+
+def apply_delta(base, ops):
+    """إعادة بناء النص من base وفرق line_delta"""
+    base_lines = base.splitlines(keepends=True)
+    return ''.join(''.join(base_lines[op[0]:op[1]]) if isinstance(op, list) else op for op in ops)
+
+
+class SnapshotStore:
+    """مخزن الكائنات (النسخ) واللقطات"""
+
+    def __init__(self, root=STORE_DIR):
+        self.root = Path(root)
+        self.objects = self.root / 'objects'
+        self.snapshots = self.root / 'snapshots'
+        self._depths = {}
+        self._latest = None
+
+    # ------------------------------------------------------------ الكائنات
+
+    def object_path(self, digest):
+        return self.objects / digest[:2] / digest[2:]
+
+    def has(self, digest):
+        return self.object_path(digest).exists()
+
+    def _read_object(self, digest):
+        """(الترويسة، المحتوى المضغوط) لكائن مخزن"""
+        try:
+            with open(self.object_path(digest), 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raise SnapshotError(f"كائن غير موجود في المخزن: {digest[:12]}")
+        header, _, payload = raw.partition(b'\n')
+        parts = header.split()
+        if not parts or parts[0] != HEADER_MAGIC:
+            raise SnapshotError(f"كائن تالف: {digest[:12]}")
+        return parts[1:], payload
+
+    def depth(self, digest):
+        """طول سلسلة الفروق حتى نسخة كاملة"""
+        if digest not in self._depths:
+            header, _ = self._read_object(digest)
+            self._depths[digest] = int(header[3]) if header[0] == b'delta' else 0
+        return self._depths[digest]
+
+    def get(self, digest):
+        """محتوى النسخة (bytes)"""
+        header, payload = self._read_object(digest)
+        data = _decompress(header[1], payload)
+        if header[0] == b'delta':
+            base = self.get(header[2].decode('ascii')).decode('utf-8')
+            data = apply_delta(base, json.loads(data.decode('utf-8'))).encode('utf-8')
+        if content_digest(data) != digest:
+            raise SnapshotError(f"بصمة الكائن لا تطابق محتواه: {digest[:12]}")
+        return data
+
+    def put(self, data, bases=()):
+        """حفظ نسخة (إن لم تكن مخزنة) -> بصمتها
+
+        bases: بصمات نسخ مشابهة مخزنة؛ تُحفظ النسخة كفرق عن أفضلها إذا كان أصغر من الكاملة.
+        """
+        digest = content_digest(data)
+        if self.has(digest):
+            return digest
+        codec, payload = _compress(data)
+        header = [HEADER_MAGIC, b'full', codec]
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = None
+        if text is not None:
+            for base in dict.fromkeys(bases):
+                if not base or base == digest or not self.has(base) or self.depth(base) >= MAX_DELTA_DEPTH:
+                    continue
+                ops = line_delta(self.get(base).decode('utf-8'), text)
+                delta_codec, delta = _compress(json.dumps(ops, ensure_ascii=False).encode('utf-8'))
+                if len(delta) < len(payload):
+                    codec, payload = delta_codec, delta
+                    header = [HEADER_MAGIC, b'delta', codec, base.encode('ascii'),
+                              str(self.depth(base) + 1).encode('ascii')]
+        path = self.object_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            f.write(b' '.join(header) + b'\n' + payload)
+        os.replace(tmp, path)
+        return digest
+
+    # ------------------------------------------------------------ اللقطات
+
+    def names(self):
+        """أسماء اللقطات من الأقدم إلى الأحدث"""
+        if not self.snapshots.is_dir():
+            return []
+        manifests = [self.load(path.stem) for path in self.snapshots.glob('*.json')]
+        return [m['name'] for m in sorted(manifests, key=lambda m: (m['created'], m['name']))]
+
+    def load(self, name):
+        """بيان اللقطة: الاسم والوقت والرسالة والمسار -> البصمة"""
+        path = self.snapshots / f"{name}.json"
+        if not path.exists():
+            raise SnapshotError(f"لا توجد لقطة باسم {name} (python snapshot_store.py list)")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def latest_versions(self):
+        """آخر بصمة معروفة لكل مسار في جميع اللقطات (أساس الفروق للنسخ الجديدة)"""
+        if self._latest is None:
+            self._latest = {}
+            for name in self.names():
+                self._latest.update(self.load(name)['files'])
+        return self._latest
+
+    def write_manifest(self, name, files, message=''):
+        """حفظ بيان لقطة -> اسمها"""
+        self.snapshots.mkdir(parents=True, exist_ok=True)
+        name = name or datetime.now().strftime('%Y%m%d-%H%M%S')
+        base, n = name, 1
+        while (self.snapshots / f"{name}.json").exists():
+            n += 1
+            name = f"{base}-{n}"
+        manifest = {'name': name, 'created': datetime.now().isoformat(timespec='microseconds'),
+                    'message': message, 'files': dict(sorted(files.items()))}
+        tmp = self.snapshots / f".{name}.json.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.snapshots / f"{name}.json")
+        if self._latest is not None:
+            self._latest.update(files)
+        return name
+
+    def snapshot(self, paths, name=None, message='', contents=None):
+        """لقطة للملفات paths (أو لمحتويات contents: المسار -> bytes) -> (الاسم، عدد النسخ الجديدة)"""
+        previous = self.latest_versions()
+        files = {}
+        new = 0
+        last = None
+        for path in paths:
+            key = Path(path).as_posix()
+            data = contents[key] if contents is not None else Path(path).read_bytes()
+            digest = content_digest(data)
+            if not self.has(digest):
+                new += 1
+                # الأساس: النسخة السابقة لنفس الملف، ثم آخر نسخة جديدة في هذه اللقطة (الدروس متشابهة)
+                self.put(data, bases=(previous.get(key), last))
+                last = digest
+            files[key] = digest
+        return self.write_manifest(name, files, message), new
+
+    def restore(self, name, paths=None):
+        """استرجاع ملفات اللقطة (أو بعضها) إلى أماكنها -> المسارات التي تغيّرت"""
+        files = self.load(name)['files']
+        if paths:
+            wanted = {Path(p).as_posix() for p in paths}
+            missing = wanted - set(files)
+            if missing:
+                raise SnapshotError(f"ليست في اللقطة {name}: {', '.join(sorted(missing))}")
+            files = {path: digest for path, digest in files.items() if path in wanted}
+        changed = [path for path, digest in files.items()
+                   if not Path(path).exists() or content_digest(Path(path).read_bytes()) != digest]
+        if changed:
+            self.snapshot(changed, name=f"pre-restore-{name}", message=f"قبل استرجاع {name}")
+        for path in changed:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            with open(tmp, 'wb') as f:
+                f.write(self.get(files[path]))
+            os.replace(tmp, target)
+        return changed
+
+    def size(self):
+        """(عدد الكائنات، حجمها على القرص)"""
+        objects = [p for p in self.objects.rglob('*') if p.is_file()] if self.objects.is_dir() else []
+        return len(objects), sum(p.stat().st_size for p in objects)
+
+
+def expand_targets(patterns, base_dir='.'):
+    """أنماط glob أو مسارات -> ملفات موجودة (بدون تكرار)"""
+    base = Path(base_dir)
+    found = []
+    for pattern in patterns:
+        matches = sorted(base.glob(pattern)) if any(c in pattern for c in '*?[') else [base / pattern]
+        found.extend(p for p in matches if p.is_file())
+    return list(dict.fromkeys(found))
+
+
+def find_backups(base_dir='.'):
+    """ملفات .backup_* القديمة: اللاحقة -> [(مسار النسخة، مسار الملف الأصلي)]"""
+    groups = {}
+    for path in sorted(Path(base_dir).rglob('*.backup*')):
+        match = BACKUP_PATTERN.match(path.name)
+        if match and path.is_file() and STORE_DIR.name not in path.parts:
+            groups.setdefault(match.group('suffix'), []).append((path, path.with_name(match.group('name'))))
+    return groups
+
+
+def import_backups(store, keep=False, base_dir='.'):
+    """نقل ملفات .backup_* إلى لقطة لكل لاحقة (بمسار الملف الأصلي) ثم حذفها -> عدد الملفات"""
+    groups = find_backups(base_dir)
+    if groups:
+        # الملفات الحالية أولاً: كل نسخة احتياطية تُحفظ كفرق عن درسها الحالي
+        store.snapshot(expand_targets(DEFAULT_TARGETS, base_dir), name='before-import',
+                       message='الملفات الحالية عند نقل النسخ الاحتياطية')
+    total = 0
+    for suffix, pairs in groups.items():
+        contents = {original.as_posix(): backup.read_bytes() for backup, original in pairs}
+        name, new = store.snapshot(list(contents), name=suffix, contents=contents,
+                                   message=f"ملفات .{suffix} القديمة")
+        print(f"📦 {name}: {len(pairs)} ملف ({new} نسخة جديدة)")
+        total += len(pairs)
+        if not keep:
+            for backup, _ in pairs:
+                backup.unlink()
+    return total
+
+
+def _diff_files(store, old, new, stat_only):
+    """طباعة الفروق بين بيانين (المسار -> البصمة أو bytes)"""
+    changed = 0
+    for path in sorted(set(old) | set(new)):
+        a, b = old.get(path), new.get(path)
+        if a == b:
+            continue
+        changed += 1
+        a_text = store.get(a).decode('utf-8') if isinstance(a, str) else (a or b'').decode('utf-8')
+        b_text = store.get(b).decode('utf-8') if isinstance(b, str) else (b or b'').decode('utf-8')
+        diff = list(difflib.unified_diff(a_text.splitlines(keepends=True), b_text.splitlines(keepends=True),
+                                         f"a/{path}", f"b/{path}"))
+        added = sum(1 for line in diff if line.startswith('+') and not line.startswith('+++'))
+        removed = sum(1 for line in diff if line.startswith('-') and not line.startswith('---'))
+        state = '➕' if a is None else '➖' if b is None else '📝'
+        print(f"{state} {path:<44} +{added:<5} -{removed}")
+        if not stat_only:
+            sys.stdout.writelines(line if line.endswith('\n') else line + '\n' for line in diff)
+    print(f"🔍 {changed} ملف مختلف")
+
+
+def main():
+    """الدالة الرئيسية"""
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+    command, args = args[0], args[1:]
+    store = SnapshotStore()
+
+    def option(name):
+        if name in args and args.index(name) + 1 < len(args):
+            i = args.index(name)
+            value = args[i + 1]
+            del args[i:i + 2]
+            return value
+        return None
+
+    try:
+        if command == 'snapshot':
+            message = option('-m') or ''
+            name = option('--name')
+            paths = expand_targets(args or DEFAULT_TARGETS)
+            if not paths:
+                print("❌ لا توجد ملفات لأخذ لقطة لها")
+                sys.exit(1)
+            name, new = store.snapshot(paths, name=name, message=message)
+            print(f"📸 {name}: {len(paths)} ملف ({new} نسخة جديدة)")
+        elif command == 'list':
+            for name in store.names():
+                manifest = store.load(name)
+                print(f"📸 {name:<28} {manifest['created'][:19]}  {len(manifest['files']):>3} ملف  {manifest['message']}")
+            count, size = store.size()
+            raw = sum(len(store.get(d)) for d in {d for n in store.names() for d in store.load(n)['files'].values()})
+            ratio = f" (المحتوى الأصلي {raw / 1024:.0f} KB، ×{raw / size:.1f})" if size else ''
+            print(f"💾 {count} نسخة مخزنة في {size / 1024:.0f} KB{ratio}")
+        elif command == 'diff':
+            stat_only = '--stat' in args
+            names = [a for a in args if not a.startswith('--')]
+            if not names:
+                print("❌ حدد اسم لقطة")
+                sys.exit(1)
+            old = store.load(names[0])['files']
+            if len(names) > 1:
+                new = store.load(names[1])['files']
+            else:
+                new = {path: Path(path).read_bytes() for path in old if Path(path).exists()}
+                old = {path: digest for path, digest in old.items()
+                       if path not in new or content_digest(new[path]) != digest}
+                new = {path: data for path, data in new.items() if path in old}
+            _diff_files(store, old, new, stat_only)
+        elif command == 'restore':
+            if not args:
+                print("❌ حدد اسم لقطة")
+                sys.exit(1)
+            changed = store.restore(args[0], args[1:])
+            for path in changed:
+                print(f"♻️  {path}")
+            print(f"✅ تم استرجاع {len(changed)} ملف من {args[0]}")
+        elif command == 'import-backups':
+            total = import_backups(store, keep='--keep' in args)
+            print(f"✅ تم نقل {total} نسخة احتياطية إلى {STORE_DIR}/")
+        else:
+            print(f"❌ أمر غير معروف: {command}")
+            print(__doc__)
+            sys.exit(1)
+    except SnapshotError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+// عامل الخدمة للعمل بدون اتصال — يولده build.py في dist/sw.js (لا تعدل النسخة المبنية)
+// - الملفات المُبصّمة والمكتبات والوسائط: من الذاكرة أولاً (cache-first)
+// - صفحات HTML: من الذاكرة فوراً مع تحديثها في الخلفية (stale-while-revalidate)
+
+const VERSION = '{{ version }}';
+const PRECACHE = 'bio-precache-' + VERSION;
+const RUNTIME = 'bio-runtime-cache';
+const MANIFEST_KEY = '__precache-manifest';
+
+// المسار النسبي -> بصمة المحتوى
+const PRECACHE_MANIFEST = {{ precache }};
+
+const HASHED_PATTERN = /\.[0-9a-f]{10,}\.\w+$/;
+
+function scoped(path) {
+  return new URL(path, self.registration.scope).href;
+}
+
+// نسخ الملفات غير المتغيرة من الذاكرة السابقة وتنزيل الباقي فقط
+async function precache() {
+  const cache = await caches.open(PRECACHE);
+  const previous = {};
+  for (const name of await caches.keys()) {
+    if (!name.startsWith('bio-precache-') || name === PRECACHE) continue;
+    const old = await caches.open(name);
+    const stored = await old.match(MANIFEST_KEY);
+    if (stored) previous[name] = await stored.json();
+  }
+
+  await Promise.all(Object.entries(PRECACHE_MANIFEST).map(async ([path, revision]) => {
+    const url = scoped(path);
+    for (const [name, manifest] of Object.entries(previous)) {
+      if (manifest[path] !== revision) continue;
+      const response = await (await caches.open(name)).match(url);
+      if (response) return cache.put(url, response);
+    }
+    const response = await fetch(url, { cache: 'reload' });
+    if (!response.ok) throw new Error(`فشل تنزيل ${path}`);
+    return cache.put(url, response);
+  }));
+
+  await cache.put(MANIFEST_KEY, new Response(JSON.stringify(PRECACHE_MANIFEST)));
+}
+
+self.addEventListener('install', event => {
+  event.waitUntil(precache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil((async () => {
+    for (const name of await caches.keys()) {
+      if (name.startsWith('bio-precache-') && name !== PRECACHE) await caches.delete(name);
+    }
+    await self.clients.claim();
+  })());
+});
+
+async function cacheFirst(request) {
+  const cached = await caches.match(request, { ignoreSearch: true });
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok || response.type === 'opaque') {
+    const cache = await caches.open(RUNTIME);
+    cache.put(request, response.clone());
+  }
+  return response;
+}
+
+async function staleWhileRevalidate(request, cacheName, key) {
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(key || request, { ignoreSearch: true });
+  const network = fetch(request).then(response => {
+    if (response.ok || response.type === 'opaque') cache.put(key || request, response.clone());
+    return response;
+  }).catch(() => cached);
+  return cached || network;
+}
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  if (request.method !== 'GET') return;
+  const url = new URL(request.url);
+
+  // المكتبات من CDN (إن لم تُنسخ محلياً عبر vendor.py)
+  if (url.origin !== self.location.origin) {
+    event.respondWith(staleWhileRevalidate(request, RUNTIME));
+    return;
+  }
+
+  if (request.mode === 'navigate' || url.pathname.endsWith('.html') || url.pathname.endsWith('/')) {
+    const key = url.pathname.endsWith('/') ? url.origin + url.pathname + 'index.html' : url.origin + url.pathname;
+    event.respondWith(staleWhileRevalidate(request, PRECACHE, key));
+    return;
+  }
+
+  if (HASHED_PATTERN.test(url.pathname) || url.pathname.includes('/assets/')) {
+    event.respondWith(cacheFirst(request));
+  }
+});
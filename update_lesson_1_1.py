@@ -1,91 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-تحديث أسئلة الدرس الأول بالأسئلة الجديدة
-"""
-
-import os
-
-def update_lesson_1_1_questions():
-    """تحديث أسئلة الدرس 1-1"""
-    file_path = "unit-1-cells/lesson-1-1/index.html"
-    
-    # الأسئلة الجديدة الـ20
-    new_questions = [
-        # المجموعة الأولى: الأساسيات
-        ('q:"أي مما يلي يُعد وحدة البناء والوظيفة في الكائنات الحية؟", c:["العضو", "الخلية", "النسيج", "الجهاز"], a:1'),
-        ('q:"الجزء الذي يتحكم في أنشطة الخلية ويحتوي على المادة الوراثية هو:", c:["الغشاء الخلوي", "النواة", "الفجوة", "السيتوبلازم"], a:1'),
-        ('q:"المادة الهلامية التي تحدث فيها معظم التفاعلات الكيميائية داخل الخلية هي:", c:["الغشاء", "الفجوة", "السيتوبلازم", "الجدار"], a:2'),
-        ('q:"أي من التراكيب التالية يوجد في الخلية النباتية فقط؟", c:["النواة", "البلاستيدات الخضراء", "الغشاء الخلوي", "السيتوبلازم"], a:1'),
-        ('q:"الجدار الخلوي في الخلايا النباتية يتكون أساسًا من:", c:["النشا", "البروتين", "السليلوز", "الدهون"], a:2'),
-        
-        # المجموعة الثانية: المقارنات
-        ('q:"أي مما يلي يوجد في الخلايا الحيوانية ولا يوجد في الخلايا النباتية؟", c:["جدار خلوي", "بلاستيدة", "فجوة عصارية كبيرة", "لا شيء مما سبق"], a:3'),
-        ('q:"الفجوة العصارية في الخلية النباتية:", c:["صغيرة الحجم وكثيرة العدد", "كبيرة وممتلئة بالعصارة", "غائبة", "مكوّنة من DNA"], a:1'),
-        ('q:"أحد أوجه التشابه بين الخلايا الحيوانية والنباتية هو:", c:["وجود جدار خلوي", "وجود نواة", "وجود بلاستيدات", "وجود فجوة كبيرة"], a:1'),
-        ('q:"أي مما يلي لا يعد من مكونات الخلية الحيوانية؟", c:["النواة", "السيتوبلازم", "الجدار الخلوي", "الغشاء الخلوي"], a:2'),
-        ('q:"وظيفة البلاستيدات الخضراء هي:", c:["التخزين", "التنفس", "البناء الضوئي", "الإخراج"], a:2'),
-        
-        # المجموعة الثالثة: وظائف وتطبيقات
-        ('q:"أي جزء في الخلية يعمل كحاجز يتحكم في مرور المواد؟", c:["الجدار الخلوي", "الغشاء الخلوي", "النواة", "السيتوبلازم"], a:1'),
-        ('q:"الخلايا النباتية تظهر باللون الأخضر لاحتوائها على:", c:["النواة", "البلاستيدات الخضراء", "الجدار الخلوي", "السيتوبلازم"], a:1'),
-        ('q:"أي جزء يخزن الماء والمواد المذابة في الخلية النباتية؟", c:["البلاستيدات", "الغشاء", "الفجوة", "النواة"], a:2'),
-        ('q:"الخلية التي لا تحتوي على بلاستيدات خضراء غالبًا تكون من:", c:["الأوراق", "الجذور", "السوق الخضراء", "البذور"], a:1'),
-        ('q:"الجزء المسؤول عن إنتاج الطاقة في الخلية هو:", c:["الميتوكندريا", "الفجوة", "النواة", "الغشاء"], a:0'),
-        
-        # المجموعة الرابعة: أسئلة حول التكبير
-        ('q:"إذا كان طول رسم خلية = 50 مم والطول الحقيقي = 0.05 مم، فإن مقدار التكبير = ؟", c:["500 ×", "100 ×", "1000 ×", "50 ×"], a:0'),
-        ('q:"يقاس الطول الحقيقي للخلية باستخدام:", c:["ورق الرسم", "المسطرة العادية", "وحدة الميكرومتر", "العدسة المكبرة"], a:2'),
-        ('q:"أي من الأجهزة التالية يُستخدم لتكبير الخلايا ودراستها؟", c:["التلسكوب", "المجهر", "المنظار", "العين المجرّدة"], a:1'),
-        ('q:"إذا كان التكبير = قياس الرسم ÷ القياس الحقيقي، فما التكبير إذا كان طول الخلية في الرسم 10 مم وطولها الحقيقي 0.1 مم؟", c:["10 ×", "50 ×", "100 ×", "1000 ×"], a:2'),
-        ('q:"عند رسم خلية بالمجهر، يجب أن تكون:", c:["صغيرة جدًا", "كبيرة وواضحة", "ملونة دائمًا", "مظللة بالرصاص"], a:1')
-    ]
-    
-    if not os.path.exists(file_path):
-        print(f"❌ الملف غير موجود: {file_path}")
-        return False
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # بناء الأسئلة الجديدة
-        questions_js = '    const bank = [\n      // الأسئلة الجديدة المحدثة - 20 سؤال منظم\n'
-        
-        for i, question in enumerate(new_questions):
-            if i == 0:
-                questions_js += f'      // المجموعة الأولى: الأساسيات\n      {{{question}}},'
-            elif i == 5:
-                questions_js += f'\n      \n      // المجموعة الثانية: المقارنات\n      {{{question}}},'
-            elif i == 10:
-                questions_js += f'\n      \n      // المجموعة الثالثة: وظائف وتطبيقات\n      {{{question}}},'
-            elif i == 15:
-                questions_js += f'\n      \n      // المجموعة الرابعة: أسئلة حول التكبير\n      {{{question}}},'
-            else:
-                questions_js += f'\n      {{{question}}},'
-        
-        questions_js = questions_js.rstrip(',') + '\n    ];'
-        
-        # البحث عن بنك الأسئلة الحالي واستبداله
-        import re
-        pattern = r'const bank = \[.*?\];'
-        
-        if re.search(pattern, content, re.DOTALL):
-            content = re.sub(pattern, questions_js, content, flags=re.DOTALL)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print("✅ تم تحديث أسئلة الدرس الأول بنجاح!")
-            print(f"📝 تم إضافة {len(new_questions)} سؤال جديد منظم في 4 مجموعات")
-            return True
-        else:
-            print("❌ لم يتم العثور على بنك الأسئلة في الملف")
-            return False
-            
-    except Exception as e:
-        print(f"❌ خطأ في التحديث: {e}")
-        return False
-
-if __name__ == "__main__":
-    update_lesson_1_1_questions()
\ No newline at end of file
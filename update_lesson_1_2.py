@@ -1,90 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-
-# الأهداف الجديدة للدرس 1-2
-new_objectives = """        <li>استخدام مهارات الملاحظة الدقيقة للخلايا تحت المجهر.</li>
-        <li>رسم خلية نباتية أو حيوانية بصورة علمية صحيحة مع تسمية أجزائها.</li>
-        <li>الالتزام بقواعد الرسم العلمي (الخطوط الواضحة، عدم التظليل، كتابة الأسماء بخط أفقي).</li>
-        <li>حساب مقدار التكبير باستخدام القانون: مقدار التكبير = قياس الرسم ÷ الطول الحقيقي</li>
-        <li>التمييز بين الطول الحقيقي والقياس على الرسم.</li>
-        <li>استخدام وحدات القياس الصحيحة (الميكرومتر – المليمتر).</li>"""
-
-# بنك الأسئلة الجديد للدرس 1-2 - 20 سؤال منظم في 4 مجموعات
-new_questions = [
-    # المجموعة الأولى: الرسم العلمي (5 أسئلة)
-    {"q": "عند رسم الخلايا بالمجهر يجب استخدام:", "c": ["قلم حبر", "قلم رصاص حاد", "ألوان خشبية", "أقلام تظليل"], "a": 1},
-    {"q": "أي مما يلي يعتبر خطأ في الرسم العلمي للخلايا؟", "c": ["كتابة أسماء الأجزاء بخط أفقي", "استخدام خطوط مستقيمة للتسميات", "تكبير الرسم قدر الإمكان", "التظليل أو التلوين"], "a": 3},
-    {"q": "من قواعد الرسم العلمي للخلايا:", "c": ["جعل الرسم صغيرًا جدًا", "استخدام عدة محاولات فوق بعضها", "أن يكون الرسم كبيرًا وواضحًا", "كتابة الأسماء داخل الرسم"], "a": 2},
-    {"q": "عند تسمية أجزاء الخلية في الرسم يجب أن تكون الخطوط:", "c": ["منحنية", "عشوائية", "مستقيمة وواضحة", "ملونة"], "a": 2},
-    {"q": "معيار التقييم الذاتي للرسم يتضمن:", "c": ["وضوح الأجزاء الصحيحة", "سرعة الرسم", "جمال الشكل الفني", "التلوين الجذاب"], "a": 0},
-    
-    # المجموعة الثانية: التكبير (5 أسئلة)
-    {"q": "مقدار التكبير يحسب من خلال:", "c": ["قياس الطول الحقيقي ÷ قياس الرسم", "قياس الرسم ÷ الطول الحقيقي", "الطول الحقيقي × قياس الرسم", "الطول الحقيقي + قياس الرسم"], "a": 1},
-    {"q": "إذا كان طول خلية في الرسم = 12 مم، والطول الحقيقي = 0.012 مم، فإن التكبير = ؟", "c": ["10 ×", "100 ×", "1000 ×", "120 ×"], "a": 2},
-    {"q": "وحدة قياس الطول الحقيقي للخلايا عادة تكون:", "c": ["المليمتر فقط", "الميكرومتر", "السنتيمتر", "الكيلومتر"], "a": 1},
-    {"q": "إذا كان العرض الحقيقي للخلية = 0.05 مم، وقياسها في الرسم = 25 مم، فما مقدار التكبير؟", "c": ["250 ×", "500 ×", "50 ×", "5 ×"], "a": 1},
-    {"q": "عند حساب التكبير، إذا كان الناتج 200 ×، فهذا يعني أن:", "c": ["حجم الخلية الحقيقي = 200 مرة أكبر من الرسم", "حجم الخلية في الرسم = 200 مرة أكبر من الحقيقي", "الطول الحقيقي يساوي 200 مم", "لا علاقة بين الطول والتكبير"], "a": 1},
-    
-    # المجموعة الثالثة: تطبيقات (5 أسئلة)
-    {"q": "صورة خلية نباتية طولها الحقيقي 0.1 مم، ورُسمت بطول 30 مم، التكبير = ؟", "c": ["100 ×", "200 ×", "300 ×", "30 ×"], "a": 2},
-    {"q": "إذا كان طول خلية على الرسم = 80 مم، والتكبير = 400 ×، فما الطول الحقيقي؟", "c": ["0.2 مم", "0.5 مم", "2 مم", "20 مم"], "a": 0},
-    {"q": "أي من الأجهزة التالية يستخدم لقياس أبعاد الأجسام الدقيقة؟", "c": ["الميكرومتر", "المتر", "الميزان", "المسطرة المدرجة"], "a": 0},
-    {"q": "خلية طولها الحقيقي 0.02 مم، إذا رسمها الطالب بطول 10 مم، فإن التكبير = ؟", "c": ["50 ×", "100 ×", "200 ×", "20 ×"], "a": 2},
-    {"q": "عند كتابة أسماء الأجزاء على الرسم يجب أن تكون:", "c": ["داخل الشكل", "فوق الخطوط", "أفقية ومرتبة بعيدًا عن الشكل", "عمودية على الشكل"], "a": 2},
-    
-    # المجموعة الرابعة: تقويم (5 أسئلة)
-    {"q": "معيار التقييم الجيد للرسم أن يستخدم الطالب:", "c": ["المساحة المتاحة كاملة", "جزء صغير من الورقة", "ألوان متعددة", "خط غير واضح"], "a": 0},
-    {"q": "عند رسم خلية تحت المجهر يجب أن يظهر:", "c": ["جميع الأجزاء المرئية فقط", "الأجزاء المتوقعة من الطالب", "جميع العضيات الدقيقة حتى لو لم تظهر", "جزء واحد فقط"], "a": 0},
-    {"q": "خلية مرسومة بطول 60 مم، طولها الحقيقي 0.06 مم، التكبير = ؟", "c": ["600 ×", "1000 ×", "60 ×", "10 ×"], "a": 1},
-    {"q": "أي مما يلي ليس من خطوات حساب التكبير؟", "c": ["قياس طول الرسم", "تحديد الطول الحقيقي", "ضرب القيمتين معًا", "قسمة الطول على الآخر"], "a": 2},
-    {"q": "عند استخدام المجهر، الهدف الرئيس هو:", "c": ["تزيين الرسومات", "تكبير رؤية العين", "قياس الأوزان", "حساب الكتلة"], "a": 1}
-]
-
-def update_lesson_1_2():
-    # قراءة الملف الحالي
-    with open(r'c:\Users\ahm7d\Desktop\W\unit-1-cells\lesson-1-2\index.html', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 1. تحديث الأهداف
-    objectives_pattern = r'(<ul>\s*)(.*?)(\s*</ul>)'
-    objectives_match = re.search(objectives_pattern, content, re.DOTALL)
-    if objectives_match:
-        content = content.replace(objectives_match.group(0), f'<ul>\n{new_objectives}\n      </ul>')
-        print("✅ تم تحديث الأهداف بنجاح!")
-    
-    # 2. تحديث بنك الأسئلة
-    # البحث عن بداية مصفوفة bank
-    bank_pattern = r'(const bank = \[)(.*?)(\];)'
-    bank_match = re.search(bank_pattern, content, re.DOTALL)
-    
-    if bank_match:
-        # تكوين الأسئلة الجديدة كنص JavaScript
-        questions_js = []
-        for i, question in enumerate(new_questions):
-            q_text = question['q'].replace('"', '\\"')
-            choices = '","'.join([choice.replace('"', '\\"') for choice in question['c']])
-            questions_js.append(f'      {{q:"{q_text}", c:["{choices}"], a:{question["a"]}}}')
-        
-        new_bank_content = ',\n'.join(questions_js)
-        new_bank = f'{bank_match.group(1)}\n{new_bank_content}\n    {bank_match.group(3)}'
-        
-        content = content.replace(bank_match.group(0), new_bank)
-        print("✅ تم تحديث بنك الأسئلة بنجاح!")
-    
-    # كتابة الملف المحدث
-    with open(r'c:\Users\ahm7d\Desktop\W\unit-1-cells\lesson-1-2\index.html', 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print("🎉 تم تحديث الدرس 1-2 بنجاح!")
-    print("📊 الإحصائيات:")
-    print(f"   • تم تحديث {len(new_objectives.split('<li>'))-1} أهداف تعليمية")
-    print(f"   • تم تحديث {len(new_questions)} سؤال تفاعلي")
-    print("   • المجموعة الأولى: الرسم العلمي (5 أسئلة)")
-    print("   • المجموعة الثانية: التكبير (5 أسئلة)")  
-    print("   • المجموعة الثالثة: تطبيقات (5 أسئلة)")
-    print("   • المجموعة الرابعة: تقويم (5 أسئلة)")
-
-if __name__ == "__main__":
-    update_lesson_1_2()
\ No newline at end of file
@@ -1,92 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-
-# الأهداف الجديدة للدرس 1-3
-new_objectives = """        <li>تسمية العضيات الرئيسة في الخلايا النباتية والحيوانية.</li>
-        <li>وصف وظائف العضيات (النواة، الجدار الخلوي، الغشاء الخلوي، السيتوبلازم، البلاستيدات الخضراء، الفجوة).</li>
-        <li>التمييز بين العضيات الموجودة في الخلايا النباتية فقط وبين المشتركة.</li>
-        <li>تفسير دور كل عضية في بقاء الخلية حية وأدائها لوظائفها.</li>
-        <li>توظيف المصطلحات العلمية المرتبطة بالعضيات بدقة.</li>"""
-
-# بنك الأسئلة الجديد للدرس 1-3 - 20 سؤال منظم في 5 مجموعات
-new_questions = [
-    # المجموعة الأولى: النواة والغشاء (4 أسئلة)
-    {"q": "أي من العضيات التالية يحتوي على المادة الوراثية DNA؟", "c": ["الغشاء الخلوي", "الجدار الخلوي", "النواة", "السيتوبلازم"], "a": 2},
-    {"q": "أي من العضيات التالية يتحكم بمرور المواد من وإلى الخلية؟", "c": ["السيتوبلازم", "الغشاء الخلوي", "النواة", "الفجوة"], "a": 1},
-    {"q": "الغشاء الخلوي يتميز بأنه:", "c": ["صلب جدًا", "منفذ كليًا", "شبه منفذ", "غير موجود في النبات"], "a": 2},
-    {"q": "السيتوبلازم هو:", "c": ["مادة سائلة تحدث فيها التفاعلات", "جدار صلب", "نواة مركزية", "غشاء مزدوج"], "a": 0},
-    
-    # المجموعة الثانية: الجدار والفجوة (4 أسئلة)
-    {"q": "الجدار الخلوي يوجد في:", "c": ["جميع الخلايا الحية", "الخلايا الحيوانية فقط", "الخلايا النباتية فقط", "البكتيريا فقط"], "a": 2},
-    {"q": "الجدار الخلوي مكوَّن أساسًا من:", "c": ["النشا", "السليلوز", "الدهون", "البروتين"], "a": 1},
-    {"q": "الفجوة في الخلية النباتية:", "c": ["صغيرة الحجم", "كبيرة تحتوي على عصارة", "غائبة", "ممتلئة بالهواء"], "a": 1},
-    {"q": "وظيفة الفجوة الرئيسة هي:", "c": ["إنتاج البروتين", "تخزين الماء والمواد", "التحكم بالنشاط", "التمثيل الضوئي"], "a": 1},
-    
-    # المجموعة الثالثة: البلاستيدات والعضيات الخاصة (4 أسئلة)
-    {"q": "البلاستيدات الخضراء توجد في:", "c": ["الخلايا الحيوانية", "الخلايا النباتية", "جميع الكائنات", "الفجوات"], "a": 1},
-    {"q": "ما وظيفة البلاستيدات الخضراء؟", "c": ["التنفس", "البناء الضوئي", "التخزين", "الإخراج"], "a": 1},
-    {"q": "العضية التي لا توجد أبدًا في الخلايا الحيوانية هي:", "c": ["النواة", "البلاستيدات", "الغشاء", "السيتوبلازم"], "a": 1},
-    {"q": "ما العضية التي توفر للخلية الطاقة عن طريق التنفس؟", "c": ["الميتوكندريا", "الفجوة", "الجدار الخلوي", "البلاستيدة"], "a": 0},
-    
-    # المجموعة الرابعة: الفروق والتطبيقات (4 أسئلة)
-    {"q": "الخلية التي تحتوي على جدار خلوي وبلاستيدات وفجوة كبيرة هي:", "c": ["حيوانية", "نباتية", "بكتيرية", "فطرية"], "a": 1},
-    {"q": "أي من العضيات التالية يوجد في كل من الخلية النباتية والحيوانية؟", "c": ["الجدار الخلوي", "البلاستيدات", "النواة", "الفجوة الكبيرة"], "a": 2},
-    {"q": "الجدار الخلوي يساعد على:", "c": ["التحكم بمرور المواد", "دعم وحماية الخلية", "إنتاج الطاقة", "بناء البروتين"], "a": 1},
-    {"q": "السيتوبلازم يُوصف بأنه:", "c": ["وسيط لنقل الكروموسومات", "مكان حدوث معظم التفاعلات الأيضية", "غشاء مزدوج حول النواة", "مخزن للعصارة"], "a": 1},
-    
-    # المجموعة الخامسة: تقويم (4 أسئلة)
-    {"q": "أي مما يلي يعد وظيفة للنواة؟", "c": ["تكوين الجدار الخلوي", "التحكم في النشاط الخلوي", "البناء الضوئي", "تخزين الماء"], "a": 1},
-    {"q": "أي تركيب إضافي يوجد في النبات ويمنحه الصلابة؟", "c": ["السيتوبلازم", "الجدار الخلوي", "الفجوة", "الغشاء"], "a": 1},
-    {"q": "وظيفة الغشاء الخلوي الأساسية:", "c": ["التخزين", "الإخراج", "تنظيم مرور المواد", "تكوين العصارة"], "a": 2},
-    {"q": "جميع ما يلي توجد في الخلايا النباتية عدا:", "c": ["البلاستيدات", "الجدار الخلوي", "الفجوة الكبيرة", "السنتريولات"], "a": 3}
-]
-
-def update_lesson_1_3():
-    # قراءة الملف الحالي
-    with open(r'c:\Users\ahm7d\Desktop\W\unit-1-cells\lesson-1-3\index.html', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 1. تحديث الأهداف
-    objectives_pattern = r'(<ul>\s*)(.*?)(\s*</ul>)'
-    objectives_match = re.search(objectives_pattern, content, re.DOTALL)
-    if objectives_match:
-        content = content.replace(objectives_match.group(0), f'<ul>\n{new_objectives}\n      </ul>')
-        print("✅ تم تحديث الأهداف بنجاح!")
-    
-    # 2. تحديث بنك الأسئلة
-    # البحث عن بداية مصفوفة bank
-    bank_pattern = r'(const bank = \[)(.*?)(\];)'
-    bank_match = re.search(bank_pattern, content, re.DOTALL)
-    
-    if bank_match:
-        # تكوين الأسئلة الجديدة كنص JavaScript
-        questions_js = []
-        for i, question in enumerate(new_questions):
-            q_text = question['q'].replace('"', '\\"')
-            choices = '","'.join([choice.replace('"', '\\"') for choice in question['c']])
-            questions_js.append(f'      {{q:"{q_text}", c:["{choices}"], a:{question["a"]}}}')
-        
-        new_bank_content = ',\n'.join(questions_js)
-        new_bank = f'{bank_match.group(1)}\n{new_bank_content}\n    {bank_match.group(3)}'
-        
-        content = content.replace(bank_match.group(0), new_bank)
-        print("✅ تم تحديث بنك الأسئلة بنجاح!")
-    
-    # كتابة الملف المحدث
-    with open(r'c:\Users\ahm7d\Desktop\W\unit-1-cells\lesson-1-3\index.html', 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print("🎉 تم تحديث الدرس 1-3 بنجاح!")
-    print("📊 الإحصائيات:")
-    print(f"   • تم تحديث {len(new_objectives.split('<li>'))-1} أهداف تعليمية")
-    print(f"   • تم تحديث {len(new_questions)} سؤال تفاعلي")
-    print("   • المجموعة الأولى: النواة والغشاء (4 أسئلة)")
-    print("   • المجموعة الثانية: الجدار والفجوة (4 أسئلة)")  
-    print("   • المجموعة الثالثة: البلاستيدات والعضيات الخاصة (4 أسئلة)")
-    print("   • المجموعة الرابعة: الفروق والتطبيقات (4 أسئلة)")
-    print("   • المجموعة الخامسة: تقويم (4 أسئلة)")
-
-if __name__ == "__main__":
-    update_lesson_1_3()
\ No newline at end of file
@@ -1,94 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-
-# الأهداف الجديدة للدرس 2-1
-new_objectives = """        <li>تعريف الانتشار بوصفه حركة الجزيئات من تركيز عالٍ إلى تركيز منخفض.</li>
-        <li>توضيح أن الانتشار عملية سلبية لا تحتاج إلى طاقة.</li>
-        <li>ذكر أمثلة على الانتشار في الكائنات الحية (دخول الأكسجين، خروج ثاني أكسيد الكربون، انتقال الروائح).</li>
-        <li>تفسير العوامل المؤثرة في سرعة الانتشار (التركيز، درجة الحرارة، مساحة السطح، حجم الجزيئات).</li>
-        <li>الربط بين الانتشار وأهمية بقاء الكائنات الحية.</li>
-        <li>التمييز بين الانتشار والأسموزية كعمليتين مختلفتين.</li>"""
-
-# بنك الأسئلة الجديد للدرس 2-1 - 20 سؤال منظم في 4 مجموعات
-new_questions = [
-    # المجموعة الأولى: الأساسيات (5 أسئلة)
-    {"q": "ما تعريف الانتشار؟", "c": ["حركة الجزيئات من تركيز منخفض إلى تركيز عالٍ", "حركة الجزيئات من تركيز عالٍ إلى تركيز منخفض", "حركة الماء فقط عبر الغشاء", "حركة المواد ضد تدرج التركيز"], "a": 1},
-    {"q": "الانتشار عملية:", "c": ["نشطة وتحتاج إلى طاقة", "سلبية ولا تحتاج إلى طاقة", "مرتبطة بالبلاستيدات", "تحدث فقط في الحيوانات"], "a": 1},
-    {"q": "مثال على الانتشار في جسم الإنسان هو:", "c": ["دخول الماء إلى الخلية", "دخول الأكسجين إلى الدم عبر الرئتين", "نقل الدم عبر الشرايين", "بناء البروتين"], "a": 1},
-    {"q": "عملية خروج ثاني أكسيد الكربون من الخلايا إلى الدم تحدث بوساطة:", "c": ["النقل النشط", "الانتشار", "الأسموزية", "البلعمة"], "a": 1},
-    {"q": "أي من العبارات التالية صحيحة عن الانتشار؟", "c": ["يحتاج إلى إنزيمات", "يعتمد على الطاقة الكيميائية", "لا يحتاج إلى طاقة", "يحدث في اتجاه عشوائي"], "a": 2},
-    
-    # المجموعة الثانية: العوامل المؤثرة (5 أسئلة)
-    {"q": "كلما زاد فرق التركيز بين منطقتين:", "c": ["قل معدل الانتشار", "زاد معدل الانتشار", "توقف الانتشار", "لم يتغير شيء"], "a": 1},
-    {"q": "من العوامل التي تزيد سرعة الانتشار:", "c": ["انخفاض درجة الحرارة", "صغر مساحة السطح", "زيادة مساحة السطح", "زيادة حجم الجزيئات"], "a": 2},
-    {"q": "أي مما يلي يبطئ عملية الانتشار؟", "c": ["زيادة درجة الحرارة", "زيادة حجم الجزيئات", "زيادة فرق التركيز", "تقليل المسافة للانتشار"], "a": 1},
-    {"q": "انتشار جزيئات صغيرة أسرع من الجزيئات الكبيرة بسبب:", "c": ["كبر حجمها", "صغر حجمها وسهولة حركتها", "حاجتها إلى طاقة", "احتوائها على بروتينات"], "a": 1},
-    {"q": "أي مما يلي مثال على زيادة مساحة السطح لتسريع الانتشار في الكائنات الحية؟", "c": ["جلد الإنسان", "وجود الحويصلات الهوائية في الرئتين", "الأسنان", "العظام"], "a": 1},
-    
-    # المجموعة الثالثة: أمثلة وتطبيقات (5 أسئلة)
-    {"q": "رائحة العطر تنتشر في الغرفة بسبب:", "c": ["النقل النشط", "الانتشار", "الأسموزية", "التوصيل الحراري"], "a": 1},
-    {"q": "أي مما يلي لا يُعتبر مثالًا على الانتشار؟", "c": ["تبادل الغازات في الرئة", "ذوبان السكر في الماء", "انتقال الأكسجين من الدم إلى الخلايا", "خروج ثاني أكسيد الكربون من الخلايا"], "a": 1},
-    {"q": "يحدث الانتشار بشكل أسرع عندما تكون درجة الحرارة:", "c": ["منخفضة جدًا", "متوسطة", "عالية", "لا علاقة لها"], "a": 2},
-    {"q": "الأكسجين ينتقل من الدم إلى الخلايا لأن:", "c": ["تركيزه أعلى في الخلايا", "تركيزه أعلى في الدم", "الخلايا تفرزه", "يحتاج إلى طاقة"], "a": 1},
-    {"q": "أي من العبارات التالية تمثل تطبيقًا للانتشار في النبات؟", "c": ["انتقال الماء في الخشب", "خروج الأكسجين خلال الثغور", "دخول الماء عبر الشعيرات الجذرية", "نقل السكر في اللحاء"], "a": 1},
-    
-    # المجموعة الرابعة: المقارنات والتقويم (5 أسئلة)
-    {"q": "الفرق الرئيس بين الانتشار والأسموزية أن:", "c": ["الانتشار خاص بالماء فقط", "الأسموزية خاصة بالماء", "الأسموزية لا تحتاج غشاء", "الانتشار يحتاج إلى بروتينات"], "a": 1},
-    {"q": "عملية الانتشار تستمر حتى:", "c": ["نفاد الجزيئات", "الوصول إلى حالة اتزان", "توقف التنفس", "استهلاك الطاقة"], "a": 1},
-    {"q": "إذا كان تركيز الأكسجين في الهواء 21% وفي الدم 15% فإن اتجاه الانتشار يكون:", "c": ["من الدم إلى الهواء", "من الهواء إلى الدم", "لا يحدث انتشار", "كلا الاتجاهين معًا"], "a": 1},
-    {"q": "انتشار الغازات عبر غشاء رقيق أسرع لأن:", "c": ["الغشاء يسمح بمرور الجزيئات الكبيرة", "المسافة قصيرة", "يحتاج إلى بروتينات", "الطاقة تزداد"], "a": 1},
-    {"q": "أي مما يلي يُعتبر وصفًا دقيقًا للانتشار؟", "c": ["انتقال الجزيئات بعكس تدرج التركيز", "انتقال الجزيئات مع تدرج التركيز", "انتقال الماء فقط", "حركة أيونات عبر مضخات"], "a": 1}
-]
-
-def update_lesson_2_1():
-    # قراءة الملف الحالي
-    with open(r'c:\Users\ahm7d\Desktop\W\unit-2-transport\lesson-2-1\index.html', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 1. تحديث عنوان الدرس
-    content = content.replace('النقل عبر الأغشية', 'الانتشار')
-    content = content.replace('فهم آليات النقل المختلفة عبر أغشية الخلايا والعوامل المؤثرة عليها', 'تعلم مفهوم الانتشار والعوامل المؤثرة فيه مع أمثلة من الكائنات الحية')
-    
-    # 2. تحديث الأهداف
-    objectives_pattern = r'(<ul>\s*)(.*?)(\s*</ul>)'
-    objectives_match = re.search(objectives_pattern, content, re.DOTALL)
-    if objectives_match:
-        content = content.replace(objectives_match.group(0), f'<ul>\n{new_objectives}\n      </ul>')
-        print("✅ تم تحديث الأهداف بنجاح!")
-    
-    # 3. تحديث بنك الأسئلة
-    # البحث عن بداية مصفوفة bank
-    bank_pattern = r'(const bank = \[)(.*?)(\];)'
-    bank_match = re.search(bank_pattern, content, re.DOTALL)
-    
-    if bank_match:
-        # تكوين الأسئلة الجديدة كنص JavaScript
-        questions_js = []
-        for i, question in enumerate(new_questions):
-            q_text = question['q'].replace('"', '\\"')
-            choices = '","'.join([choice.replace('"', '\\"') for choice in question['c']])
-            questions_js.append(f'      {{q:"{q_text}", c:["{choices}"], a:{question["a"]}}}')
-        
-        new_bank_content = ',\n'.join(questions_js)
-        new_bank = f'{bank_match.group(1)}\n{new_bank_content}\n    {bank_match.group(3)}'
-        
-        content = content.replace(bank_match.group(0), new_bank)
-        print("✅ تم تحديث بنك الأسئلة بنجاح!")
-    
-    # كتابة الملف المحدث
-    with open(r'c:\Users\ahm7d\Desktop\W\unit-2-transport\lesson-2-1\index.html', 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print("🎉 تم تحديث الدرس 2-1 بنجاح!")
-    print("📊 الإحصائيات:")
-    print(f"   • تم تحديث {len(new_objectives.split('<li>'))-1} أهداف تعليمية")
-    print(f"   • تم تحديث {len(new_questions)} سؤال تفاعلي")
-    print("   • المجموعة الأولى: الأساسيات (5 أسئلة)")
-    print("   • المجموعة الثانية: العوامل المؤثرة (5 أسئلة)")  
-    print("   • المجموعة الثالثة: أمثلة وتطبيقات (5 أسئلة)")
-    print("   • المجموعة الرابعة: المقارنات والتقويم (5 أسئلة)")
-
-if __name__ == "__main__":
-    update_lesson_2_1()
\ No newline at end of file
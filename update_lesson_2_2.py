@@ -1,94 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-
-# الأهداف الجديدة للدرس 2-2
-new_objectives = """        <li>تعريف الأسموزية بأنها حركة الماء عبر غشاء شبه منفذ من منطقة ذات تركيز عالٍ للماء إلى منطقة ذات تركيز منخفض.</li>
-        <li>تمييز دور الغشاء شبه المنفذ في تنظيم مرور الماء.</li>
-        <li>توضيح العلاقة بين الأسموزية والجهد المائي (Water potential).</li>
-        <li>تفسير التغيرات التي تحدث في الخلايا النباتية عند دخول وخروج الماء (ممتلئة Turgid، مترهلة Flaccid، مبلزمة Plasmolysed).</li>
-        <li>بيان أهمية الأسموزية في امتصاص الماء بواسطة الشعيرات الجذرية في النباتات.</li>
-        <li>تطبيق مفهوم الأسموزية على تجارب عملية (مثل تجربة البطاطس أو النقع في المحاليل المختلفة).</li>"""
-
-# بنك الأسئلة الجديد للدرس 2-2 - 20 سؤال منظم في 4 مجموعات
-new_questions = [
-    # المجموعة الأولى: المفهوم الأساسي (5 أسئلة)
-    {"q": "ما تعريف الأسموزية؟", "c": ["حركة الجزيئات من تركيز عالٍ إلى تركيز منخفض", "حركة الماء عبر غشاء شبه منفذ", "حركة البروتينات عبر الغشاء", "حركة الغازات في الرئة"], "a": 1},
-    {"q": "أي من التالي يُعد شرطًا لحدوث الأسموزية؟", "c": ["وجود بلاستيدات", "وجود غشاء شبه منفذ", "وجود طاقة (ATP)", "غياب الماء"], "a": 1},
-    {"q": "في عملية الأسموزية ينتقل الماء:", "c": ["من تركيز ماء منخفض إلى تركيز ماء مرتفع", "من تركيز ماء مرتفع إلى تركيز ماء منخفض", "من منطقة تركيز الأملاح الأقل إلى الأعلى مباشرة", "بشكل عشوائي غير منظم"], "a": 1},
-    {"q": "الغشاء شبه المنفذ يسمح بمرور:", "c": ["جميع الجزيئات", "جزيئات الماء فقط", "جزيئات البروتين", "جميع المواد الذائبة"], "a": 1},
-    {"q": "مصطلح \"جهد مائي\" يشير إلى:", "c": ["كمية البروتين في الخلية", "قدرة الماء على الحركة", "تركيز الأملاح", "حجم الفجوة العصارية"], "a": 1},
-    
-    # المجموعة الثانية: تطبيقات في الخلية (5 أسئلة)
-    {"q": "خلية نباتية وُضعت في محلول منخفض التركيز ستصبح:", "c": ["مترهلة (Flaccid)", "ممتلئة (Turgid)", "مبلزمة (Plasmolysed)", "ميتة"], "a": 1},
-    {"q": "خلية نباتية وُضعت في محلول مركز ستصبح:", "c": ["ممتلئة (Turgid)", "مبلزمة (Plasmolysed)", "سليمة", "كبيرة الحجم"], "a": 1},
-    {"q": "عندما تفقد الخلية النباتية الماء وتنكمش بعيدًا عن الجدار الخلوي تسمى العملية:", "c": ["البلزمة (Plasmolysis)", "الامتلاء", "الانتشار", "النقل النشط"], "a": 0},
-    {"q": "الضغط الناتج من امتلاء الفجوة العصارية بالماء هو:", "c": ["ضغط الدم", "ضغط الامتلاء (Turgor pressure)", "الضغط الجوي", "ضغط البلازما"], "a": 1},
-    {"q": "خلية بطاطس في محلول مائي نقي ست:", "c": ["تفقد كتلتها", "تزداد كتلتها", "تبقى كما هي", "تنكمش"], "a": 1},
-    
-    # المجموعة الثالثة: الفروق مع العمليات الأخرى (5 أسئلة)
-    {"q": "الفرق بين الانتشار والأسموزية أن:", "c": ["الانتشار للماء فقط", "الأسموزية للماء فقط", "الأسموزية تحتاج طاقة", "الانتشار يحتاج غشاء"], "a": 1},
-    {"q": "انتقال الغلوكوز عبر الغشاء يحدث عادةً بواسطة:", "c": ["الانتشار", "الأسموزية", "النقل النشط", "البلزمة"], "a": 2},
-    {"q": "الأسموزية عملية:", "c": ["نشطة تحتاج ATP", "سلبية لا تحتاج طاقة", "تحدث فقط في الدم", "تحتاج إلى بروتينات ناقلة دائمًا"], "a": 1},
-    {"q": "الشعيرات الجذرية تمتص الماء أساسًا بفضل:", "c": ["النقل النشط", "الأسموزية", "البلزمة", "البناء الضوئي"], "a": 1},
-    {"q": "عندما تتساوى تركيزات الماء داخل وخارج الخلية يحدث:", "c": ["توقف لحركة الماء", "امتلاء دائم", "فقدان للماء", "تدمير للغشاء"], "a": 0},
-    
-    # المجموعة الرابعة: تقويم وتطبيقات (5 أسئلة)
-    {"q": "أي مما يلي يصف حالة الخلية في محلول متعادل التركيز؟", "c": ["ميتة", "سليمة ولا يتغير حجمها", "ممتلئة جدًا", "مبلزمة"], "a": 1},
-    {"q": "إذا وضعت خلية نباتية في ماء مقطر فإن الماء:", "c": ["يخرج من الخلية", "يدخل إلى الخلية", "لا يتحرك", "يذيب الجدار الخلوي"], "a": 1},
-    {"q": "ما سبب ذبول النباتات عند قلة الماء في التربة؟", "c": ["زيادة البناء الضوئي", "فقدان الامتلاء بسبب خروج الماء بالأسموزية", "زيادة الامتلاء", "نقص الغازات"], "a": 1},
-    {"q": "عند إضافة ملح بكثرة إلى التربة، فإن امتصاص الماء من قبل النبات:", "c": ["يزداد", "يقل بسبب الأسموزية العكسية", "لا يتأثر", "يزداد فجأة"], "a": 1},
-    {"q": "أهمية الأسموزية في النباتات أنها:", "c": ["تساعد على إخراج الفضلات", "تحافظ على صلابة الخلايا ودعم النبات", "تخزن المواد العضوية", "تنتج الطاقة"], "a": 1}
-]
-
-def update_lesson_2_2():
-    # قراءة الملف الحالي
-    with open(r'c:\Users\ahm7d\Desktop\W\unit-2-transport\lesson-2-2\index.html', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # 1. تحديث عنوان الدرس
-    content = content.replace('الانتشار والخاصية الأسموزية', 'الأسموزية')
-    content = content.replace('تعلم مفاهيم الانتشار والأسموزية وتطبيقاتها في الخلايا الحية', 'فهم مفهوم الأسموزية وحالات الخلايا النباتية والتطبيقات العملية')
-    
-    # 2. تحديث الأهداف
-    objectives_pattern = r'(<ul>\s*)(.*?)(\s*</ul>)'
-    objectives_match = re.search(objectives_pattern, content, re.DOTALL)
-    if objectives_match:
-        content = content.replace(objectives_match.group(0), f'<ul>\n{new_objectives}\n      </ul>')
-        print("✅ تم تحديث الأهداف بنجاح!")
-    
-    # 3. تحديث بنك الأسئلة
-    # البحث عن بداية مصفوفة bank
-    bank_pattern = r'(const bank = \[)(.*?)(\];)'
-    bank_match = re.search(bank_pattern, content, re.DOTALL)
-    
-    if bank_match:
-        # تكوين الأسئلة الجديدة كنص JavaScript
-        questions_js = []
-        for i, question in enumerate(new_questions):
-            q_text = question['q'].replace('"', '\\"')
-            choices = '","'.join([choice.replace('"', '\\"') for choice in question['c']])
-            questions_js.append(f'      {{q:"{q_text}", c:["{choices}"], a:{question["a"]}}}')
-        
-        new_bank_content = ',\n'.join(questions_js)
-        new_bank = f'{bank_match.group(1)}\n{new_bank_content}\n    {bank_match.group(3)}'
-        
-        content = content.replace(bank_match.group(0), new_bank)
-        print("✅ تم تحديث بنك الأسئلة بنجاح!")
-    
-    # كتابة الملف المحدث
-    with open(r'c:\Users\ahm7d\Desktop\W\unit-2-transport\lesson-2-2\index.html', 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print("🎉 تم تحديث الدرس 2-2 بنجاح!")
-    print("📊 الإحصائيات:")
-    print(f"   • تم تحديث {len(new_objectives.split('<li>'))-1} أهداف تعليمية")
-    print(f"   • تم تحديث {len(new_questions)} سؤال تفاعلي")
-    print("   • المجموعة الأولى: المفهوم الأساسي (5 أسئلة)")
-    print("   • المجموعة الثانية: تطبيقات في الخلية (5 أسئلة)")  
-    print("   • المجموعة الثالثة: الفروق مع العمليات الأخرى (5 أسئلة)")
-    print("   • المجموعة الرابعة: تقويم وتطبيقات (5 أسئلة)")
-
-if __name__ == "__main__":
-    update_lesson_2_2()
\ No newline at end of file
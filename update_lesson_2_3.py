@@ -1,96 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-import os
-
-def update_lesson_2_3():
-    """تحديث محتوى الدرس 2-3: تطبيقات الأسموزية"""
-    
-    file_path = r"unit-2-transport\lesson-2-3\index.html"
-    
-    if not os.path.exists(file_path):
-        print(f"❌ الملف غير موجود: {file_path}")
-        return False
-    
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>تطبيقات الأسموزية</h1>\n      <p class="lead">تجارب عملية وتطبيقات حياتية للأسموزية في النباتات</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تفسير التغيرات التي تطرأ على الخلية النباتية عند وضعها في محاليل مختلفة التركيز (ماء نقي، محلول متعادل، محلول مركز).</li>
-        <li>وصف حالات الخلية: ممتلئة Turgid، مترهلة Flaccid، مبلزمة Plasmolysed.</li>
-        <li>ربط الأسموزية بظاهرة الذبول في النباتات.</li>
-        <li>إجراء تجارب عملية (مثل تجربة شرائح البطاطس في محاليل مختلفة) لتوضيح تأثير الأسموزية.</li>
-        <li>توضيح دور الضغط الامتلائي (Turgor pressure) في بقاء النبات قائمًا وصلبًا.</li>
-        <li>استنتاج العلاقة بين تركيز المحلول وحركة الماء عبر الغشاء شبه المنفذ.</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"عندما توضع خلية نباتية في ماء نقي تصبح:", c:["مبلزمة","ممتلئة (Turgid)","مترهلة","ميتة"], a:1},
-      {q:"الخلية التي تفقد ماءها وتنكمش بعيدًا عن الجدار الخلوي توصف بأنها:", c:["ممتلئة","مبلزمة (Plasmolysed)","مترهلة","طبيعية"], a:1},
-      {q:"الخلية المترهلة (Flaccid) تعني:", c:["فقدت بعض الماء دون أن تنفصل عن الجدار","فقدت كل الماء","امتلأت إلى أقصى حد","ماتت"], a:0},
-      {q:"الضغط الناتج عن امتلاء الخلية بالماء هو:", c:["الضغط الجوي","ضغط الامتلاء (Turgor pressure)","الضغط الأسموزي","ضغط الدم"], a:1},
-      {q:"الذبول في النبات يحدث نتيجة:", c:["زيادة البناء الضوئي","فقدان الماء بالأسموزية","نقص ثاني أكسيد الكربون","زيادة الأكسجين"], a:1},
-      {q:"عند وضع شريحة بطاطس في ماء نقي:", c:["تفقد كتلتها","تزداد كتلتها","تبقى كما هي","تتبلزم"], a:1},
-      {q:"عند وضع شريحة بطاطس في محلول مركز:", c:["تكتسب ماءً","تفقد ماءها وتقل كتلتها","يزداد طولها","لا يتغير حجمها"], a:1},
-      {q:"السبب في تغير كتلة البطاطس عند وضعها في محاليل مختلفة هو:", c:["النقل النشط","الأسموزية","الانتشار البسيط","التمثيل الضوئي"], a:1},
-      {q:"إذا بقيت شريحة البطاطس كما هي عند وضعها في محلول ما، فهذا يعني أن المحلول:", c:["مركز جدًا","منخفض التركيز","متساوي التركيز (Isotonic)","لا يحتوي ماء"], a:2},
-      {q:"التجربة باستخدام البطاطس توضح أن:", c:["الأملاح تنتقل بسهولة","الماء يتحرك حسب فرق التركيز","البروتين يمر بحرية","الغشاء منفذ كليًا"], a:1},
-      {q:"أي حالة من التالية تساعد النبات على البقاء قائمًا وصلبًا؟", c:["البلزمة","الامتلاء (Turgidity)","الترهّل","موت الخلايا"], a:1},
-      {q:"عند فقدان الضغط الامتلائي في الخلايا النباتية يحدث:", c:["تصلب النبات","ذبول النبات","زيادة النمو","امتصاص أكبر للماء"], a:1},
-      {q:"وضع الخلايا النباتية في محلول مركز يسبب:", c:["امتلاءها","خروج الماء منها","دخول الماء إليها","زيادة البناء الضوئي"], a:1},
-      {q:"حالة البلزمة يمكن عكسها إذا وضعت الخلية في:", c:["محلول ملحي شديد التركيز","ماء نقي","وسط جاف","وسط عديم الماء"], a:1},
-      {q:"الضغط الامتلائي ينتج من:", c:["امتلاء الفجوة العصارية بالماء","زيادة الأملاح","تقليل الكلوروفيل","نقص الأكسجين"], a:0},
-      {q:"خلية نباتية في محلول متساوي التركيز تكون:", c:["ممتلئة جدًا","مبلزمة","طبيعية (لا تغير في الحجم)","ميتة"], a:2},
-      {q:"من أهم وظائف الضغط الامتلائي:", c:["تخزين البروتين","دعم النبات ميكانيكيًا","إنتاج الطاقة","تنظيم التنفس"], a:1},
-      {q:"السبب المباشر للبلزمة هو:", c:["دخول الماء","خروج الماء بكثرة","تراكم الأكسجين","زيادة الكلوروفيل"], a:1},
-      {q:"أي مما يلي يصف خلية مبلزمة؟", c:["تنكمش السيتوبلازم مبتعدًا عن الجدار","يمتلئ السيتوبلازم بالماء","يظل حجمها ثابتًا","يكون الغشاء صلبًا"], a:0},
-      {q:"تطبيق عملي للأسموزية في حياة النبات:", c:["انتقال الماء من التربة إلى الجذور","نقل السكر في اللحاء","تبادل الغازات في الأوراق","إنتاج البروتين في النواة"], a:0}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 2-3 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: تطبيقات الأسموزية")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: حالات الخلية (5 أسئلة)")
-        print("      - المجموعة الثانية: التجربة - شرائح البطاطس (5 أسئلة)")
-        print("      - المجموعة الثالثة: المفاهيم العلمية (5 أسئلة)")
-        print("      - المجموعة الرابعة: التقويم (5 أسئلة)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في تحديث الملف: {e}")
-        return False
-
-if __name__ == "__main__":
-    update_lesson_2_3()
\ No newline at end of file
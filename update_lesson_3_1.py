@@ -1,96 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-import os
-
-def update_lesson_3_1():
-    """تحديث محتوى الدرس 3-1: الكربوهيدرات"""
-    
-    file_path = r"unit-3-biomolecules\lesson-3-1\index.html"
-    
-    if not os.path.exists(file_path):
-        print(f"❌ الملف غير موجود: {file_path}")
-        return False
-    
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>الكربوهيدرات</h1>\n      <p class="lead">تعرف على الكربوهيدرات وأنواعها ووظائفها كمصدر للطاقة</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تعريف الكربوهيدرات وذكر أهميتها للكائنات الحية كمصدر رئيسي للطاقة.</li>
-        <li>التمييز بين السكريات الأحادية (مثل الجلوكوز) والسكريات الثنائية (مثل السكروز) والسكريات العديدة (مثل النشا والجلايكوجين).</li>
-        <li>وصف تركيب الكربوهيدرات (كربون – هيدروجين – أكسجين بنسبة 1:2:1 تقريبًا).</li>
-        <li>التعرف على أمثلة رئيسية للكربوهيدرات في النبات والحيوان.</li>
-        <li>إجراء اختبارات الكشف عن الكربوهيدرات (مثل اختبار بندكت للسكريات المختزلة).</li>
-        <li>تفسير العلاقة بين بنية الكربوهيدرات ووظيفتها في التخزين والطاقة.</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"الكربوهيدرات تتكون أساسًا من العناصر:", c:["C, H, O","C, H, N","C, N, S","C, H, P"], a:0},
-      {q:"الصيغة العامة للكربوهيدرات غالبًا:", c:["CnH2nOn","CnHnOn","CnH2n-1On","CnH2n+2On"], a:0},
-      {q:"أهم وظيفة للكربوهيدرات في الكائنات الحية هي:", c:["بناء البروتينات","تخزين الطاقة واستخدامها","إنتاج الفيتامينات","تكوين الأحماض النووية"], a:1},
-      {q:"أي مما يلي يُعتبر سكرًا أحاديًا؟", c:["السكروز","الجلوكوز","المالتوز","النشا"], a:1},
-      {q:"أي مما يلي يُعد من السكريات الثنائية؟", c:["الفركتوز","المالتوز","الجلايكوجين","الجلوكوز"], a:1},
-      {q:"النشا يوجد أساسًا في:", c:["الحيوانات","النباتات","البكتيريا","الدم"], a:1},
-      {q:"الجلايكوجين يُخزن في:", c:["أوراق النبات","عضلات الكائنات الحية والحيوانات","الخشب","الثمار فقط"], a:1},
-      {q:"السكريات الأحادية مثل الجلوكوز والفركتوز تتميز بأنها:", c:["صلبة دائمًا","سهلة الذوبان وسريعة الامتصاص","غير قابلة للذوبان","معقدة جدًا"], a:1},
-      {q:"أي من السكريات التالية يُعتبر من السكريات العديدة (Polysaccharides)؟", c:["السكروز","النشا","الجلوكوز","الفركتوز"], a:1},
-      {q:"أي مما يلي يُعد من السكريات المختزلة؟", c:["السكروز","المالتوز","السليلوز","الجلايكوجين"], a:1},
-      {q:"يستخدم اختبار بندكت للكشف عن:", c:["البروتينات","السكريات المختزلة","الدهون","الأحماض النووية"], a:1},
-      {q:"في اختبار بندكت، يتحول اللون الأزرق إلى:", c:["أحمر آجري","أسود","بنفسجي","أصفر"], a:0},
-      {q:"اختبار اليود يُستخدم للكشف عن:", c:["السكريات الثنائية","النشا","الجلوكوز","الدهون"], a:1},
-      {q:"عند إضافة اليود للنشا يتحول اللون إلى:", c:["أحمر","أزرق/أسود","أصفر","بنفسجي"], a:1},
-      {q:"إذا لم يتغير لون اليود عند إضافته لعينة فهذا يعني أن العينة:", c:["تحتوي على نشا","لا تحتوي على نشا","تحتوي على بروتين","تحتوي على دهون"], a:1},
-      {q:"أي مما يلي يمثل وظيفة السليلوز؟", c:["تخزين الطاقة","بناء جدران الخلايا النباتية","تكوين البروتينات","إنتاج الدهون"], a:1},
-      {q:"أي مما يلي يُعتبر سكر الفواكه؟", c:["الجلوكوز","الفركتوز","المالتوز","اللاكتوز"], a:1},
-      {q:"السكروز يتكون من اتحاد:", c:["جلوكوز + جلوكوز","جلوكوز + فركتوز","جلوكوز + جلايكوجين","فركتوز + فركتوز"], a:1},
-      {q:"الكربوهيدرات تُخزن في جسم الإنسان على شكل:", c:["سليلوز","نشا","جلايكوجين","لاكتوز"], a:2},
-      {q:"أي من الكربوهيدرات التالية لا يمكن للإنسان هضمها؟", c:["النشا","الجلوكوز","السليلوز","الجلايكوجين"], a:2}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 3-1 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: الكربوهيدرات")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: الأساسيات (5 أسئلة)")
-        print("      - المجموعة الثانية: الأنواع والأمثلة (5 أسئلة)")
-        print("      - المجموعة الثالثة: الاختبارات العملية (5 أسئلة)")
-        print("      - المجموعة الرابعة: الوظائف والتقويم (5 أسئلة)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في تحديث الملف: {e}")
-        return False
-
-if __name__ == "__main__":
-    update_lesson_3_1()
\ No newline at end of file
@@ -1,96 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-import os
-
-def update_lesson_3_2():
-    """تحديث محتوى الدرس 3-2: البروتينات والدهون"""
-    
-    file_path = r"unit-3-biomolecules\lesson-3-2\index.html"
-    
-    if not os.path.exists(file_path):
-        print(f"❌ الملف غير موجود: {file_path}")
-        return False
-    
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>البروتينات والدهون</h1>\n      <p class="lead">دراسة البروتينات والدهون كمركبات عضوية أساسية ووظائفها واختباراتها</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تعريف البروتينات والدهون كمركبات عضوية أساسية في الكائنات الحية.</li>
-        <li>ذكر مكونات البروتين (الأحماض الأمينية) والدهون (الأحماض الدهنية + الجلسرول).</li>
-        <li>توضيح وظائف البروتينات (بناء الخلايا، الإنزيمات، الهرمونات، الأجسام المضادة).</li>
-        <li>تفسير دور الدهون كمخزن للطاقة وحماية الأعضاء وعزل حراري.</li>
-        <li>التعرف على اختبارات الكشف عن البروتينات (اختبار البيوريت) والدهون (اختبار الورق البني أو الإيثانول).</li>
-        <li>مقارنة بين البروتينات والدهون من حيث التركيب والوظيفة.</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"البروتينات تتكون من وحدات أساسية هي:", c:["الجلوكوز","الأحماض الأمينية","الأحماض الدهنية","النشا"], a:1},
-      {q:"عدد الأحماض الأمينية الأساسية في بناء البروتينات:", c:["10","15","20","30"], a:2},
-      {q:"الرابطة التي تربط بين الأحماض الأمينية في البروتين هي:", c:["رابطة هيدروجينية","رابطة ببتيدية","رابطة فوسفورية","رابطة أيونية"], a:1},
-      {q:"وظيفة البروتينات تشمل جميع ما يلي عدا:", c:["تكوين الإنزيمات","تكوين الهرمونات","تخزين الطاقة طويلة الأمد","تكوين الأجسام المضادة"], a:2},
-      {q:"اختبار البيوريت يُستخدم للكشف عن:", c:["السكريات","البروتينات","الدهون","النشا"], a:1},
-      {q:"الدهون تتكون من:", c:["أحماض أمينية فقط","جلسرول وأحماض دهنية","نشا وسكر","جلوكوز وفركتوز"], a:1},
-      {q:"أهم وظيفة للدهون في الجسم هي:", c:["عزل حراري","تكوين DNA","إنتاج ثاني أكسيد الكربون","تكوين البلاستيدات"], a:0},
-      {q:"الدهون توفر طاقة أكثر من الكربوهيدرات بمعدل:", c:["ضعفها","نصفها","مساوية لها","أقل منها"], a:0},
-      {q:"الدهون المخزنة في الجسم توجد غالبًا في:", c:["النخاع","الأنسجة الدهنية","النواة","الكبد فقط"], a:1},
-      {q:"من أمثلة الدهون الفسفورية:", c:["السليلوز","الفوسفوليبيد","الجلايكوجين","اللاكتوز"], a:1},
-      {q:"اختبار البيوريت للبروتين يعطي لونًا:", c:["أزرق","بنفسجي","أحمر آجري","أسود"], a:1},
-      {q:"اختبار اليود لا يستخدم للكشف عن البروتين لأنه:", c:["خاص بالسكريات الثنائية","خاص بالكشف عن النشا","خاص بالكشف عن الدهون","لا يعطي أي لون"], a:1},
-      {q:"اختبار الدهون باستخدام الورق البني يعتمد على:", c:["تغير اللون إلى أزرق","ظهور بقعة شفافة","تكوين راسب أبيض","ظهور فقاعات"], a:1},
-      {q:"عند إضافة الإيثانول للمادة الدهنية يتكون:", c:["لون بنفسجي","راسب أبيض","لون أحمر","لون أسود"], a:1},
-      {q:"أي مما يلي يثبت وجود الدهون في الطعام؟", c:["رائحة قوية","بقعة شفافة على الورق","ذوبان سريع في الماء","تحول إلى اللون البنفسجي"], a:1},
-      {q:"الفرق بين البروتينات والدهون أن:", c:["البروتينات تبني الجسم والدهون تخزن الطاقة","البروتينات مصدر للطاقة والدهون مصدر للإنزيمات","البروتينات غير مهمة","الدهون لا توجد في الجسم"], a:0},
-      {q:"أي مما يلي مثال على بروتين؟", c:["الجلوكوز","الكولاجين","الفوسفوليبيد","النشا"], a:1},
-      {q:"أي مما يلي مثال على دهون؟", c:["اللاكتوز","الفركتوز","الفوسفوليبيد","الكولاجين"], a:2},
-      {q:"الدهون تعمل كعازل حراري لأنها:", c:["تذوب في الماء","لا تذوب في الماء","تتبخر بسرعة","تحتوي على بروتين"], a:1},
-      {q:"أي مما يلي ليس من وظائف البروتين؟", c:["بناء العضلات","تكوين الأجسام المضادة","إنتاج الإنزيمات","تخزين طويل الأمد للطاقة"], a:3}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 3-2 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: البروتينات والدهون")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: البروتينات (5 أسئلة)")
-        print("      - المجموعة الثانية: الدهون (5 أسئلة)")
-        print("      - المجموعة الثالثة: الاختبارات العملية (5 أسئلة)")
-        print("      - المجموعة الرابعة: المقارنة والتقويم (5 أسئلة)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في تحديث الملف: {e}")
-        return False
-
-if __name__ == "__main__":
-    update_lesson_3_2()
\ No newline at end of file
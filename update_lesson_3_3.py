@@ -1,96 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-import os
-
-def update_lesson_3_3():
-    """تحديث محتوى الدرس 3-3: الإنزيمات"""
-    
-    file_path = r"unit-3-biomolecules\lesson-3-3\index.html"
-    
-    if not os.path.exists(file_path):
-        print(f"❌ الملف غير موجود: {file_path}")
-        return False
-    
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>الإنزيمات</h1>\n      <p class="lead">دراسة الإنزيمات كعوامل حفازة حيوية والعوامل المؤثرة على نشاطها</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تعريف الإنزيمات بأنها بروتينات تعمل كعوامل حفازة حيوية (Biological catalysts).</li>
-        <li>شرح دور الإنزيمات في تسريع التفاعلات الحيوية دون أن تُستهلك.</li>
-        <li>وصف العلاقة بين الإنزيم والركيزة (Substrate) من خلال الموقع النشط (Active site).</li>
-        <li>توضيح العوامل المؤثرة على نشاط الإنزيم (درجة الحرارة، pH، تركيز الركيزة).</li>
-        <li>تفسير ظاهرة تثبيط الإنزيم (Denaturation) عند تعرضه لحرارة عالية أو pH غير مناسب.</li>
-        <li>تطبيق أمثلة على الإنزيمات مثل: الأميلاز، الليبيز، البروتيز، الكاتاليز.</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"الإنزيمات تُصنف بأنها:", c:["كربوهيدرات","بروتينات","دهون","فيتامينات"], a:1},
-      {q:"الوظيفة الرئيسة للإنزيمات هي:", c:["إنتاج الطاقة","تسريع التفاعلات الكيميائية","تخزين الغذاء","نقل الأكسجين"], a:1},
-      {q:"الموقع النشط (Active site) في الإنزيم هو:", c:["المكان الذي يرتبط به الركيزة","جزء من الغشاء الخلوي","مكان تخزين الطاقة","فراغ في الخلية"], a:0},
-      {q:"العلاقة بين الإنزيم والركيزة تشبه:", c:["المفتاح والقفل","المسطرة والورق","الكتاب والقلم","العجلة والمحرك"], a:0},
-      {q:"الإنزيم لا يُستهلك في التفاعل لأنه:", c:["يتغير شكله","يعمل كعامل حفاز","يختفي بعد الاستخدام","يتحلل سريعًا"], a:1},
-      {q:"الإنزيم الذي يحلل النشا إلى جلوكوز هو:", c:["البروتيز","الأميلاز","الليبيز","الكاتاليز"], a:1},
-      {q:"الإنزيم الذي يحلل الدهون هو:", c:["الليبيز","الأميلاز","البروتيز","المالتاز"], a:0},
-      {q:"الإنزيم الذي يحلل البروتينات إلى أحماض أمينية هو:", c:["البروتيز","الأميلاز","الليبيز","الكاتاليز"], a:0},
-      {q:"الإنزيم الذي يحلل فوق أكسيد الهيدروجين (H2O2) إلى ماء وأكسجين هو:", c:["الكاتاليز","البروتيز","الأميلاز","الليبيز"], a:0},
-      {q:"الأميلاز يوجد أساسًا في:", c:["العصارة الصفراوية","اللعاب","المعدة","الكبد"], a:1},
-      {q:"الإنزيم يعمل بكفاءة عند:", c:["أي درجة حرارة","درجة الحرارة المثلى","درجات الحرارة العالية جدًا","درجات الحرارة المنخفضة جدًا"], a:1},
-      {q:"عند رفع درجة الحرارة فوق الحد الأمثل للإنزيم يحدث:", c:["زيادة في النشاط","تثبيط (Denaturation)","توقف مؤقت ثم يعود","عدم تأثر"], a:1},
-      {q:"الإنزيمات تتأثر أيضًا بـ:", c:["شدة الضوء","قيمة pH","الضغط الجوي فقط","حجم الخلية"], a:1},
-      {q:"إذا كانت قيمة pH غير مناسبة للإنزيم فإن:", c:["يتضاعف نشاطه","يتوقف نشاطه","يبقى كما هو","يتحول إلى فيتامين"], a:1},
-      {q:"إنزيم البيبسين يعمل بشكل أفضل في:", c:["وسط حمضي","وسط قاعدي","وسط متعادل","وسط جاف"], a:0},
-      {q:"الإنزيمات تختلف عن العوامل غير الحية في أنها:", c:["لا تتأثر بالحرارة","بروتينات حية","تُستهلك أثناء التفاعل","لا تؤثر على سرعة التفاعل"], a:1},
-      {q:"جميع الإنزيمات التالية موجودة في الجهاز الهضمي عدا:", c:["الأميلاز","البروتيز","الكاتاليز","الليبيز"], a:2},
-      {q:"تثبيط الإنزيم (Denaturation) يعني:", c:["زيادة سرعة التفاعل","فقدان شكله ووظيفته","تحوله إلى بروتين جديد","توقف الركيزة عن الارتباط"], a:1},
-      {q:"عند درجة حرارة منخفضة جدًا:", c:["يتوقف نشاط الإنزيم مؤقتًا","يتحلل الإنزيم","يثبت نشاطه","يتحول إلى فيتامين"], a:0},
-      {q:"أهمية الإنزيمات للكائنات الحية تكمن في أنها:", c:["تزيد الطاقة المخزنة","تسهل التفاعلات الحيوية بسرعة وكفاءة","تُستهلك كمصدر غذاء","تعمل كمضادات حيوية"], a:1}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 3-3 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: الإنزيمات")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: المفاهيم الأساسية (5 أسئلة)")
-        print("      - المجموعة الثانية: أمثلة على الإنزيمات (5 أسئلة)")
-        print("      - المجموعة الثالثة: العوامل المؤثرة (5 أسئلة)")
-        print("      - المجموعة الرابعة: التطبيقات والتقويم (5 أسئلة)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في تحديث الملف: {e}")
-        return False
-
-if __name__ == "__main__":
-    update_lesson_3_3()
\ No newline at end of file
@@ -1,96 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-import os
-
-def update_lesson_4_1():
-    """تحديث محتوى الدرس 4-1: النظام الغذائي"""
-    
-    file_path = r"unit-4-nutrition\lesson-4-1\index.html"
-    
-    if not os.path.exists(file_path):
-        print(f"❌ الملف غير موجود: {file_path}")
-        return False
-    
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>النظام الغذائي</h1>\n      <p class="lead">دراسة النظام الغذائي المتوازن والمجموعات الغذائية وأهميتها للصحة</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تعريف النظام الغذائي المتوازن وأهميته لصحة الإنسان.</li>
-        <li>ذكر المجموعات الغذائية الرئيسة (الكربوهيدرات – البروتينات – الدهون – الفيتامينات – المعادن – الألياف – الماء).</li>
-        <li>تفسير دور كل مجموعة غذائية في الجسم (الطاقة، النمو، الوقاية).</li>
-        <li>التمييز بين الاحتياجات الغذائية عند الأطفال، المراهقين، والبالغين.</li>
-        <li>حساب السعرات الحرارية ومقارنتها باحتياجات الجسم.</li>
-        <li>ربط سوء النظام الغذائي بمشكلات صحية مثل السمنة ونقص الفيتامينات.</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"النظام الغذائي المتوازن هو الذي يحتوي على:", c:["الكربوهيدرات فقط","جميع المجموعات الغذائية بنسب مناسبة","البروتينات والدهون فقط","الماء فقط"], a:1},
-      {q:"أي من المجموعات الغذائية تُعد مصدرًا رئيسيًا للطاقة؟", c:["البروتينات","الكربوهيدرات","المعادن","الفيتامينات"], a:1},
-      {q:"البروتينات تُعد ضرورية من أجل:", c:["إنتاج الطاقة فقط","بناء أنسجة الجسم","العزل الحراري","تنظيم درجة الحرارة"], a:1},
-      {q:"الدهون تُستخدم بشكل أساسي في الجسم لـ:", c:["تكوين الأجسام المضادة","العزل وتخزين الطاقة","تكوين العظام","تكوين الإنزيمات"], a:1},
-      {q:"الفيتامينات والمعادن دورها الأساسي هو:", c:["مد الجسم بالطاقة","تنظيم العمليات الحيوية","بناء العضلات","إنتاج الدهون"], a:1},
-      {q:"يشكل الماء نسبة تقريبية من وزن جسم الإنسان مقدارها:", c:["25%","45%","60 – 70%","90%"], a:2},
-      {q:"الألياف الغذائية مهمة لأنها:", c:["مصدر رئيسي للطاقة","تساعد في حركة الأمعاء","تُخزن في العضلات","تُنتج الفيتامينات"], a:1},
-      {q:"نقص الألياف في النظام الغذائي قد يؤدي إلى:", c:["ضعف العضلات","الإمساك","هشاشة العظام","السمنة"], a:1},
-      {q:"من الأمثلة على الأطعمة الغنية بالألياف:", c:["اللحوم","الحبوب الكاملة","الأجبان","البيض"], a:1},
-      {q:"أهم فائدة لشرب الماء بكمية كافية هي:", c:["زيادة الكتلة العضلية","إذابة ونقل المواد داخل الجسم","إنتاج البروتين","زيادة السعرات الحرارية"], a:1},
-      {q:"وحدة قياس الطاقة في الغذاء هي:", c:["الجول","الكيلو جول","السعر الحراري (Calorie)","الوات"], a:2},
-      {q:"احتياجات الجسم من الطاقة تعتمد على:", c:["العمر والجنس والنشاط","لون العين","الطول فقط","مستوى الذكاء"], a:0},
-      {q:"الطفل يحتاج نسبة أكبر من:", c:["الدهون","البروتين","الألياف","الماء"], a:1},
-      {q:"الرياضيون يحتاجون كميات أكبر من:", c:["الكربوهيدرات","الفيتامينات فقط","الماء فقط","الدهون فقط"], a:0},
-      {q:"نقص الكالسيوم في النظام الغذائي يسبب:", c:["الأنيميا","هشاشة العظام","الإسقربوط","الكواشيوركور"], a:1},
-      {q:"أي مما يلي يُعد مثالًا على نظام غذائي متوازن؟", c:["وجبة تحتوي على خبز، خضار، لحم، فاكهة، ماء","وجبة من الحلويات فقط","وجبة من اللحوم فقط","وجبة من الدهون فقط"], a:0},
-      {q:"نقص فيتامين C يؤدي إلى مرض:", c:["الكساح","الإسقربوط","فقر الدم","الكواشيوركور"], a:1},
-      {q:"نقص الحديد في النظام الغذائي يؤدي إلى:", c:["هشاشة العظام","فقر الدم (أنيميا)","الإسقربوط","الكواشيوركور"], a:1},
-      {q:"النظام الغذائي غير المتوازن يؤدي إلى:", c:["صحة جيدة","أمراض سوء التغذية","زيادة المناعة دائمًا","زيادة الذكاء"], a:1},
-      {q:"أي من التالي يمثل مثالًا على سوء التغذية؟", c:["تناول وجبات متنوعة","نقص الفيتامينات والمعادن","شرب الماء بكثرة","تناول الفواكه والخضروات بانتظام"], a:1}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 4-1 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: النظام الغذائي")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: المفاهيم الأساسية (5 أسئلة)")
-        print("      - المجموعة الثانية: الماء والألياف (5 أسئلة)")
-        print("      - المجموعة الثالثة: الاحتياجات والسعرات (5 أسئلة)")
-        print("      - المجموعة الرابعة: التقويم والتطبيقات (5 أسئلة)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في تحديث الملف: {e}")
-        return False
-
-if __name__ == "__main__":
-    update_lesson_4_1()
\ No newline at end of file
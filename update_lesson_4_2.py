@@ -1,95 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-import os
-
-def update_lesson_4_2():
-    """تحديث محتوى الدرس 4-2: السمنة وسوء التغذية"""
-    
-    file_path = r"unit-4-nutrition\lesson-4-2\index.html"
-    
-    if not os.path.exists(file_path):
-        print(f"❌ الملف غير موجود: {file_path}")
-        return False
-    
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>السمنة وسوء التغذية</h1>\n      <p class="lead">دراسة مشكلات التغذية: السمنة وسوء التغذية وأمراضها وطرق الوقاية</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تعريف السمنة وأسبابها الرئيسة (زيادة السعرات الحرارية – قلة النشاط البدني – عادات غذائية غير صحية).</li>
-        <li>تفسير الآثار السلبية للسمنة على الصحة (أمراض القلب – السكري – ارتفاع ضغط الدم).</li>
-        <li>تعريف سوء التغذية وأمثلته (نقص البروتين، نقص الفيتامينات، نقص المعادن).</li>
-        <li>الربط بين نقص عناصر غذائية محددة والأمراض الناتجة (الكساح – الإسقربوط – فقر الدم – الكواشيوركور – المارسمس).</li>
-        <li>اقتراح طرق للوقاية من السمنة وسوء التغذية (نظام غذائي متوازن + نشاط بدني).</li>"""
-        
-        # استبدال الأهداف (5 أهداف بدلاً من 6)
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"السمنة تحدث غالبًا بسبب:", c:["نقص البروتين","زيادة السعرات الحرارية مع قلة النشاط","نقص الماء","نقص الألياف"], a:1},
-      {q:"من مضاعفات السمنة:", c:["زيادة النمو","أمراض القلب","زيادة المناعة","تقوية العظام"], a:1},
-      {q:"السمنة ترتبط أيضًا بـ:", c:["ارتفاع ضغط الدم","فقر الدم","الكساح","الإسقربوط"], a:0},
-      {q:"من طرق الوقاية من السمنة:", c:["الإفراط في الأطعمة الدهنية","ممارسة النشاط البدني","قلة شرب الماء","النوم الزائد"], a:1},
-      {q:"مؤشر كتلة الجسم (BMI) يُستخدم لـ:", c:["حساب نسبة الفيتامينات","تحديد حالة الوزن","قياس ضغط الدم","قياس الطاقة الحرارية"], a:1},
-      {q:"سوء التغذية يعني:", c:["تناول الطعام بكثرة","نقص أو زيادة غير متوازنة للعناصر الغذائية","شرب الماء فقط","تناول البروتين وحده"], a:1},
-      {q:"نقص البروتين في الغذاء يسبب مرض:", c:["الكساح","الكواشيوركور","الإسقربوط","فقر الدم"], a:1},
-      {q:"المارسمس يحدث بسبب:", c:["نقص البروتين والسعرات الحرارية معًا","زيادة الكالسيوم","نقص الحديد فقط","زيادة الدهون"], a:0},
-      {q:"مرض الإسقربوط ينتج عن نقص:", c:["فيتامين A","فيتامين C","فيتامين D","الحديد"], a:1},
-      {q:"مرض الكساح يحدث نتيجة نقص:", c:["فيتامين D","فيتامين C","البروتين","الماء"], a:0},
-      {q:"فقر الدم (الأنيميا) ينتج عن نقص:", c:["الكالسيوم","الحديد","الفيتامين C","الفيتامين D"], a:1},
-      {q:"من أعراض فقر الدم:", c:["ضعف العظام","شحوب وإرهاق","نزيف اللثة","تشوه الساقين"], a:1},
-      {q:"نقص فيتامين A يؤدي إلى:", c:["العمى الليلي","فقر الدم","الكساح","السمنة"], a:0},
-      {q:"نقص اليود في الغذاء يسبب:", c:["تضخم الغدة الدرقية","الإسقربوط","الكواشيوركور","المارسمس"], a:0},
-      {q:"الأطفال المصابون بالكواشيوركور يظهر لديهم:", c:["بطن منتفخ","ضعف النظر","عظام لينة","نزيف اللثة"], a:0},
-      {q:"للوقاية من السمنة يُنصح بـ:", c:["تناول أطعمة عالية الدهون","ممارسة الرياضة وتناول غذاء متوازن","النوم المفرط","تقليل الماء"], a:1},
-      {q:"للوقاية من الإسقربوط يجب تناول:", c:["الحليب","الفواكه الحمضية","اللحوم","الأرز"], a:1},
-      {q:"مرض الكساح يمكن الوقاية منه بـ:", c:["شرب الحليب والتعرض للشمس","أكل اللحوم فقط","شرب الماء بكثرة","أكل الدهون"], a:0},
-      {q:"سوء التغذية قد يؤدي إلى:", c:["زيادة الذكاء","ضعف النمو","تقوية المناعة","زيادة العضلات"], a:1},
-      {q:"السمنة وسوء التغذية يمكن معالجتهما بـ:", c:["النوم الطويل","نظام غذائي متوازن + نشاط بدني","تناول الحلويات","الامتناع عن شرب الماء"], a:1}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 4-2 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: السمنة وسوء التغذية")
-        print("   ✅ الأهداف: 5 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: السمنة (5 أسئلة)")
-        print("      - المجموعة الثانية: سوء التغذية (5 أسئلة)")
-        print("      - المجموعة الثالثة: الأمثلة التطبيقية (5 أسئلة)")
-        print("      - المجموعة الرابعة: الوقاية والتقويم (5 أسئلة)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في تحديث الملف: {e}")
-        return False
-
-if __name__ == "__main__":
-    update_lesson_4_2()
\ No newline at end of file
@@ -1,96 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-import os
-
-def update_lesson_5_1():
-    """تحديث محتوى الدرس 5-1: التنفس"""
-    
-    file_path = r"unit-5-respiration\lesson-5-1\index.html"
-    
-    if not os.path.exists(file_path):
-        print(f"❌ الملف غير موجود: {file_path}")
-        return False
-    
-    try:
-        # قراءة الملف
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>التنفس</h1>\n      <p class="lead">دراسة عملية التنفس الخلوي وإطلاق الطاقة من الجلوكوز</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تعريف التنفس باعتباره عملية حيوية لإطلاق الطاقة من الجلوكوز.</li>
-        <li>التمييز بين التنفس الهوائي والتنفس اللاهوائي.</li>
-        <li>كتابة معادلة التنفس الهوائي (الجلوكوز + الأكسجين → ثاني أكسيد الكربون + ماء + طاقة).</li>
-        <li>ذكر معادلة التنفس اللاهوائي في الإنسان (الجلوكوز → حمض لاكتيك + طاقة قليلة).</li>
-        <li>توضيح أهمية الطاقة الناتجة من التنفس في الأنشطة الحيوية (النمو – الحركة – نقل المواد – المحافظة على حرارة الجسم).</li>
-        <li>إدراك أن التنفس يحدث في جميع الخلايا الحية باستمرار.</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"عملية التنفس هي:", c:["إدخال الهواء إلى الرئتين فقط","إطلاق الطاقة من الغذاء داخل الخلايا","حركة الأكسجين في الدم","تبادل الغازات عبر الجلد"], a:1},
-      {q:"المصدر الرئيس للطاقة في التنفس هو:", c:["البروتين","الدهون","الجلوكوز","الألياف"], a:2},
-      {q:"التنفس يحدث في:", c:["الجهاز الدوري","جميع الخلايا","الرئتين فقط","الدم"], a:1},
-      {q:"الطاقة الناتجة من التنفس تُخزن في صورة:", c:["ماء","بروتين","ATP","أكسجين"], a:2},
-      {q:"أي مما يلي يُعد من استخدامات الطاقة في الجسم؟", c:["نقل المواد","إنتاج ثاني أكسيد الكربون فقط","امتصاص الضوء","تكوين الألياف الغذائية"], a:0},
-      {q:"المعادلة العامة للتنفس الهوائي هي:", c:["جلوكوز + أكسجين → ماء + ثاني أكسيد الكربون + طاقة","جلوكوز → كحول + طاقة","بروتين + ماء → طاقة","دهون + بروتين → طاقة"], a:0},
-      {q:"التنفس الهوائي يتميز بـ:", c:["إنتاج طاقة قليلة","إنتاج طاقة كبيرة","عدم استخدام الأكسجين","إنتاج كحول"], a:1},
-      {q:"نواتج التنفس الهوائي هي:", c:["كحول + طاقة","حمض لاكتيك + طاقة","ماء + ثاني أكسيد الكربون + طاقة","دهون + بروتين"], a:2},
-      {q:"أكثر كفاءة في إنتاج الطاقة:", c:["التنفس اللاهوائي","التنفس الهوائي","التخمّر","البناء الضوئي"], a:1},
-      {q:"التنفس الهوائي يحدث في عضية:", c:["البلاستيدة","الميتوكوندريا","النواة","الريبوسوم"], a:1},
-      {q:"يحدث التنفس اللاهوائي عند:", c:["نقص الأكسجين","زيادة الماء","وفرة البروتين","ارتفاع الكالسيوم"], a:0},
-      {q:"المعادلة العامة للتنفس اللاهوائي في الإنسان:", c:["جلوكوز → حمض لاكتيك + طاقة","جلوكوز + أكسجين → ماء + طاقة","بروتين + ماء → طاقة","دهون → كحول"], a:0},
-      {q:"أحد عيوب التنفس اللاهوائي أنه:", c:["يحتاج إلى أكسجين","ينتج طاقة أقل","لا يعطي أي طاقة","ينتج ماء زائد"], a:1},
-      {q:"من نتائج تراكم حمض اللاكتيك:", c:["تقلص العضلات وإرهاقها","زيادة الطاقة","زيادة الأكسجين","نمو أسرع"], a:0},
-      {q:"أي مما يلي مثال على التنفس اللاهوائي؟", c:["الجري لمسافات طويلة ببطء","التمرينات العنيفة مثل العدو السريع","النوم","التنفس أثناء الراحة"], a:1},
-      {q:"الطاقة الناتجة من التنفس تُستخدم في:", c:["انقسام الخلايا","تكوين الماء فقط","طرح الفضلات","امتصاص الضوء"], a:0},
-      {q:"من أوجه الشبه بين التنفس الهوائي واللاهوائي:", c:["كلاهما ينتج طاقة","كلاهما يحتاج أكسجين","كلاهما ينتج ماء","كلاهما يتم في النواة"], a:0},
-      {q:"عند القيام بمجهود عضلي شديد، الجسم يعتمد على:", c:["التنفس الهوائي فقط","التنفس اللاهوائي جزئيًا","عدم التنفس","البناء الضوئي"], a:1},
-      {q:"كمية الطاقة الناتجة من جزيء واحد من الجلوكوز في التنفس الهوائي تقارب:", c:["2 ATP","36 – 38 ATP","5 ATP","100 ATP"], a:1},
-      {q:"عند توقف التنفس في الخلية فإن:", c:["تستمر العمليات الحيوية","تتوقف الحياة","يزداد إنتاج الطاقة","يزداد الجلوكوز"], a:1}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 5-1 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: التنفس")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: المفاهيم الأساسية (5 أسئلة)")
-        print("      - المجموعة الثانية: التنفس الهوائي (5 أسئلة)")
-        print("      - المجموعة الثالثة: التنفس اللاهوائي (5 أسئلة)")
-        print("      - المجموعة الرابعة: التطبيقات (5 أسئلة)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ خطأ في تحديث الملف: {e}")
-        return False
-
-if __name__ == "__main__":
-    update_lesson_5_1()
\ No newline at end of file
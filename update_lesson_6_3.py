@@ -1,94 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-
-def update_lesson_6_3():
-    """
-    تحديث منهجي للدرس 6-3: العين
-    """
-    try:
-        file_path = "unit-6-homeostasis/lesson-6-3/index.html"
-        
-        # قراءة المحتوى الحالي
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>👁️ العين</h1>\n      <p class="lead">تركيب العين ووظائفها، آلية الرؤية، عيوب الإبصار وطرق تصحيحها</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>وصف <strong>التركيب الأساسي للعين</strong> (القرنية، البؤبؤ، العدسة، الشبكية، العصب البصري).</li>
-        <li>توضيح <strong>آلية الرؤية</strong> من دخول الضوء حتى تكوين الصورة في الدماغ.</li>
-        <li>شرح دور <strong>القزحية</strong> في التحكم بكمية الضوء الداخل للعين.</li>
-        <li>تفسير <strong>عيوب الإبصار الشائعة</strong>: قصر النظر، طول النظر، والاستجماتيزم.</li>
-        <li>التعرف على <strong>طرق تصحيح عيوب الإبصار</strong> (النظارات، العدسات اللاصقة، الجراحة).</li>
-        <li>فهم أهمية <strong>العناية بصحة العين</strong> والوقاية من أمراض العيون.</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"ما هو الجزء الشفاف الأمامي للعين الذي يساعد على تجميع الضوء؟", c:["الشبكية","القرنية","البؤبؤ","العصب البصري"], a:1},
-      {q:"أين تتكون الصورة في العين؟", c:["على القرنية","على الشبكية","في البؤبؤ","في العدسة"], a:1},
-      {q:"وظيفة القزحية في العين هي:", c:["تكوين الصورة","التحكم في كمية الضوء الداخل","نقل الصورة للدماغ","إفراز الدموع"], a:1},
-      {q:"البؤبؤ هو:", c:["عضلة في العين","الفتحة الوسطية في القزحية","جزء من الشبكية","نوع من العدسات"], a:1},
-      {q:"العدسة البلورية في العين تقوم بـ:", c:["إنتاج الضوء","تجميع أشعة الضوء على الشبكية","حماية العين","إفراز السوائل"], a:1},
-      {q:"في الضوء الساطع، البؤبؤ يصبح:", c:["أكبر حجماً","أصغر حجماً","لا يتغير","يختفي"], a:1},
-      {q:"الشبكية تحتوي على خلايا حساسة للضوء تسمى:", c:["العصبونات","المستقبلات الضوئية","الخلايا العضلية","الخلايا الدهنية"], a:1},
-      {q:"العصب البصري وظيفته:", c:["تجميع الضوء","نقل الإشارات البصرية للدماغ","حماية العين","تحريك العين"], a:1},
-      {q:"قصر النظر (Myopia) يعني:", c:["رؤية الأشياء البعيدة بوضوح فقط","رؤية الأشياء القريبة بوضوح أكثر من البعيدة","عدم رؤية الألوان","فقدان البصر تماماً"], a:1},
-      {q:"طول النظر (Hyperopia) يعني:", c:["رؤية الأشياء القريبة بوضوح أكثر من البعيدة","رؤية الأشياء البعيدة بوضوح أكثر من القريبة","رؤية الألوان فقط","عدم الرؤية نهائياً"], a:1},
-      {q:"قصر النظر يُصحح باستخدام:", c:["عدسات محدبة","عدسات مقعرة","عدسات مسطحة","لا يمكن تصحيحه"], a:1},
-      {q:"طول النظر يُصحح باستخدام:", c:["عدسات مقعرة","عدسات محدبة","عدسات مسطحة","المرايا"], a:1},
-      {q:"الاستجماتيزم (Astigmatism) ينتج عن:", c:["تلف الشبكية","عدم انتظام شكل القرنية أو العدسة","صغر حجم العين","كبر حجم البؤبؤ"], a:1},
-      {q:"من طرق تصحيح عيوب الإبصار:", c:["النظارات الطبية","العدسات اللاصقة","جراحة العين","جميع ما سبق"], a:3},
-      {q:"للحفاظ على صحة العين يُنصح بـ:", c:["النظر المباشر للشمس","القراءة في الإضاءة الضعيفة","أخذ راحة منتظمة أثناء استخدام الشاشات","إهمال فحص العين"], a:2},
-      {q:"العضلات التي تتحكم في شكل العدسة تسمى:", c:["العضلات الهدبية","عضلات القزحية","عضلات الجفن","عضلات الوجه"], a:0},
-      {q:"المسافة المثلى للقراءة من الكتاب هي:", c:["5 سم","حوالي 25-30 سم","متر واحد","مترين"], a:1},
-      {q:"أي من التالي يضر بصحة العين؟", c:["الإضاءة الجيدة أثناء القراءة","أخذ راحة كل 20 دقيقة","النظر المباشر لمصادر ضوء قوية","ارتداء النظارات الشمسية"], a:2},
-      {q:"جراحة الليزك (LASIK) تستخدم لـ:", c:["إزالة المياه البيضاء","تصحيح عيوب الإبصار","علاج العمى الألوان","تكبير حجم العين"], a:1},
-      {q:"أهمية فحص العين الدوري:", c:["مضيعة للوقت","الكشف المبكر عن مشاكل البصر","مكلف فقط","غير ضروري للشباب"], a:1}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 6-3 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: العين")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: تركيب العين (5 أسئلة)")
-        print("      - المجموعة الثانية: آلية الرؤية (5 أسئلة)")
-        print("      - المجموعة الثالثة: عيوب الإبصار وتصحيحها (5 أسئلة)")
-        print("      - المجموعة الرابعة: العناية بصحة العين (5 أسئلة)")
-        print("   🔬 المواضيع: تركيب العين، الرؤية، عيوب الإبصار، العناية بالعين")
-        print("   🎯 نتائج التعلم: فهم شامل لفسيولوجيا البصر وطرق العناية بالعين")
-        
-    except FileNotFoundError:
-        print("❌ خطأ: لم يتم العثور على ملف الدرس!")
-        print("📁 تأكد من وجود المسار: unit-6-homeostasis/lesson-6-3/index.html")
-    except Exception as e:
-        print(f"❌ خطأ غير متوقع: {e}")
-
-if __name__ == "__main__":
-    update_lesson_6_3()
\ No newline at end of file
@@ -1,94 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-
-def update_lesson_6_4():
-    """
-    تحديث منهجي للدرس 6-4: الهرمونات
-    """
-    try:
-        file_path = "unit-6-homeostasis/lesson-6-4/index.html"
-        
-        # قراءة المحتوى الحالي
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>🧪 الهرمونات</h1>\n      <p class="lead">تعريف الهرمونات ووظائفها، الغدد الصماء وأهميتها في التحكم والاتزان الداخلي</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تعريف الهرمونات بأنها <strong>مواد كيميائية تُفرز من الغدد الصماء</strong> وتُنقل عبر الدم لتؤثر في أعضاء مستهدفة.</li>
-        <li>التمييز بين <strong>الاستجابة العصبية والاستجابة الهرمونية</strong>.</li>
-        <li>ذكر أهم <strong>الغدد الصماء</strong> في الجسم ووظائفها (النخامية – الدرقية – البنكرياس – الكظرية – التناسلية).</li>
-        <li>توضيح أمثلة لهرمونات مهمة: <strong>الأنسولين، الجلوكاجون، الأدرينالين، هرمون النمو</strong>.</li>
-        <li>شرح أثر <strong>اختلال إفراز الهرمونات</strong> (مثل: السكري – فرط أو قصور إفراز الغدة الدرقية).</li>
-        <li>ربط عمل الهرمونات بـ<strong>الاتزان الداخلي</strong> (مثل تنظيم مستوى السكر في الدم).</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"الهرمونات تُعرّف بأنها:", c:["إشارات كهربائية","مواد كيميائية تُفرز في الدم وتؤثر في أعضاء معينة","بروتينات غذائية","إنزيمات هاضمة"], a:1},
-      {q:"الغدد التي تفرز الهرمونات مباشرة في الدم تسمى:", c:["الغدد الصماء","الغدد القنوية","الغدد العرقية","الغدد الدمعية"], a:0},
-      {q:"الاستجابة العصبية تتميز بأنها:", c:["سريعة وقصيرة المدى","بطيئة وطويلة الأمد","كيميائية بالكامل","تعتمد على الدم"], a:0},
-      {q:"الاستجابة الهرمونية تتميز بأنها:", c:["سريعة جداً","أبطأ ولكن طويلة الأمد","لا تؤثر في الجسم","لا تحتاج إلى دم"], a:1},
-      {q:"الهرمون يعمل على:", c:["جميع خلايا الجسم","أعضاء أو خلايا مستهدفة محددة","الجهاز العصبي فقط","الدماغ فقط"], a:1},
-      {q:"الغدة المسؤولة عن التحكم في معظم الغدد الأخرى هي:", c:["البنكرياس","النخامية","الكظرية","الدرقية"], a:1},
-      {q:"الغدة التي تفرز هرمون الأنسولين هي:", c:["النخامية","البنكرياس","الدرقية","الكظرية"], a:1},
-      {q:"وظيفة الأنسولين هي:", c:["رفع مستوى السكر في الدم","خفض مستوى السكر في الدم","تنظيم ضربات القلب","زيادة ضغط الدم"], a:1},
-      {q:"الهرمون المضاد للأنسولين هو:", c:["الأدرينالين","الجلوكاجون","هرمون النمو","الثيروكسين"], a:1},
-      {q:"الغدة التي تفرز الأدرينالين هي:", c:["البنكرياس","الكظرية","الدرقية","النخامية"], a:1},
-      {q:"الأدرينالين يُعرف بهرمون:", c:["السعادة","الطوارئ (الخوف والقتال والهرب)","النمو","الأيض"], a:1},
-      {q:"هرمون النمو يُفرز من:", c:["الغدة النخامية","الغدة الكظرية","الغدة الدرقية","البنكرياس"], a:0},
-      {q:"نقص هرمون النمو في الطفولة يؤدي إلى:", c:["العملقة","التقزم","السمنة","السكري"], a:1},
-      {q:"زيادة إفراز هرمون النمو في الطفولة يؤدي إلى:", c:["التقزم","العملقة","فقر الدم","الذبول"], a:1},
-      {q:"الغدة الدرقية تُفرز:", c:["الأنسولين","الثيروكسين","الأدرينالين","الكورتيزول"], a:1},
-      {q:"نقص إفراز هرمون الثيروكسين يؤدي إلى:", c:["زيادة النشاط","بطء النمو وانخفاض الأيض","زيادة السكر","زيادة ضغط الدم"], a:1},
-      {q:"زيادة إفراز هرمون الثيروكسين يؤدي إلى:", c:["بطء الحركة","زيادة معدل الأيض","فقر الدم","نقص السكر"], a:1},
-      {q:"مرض السكري يحدث بسبب:", c:["نقص إفراز الأنسولين","نقص إفراز الثيروكسين","نقص إفراز الأدرينالين","زيادة هرمون النمو"], a:0},
-      {q:"الغدة الكظرية تستجيب مباشرة في مواقف الخوف بإفراز:", c:["الأنسولين","الأدرينالين","الثيروكسين","الجلوكاجون"], a:1},
-      {q:"الهرمونات مهمة لأنها:", c:["تتحكم فقط في التنفس","تنظم أنشطة الجسم وتحافظ على الاتزان الداخلي","تنتج البروتين فقط","تعطي اللون للعين"], a:1}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 6-4 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: الهرمونات")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: المفاهيم الأساسية (5 أسئلة)")
-        print("      - المجموعة الثانية: الغدد والهرمونات (5 أسئلة)")
-        print("      - المجموعة الثالثة: أمثلة وأثرها (5 أسئلة)")
-        print("      - المجموعة الرابعة: التقييم والاضطرابات (5 أسئلة)")
-        print("   🔬 المواضيع: الغدد الصماء، الهرمونات المهمة، الاضطرابات الهرمونية")
-        print("   🎯 نتائج التعلم: فهم شامل لدور الهرمونات في الاتزان الداخلي")
-        
-    except FileNotFoundError:
-        print("❌ خطأ: لم يتم العثور على ملف الدرس!")
-        print("📁 تأكد من وجود المسار: unit-6-homeostasis/lesson-6-4/index.html")
-    except Exception as e:
-        print(f"❌ خطأ غير متوقع: {e}")
-
-if __name__ == "__main__":
-    update_lesson_6_4()
\ No newline at end of file
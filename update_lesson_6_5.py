@@ -1,94 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import re
-
-def update_lesson_6_5():
-    """
-    تحديث منهجي للدرس 6-5: الاتزان الداخلي
-    """
-    try:
-        file_path = "unit-6-homeostasis/lesson-6-5/index.html"
-        
-        # قراءة المحتوى الحالي
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # تحديث عنوان الدرس ووصفه
-        content = re.sub(
-            r'<h1>.*?</h1>\s*<p class="lead">.*?</p>',
-            '<h1>⚖️ الاتزان الداخلي</h1>\n      <p class="lead">مفهوم الاتزان الداخلي وآلياته، دور الأجهزة الحيوية في المحافظة على ثبات البيئة الداخلية للجسم</p>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأهداف الجديدة
-        new_objectives = """        <li>تعريف <strong>الاتزان الداخلي</strong> بأنه المحافظة على ثبات البيئة الداخلية للجسم رغم التغيرات الخارجية.</li>
-        <li>ذكر أمثلة على الاتزان الداخلي مثل: <strong>تنظيم درجة حرارة الجسم – تنظيم مستوى السكر في الدم – تنظيم كمية الماء</strong>.</li>
-        <li>شرح دور كل من <strong>الجهاز العصبي والجهاز الهرموني</strong> في المحافظة على الاتزان الداخلي.</li>
-        <li>توضيح مفهوم <strong>التغذية الراجعة السالبة (Negative feedback)</strong>.</li>
-        <li>بيان أثر <strong>فقدان الاتزان الداخلي</strong> على صحة الإنسان.</li>
-        <li>ربط الاتزان الداخلي بـ<strong>آليات التكيف مع البيئة</strong>.</li>"""
-        
-        # استبدال الأهداف
-        content = re.sub(
-            r'<ul>\s*<li>.*?</li>\s*</ul>',
-            f'<ul>\n{new_objectives}\n      </ul>',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # الأسئلة الجديدة مقسمة إلى 4 مجموعات
-        new_questions = """      {q:"الاتزان الداخلي هو:", c:["ثبات البيئة الخارجية","ثبات البيئة الداخلية للجسم","زيادة الطاقة","توقف النمو"], a:1},
-      {q:"الهدف من الاتزان الداخلي هو:", c:["تسريع التمثيل الضوئي","المحافظة على الظروف المثلى لعمل الخلايا","زيادة كتلة الجسم","إنتاج الطاقة فقط"], a:1},
-      {q:"مثال على الاتزان الداخلي:", c:["تغير لون الشعر","ثبات درجة حرارة الجسم","زيادة الوزن","تغير شكل العين"], a:1},
-      {q:"الجهازان الرئيسان المسؤولان عن الاتزان الداخلي هما:", c:["الهضمي والدوري","العصبي والهرموني","الهيكلي والعضلي","التنفسي والهضمي"], a:1},
-      {q:"التغذية الراجعة السالبة تعني:", c:["تعزيز التغير وزيادته","إرجاع المتغير إلى حالته الطبيعية","منع حدوث أي تغير","زيادة درجة الحرارة دائماً"], a:1},
-      {q:"عند ارتفاع درجة حرارة الجسم:", c:["تتوقف جميع العمليات","يتم التعرق وتوسع الأوعية الدموية","ينخفض معدل التنفس","يزيد السكر في الدم"], a:1},
-      {q:"عند انخفاض درجة حرارة الجسم:", c:["تنقبض الأوعية الدموية","يتم إفراز العرق","يتوقف التنفس","ينخفض معدل الأيض"], a:0},
-      {q:"تنظيم مستوى السكر في الدم يتم بواسطة:", c:["الأدرينالين فقط","الأنسولين والجلوكاجون","الكورتيزول","الثيروكسين"], a:1},
-      {q:"الأنسولين يعمل على:", c:["رفع مستوى السكر","خفض مستوى السكر","زيادة ضغط الدم","إنتاج ثاني أكسيد الكربون"], a:1},
-      {q:"الجلوكاجون يعمل على:", c:["خفض مستوى السكر","رفع مستوى السكر في الدم","تقليل البروتين","زيادة الأكسجين"], a:1},
-      {q:"عند ارتفاع حرارة الجسم فإن:", c:["تحت المهاد (Hypothalamus) ينظم الاستجابة","الكبد يفرز الأنسولين","البنكرياس يفرز العرق","الدماغ يوقف التنفس"], a:0},
-      {q:"تنظيم درجة الحرارة يعتمد على:", c:["الكلية","تحت المهاد","البنكرياس","الغدة الدرقية"], a:1},
-      {q:"عند زيادة الماء في الجسم:", c:["يفرز الجسم هرمون ADH","يقل إفراز هرمون ADH","يزداد إفراز الأنسولين","يزداد إنتاج الكورتيزول"], a:1},
-      {q:"عند قلة الماء في الجسم:", c:["يزداد إفراز هرمون ADH","يقل معدل ضربات القلب","يزيد إفراز العرق","يقل معدل التنفس"], a:0},
-      {q:"الكلية تشارك في الاتزان الداخلي من خلال:", c:["تنظيم درجة الحرارة","تنظيم الماء والأملاح","إفراز الأنسولين","التحكم في ضربات القلب"], a:1},
-      {q:"إذا لم يعمل الاتزان الداخلي بكفاءة:", c:["يبقى الجسم طبيعياً","يختل عمل الأعضاء","يزداد النمو","تتضاعف الطاقة"], a:1},
-      {q:"من أمثلة التغذية الراجعة السالبة:", c:["زيادة السكر → زيادة إفراز الأنسولين","زيادة الحرارة → زيادة الحرارة أكثر","نقص الماء → زيادة فقده","نقص الأكسجين → توقف التنفس"], a:0},
-      {q:"عند ممارسة الرياضة، للمحافظة على الاتزان الداخلي يزداد:", c:["معدل التنفس","معدل التعرق فقط","معدل النوم","معدل إنتاج الدهون"], a:0},
-      {q:"الاتزان الداخلي ضروري من أجل:", c:["الحفاظ على الوظائف الحيوية","إيقاف العمليات الحيوية","زيادة الوزن","بناء العظام فقط"], a:0},
-      {q:"السبب في نجاح آلية الاتزان الداخلي هو:", c:["وجود التغذية الراجعة السالبة","توقف عمل الغدد","زيادة الحرارة دائماً","تراكم حمض اللاكتيك"], a:0}"""
-        
-        # استبدال بنك الأسئلة
-        content = re.sub(
-            r'const bank = \[\s*\{q:.*?\}\s*\];',
-            f'const bank = [\n{new_questions}\n    ];',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # حفظ الملف المحدث
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-        
-        print("🎉 تم تحديث الدرس 6-5 بنجاح!")
-        print("📊 إحصائيات التحديث:")
-        print("   ✅ العنوان: الاتزان الداخلي")
-        print("   ✅ الأهداف: 6 أهداف جديدة")
-        print("   ✅ الأسئلة: 20 سؤال منظم في 4 مجموعات:")
-        print("      - المجموعة الأولى: المفاهيم الأساسية (5 أسئلة)")
-        print("      - المجموعة الثانية: أمثلة عملية (5 أسئلة)")
-        print("      - المجموعة الثالثة: دور الأجهزة (5 أسئلة)")
-        print("      - المجموعة الرابعة: التقويم والتطبيقات (5 أسئلة)")
-        print("   🔬 المواضيع: تنظيم الحرارة، السكر، الماء، التغذية الراجعة السالبة")
-        print("   🎯 نتائج التعلم: فهم شامل لآليات الاتزان الداخلي والتكيف")
-        
-    except FileNotFoundError:
-        print("❌ خطأ: لم يتم العثور على ملف الدرس!")
-        print("📁 تأكد من وجود المسار: unit-6-homeostasis/lesson-6-5/index.html")
-    except Exception as e:
-        print(f"❌ خطأ غير متوقع: {e}")
-
-if __name__ == "__main__":
-    update_lesson_6_5()
\ No newline at end of file
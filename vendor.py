@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+نسخ محلية مثبتة الإصدار من المكتبات الخارجية (بدلاً من CDN)
+Vendor pinned, trimmed copies of the CDN libraries into assets/vendor/
+
+- كل مكتبة لها رابط بإصدار محدد، وتُسجل بصمة sha384 لكل رابط ولكل ملف محلي في
+  vendor.lock.json عند أول تنزيل، ويُرفض أي تنزيل لاحق لا يطابقها
+- التقليص: howler بدون إضافة الصوت المكاني، إزالة تعليقات sourceMappingURL،
+  وخط Cairo بمجموعتي المحارف العربية واللاتينية فقط
+- build.py يستبدل روابط CDN في الصفحات المبنية بالنسخ المحلية الموجودة
+
+الاستخدام:
+    python vendor.py             # تنزيل المكتبات غير الموجودة
+    python vendor.py --update    # إعادة تنزيل الكل وتحديث البصمات
+    python vendor.py --check     # التحقق من الملفات المحلية مقابل البصمات
+    python vendor.py --frozen    # للنشر: تنزيل الناقص بالبصمات المودعة فقط، والفشل عند أي اختلاف
+
+vendor.lock.json و assets/vendor/ يُودعان في git؛ --frozen يرفض أي رابط أو ملف غير مسجل
+فيهما فلا يُنشر الموقع بروابط CDN أو بمحتوى لم تُراجع بصمته
+"""
+
+import base64
+import hashlib
+import json
+import re
+import sys
+import urllib.request
+from pathlib import Path
+
+VENDOR_DIR = Path('assets/vendor')
+LOCK_FILE = VENDOR_DIR / 'vendor.lock.json'
+
+# المكتبات المثبتة: الرابط الأصلي في الصفحات -> الملف المحلي
+LIBRARIES = [
+    {
+        'name': 'sweetalert2',
+        'url': 'https://cdn.jsdelivr.net/npm/sweetalert2@11.10.5/dist/sweetalert2.all.min.js',
+        'file': 'sweetalert2-11.10.5.all.min.js',
+        'replaces': ['https://cdn.jsdelivr.net/npm/sweetalert2@11'],
+    },
+    {
+        'name': 'canvas-confetti',
+        'url': 'https://cdn.jsdelivr.net/npm/canvas-confetti@1.9.3/dist/confetti.browser.min.js',
+        'file': 'canvas-confetti-1.9.3.min.js',
+        'replaces': ['https://cdn.jsdelivr.net/npm/canvas-confetti@1.9.3/dist/confetti.browser.min.js'],
+    },
+    {
+        'name': 'gsap',
+        'url': 'https://cdn.jsdelivr.net/npm/gsap@3.12.5/dist/gsap.min.js',
+        'file': 'gsap-3.12.5.min.js',
+        'replaces': ['https://cdn.jsdelivr.net/npm/gsap@3.12.5/dist/gsap.min.js'],
+    },
+    {
+        'name': 'aos',
+        'url': 'https://cdn.jsdelivr.net/npm/aos@2.3.4/dist/aos.js',
+        'file': 'aos-2.3.4.min.js',
+        'replaces': ['https://cdn.jsdelivr.net/npm/aos@2.3.4/dist/aos.js'],
+    },
+    {
+        'name': 'aos-css',
+        'url': 'https://cdn.jsdelivr.net/npm/aos@2.3.4/dist/aos.css',
+        'file': 'aos-2.3.4.min.css',
+        'replaces': ['https://cdn.jsdelivr.net/npm/aos@2.3.4/dist/aos.css'],
+    },
+    {
+        # الدروس تستخدم Howl فقط، فتكفي النسخة الأساسية بدون الصوت المكاني
+        'name': 'howler',
+        'url': 'https://cdn.jsdelivr.net/npm/howler@2.2.4/dist/howler.core.min.js',
+        'file': 'howler-2.2.4.core.min.js',
+        'replaces': ['https://cdn.jsdelivr.net/npm/howler@2.2.4/dist/howler.min.js'],
+    },
+]
+
+# خط Cairo: ملف CSS من Google مع ملفات woff2 المحلية
+FONT = {
+    'name': 'cairo',
+    'url': 'https://fonts.googleapis.com/css2?family=Cairo:wght@500;700;900&display=swap',
+    'file': 'cairo/cairo.css',
+    'replaces': ['https://fonts.googleapis.com/css2?family=Cairo:wght@500;700;900&display=swap'],
+    # مجموعات المحارف المستخدمة في المحتوى (تُحذف البقية مثل latin-ext)
+    'subsets': ['arabic', 'latin'],
+}
+
+# متصفح حديث حتى يُرجع Google روابط woff2
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/124.0 Safari/537.36')
+
+SOURCE_MAP_PATTERN = re.compile(r'\n?(?://[#@] sourceMappingURL=[^\n]*|/\*[#@] sourceMappingURL=[^*]*\*/)')
+FONT_FACE_PATTERN = re.compile(r'/\* ([\w-]+) \*/\s*(@font-face\s*\{[^}]*\})')
+FONT_URL_PATTERN = re.compile(r'url\((https://[^)]+)\)')
+
+
+class VendorError(Exception):
+    """خطأ في تنزيل أو التحقق من مكتبة"""
+
+
+def integrity(data):
+    """بصمة sha384 بصيغة Subresource Integrity"""
+    return 'sha384-' + base64.b64encode(hashlib.sha384(data).digest()).decode('ascii')
+
+
+def fetch(url):
+    """تنزيل رابط وإرجاع المحتوى"""
+    request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.read()
+    except OSError as e:
+        raise VendorError(f"تعذر تنزيل {url}: {e}")
+
+
+def load_lock():
+    """قراءة ملف البصمات"""
+    try:
+        with open(LOCK_FILE, 'r', encoding='utf-8') as f:
+            lock = json.load(f)
+    except (OSError, ValueError):
+        lock = {}
+    lock.setdefault('sources', {})
+    lock.setdefault('files', {})
+    return lock
+
+
+def save_lock(lock):
+    """حفظ ملف البصمات"""
+    LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_FILE, 'w', encoding='utf-8') as f:
+        json.dump(lock, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def _verified(lock, url, data, frozen=False):
+    """التحقق من بصمة المحتوى المنزّل مقابل المسجل في الملف (frozen: يجب أن يكون مسجلاً)"""
+    digest = integrity(data)
+    expected = lock['sources'].get(url)
+    if frozen and expected is None:
+        raise VendorError(f"الرابط غير مثبت في vendor.lock.json: {url} (شغّل python vendor.py وأودِع assets/vendor/)")
+    if expected and expected != digest:
+        raise VendorError(f"البصمة لا تطابق vendor.lock.json: {url}\n   المتوقع {expected}\n   الفعلي  {digest}")
+    lock['sources'][url] = digest
+    return data
+
+
+def _write(lock, relative, data, frozen=False):
+    """كتابة ملف داخل assets/vendor/ وتسجيل بصمته (frozen: يجب أن تطابق المسجلة)"""
+    if frozen and lock['files'].get(Path(relative).as_posix()) != integrity(data):
+        raise VendorError(f"الملف الناتج لا يطابق vendor.lock.json: {relative}")
+    path = VENDOR_DIR / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    lock['files'][Path(relative).as_posix()] = integrity(data)
+    return path
+
+
+def vendor_library(library, lock, frozen=False):
+    """تنزيل مكتبة واحدة وتقليصها"""
+    data = _verified(lock, library['url'], fetch(library['url']), frozen)
+    text = SOURCE_MAP_PATTERN.sub('', data.decode('utf-8'))
+    return _write(lock, library['file'], text.encode('utf-8'), frozen)
+
+
+def vendor_font(font, lock, frozen=False):
+    """تنزيل خط Cairo بالمجموعات المطلوبة فقط وإعادة كتابة الروابط محلياً"""
+    css = fetch(font['url']).decode('utf-8')
+    blocks = []
+    for subset, block in FONT_FACE_PATTERN.findall(css):
+        if subset not in font['subsets']:
+            continue
+        for url in FONT_URL_PATTERN.findall(block):
+            data = _verified(lock, url, fetch(url), frozen)
+            name = f"{hashlib.sha256(data).hexdigest()[:12]}.woff2"
+            _write(lock, Path(font['file']).parent / name, data, frozen)
+            block = block.replace(url, name)
+        blocks.append(f"/* {subset} */\n{block}")
+    if not blocks:
+        raise VendorError(f"لم يتم العثور على خطوط woff2 في {font['url']}")
+    return _write(lock, font['file'], ('\n'.join(blocks) + '\n').encode('utf-8'), frozen)
+
+
+def url_map():
+    """روابط CDN -> المسار المحلي (للملفات الموجودة فقط)"""
+    mapping = {}
+    for item in LIBRARIES + [FONT]:
+        path = VENDOR_DIR / item['file']
+        if path.exists():
+            for url in item['replaces']:
+                mapping[url] = path.as_posix()
+    return mapping
+
+
+def rewrite_urls(page, mapping, prefix=''):
+    """استبدال روابط CDN في صفحة بالمسارات المحلية (prefix مثل ../../)"""
+    for url, local in mapping.items():
+        page = page.replace(f'"{url}"', f'"{prefix}{local}"')
+    return page
+
+
+def check(lock):
+    """التحقق من الملفات المحلية مقابل البصمات المسجلة"""
+    problems = 0
+    for item in LIBRARIES + [FONT]:
+        if item['file'] not in lock['files']:
+            print(f"⚠️ غير منسوخ: {item['name']}")
+            problems += 1
+    for relative, expected in sorted(lock['files'].items()):
+        path = VENDOR_DIR / relative
+        if not path.exists():
+            print(f"❌ غير موجود: {path}")
+            problems += 1
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        if integrity(data) != expected:
+            print(f"❌ تغير محتوى الملف: {path}")
+            problems += 1
+        else:
+            print(f"✅ {path} ({len(data) / 1024:.1f} KB)")
+    return problems
+
+
+def main():
+    """الدالة الرئيسية"""
+    lock = load_lock()
+    if '--check' in sys.argv:
+        sys.exit(1 if check(lock) else 0)
+
+    update = '--update' in sys.argv
+    if update:
+        lock = {'sources': {}, 'files': {}}
+    frozen = '--frozen' in sys.argv and not update
+    if frozen and not lock['sources']:
+        print(f"❌ {LOCK_FILE} غير موجود أو فارغ: شغّل python vendor.py محلياً وأودِع assets/vendor/")
+        sys.exit(1)
+
+    print(f"📦 نسخ المكتبات إلى {VENDOR_DIR}/ ...")
+    errors = 0
+    for item in LIBRARIES + [FONT]:
+        if not update and (VENDOR_DIR / item['file']).exists():
+            print(f"⏭️ موجود مسبقاً: {item['name']}")
+            continue
+        try:
+            path = vendor_font(item, lock, frozen) if item is FONT else vendor_library(item, lock, frozen)
+        except VendorError as e:
+            errors += 1
+            print(f"❌ {e}")
+            continue
+        print(f"✅ {item['name']}: {path} ({path.stat().st_size / 1024:.1f} KB)")
+
+    if lock['files'] and not frozen:
+        save_lock(lock)
+    if errors:
+        print(f"\n⚠️ فشل تنزيل {errors} مكتبة (ستبقى روابط CDN في الصفحات المبنية)")
+        sys.exit(1)
+    if frozen and check(lock):
+        sys.exit(1)
+    print("\n🎉 تم نسخ جميع المكتبات؛ شغّل python build.py لتحديث الصفحات")
+
+
+if __name__ == "__main__":
+    main()